@@ -0,0 +1,155 @@
+"""
+Benchmark for the collision checks done every frame with a full alien fleet.
+The same checks are timed with rects only, with the precise collisions
+of the default settings and with precise collisions for every entity type.
+
+Run it from the project folder with:
+    python -m benchmarks.collisions
+"""
+
+import os
+import timeit
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((1260, 700))
+
+# pylint: disable=wrong-import-position
+from src.entities.alien_entities.aliens import Alien, BossAlien
+from src.entities.asteroid import Asteroid
+from src.entities.projectiles.laser import Laser
+from src.entities.projectiles.player_bullets import Thunderbolt
+from src.game_logic.game_settings import Settings
+from src.utils.constants import MASK_COLLISIONS
+from src.utils.game_utils import get_colliding_sprite, get_group_collisions
+
+COLUMNS = 12
+ROWS = 6
+BULLETS = 40
+HITS = 3
+ASTEROIDS = 8
+REPEATS = 200
+RUNS = 30
+
+
+def make_game():
+    """Return the parts of the game that the sprites need."""
+    settings = Settings()
+    settings.bounds.refresh(screen, settings.game_modes)
+    ship = pygame.sprite.Sprite()
+    ship.image = pygame.Surface((60, 60))
+    ship.rect = ship.image.get_rect(midbottom=(630, 700))
+    ship.state = SimpleNamespace(exploding=False)
+    game = SimpleNamespace(
+        screen=screen,
+        settings=settings,
+        stats=SimpleNamespace(level=1),
+        aliens=pygame.sprite.Group(),
+        thunderbird_ship=ship,
+        weapons={"thunderbird": {"weapon": pygame.Surface((6, 20))}},
+    )
+    return game, ship
+
+
+def make_sprites(game, ship):
+    """Return a full fleet with bullets in flight, a laser on the boss
+    and falling asteroids.
+    """
+    aliens = game.aliens
+    for row in range(ROWS):
+        for column in range(COLUMNS):
+            alien = Alien(game)
+            alien.rect.topleft = (40 + column * 100, 40 + row * 70)
+            aliens.add(alien)
+    boss = BossAlien(game)
+    # Below the fleet, centered on the gap between two columns.
+    boss.rect.midtop = (610, 450)
+    aliens.add(boss)
+
+    bullets = pygame.sprite.Group()
+    for i in range(BULLETS):
+        bullet = Thunderbolt(game, ship)
+        # Bullets fly between the columns, the first ones hit an alien.
+        bullet.rect.topleft = (110 + i % COLUMNS * 100, 30 + i * 53 % 560)
+        if i < HITS:
+            bullet.rect.center = aliens.sprites()[i * 7].rect.center
+        bullets.add(bullet)
+
+    laser = pygame.sprite.Group(Laser(game, ship))
+    laser.sprites()[0].rect.midbottom = boss.rect.midbottom
+
+    asteroids = pygame.sprite.Group()
+    for i in range(ASTEROIDS):
+        asteroid = Asteroid(game)
+        asteroid.rect.topleft = (75 + i * 150, 580)
+        asteroids.add(asteroid)
+
+    return aliens, bullets, laser, asteroids
+
+
+def rect_frame(ship, aliens, bullets, laser, asteroids):
+    """The collision checks of one frame, with pygame rect collisions."""
+    pygame.sprite.groupcollide(bullets, aliens, False, False)
+    pygame.sprite.groupcollide(laser, aliens, False, False)
+    pygame.sprite.spritecollideany(ship, aliens)
+    pygame.sprite.spritecollideany(ship, asteroids)
+    for bullet in bullets:
+        pygame.sprite.spritecollideany(bullet, asteroids)
+
+
+def precise_frame(ship, aliens, bullets, laser, asteroids):
+    """The collision checks of one frame, with the precise collisions."""
+    get_group_collisions(bullets, aliens)
+    get_group_collisions(laser, aliens)
+    get_colliding_sprite(ship, aliens)
+    get_colliding_sprite(ship, asteroids)
+    for bullet in bullets:
+        get_colliding_sprite(bullet, asteroids)
+
+
+def all_masks(check):
+    """Return the check, run with precise collisions for every entity type."""
+
+    def run(*sprites):
+        saved = dict(MASK_COLLISIONS)
+        MASK_COLLISIONS.update(dict.fromkeys(MASK_COLLISIONS, True))
+        check(*sprites)
+        MASK_COLLISIONS.update(saved)
+
+    return run
+
+
+def main():
+    """Run the benchmark and print the cost per frame."""
+    game, ship = make_game()
+    sprites = (ship, *make_sprites(game, ship))
+    hits = sum(
+        len(hit)
+        for group in sprites[2:4]
+        for hit in pygame.sprite.groupcollide(group, sprites[1], False, False).values()
+    )
+    print(f"{len(sprites[1])} aliens, {BULLETS} bullets, {hits} rect hits per frame")
+
+    cases = {
+        "rects only": rect_frame,
+        "default masks": precise_frame,
+        "masks for every type": all_masks(precise_frame),
+    }
+    # The cases take turns so that they all see the same machine load.
+    best = dict.fromkeys(cases, float("inf"))
+    for _ in range(RUNS):
+        for name, check in cases.items():
+            seconds = timeit.timeit(lambda: check(*sprites), number=REPEATS)
+            best[name] = min(best[name], seconds / REPEATS * 1e6)
+
+    rect_only = best["rects only"]
+    for name, micros in best.items():
+        print(f"{name:<24}{micros:>10.1f} us{(micros / rect_only - 1) * 100:>+8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Memory check of a long Endless Onslaught session. A bot match is played
+headless with tracemalloc on, and every few thousand frames the traced
+memory and the live aliens, bosses, missiles, lasers and surfaces are
+printed, with the counts that kept growing over the last samples.
+
+Run it from the project folder with:
+    python -m benchmarks.endless_memory --frames 60000
+"""
+
+import argparse
+import os
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+from src.alien_onslaught import AlienOnslaught
+from src.game_logic.bot_match import BotPilot, MatchConfig, SimulatedClock, setup_match
+from src.managers.memory_manager import MemoryManager
+
+COUNTS = ("traced_kb", "Alien", "BossAlien", "Missile", "Laser", "Surface")
+
+
+def parse_args():
+    """Return the options of the check."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=36000)
+    parser.add_argument("--every", type=int, default=3600)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def main():
+    """Play the session and print the samples."""
+    args = parse_args()
+    game = AlienOnslaught()
+    config = MatchConfig(args.seed, game_mode="endless_onslaught")
+    tracemalloc.start()
+    memory = MemoryManager(game)
+
+    print(f"{'frame':>7}{'level':>6}" + "".join(f"{name:>11}" for name in COUNTS))
+    clock = SimulatedClock()
+    with clock.use():
+        setup_match(game, config)
+        pilots = [BotPilot(game, ship, args.seed) for ship in game.ships]
+        for frame in range(1, args.frames + 1):
+            for ship in game.ships:
+                # Keep the bots alive, only the memory is of interest.
+                ship.state.alive = True
+            for pilot in pilots:
+                pilot.fly()
+            game.update_simulation()
+            clock.tick()
+
+            if frame % args.every == 0:
+                record = memory.sample()
+                print(
+                    f"{frame:>7}{record['level']:>6}"
+                    + "".join(f"{record[name]:>11}" for name in COUNTS)
+                )
+                if "growing" in record:
+                    print("  growing:", ", ".join(record["growing"]))
+                    for line in record.get("top_allocations", ()):
+                        print("   ", line)
+
+
+if __name__ == "__main__":
+    main()
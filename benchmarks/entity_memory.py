@@ -0,0 +1,112 @@
+"""
+Memory report for the sprites that the game creates in large numbers.
+Every entity type is created in bulk while tracemalloc follows the Python
+allocations, the report shows the bytes used by each entity. The pixels
+of the images are allocated by SDL, they are reported separately for the
+images that an entity doesn't share with the others.
+
+Run it from the project folder with:
+    python -m benchmarks.entity_memory
+"""
+
+import os
+import tracemalloc
+from collections import Counter
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((1260, 700))
+
+# pylint: disable=wrong-import-position
+from src.entities.alien_entities.alien_bullets import AlienBullet
+from src.entities.alien_entities.aliens import Alien
+from src.entities.asteroid import Asteroid
+from src.entities.powers import Power
+from src.entities.projectiles.player_bullets import Thunderbolt
+from src.game_logic.game_settings import Settings
+
+ALIENS = 500
+PROJECTILES = 200
+OTHERS = 50
+
+
+def make_game():
+    """Return the parts of the game that the sprites need."""
+    settings = Settings()
+    settings.bounds.refresh(screen, settings.game_modes)
+    ship = SimpleNamespace(rect=pygame.Rect(600, 600, 60, 60))
+    game = SimpleNamespace(
+        screen=screen,
+        settings=settings,
+        stats=SimpleNamespace(level=1),
+        aliens=pygame.sprite.Group(),
+        thunderbird_ship=ship,
+        weapons={"thunderbird": {"weapon": pygame.Surface((6, 20))}},
+    )
+    return game, ship
+
+
+def get_images(entity):
+    """Return the distinct surfaces referenced by an entity."""
+    names = set(getattr(entity, "__dict__", ()))
+    for cls in type(entity).__mro__:
+        names.update(getattr(cls, "__slots__", ()))
+    values = (getattr(entity, name, None) for name in names)
+    return {
+        id(value): value for value in values if isinstance(value, pygame.Surface)
+    }.values()
+
+
+def measure(create, count):
+    """Return the Python bytes and the unshared pixel bytes per entity."""
+    # The first entity loads what is shared by all of them.
+    create()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entities = [create() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    python_bytes = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    owners = Counter(id(image) for entity in entities for image in get_images(entity))
+    pixel_bytes = sum(
+        image.get_width() * image.get_height() * image.get_bytesize()
+        for entity in entities
+        for image in get_images(entity)
+        if owners[id(image)] == 1
+    )
+    return python_bytes / count, pixel_bytes / count
+
+
+def main():
+    """Create the entities and print the memory used by each one."""
+    game, ship = make_game()
+    for _ in range(ALIENS):
+        game.aliens.add(Alien(game))
+
+    cases = {
+        "Alien": (lambda: Alien(game), ALIENS),
+        "Thunderbolt": (lambda: Thunderbolt(game, ship), PROJECTILES // 2),
+        "AlienBullet": (lambda: AlienBullet(game), PROJECTILES // 2),
+        "Asteroid": (lambda: Asteroid(game), OTHERS),
+        "Power": (lambda: Power(game), OTHERS),
+    }
+
+    print(f"{'':<14}{'count':>7}{'python':>12}{'pixels':>12}{'total':>12}")
+    total = 0
+    for name, (create, count) in cases.items():
+        python_bytes, pixel_bytes = measure(create, count)
+        total += (python_bytes + pixel_bytes) * count
+        print(
+            f"{name:<14}{count:>7}{python_bytes:>10.0f} B{pixel_bytes:>10.0f} B"
+            f"{(python_bytes + pixel_bytes) * count / 1024:>9.1f} KB"
+        )
+    print(f"{'all entities':<14}{'':>31}{total / 1024:>9.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
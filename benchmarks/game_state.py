@@ -0,0 +1,79 @@
+"""
+Benchmark for the snapshots of the game state, in the middle of a level
+with a full alien fleet, projectiles, powers and asteroids on the screen.
+The snapshots alone and the snapshot and restore round trips are timed.
+
+Run it from the project folder with:
+    python -m benchmarks.game_state
+"""
+
+import os
+import timeit
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# pylint: disable=wrong-import-position
+from src.alien_onslaught import AlienOnslaught
+from src.entities.asteroid import Asteroid
+from src.entities.projectiles.missile import Missile
+from src.entities.projectiles.player_bullets import Firebird, Thunderbolt
+
+ROWS = 5
+POWERS = 3
+ASTEROIDS = 4
+BULLETS = 6
+REPEATS = 200
+RUNS = 10
+
+
+def make_game():
+    """Return a game in the middle of a level."""
+    with patch("src.alien_onslaught.pygame.display.set_mode") as set_mode:
+        set_mode.return_value = pygame.Surface((1260, 700))
+        game = AlienOnslaught(singleplayer=False)
+
+    game.aliens_manager.create_fleet(ROWS)
+    for _ in range(POWERS):
+        game.powers_manager.create_power_up_or_penalty()
+    for i in range(ASTEROIDS):
+        asteroid = Asteroid(game)
+        asteroid.rect.topleft = (100 + i * 250, 300)
+        game.asteroids.add(asteroid)
+    for ship, bullet_class in zip(game.ships, (Thunderbolt, Firebird)):
+        bullets = getattr(game, f"{ship.ship_type}_bullets")
+        for i in range(BULLETS):
+            bullet = bullet_class(game.weapons_manager, ship)
+            bullet.rect.y -= i * 80
+            bullets.add(bullet)
+        game.weapons_manager.fire_missile(
+            getattr(game, f"{ship.ship_type}_missiles"), ship, Missile
+        )
+    return game
+
+
+def main():
+    """Run the benchmark and print the snapshots per second."""
+    game = make_game()
+    game_state = game.game_state
+    print(sum(len(group) for group in game.sprite_groups), "sprites")
+
+    cases = {
+        "snapshot": game_state.snapshot,
+        "snapshot and restore": lambda: game_state.restore(game_state.snapshot()),
+    }
+    best = dict.fromkeys(cases, float("inf"))
+    for _ in range(RUNS):
+        for name, case in cases.items():
+            seconds = timeit.timeit(case, number=REPEATS)
+            best[name] = min(best[name], seconds / REPEATS)
+
+    for name, seconds in best.items():
+        print(f"{name:<24}{seconds * 1e6:>10.1f} us{1 / seconds:>10.0f} per second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Nightly match farm. Thousands of seeded bot matches are played headless on
+every core, going through every difficulty, game mode, ship loadout and
+number of players, and the results are summed up in a report: the win
+rate, the level reached, the mean and worst cost of a frame and the peak
+entity counts, followed by the frame cost of every level. Comparing two
+reports shows the balance changes and the levels where the frames go over
+their budget.
+
+Run it from the project folder with:
+    python -m benchmarks.match_farm --matches 2000 --json report.json
+"""
+
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+from src.utils.constants import FARM_MAX_FRAMES
+from src.utils.match_farm import (
+    format_errors,
+    format_report,
+    get_level_costs,
+    make_configs,
+    run_farm,
+    summarize,
+)
+
+
+def parse_args():
+    """Return the options of the farm."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=FARM_MAX_FRAMES)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--json", help="also write the report to this file")
+    return parser.parse_args()
+
+
+def main():
+    """Play the matches and print the report."""
+    args = parse_args()
+    configs = make_configs(args.matches, args.seed, args.frames)
+
+    start = time.perf_counter()
+    results = run_farm(configs, args.processes)
+    seconds = time.perf_counter() - start
+
+    rows = summarize(results)
+    level_costs = get_level_costs(results)
+    errors = format_errors(results)
+    print(format_report(rows, level_costs))
+    if errors:
+        print(f"\n{len(errors)} matches failed:")
+        print("\n".join(errors))
+    print(f"\n{len(results)} matches in {seconds:.1f} s")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "matches": rows,
+                    "levels": [
+                        {"level": level, "frames": frames, "frame_ms": cost * 1000}
+                        for level, frames, cost in level_costs
+                    ],
+                    "errors": errors,
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Micro-benchmark for the per-sprite work done every frame: the alien edge
+checks, the player bullet update and the culling of sprites that left the
+screen. Each case is timed the way it was done before the world bounds
+were added and the way it is done now.
+
+Run it from the project folder with:
+    python -m benchmarks.sprite_updates
+"""
+
+import os
+import timeit
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((1260, 700))
+
+# pylint: disable=wrong-import-position
+from src.entities.alien_entities.aliens import Alien
+from src.entities.projectiles.bullet import Bullet
+from src.game_logic.game_settings import Settings
+from src.utils.game_utils import remove_sprites_below, remove_sprites_outside
+
+SPRITES = 1000
+REPEATS = 200
+
+
+def legacy_check_edges(alien):
+    """The edge check as it was, with a screen.get_rect() call per alien."""
+    screen_rect = alien.screen.get_rect()
+    return alien.rect.right >= screen_rect.right or alien.rect.left <= 0
+
+
+def legacy_bullet_update(bullet):
+    """The bullet update as it was, reaching through the game settings."""
+    if bullet.game.settings.game_modes.cosmic_conflict:
+        bullet.x_pos += bullet.speed
+        bullet.rect.x = int(bullet.x_pos)
+    else:
+        bullet.y_pos -= bullet.speed
+        bullet.rect.y = int(bullet.y_pos)
+
+
+def legacy_cull_below(group, bottom):
+    """The culling as it was, copying the group and removing one by one."""
+    for sprite in group.copy():
+        if sprite.rect.y > bottom:
+            group.remove(sprite)
+
+
+def legacy_cull_outside(group, area):
+    """The projectile culling as it was."""
+    for sprite in group.copy():
+        if not screen.get_rect().colliderect(sprite.rect):
+            group.remove(sprite)
+
+
+def make_game():
+    """Return the parts of the game that the sprites need."""
+    settings = Settings()
+    settings.bounds.refresh(screen, settings.game_modes)
+    ship = SimpleNamespace(rect=pygame.Rect(600, 600, 40, 40))
+    return (
+        SimpleNamespace(
+            screen=screen,
+            settings=settings,
+            stats=SimpleNamespace(level=1),
+            aliens=pygame.sprite.Group(),
+            thunderbird_ship=ship,
+        ),
+        ship,
+    )
+
+
+def make_group(game, ship, offscreen_every=10):
+    """Return a group of bullets, some of them below the screen."""
+    group = pygame.sprite.Group()
+    image = pygame.Surface((4, 10))
+    for i in range(SPRITES):
+        bullet = Bullet(game, image, ship, 5.0)
+        bullet.rect.y = 900 if i % offscreen_every == 0 else 300
+        group.add(bullet)
+    return group
+
+
+def per_sprite(seconds):
+    """Return the time per sprite in nanoseconds."""
+    return seconds / (REPEATS * SPRITES) * 1e9
+
+
+def report(name, before, after):
+    """Print one row of the results."""
+    print(
+        f"{name:<22}{per_sprite(before):>10.1f} ns{per_sprite(after):>10.1f} ns"
+        f"{before / after:>8.1f}x"
+    )
+
+
+def main():
+    """Run every benchmark and print the cost per sprite."""
+    game, ship = make_game()
+    aliens = [Alien(game) for _ in range(SPRITES)]
+    bullets = make_group(game, ship).sprites()
+    bottom = game.settings.bounds.rect.bottom
+    area = game.settings.bounds.rect
+
+    print(f"{SPRITES} sprites, {REPEATS} frames")
+    print(f"{'':<22}{'before':>13}{'after':>13}")
+
+    report(
+        "alien edge check",
+        timeit.timeit(lambda: [legacy_check_edges(a) for a in aliens], number=REPEATS),
+        timeit.timeit(lambda: [a.check_edges() for a in aliens], number=REPEATS),
+    )
+    report(
+        "bullet update",
+        timeit.timeit(
+            lambda: [legacy_bullet_update(b) for b in bullets], number=REPEATS
+        ),
+        timeit.timeit(lambda: [b.update() for b in bullets], number=REPEATS),
+    )
+
+    groups = [make_group(game, ship) for _ in range(REPEATS)]
+    before = timeit.timeit(
+        lambda: legacy_cull_below(groups.pop(), bottom), number=REPEATS
+    )
+    groups = [make_group(game, ship) for _ in range(REPEATS)]
+    after = timeit.timeit(
+        lambda: remove_sprites_below(groups.pop(), bottom), number=REPEATS
+    )
+    report("cull below screen", before, after)
+
+    groups = [make_group(game, ship) for _ in range(REPEATS)]
+    before = timeit.timeit(
+        lambda: legacy_cull_outside(groups.pop(), area), number=REPEATS
+    )
+    groups = [make_group(game, ship) for _ in range(REPEATS)]
+    after = timeit.timeit(
+        lambda: remove_sprites_outside(groups.pop(), area), number=REPEATS
+    )
+    report("cull outside screen", before, after)
+
+
+if __name__ == "__main__":
+    main()
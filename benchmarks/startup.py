@@ -0,0 +1,115 @@
+"""
+Startup report of the game, from a cold interpreter to the first frame
+of the main menu. The modules that take the longest to import are measured
+with `python -X importtime` in a new interpreter, so that nothing is
+already imported. The game is then started in this process and the time
+of every constructor called by AlienOnslaught is reported, followed by
+the first frame of the menu.
+
+Run it from the project folder with:
+    python -m benchmarks.startup
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+GAME_MODULE = "src.alien_onslaught"
+TOP_MODULES = 15
+
+
+def get_import_times(module):
+    """Import a module in a new interpreter and return the self and the
+    cumulative import time in milliseconds of every module it imports.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times.append((int(self_us) / 1000, int(cumulative_us) / 1000, name.strip()))
+    return times
+
+
+def report_imports(module):
+    """Print the modules with the highest self import time."""
+    times = get_import_times(module)
+    total = next(cumulative for _, cumulative, name in times if name == module)
+    print(f"Cold import of {module}: {total:.1f} ms")
+    print(f"{'self':>10}{'cumulative':>12}  module")
+    for self_ms, cumulative_ms, name in sorted(times, reverse=True)[:TOP_MODULES]:
+        print(f"{self_ms:>7.1f} ms{cumulative_ms:>9.1f} ms  {name}")
+    print()
+
+
+def timed(cls, timings):
+    """Return a constructor of the class that records its time."""
+
+    def create(*args, **kwargs):
+        start = time.perf_counter()
+        instance = cls(*args, **kwargs)
+        timings.append((cls.__name__, time.perf_counter() - start))
+        return instance
+
+    return create
+
+
+def start_game():
+    """Start the game in this process and return the time of every phase."""
+    phases = []
+    start = time.perf_counter()
+    game_module = importlib.import_module(GAME_MODULE)
+    phases.append(("import", time.perf_counter() - start))
+
+    # The classes the game creates are looked up in the globals of its module.
+    constructors = []
+    for name, value in list(vars(game_module).items()):
+        if (
+            isinstance(value, type)
+            and value.__module__.startswith("src.")
+            and value is not game_module.AlienOnslaught
+        ):
+            setattr(game_module, name, timed(value, constructors))
+
+    start = time.perf_counter()
+    game = game_module.AlienOnslaught()
+    init_time = time.perf_counter() - start
+    phases.extend(constructors)
+    phases.append(
+        ("rest of __init__", init_time - sum(seconds for _, seconds in constructors))
+    )
+
+    start = time.perf_counter()
+    game.sound_manager.load_sounds("menu_sounds")
+    game.screen_manager.draw_menu_objects(game.bg_img, game.bg_img_rect)
+    game.screen_manager.draw_cursor()
+    game.display_manager.present()
+    phases.append(("first menu frame", time.perf_counter() - start))
+    return phases
+
+
+def main():
+    """Print the import times and the startup phases of the game."""
+    report_imports(GAME_MODULE)
+
+    phases = start_game()
+    print("Startup phases")
+    for name, seconds in phases:
+        print(f"{seconds * 1000:>7.1f} ms  {name}")
+    total = sum(seconds for _, seconds in phases)
+    print(f"{total * 1000:>7.1f} ms  menu visible")
+
+
+if __name__ == "__main__":
+    main()
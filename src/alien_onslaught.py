@@ -15,6 +15,8 @@ Contact: quality_xqs@yahoo.com
 
 """
 
+from functools import cached_property
+
 import pygame
 
 from src.game_logic.game_settings import Settings
@@ -22,11 +24,12 @@ from src.game_logic.game_stats import GameStats
 from src.game_logic.collision_detection import CollisionManager
 from src.game_logic.input_handling import PlayerInput
 from src.game_logic.gameplay_handler import GameplayHandler
+from src.game_logic.game_events import EventBus
+from src.game_logic.game_state import GameState
 
 from src.utils.game_utils import (
     resize_image,
     play_sound,
-    play_music,
 )
 
 from src.ui.scoreboards import ScoreBoard
@@ -34,17 +37,22 @@ from src.ui.scoreboards import ScoreBoard
 from src.managers.powers_manager import PowerEffectsManager
 from src.managers.asteroids_manager import AsteroidsManager
 from src.managers.sounds_manager import SoundManager
+from src.managers.fx_manager import FXManager
 from src.managers.game_over_manager import EndGameManager
 from src.managers.alien_managers.alien_bullets_manager import AlienBulletsManager
 from src.managers.alien_managers.aliens_manager import AliensManager
 from src.managers.ui_managers.screen_manager import ScreenManager
+from src.managers.ui_managers.display_manager import DisplayManager, RESIZE_EVENTS
 from src.managers.ui_managers.loading_screen import LoadingScreen
 from src.managers.ui_managers.buttons_manager import GameButtonsManager
 from src.managers.player_managers.weapons_manager import WeaponsManager
 from src.managers.high_score_manager import HighScoreManager
+from src.managers.memory_manager import MemoryManager
+from src.managers.telemetry_manager import TelemetryManager
 from src.managers.player_managers.ships_manager import ShipsManager
 from src.managers.player_managers.ship_selection_manager import ShipSelection
 from src.managers.save_load_manager import SaveLoadSystem
+from src.utils.save_writer import SAVE_COMPLETED_EVENT
 
 
 class AlienOnslaught:
@@ -60,26 +68,27 @@ class AlienOnslaught:
         self.singleplayer = singleplayer
         self.clock = pygame.time.Clock()
         self.settings = Settings()
-        self.screen = pygame.display.set_mode(
-            (self.settings.screen_width, self.settings.screen_height), pygame.RESIZABLE
-        )
+        # The game is drawn on a canvas of a fixed size that is scaled to the window.
+        self.display_manager = DisplayManager(self.settings)
+        self.screen = self.display_manager.canvas
         self.bg_img = resize_image(self.settings.bg_img, self.screen.get_size())
         self.bg_img_rect = self.bg_img.get_rect()
         self.reset_bg = self.bg_img.copy()
 
-        self.second_bg = resize_image(self.settings.second_bg, self.screen.get_size())
-        self.third_bg = resize_image(self.settings.third_bg, self.screen.get_size())
-        self.fourth_bg = resize_image(self.settings.fourth_bg, self.screen.get_size())
-
         self.ui_options = self.settings.ui_options
         self.ships = []
         self.music_muted = False
         self.sfx_muted = False
+        self.events = EventBus()
         self._initialize_game_objects()
         self._initialize_sprite_groups()
         self.initialize_managers()
 
         self.pause_time = 0
+        # Unlike pause_time, which the timed weapons and powers reset,
+        # the time paused in the current match is only reset with it.
+        self.match_pause_time = 0
+        self.match_start_time = 0
         self.game_loaded = False
 
         pygame.display.set_icon(self.settings.game_icon)
@@ -93,10 +102,7 @@ class AlienOnslaught:
         self.ships = [self.thunderbird_ship, self.phoenix_ship]
         self.stats = GameStats(self, self.phoenix_ship, self.thunderbird_ship)
         self.score_board = ScoreBoard(self)
-        self.loading_screen = LoadingScreen(self.screen)
-        self.ship_selection = ShipSelection(
-            self, self.screen, self.thunderbird_ship.anims.ship_images, self.settings
-        )
+        self.loading_screen = LoadingScreen(self.screen, self.display_manager)
 
     @property
     def singleplayer(self):
@@ -151,6 +157,10 @@ class AlienOnslaught:
     def initialize_managers(self):
         """Initialize the managers and handlers required."""
         self.sound_manager = SoundManager(self)
+        self.events.subscribe(self.sound_manager.play_event_sounds)
+        self.events.subscribe(self.score_board.handle_events)
+        self.fx_manager = FXManager(self)
+        self.events.subscribe(self.fx_manager.handle_events)
         self.buttons_manager = GameButtonsManager(
             self, self.screen, self.ui_options, self.settings.game_modes
         )
@@ -175,22 +185,56 @@ class AlienOnslaught:
         self.game_over_manager = EndGameManager(
             self, self.settings, self.stats, self.screen
         )
-        self.save_load_manager = SaveLoadSystem(self, "save", "save_data")
-        self.high_score_manager = HighScoreManager(self)
+        self.game_state = GameState(self)
+        self.telemetry = TelemetryManager(self)
+        self.memory_manager = MemoryManager(self)
+
+    # The parts of the game that the main menu doesn't need are created on
+    # first use, so that the menu is shown as soon as possible.
+    @cached_property
+    def save_load_manager(self):
+        """The save system, created when the game is first saved or loaded."""
+        return SaveLoadSystem(self, "save", "save_data")
+
+    @cached_property
+    def high_score_manager(self):
+        """The high scores, created when the first game starts."""
+        return HighScoreManager(self)
+
+    @cached_property
+    def ship_selection(self):
+        """The ship selection, created when it is first shown."""
+        return ShipSelection(
+            self, self.screen, self.thunderbird_ship.anims.ship_images, self.settings
+        )
+
+    @cached_property
+    def second_bg(self):
+        """The background of the levels 9 to 16."""
+        return resize_image(self.settings.second_bg, self.screen.get_size())
+
+    @cached_property
+    def third_bg(self):
+        """The background of the levels 17 to 25."""
+        return resize_image(self.settings.third_bg, self.screen.get_size())
+
+    @cached_property
+    def fourth_bg(self):
+        """The background of the levels after 25."""
+        return resize_image(self.settings.fourth_bg, self.screen.get_size())
 
     def run_menu(self):
         """Run the main menu."""
         self.sound_manager.load_sounds("menu_sounds")
-        play_music(self.sound_manager.menu_music, "menu")
+        self.sound_manager.play_menu_music("menu")
         self.sound_manager.check_music_volume()
         self.sound_manager.check_sfx_volume()
         while self.MENU_RUNNING:
             self.handle_menu_events()
-            self.screen_manager.update_window_mode()
             self.screen_manager.draw_menu_objects(self.bg_img, self.bg_img_rect)
             self.sound_manager.check_muted_state()
             self.screen_manager.draw_cursor()
-            pygame.display.flip()
+            self.display_manager.present()
 
     def handle_menu_events(self):
         """Handles events for the main menu."""
@@ -199,7 +243,7 @@ class AlienOnslaught:
                 self.buttons_manager.handle_quit_event()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_f:
-                    self.screen_manager.toggle_window_mode()
+                    self.display_manager.toggle_fullscreen()
                 elif event.key == pygame.K_F1:
                     self.sound_manager.toggle_mute_music("menu")
                 elif event.key == pygame.K_F2:
@@ -208,7 +252,7 @@ class AlienOnslaught:
                 event.type == pygame.MOUSEBUTTONDOWN
                 and event.button == pygame.BUTTON_LEFT
             ):
-                mouse_x, mouse_y = pygame.mouse.get_pos()
+                mouse_x, mouse_y = self.display_manager.get_mouse_pos()
                 if self.buttons_manager.single.rect.collidepoint(mouse_x, mouse_y):
                     self.buttons_manager.handle_single_player_button_click(
                         self.start_single_player_game
@@ -219,14 +263,8 @@ class AlienOnslaught:
                     )
                 elif self.buttons_manager.menu_quit.rect.collidepoint(mouse_x, mouse_y):
                     self.buttons_manager.handle_quit_button_click()
-            elif event.type == pygame.VIDEORESIZE:
-                self.handle_menu_resize_screen_event(event.size)
-
-    def handle_menu_resize_screen_event(self, size):
-        """Handle the event to resize the menu screen."""
-        self.screen_manager.resize_screen(size)
-        self.screen_manager.update_buttons()
-        self.screen_manager.create_controls()
+            elif event.type in RESIZE_EVENTS:
+                self.display_manager.request_resize()
 
     def start_single_player_game(self):
         """Switches the game to singleplayer."""
@@ -264,6 +302,27 @@ class AlienOnslaught:
         self.sound_manager.check_sfx_volume()
         self.run_game()
 
+    def start_headless_match(self, singleplayer):
+        """Start a match without the menu and the game loop, the frames
+        of the match are then run by calling update_simulation.
+        """
+        self.singleplayer = singleplayer
+        if singleplayer:
+            self._set_singleplayer_variables()
+        else:
+            self._set_multiplayer_variables()
+        self.sound_manager.load_sounds("gameplay_sounds")
+        self.sound_manager.music_enabled = False
+        self.ui_options.paused = False
+        self.settings.disable_ui_flags()
+        self._reset_game()
+
+    def update_simulation(self):
+        """Run the game logic of one frame, without drawing it."""
+        self.settings.bounds.refresh(self.screen, self.settings.game_modes)
+        self._handle_game_logic()
+        self.events.dispatch()
+
     def _update_background(self, i):
         """Updates the background image of the game and scrolls it downwards
         to create the effect of movement"""
@@ -282,25 +341,34 @@ class AlienOnslaught:
         self.sound_manager.check_music_volume()
         self.sound_manager.check_sfx_volume()
         while self.GAME_RUNNING:
+            self.settings.bounds.refresh(self.screen, self.settings.game_modes)
             self.check_events()
             self.game_over_manager.check_game_over()
-            self.screen_manager.update_window_mode()
+            self.sound_manager.update_music()
 
             if self.stats.game_active:
                 if not self.ui_options.paused:
                     i = self._update_background(i)
+                    self.player_input.update_ships(
+                        self.weapons_manager.fire_missile,
+                        self.weapons_manager.fire_laser,
+                    )
                     self._handle_game_logic()
 
+                self.events.dispatch()
                 self.sound_manager.check_muted_state()
                 self._update_screen()
                 self._check_for_pause()
             else:
                 self.screen.blit(self.bg_img, [0, 0])
                 self.game_over_manager.check_game_over()
+                self.events.dispatch()
                 self.sound_manager.check_muted_state()
                 self._update_screen()
 
             self.clock.tick(60)
+            self.telemetry.update(self.clock.get_rawtime())
+            self.memory_manager.update()
 
     def _handle_game_logic(self):
         """Call the functions that are handling the game logic."""
@@ -336,11 +404,11 @@ class AlienOnslaught:
 
         self.ships_manager.update_ship_state()
         self.weapons_manager.update_laser_status()
-        self.weapons_manager.check_laser_availability()
 
         self.collision_handler.handle_shielded_ship_collisions(
             self.ships, self.aliens, self.alien_bullet, self.asteroids
         )
+        self.fx_manager.update()
 
     def check_events(self):
         """Respond to keyboard, mouse and videoresize events."""
@@ -354,11 +422,9 @@ class AlienOnslaught:
                         self._reset_game,
                         self.run_menu,
                         self.game_over_manager.return_to_game_menu,
-                        self.weapons_manager.fire_missile,
-                        self.weapons_manager.fire_laser,
                     )
                 if event.key == pygame.K_f:
-                    self.screen_manager.toggle_window_mode()
+                    self.display_manager.toggle_fullscreen()
                 elif event.key == pygame.K_F1:
                     self.sound_manager.toggle_mute_music("game")
                 elif event.key == pygame.K_F2:
@@ -370,12 +436,16 @@ class AlienOnslaught:
                 event.type == pygame.MOUSEBUTTONDOWN
                 and event.button == pygame.BUTTON_LEFT
             ):
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = self.display_manager.get_mouse_pos()
                 self._check_buttons(mouse_pos)
                 self.ship_selection.handle_ship_selection(mouse_pos)
-            elif event.type == pygame.VIDEORESIZE:
-                self.screen_manager.resize_screen(event.size)
-                self.screen_manager.update_buttons()
+            elif event.type in RESIZE_EVENTS:
+                self.display_manager.request_resize()
+            elif event.type == SAVE_COMPLETED_EVENT:
+                self.save_load_manager.handle_save_completed(event)
+                self.telemetry.record_event(
+                    "save", slot=event.slot, success=event.success
+                )
 
     def _check_buttons(self, mouse_pos):
         """Check for UI buttons being clicked and act accordingly."""
@@ -396,15 +466,16 @@ class AlienOnslaught:
 
     def _handle_background_change(self):
         """Change the background image based on the level ranges."""
+        # Only the background of the current level is loaded.
         bg_images = {
-            range(1, 9): self.reset_bg,
-            range(9, 17): self.second_bg,
-            range(17, 26): self.third_bg,
+            range(1, 9): "reset_bg",
+            range(9, 17): "second_bg",
+            range(17, 26): "third_bg",
         }
 
-        for level_range, bg_image in bg_images.items():
+        for level_range, bg_name in bg_images.items():
             if self.stats.level in level_range:
-                self.bg_img = bg_image
+                self.bg_img = getattr(self, bg_name)
                 break
         else:
             self.bg_img = self.fourth_bg if self.stats.level > 25 else self.bg_img
@@ -418,6 +489,8 @@ class AlienOnslaught:
                 if not self.ui_options.paused:
                     pause_end_time = pygame.time.get_ticks()
                     self.pause_time += pause_end_time - pause_start_time
+                    self.match_pause_time += pause_end_time - pause_start_time
+                    self.telemetry.skip_frame()
                     break
 
     def apply_game_mode_behaviors(self):
@@ -462,6 +535,7 @@ class AlienOnslaught:
         """Start a new game."""
         # Clear the screen of remaining entities
         self.gameplay_manager.reset_game_objects()
+        self.fx_manager.clear()
 
         # Check if a new game is started or loaded from a savefile
         self.check_game_loaded()
@@ -470,6 +544,8 @@ class AlienOnslaught:
         self.stats.game_active = True
         self.ui_options.high_score_saved = False
         self.ui_options.game_over_sound_played = False
+        self.match_start_time = pygame.time.get_ticks()
+        self.match_pause_time = 0
 
         # Play the warp animation and center the ships.
         self.player_input.reset_ship_flags()
@@ -539,6 +615,7 @@ class AlienOnslaught:
             for sprite in group.sprites():
                 sprite.draw()
 
+        self.fx_manager.draw()
         self.score_board.show_score()
 
     def _update_screen(self):
@@ -552,7 +629,10 @@ class AlienOnslaught:
         else:
             self._update_game_screen_components()
 
-        pygame.display.flip()
+        # Only a save system that was already created can have a message.
+        if "save_load_manager" in vars(self):
+            self.save_load_manager.draw_save_message()
+        self.display_manager.present()
 
     def _update_game_screen_components(self):
         """Update and draw various components on the screen."""
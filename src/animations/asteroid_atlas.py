@@ -0,0 +1,92 @@
+"""
+The 'asteroid_atlas' module contains the AsteroidAtlas class that holds
+the animation frames shared by every asteroid.
+"""
+
+import pygame
+
+from src.utils.constants import (
+    ASTEROID_FRAMES,
+    ASTEROID_FRAMES_NUM,
+    ASTEROID_ROTATION_STEPS,
+)
+from src.utils.game_utils import load_frames
+
+
+class AsteroidAtlas:
+    """This class packs the asteroid frames, cropped to the area they
+    actually use, into a single surface. The frames are subsurfaces of it.
+    Every asteroid shares one animation phase that is advanced once per
+    frame, an asteroid only keeps its offset into the phase table.
+    With rotation steps, the frames are rotated copies of the first frame
+    instead of the full set of animation frames.
+    """
+
+    shared = None
+
+    def __init__(self, frames, cycle_length, rotation_steps=0):
+        if rotation_steps:
+            frames = [
+                pygame.transform.rotate(frames[0], -360 * step / rotation_steps)
+                for step in range(rotation_steps)
+            ]
+
+        self.atlas, self.frames = self._pack(frames)
+        # The image shown at each tick of the animation cycle.
+        self.table = [
+            self.frames[tick * len(self.frames) // cycle_length]
+            for tick in range(cycle_length)
+        ]
+        self.phase = 0
+
+    @classmethod
+    def get(cls):
+        """Return the shared atlas, loading the frames on first use."""
+        if cls.shared is None:
+            frames_num = 1 if ASTEROID_ROTATION_STEPS else ASTEROID_FRAMES_NUM
+            cls.shared = cls(
+                load_frames(ASTEROID_FRAMES, frames_num),
+                ASTEROID_FRAMES_NUM,
+                ASTEROID_ROTATION_STEPS,
+            )
+        return cls.shared
+
+    @staticmethod
+    def _pack(frames):
+        """Copy the frames next to each other in one surface and
+        return it with a subsurface for every frame.
+        """
+        # The visible area of each frame, relative to its center.
+        areas = [
+            frame.get_bounding_rect().move(
+                -(frame.get_width() // 2), -(frame.get_height() // 2)
+            )
+            for frame in frames
+        ]
+        cell = areas[0].unionall(areas[1:])
+
+        atlas = pygame.Surface((cell.width * len(frames), cell.height), pygame.SRCALPHA)
+        subsurfaces = []
+        for i, frame in enumerate(frames):
+            subsurface = atlas.subsurface((i * cell.width, 0), cell.size)
+            # Copy the pixels as they are, without blending them.
+            subsurface.blit(
+                frame,
+                (-cell.x - frame.get_width() // 2, -cell.y - frame.get_height() // 2),
+                special_flags=pygame.BLEND_RGBA_MAX,
+            )
+            subsurfaces.append(subsurface)
+
+        return atlas, subsurfaces
+
+    def advance(self):
+        """Move the shared animation to its next tick."""
+        self.phase = (self.phase + 1) % len(self.table)
+
+    def frame(self, offset):
+        """Return the image for an asteroid with the given phase offset."""
+        return self.table[(self.phase + offset) % len(self.table)]
+
+    def memory_size(self):
+        """Return the number of bytes used by the frames."""
+        return self.atlas.get_width() * self.atlas.get_height() * 4
@@ -11,19 +11,22 @@ import random
 import pygame
 from pygame.sprite import Sprite
 
-from src.utils.constants import LEVEL_PREFIX, ALIEN_BULLETS_IMG
-from src.utils.game_utils import (
-    load_alien_bullets,
-    load_boss_bullets,
-    load_single_image,
-)
+from src.utils.constants import LEVEL_PREFIX
+from src.utils.game_utils import load_alien_bullets, load_boss_bullets
 from src.entities.alien_entities.aliens import BossAlien
 
 
 class AlienBullet(Sprite):
     """A class that manages bullets for the aliens."""
 
-    bullet_images = load_alien_bullets()
+    bullet_images = None
+
+    @classmethod
+    def get_images(cls):
+        """Return the alien bullet images, loading them for the first bullet."""
+        if cls.bullet_images is None:
+            cls.bullet_images = load_alien_bullets()
+        return cls.bullet_images
 
     def __init__(self, game):
         super().__init__()
@@ -31,7 +34,7 @@ class AlienBullet(Sprite):
         self.settings = game.settings
         level_prefix = LEVEL_PREFIX.get(game.stats.level // 4 + 1, "Alien7")
         bullet_name = f"alien_bullet{level_prefix[-1]}"
-        self.image = load_single_image(ALIEN_BULLETS_IMG[bullet_name])
+        self.image = self.get_images()[bullet_name]
         self.rect = self.image.get_rect()
         self._choose_random_alien(game)
 
@@ -66,7 +69,14 @@ class AlienBullet(Sprite):
 class BossBullet(Sprite):
     """A class that manages bullets for the boss alien."""
 
-    bullet_images = load_boss_bullets()
+    bullet_images = None
+
+    @classmethod
+    def get_images(cls):
+        """Return the boss bullet images, loading them for the first bullet."""
+        if cls.bullet_images is None:
+            cls.bullet_images = load_boss_bullets()
+        return cls.bullet_images
 
     def __init__(self, game, alien):
         """Initialize a new bullet for an alien."""
@@ -74,7 +84,7 @@ class BossBullet(Sprite):
         self.screen = game.screen
         self.settings = game.settings
         self.alien = alien
-        self.image = self.bullet_images["boss_bullet2"]
+        self.image = self.get_images()["boss_bullet2"]
         self.rect = self.image.get_rect()
         self._init_variables(alien)
         self._update_image(game)
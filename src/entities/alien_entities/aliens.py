@@ -12,8 +12,8 @@ import random
 
 
 from pygame.sprite import Sprite
-from src.animations.entities_animations import DestroyAnim, Immune
 from src.managers.alien_managers.aliens_behaviors import AlienMovement, AlienAnimation
+from src.utils.animation_constants import alien_immune_frames
 from src.utils.game_utils import load_boss_images
 
 
@@ -22,8 +22,8 @@ class Alien(Sprite):
 
     def __init__(self, game, baby_location=0, is_baby=False):
         """Initializes the Alien object and also creates instances of the
-        AlienMovement, AlienAnimation, DestroyAnim, and Immune classes which manage the
-        alien's movement, animation, destruction animation and immune state.
+        AlienMovement and AlienAnimation classes which manage the
+        alien's movement and animation.
         """
         super().__init__()
         self.aliens = game.aliens
@@ -38,14 +38,15 @@ class Alien(Sprite):
         self.frozen_state = False
         self.frozen_start_time = 0
         self.immune_start_time = 0
+        self.immune_frame = 0
         self.is_baby = is_baby
         self.baby_location = baby_location
+        # Set by the FleetEngine when it updates this alien.
+        self.fleet = None
 
         self.motion = AlienMovement(self, game)
         self.animation = AlienAnimation(self, game)
         self._init_position()
-        self.destroy = DestroyAnim(self)
-        self.immune = Immune(self)
         self.image = self.animation.get_current_image()
 
     def _init_position(self):
@@ -61,12 +62,12 @@ class Alien(Sprite):
 
     def check_edges(self):
         """Return True if alien is at edge of screen."""
-        screen_rect = self.screen.get_rect()
+        screen_rect = self.settings.bounds.rect
         return self.rect.right >= screen_rect.right or self.rect.left <= 0
 
     def check_top_edges(self):
         """Return True if alien is at the top of the screen."""
-        screen_rect = self.screen.get_rect()
+        screen_rect = self.settings.bounds.rect
         return self.rect.top <= screen_rect.top
 
     def update(self):
@@ -90,8 +91,7 @@ class Alien(Sprite):
         self.motion.update_horizontal_position()
 
         if self.immune_state:
-            self.immune.draw_immune_anim()
-            self.immune.update_immune_anim()
+            self.draw_immune()
 
         if (
             self.immune_state
@@ -100,11 +100,8 @@ class Alien(Sprite):
             self.immune_state = False
 
     def destroy_alien(self):
-        """Start the alien's destruction animation and draw it on the screen,
-        and split the alien if necessary."""
-        self.destroy.update_destroy_animation()
-        self.destroy.draw_animation()
-
+        """Split the alien if necessary, the destruction
+        animation is played by the FXManager."""
         if not self.game_modes.last_bullet and (
             not self.is_baby and random.random() <= 0.1
         ):
@@ -122,13 +119,22 @@ class Alien(Sprite):
     def upgrade(self):
         """Set the alien's immune state to True."""
         self.immune_state = True
-        self.immune.immune_rect.center = self.rect.center
         self.immune_start_time = time.time()
+        if self.fleet is not None:
+            self.fleet.refresh_timers(self)
 
     def freeze(self):
         """Set's the alien's frozen state to True."""
         self.frozen_state = True
         self.frozen_start_time = time.time()
+        if self.fleet is not None:
+            self.fleet.refresh_timers(self)
+
+    def draw_immune(self):
+        """Draw the immune animation around the alien and advance it."""
+        image = alien_immune_frames[self.immune_frame]
+        self.screen.blit(image, image.get_rect(center=self.rect.center))
+        self.immune_frame = (self.immune_frame + 1) % len(alien_immune_frames)
 
     def draw(self):
         """Draw the alien on screen."""
@@ -138,16 +144,23 @@ class Alien(Sprite):
 class BossAlien(Sprite):
     """A class that represents bosses."""
 
-    boss_images = load_boss_images()
+    boss_images = None
+
+    @classmethod
+    def get_images(cls):
+        """Return the boss images, loading them for the first boss."""
+        if cls.boss_images is None:
+            cls.boss_images = load_boss_images()
+        return cls.boss_images
 
     def __init__(self, game):
-        """Initializes the BossAlien object and creates instances of AlienMovement
-        and DestroyAnim classes to manage the movement and destruction animation.
+        """Initializes the BossAlien object and creates an instance of
+        AlienMovement to manage the movement.
         """
         super().__init__()
         self.screen = game.screen
         self.settings = game.settings
-        self.image = self.boss_images["boss2"]
+        self.image = self.get_images()["boss2"]
         self._update_image(game)
 
         self.last_bullet_time = 0
@@ -157,6 +170,7 @@ class BossAlien(Sprite):
         self.frozen_start_time = 0
         self.immune_state = False
         self.last_hit_time = 0.0
+        self.fleet = None
 
         self.rect = self.image.get_rect()
         self.rect = self.rect.inflate(-30, 0)
@@ -165,7 +179,6 @@ class BossAlien(Sprite):
         self.x_pos = float(self.rect.x)
 
         self.motion = AlienMovement(self, game)
-        self.destroy = DestroyAnim(self)
 
     def _update_image(self, game):
         """Change the image for the specific boss."""
@@ -195,19 +208,20 @@ class BossAlien(Sprite):
 
     def check_edges(self):
         """Return True if boss is at edge of screen."""
-        screen_rect = self.screen.get_rect()
+        screen_rect = self.settings.bounds.rect
         return self.rect.right >= screen_rect.right or self.rect.left <= 0
 
     def destroy_alien(self):
-        """Set the is_alive attribute to False and display the destroy animation."""
+        """Set the is_alive attribute to False, the explosion
+        is played by the FXManager."""
         self.is_alive = False
-        self.destroy.update_destroy_animation()
-        self.destroy.draw_animation()
 
     def freeze(self):
         """Set's the alien's frozen state to True."""
         self.frozen_state = True
         self.frozen_start_time = time.time()
+        if self.fleet is not None:
+            self.fleet.refresh_timers(self)
 
     def upgrade(self):
         """Increase boss HP."""
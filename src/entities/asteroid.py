@@ -3,7 +3,7 @@
 import random
 
 from pygame.sprite import Sprite
-from src.utils.animation_constants import asteroid_frames
+from src.animations.asteroid_atlas import AsteroidAtlas
 
 
 class Asteroid(Sprite):
@@ -15,23 +15,23 @@ class Asteroid(Sprite):
         self.settings = game.settings
         self.speed = self.settings.asteroid_speed
 
-        self.frames = asteroid_frames
-        self.current_frame = 0
-        self.image = self.frames[self.current_frame]
+        # The asteroid starts at the first frame of the shared animation.
+        self.atlas = AsteroidAtlas.get()
+        self.phase_offset = -self.atlas.phase
+        self.image = self.atlas.frame(self.phase_offset)
 
         self._initialize_position()
 
     def _initialize_position(self):
         """Set the initial position of the asteroid."""
-        self.rect = self.frames[0].get_rect()
+        self.rect = self.image.get_rect()
         self.rect.x = random.randint(0, self.settings.screen_width - self.rect.width)
         self.rect.y = 0
         self.y_pos = float(self.rect.y)
 
     def update(self):
         """Update the asteroid's animation and position."""
-        self.current_frame = (self.current_frame + 1) % len(self.frames)
-        self.image = self.frames[self.current_frame]
+        self.image = self.atlas.frame(self.phase_offset)
 
         self.y_pos += self.speed
         self.rect.y = int(self.y_pos)
@@ -4,7 +4,7 @@ import random
 
 from pygame.sprite import Sprite
 from src.utils.constants import POWERS, GAME_CONSTANTS, WEAPON_BOXES
-from src.utils.game_utils import load_single_image
+from src.utils.game_utils import load_images
 
 
 class Power(Sprite):
@@ -14,12 +14,28 @@ class Power(Sprite):
     health or weapon power ups, and for updating and drawing the power on screen.
     """
 
+    power_images = None
+    weapon_images = None
+
+    @classmethod
+    def get_images(cls):
+        """Return the power images, loading them for the first power."""
+        if cls.power_images is None:
+            cls.power_images = load_images(POWERS)
+        return cls.power_images
+
+    @classmethod
+    def get_weapon_images(cls):
+        """Return the weapon box images, loading them for the first weapon."""
+        if cls.weapon_images is None:
+            cls.weapon_images = load_images(WEAPON_BOXES)
+        return cls.weapon_images
+
     def __init__(self, game):
         super().__init__()
         self.game = game
 
-        self.image = load_single_image(POWERS["power"])
-        self.health_image = load_single_image(POWERS["health"])
+        self.image = self.get_images()["power"]
         self.speed = GAME_CONSTANTS["POWER_SPEED"]
         self.last_power_time = 0
         self._initialize_position()
@@ -40,13 +56,13 @@ class Power(Sprite):
     def make_health_power_up(self):
         """Change the power up to a health power up."""
         self.health = True
-        self.image = self.health_image
+        self.image = self.get_images()["health"]
 
     def make_weapon_power_up(self):
         """Change the power up to a random weapon power up."""
         self.weapon = True
         random_box = random.choice(list(WEAPON_BOXES.keys()))
-        self.image = load_single_image(WEAPON_BOXES[random_box])
+        self.image = self.get_weapon_images()[random_box]
         self.weapon_name = random_box
 
     def update(self):
@@ -13,6 +13,7 @@ class Bullet(Sprite):
         self.game = game
         self.speed = speed
         self.ship = ship
+        self.bounds = game.settings.bounds
         self.image = image_path
 
         self.rect = self.image.get_rect()
@@ -22,7 +23,7 @@ class Bullet(Sprite):
 
     def update(self):
         """Update the bullet location on screen."""
-        if self.game.settings.game_modes.cosmic_conflict:
+        if self.bounds.cosmic_conflict:
             self.x_pos += (
                 self.speed if self.ship == self.game.thunderbird_ship else -self.speed
             )
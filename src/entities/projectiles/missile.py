@@ -6,16 +6,19 @@ missile instances.
 import pygame
 from pygame.sprite import Sprite
 
-from src.animations.entities_animations import MissileEx
-from src.utils.animation_constants import missile_frames
+from src.game_logic.game_events import MissileExploded
+from src.utils.animation_constants import missile_frames, missile_ex_frames
 
 
 class Missile(Sprite):
     """The Missile class represents a missile object in the game.
-    It also creates an instance of MissileEx class to manage the
-    explosion animation for the missile.
+    Once it explodes, the missile stays in place and destroys the aliens
+    in its explosion area for a while, the explosion animation is played
+    by the FXManager.
     """
 
+    explosion_size = missile_ex_frames[0].get_size()
+
     def __init__(self, game, ship):
         super().__init__()
         self.game = game
@@ -36,7 +39,6 @@ class Missile(Sprite):
         self.frame_update_rate = 5
         self.frame_counter = 0
 
-        self.destroy_anim = MissileEx(self)
         self.is_destroyed = False
 
     def update(self):
@@ -49,7 +51,6 @@ class Missile(Sprite):
     def _update_destroyed_state(self):
         """Update the missile when it's in the destroyed state."""
         if self.destroy_delay > 0:
-            self.destroy_anim.update_animation()
             self.destroy_delay -= 1
         else:
             self.kill()
@@ -103,14 +104,19 @@ class Missile(Sprite):
         else:
             self.image = pygame.transform.rotate(self.frames[self.current_frame], 90)
 
+    def explosion_rect(self):
+        """Return the area destroyed by the explosion of the missile."""
+        explosion_rect = pygame.Rect((0, 0), self.explosion_size)
+        explosion_rect.center = self.rect.center
+        return explosion_rect
+
     def draw(self):
-        """Draw the missile or explosion effect,
-        depending on whether it's destroyed or not."""
-        if self.is_destroyed:
-            self.destroy_anim.draw_explosion()
-        else:
+        """Draw the missile if it didn't explode yet."""
+        if not self.is_destroyed:
             self.screen.blit(self.image, self.rect)
 
     def explode(self):
-        """Trigger the explosion effect."""
-        self.is_destroyed = True
+        """Trigger the explosion, the first time the missile hits something."""
+        if not self.is_destroyed:
+            self.is_destroyed = True
+            self.game.events.emit(MissileExploded(position=self.rect.center))
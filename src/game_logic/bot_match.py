@@ -0,0 +1,314 @@
+"""
+The 'bot_match' module contains the BotPilot class that flies a ship, the
+SimulatedClock class and the run_match function that plays a whole match
+headless with bots, for the match farm.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import pygame
+
+from src.entities.alien_entities.aliens import BossAlien
+from src.utils.constants import (
+    BOT_DODGE_DISTANCE,
+    BOT_MISSILE_CHANCE,
+    DIFFICULTIES,
+    FARM_FRAME_BUDGET,
+    FARM_FRAME_RATE,
+    FARM_GAME_MODES,
+    FARM_LOADOUTS,
+    FARM_MAX_FRAMES,
+    INPUT_BITS,
+)
+
+# The sprite groups whose peak size is kept in the results.
+COUNTED_GROUPS = (
+    "aliens",
+    "alien_bullet",
+    "asteroids",
+    "powers",
+    "thunderbird_bullets",
+    "phoenix_bullets",
+    "thunderbird_missiles",
+    "phoenix_missiles",
+)
+
+# How far from its target a ship stops moving, in pixels.
+FOLLOW_TOLERANCE = 8
+
+
+@dataclass
+class MatchConfig:
+    """The settings of one bot match. The seed makes the match repeatable."""
+
+    seed: int
+    difficulty: str = "EASY"
+    game_mode: str = "normal"
+    loadout: tuple = FARM_LOADOUTS[0]
+    singleplayer: bool = False
+    max_frames: int = FARM_MAX_FRAMES
+
+
+@dataclass
+class MatchResult:
+    """How a bot match ended and what its frames cost."""
+
+    config: MatchConfig
+    outcome: str
+    level: int
+    score: int
+    frames: int
+    frame_time: float
+    worst_frame: float
+    over_budget: int
+    peak_entities: dict = field(default_factory=dict)
+    # Level -> [frames, seconds] spent on that level.
+    level_costs: dict = field(default_factory=dict)
+
+    # The exception that stopped the match, when its outcome is "error".
+    error: str = ""
+
+    @property
+    def won(self):
+        """True when the players won or were still alive at the end."""
+        return self.outcome in ("victory", "survived")
+
+
+class SimulatedClock:
+    """A clock that moves forward by one frame at every tick. While it is
+    used, the timers of the game read it instead of the real time, so a
+    match plays the same at any speed.
+    """
+
+    def __init__(self, frame_rate=FARM_FRAME_RATE, start=1000.0):
+        self.frame_time = 1 / frame_rate
+        self.now = start
+
+    def tick(self):
+        """Move the clock forward by one frame."""
+        self.now += self.frame_time
+
+    def time(self):
+        """Return the time in seconds, like time.time."""
+        return self.now
+
+    def get_ticks(self):
+        """Return the time in milliseconds, like pygame.time.get_ticks."""
+        return int(self.now * 1000)
+
+    @contextmanager
+    def use(self):
+        """Make the game timers read this clock until the block ends."""
+        real_time, real_get_ticks = time.time, pygame.time.get_ticks
+        time.time, pygame.time.get_ticks = self.time, self.get_ticks
+        try:
+            yield self
+        finally:
+            time.time, pygame.time.get_ticks = real_time, real_get_ticks
+
+
+class BotPilot:
+    """Flies a ship like a player would. It keeps firing, lines up with the
+    closest alien, or with the other ship in Cosmic Conflict, and dodges the
+    alien bullets and the asteroids falling on it. The missiles are saved
+    for the bosses and the laser is fired as soon as it is ready.
+    """
+
+    def __init__(self, game, ship, seed=None):
+        self.game = game
+        self.ship = ship
+        self.other_ship = (
+            game.phoenix_ship
+            if ship is game.thunderbird_ship
+            else game.thunderbird_ship
+        )
+        self.random = random.Random(seed)
+
+    def fly(self):
+        """Apply the controls of the ship for this frame."""
+        self.game.player_input.apply_input_bits(
+            self.ship,
+            self.get_input_bits(),
+            self.game.weapons_manager.fire_missile,
+            self.game.weapons_manager.fire_laser,
+        )
+
+    def get_input_bits(self):
+        """Return the controls of the ship for this frame."""
+        ship = self.ship
+        bits = INPUT_BITS["fire"]
+        if self.game.settings.game_modes.cosmic_conflict:
+            bits |= self._follow(
+                ship.rect.centery, self.other_ship.rect.centery, "up", "down"
+            )
+        else:
+            bits |= self._dodge() or self._follow_alien()
+
+        if ship.laser_ready:
+            bits |= INPUT_BITS["laser"]
+        if (
+            ship.missiles_num > 0
+            and self._boss_ahead()
+            and self.random.random() < BOT_MISSILE_CHANCE
+        ):
+            bits |= INPUT_BITS["missile"]
+        return bits
+
+    @staticmethod
+    def _follow(position, target, lower, higher):
+        """Return the bit that moves the position towards the target."""
+        if target < position - FOLLOW_TOLERANCE:
+            return INPUT_BITS[lower]
+        if target > position + FOLLOW_TOLERANCE:
+            return INPUT_BITS[higher]
+        return 0
+
+    def _follow_alien(self):
+        """Return the bit that lines the ship up with the closest alien."""
+        if not self.game.aliens:
+            return 0
+        center = self.ship.rect.centerx
+        alien = min(
+            self.game.aliens, key=lambda alien: abs(alien.rect.centerx - center)
+        )
+        return self._follow(center, alien.rect.centerx, "left", "right")
+
+    def _dodge(self):
+        """Return the bit that moves the ship away from the closest threat
+        falling on it, 0 when nothing is falling on it.
+        """
+        rect = self.ship.rect
+        danger_zone = pygame.Rect(
+            rect.left - rect.width // 2,
+            rect.top - BOT_DODGE_DISTANCE,
+            rect.width * 2,
+            rect.height + BOT_DODGE_DISTANCE,
+        )
+        threats = [
+            sprite.rect
+            for group in (self.game.alien_bullet, self.game.asteroids)
+            for sprite in group
+            if danger_zone.colliderect(sprite.rect)
+        ]
+        if not threats:
+            return 0
+
+        threat = max(threats, key=lambda threat: threat.bottom)
+        go_right = threat.centerx <= rect.centerx
+        # Turn around instead of pushing against the side of the screen.
+        if go_right and rect.right >= self.game.settings.screen_width:
+            go_right = False
+        elif not go_right and rect.left <= 0:
+            go_right = True
+        return INPUT_BITS["right" if go_right else "left"]
+
+    def _boss_ahead(self):
+        """Return True when a boss is in front of the ship."""
+        center = self.ship.rect.centerx
+        return any(
+            isinstance(alien, BossAlien)
+            and alien.rect.left <= center <= alien.rect.right
+            for alien in self.game.aliens
+        )
+
+
+def setup_match(game, config):
+    """Set the difficulty, the game mode and the loadout of a match and
+    start it.
+    """
+    random.seed(config.seed)
+    fleet_engine = game.aliens_manager.fleet_engine
+    if fleet_engine is not None:
+        fleet_engine.seed(config.seed)
+    settings = game.settings
+    settings.difficulty = config.difficulty
+    settings.speedup_scale = DIFFICULTIES[config.difficulty]
+    settings.max_alien_speed = DIFFICULTIES[f"MAX_{config.difficulty}"]
+
+    game_modes = settings.game_modes
+    for game_mode in FARM_GAME_MODES:
+        if hasattr(game_modes, game_mode):
+            setattr(game_modes, game_mode, game_mode == config.game_mode)
+    game_modes.game_mode = config.game_mode
+
+    loadouts = dict(game.ship_selection.ship_selection_functions.values())
+    for loadout in config.loadout:
+        loadouts[loadout]()
+
+    game.start_headless_match(config.singleplayer)
+
+
+def get_outcome(game):
+    """Return how the match ended, None while it is still being played."""
+    thunderbird_alive = game.thunderbird_ship.state.alive
+    phoenix_alive = game.phoenix_ship.state.alive
+    game_modes = game.settings.game_modes
+    if game_modes.cosmic_conflict:
+        if not thunderbird_alive:
+            return "phoenix_win"
+        if not phoenix_alive:
+            return "thunderbird_win"
+        return None
+    if game_modes.boss_rush and game.stats.level == 15 and not game.aliens:
+        return "victory"
+    if not thunderbird_alive and not phoenix_alive:
+        return "defeat"
+    return None
+
+
+def run_match(game, config):
+    """Play a match with a bot flying every ship and return its result.
+    The match ends when it is won or lost, or after the frame limit.
+    """
+    clock = SimulatedClock()
+    with clock.use():
+        setup_match(game, config)
+        pilots = [
+            BotPilot(game, ship, config.seed + number)
+            for number, ship in enumerate(game.ships)
+        ]
+        peak_entities = dict.fromkeys(COUNTED_GROUPS, 0)
+        level_costs = {}
+        frame_time = worst_frame = 0.0
+        over_budget = frames = 0
+        outcome = "survived"
+
+        while frames < config.max_frames:
+            start = time.perf_counter()
+            for pilot in pilots:
+                pilot.fly()
+            game.update_simulation()
+            cost = time.perf_counter() - start
+            clock.tick()
+            frames += 1
+
+            frame_time += cost
+            worst_frame = max(worst_frame, cost)
+            over_budget += cost > FARM_FRAME_BUDGET
+            level_cost = level_costs.setdefault(game.stats.level, [0, 0.0])
+            level_cost[0] += 1
+            level_cost[1] += cost
+            for name in COUNTED_GROUPS:
+                peak_entities[name] = max(peak_entities[name], len(getattr(game, name)))
+
+            ending = get_outcome(game)
+            if ending:
+                outcome = ending
+                break
+
+    stats = game.stats
+    return MatchResult(
+        config=config,
+        outcome=outcome,
+        level=stats.level,
+        score=stats.thunderbird_score + stats.phoenix_score,
+        frames=frames,
+        frame_time=frame_time,
+        worst_frame=worst_frame,
+        over_budget=over_budget,
+        peak_entities=peak_entities,
+        level_costs=level_costs,
+    )
@@ -4,13 +4,28 @@ that handles the collisions in the game.
 """
 
 import time
-import pygame
+import weakref
 
 from src.entities.projectiles.missile import Missile
 from src.entities.alien_entities.aliens import BossAlien
 
-from src.utils.constants import ALIENS_HP_MAP
-from src.utils.game_utils import play_sound, get_colliding_sprites
+from src.game_logic.game_events import (
+    AlienKilled,
+    AsteroidDestroyed,
+    ShieldHit,
+    MissileExploded,
+    ScoreChanged,
+)
+from src.utils.constants import ALIENS_HP_MAP, MASK_COLLISIONS
+from src.utils.game_utils import (
+    get_colliding_sprite,
+    get_colliding_sprites,
+    get_group_collisions,
+    get_mask,
+    get_rect_mask,
+    masks_collide,
+    uses_mask,
+)
 
 
 class CollisionManager:
@@ -22,10 +37,12 @@ class CollisionManager:
         self.stats = game.stats
         self.settings = game.settings
         self.score_board = game.score_board
+        self.events = game.events
         self.thunderbird_ship = self.game.thunderbird_ship
         self.phoenix_ship = self.game.phoenix_ship
 
-        self.handled_collisions = {}
+        # Missile -> bosses hit by its explosion, dead missiles drop out.
+        self.handled_collisions = weakref.WeakKeyDictionary()
 
     def handle_shielded_ship_collisions(self, ships, aliens, bullets, asteroids):
         """Destroy aliens, bullets, or asteroids colliding with ship shields."""
@@ -37,32 +54,46 @@ class CollisionManager:
     def _handle_alien_collisions_with_shielded_ship(self, ship, aliens):
         """Handle collisions between aliens and ship shields."""
         for alien in aliens:
-            if ship.state.shielded and ship.anims.shield_rect.colliderect(alien.rect):
+            if ship.state.shielded and self._shield_collides(ship, alien):
                 if not isinstance(alien, BossAlien):
-                    self._destroy_alien_and_play_sound(alien)
+                    self._destroy_alien_with_shield(alien, ship)
                 ship.state.shielded = False
 
     def _handle_bullet_collisions_with_shielded_ship(self, ship, bullets):
         """Handle collisions between bullets and ship shields."""
         for bullet in bullets:
-            if ship.state.shielded and ship.anims.shield_rect.colliderect(bullet.rect):
-                self._resolve_shield_collision(bullet, "alien_exploding", ship)
+            if ship.state.shielded and self._shield_collides(ship, bullet):
+                self._resolve_shield_collision(bullet, "bullet", ship)
 
     def _handle_asteroid_collisions_with_shielded_ship(self, ship, asteroids):
         """Handle collisions between asteroids and ship shields."""
         for asteroid in asteroids:
-            if ship.state.shielded and ship.anims.shield_rect.colliderect(asteroid):
-                self._resolve_shield_collision(asteroid, "asteroid_exploding", ship)
+            if ship.state.shielded and self._shield_collides(ship, asteroid):
+                self._resolve_shield_collision(asteroid, "asteroid", ship)
+
+    @staticmethod
+    def _shield_collides(ship, sprite):
+        """Check if a sprite collides with the shield of the ship."""
+        anims = ship.anims
+        if not anims.shield_rect.colliderect(sprite.rect):
+            return False
+        if MASK_COLLISIONS["Shield"]:
+            shield_mask = get_mask(anims.shield_image)
+        elif uses_mask(sprite):
+            shield_mask = get_rect_mask(anims.shield_rect.size)
+        else:
+            return True
+        return masks_collide(anims.shield_rect, shield_mask, sprite)
 
-    def _destroy_alien_and_play_sound(self, alien):
-        """Destroy an alien and play the corresponding sound."""
+    def _destroy_alien_with_shield(self, alien, ship):
+        """Destroy an alien that hit a ship shield."""
         alien.kill()
-        play_sound(self.game.sound_manager.game_sounds, "alien_exploding")
+        self.events.emit(ShieldHit("alien", ship.anims.shield_rect.center))
 
-    def _resolve_shield_collision(self, entity, sound_key, ship):
-        """Handle a collision with a shielded ship and play a sound."""
+    def _resolve_shield_collision(self, entity, target, ship):
+        """Handle a collision with a shielded ship."""
         entity.kill()
-        play_sound(self.game.sound_manager.game_sounds, sound_key)
+        self.events.emit(ShieldHit(target, ship.anims.shield_rect.center))
         ship.state.shielded = False
 
     def check_asteroids_collisions(self, thunder_hit_method, phoenix_hit_method):
@@ -84,7 +115,7 @@ class CollisionManager:
         self, ship, thunder_hit_method, phoenix_hit_method
     ):
         """Handle collision between ship and asteroids."""
-        if collision := pygame.sprite.spritecollideany(ship, self.game.asteroids):
+        if collision := get_colliding_sprite(ship, self.game.asteroids):
             hit_method = (
                 thunder_hit_method
                 if ship is self.thunderbird_ship
@@ -97,7 +128,7 @@ class CollisionManager:
         if not ship.state.immune:
             hit_method()
             collision.kill()
-            play_sound(self.game.sound_manager.game_sounds, "asteroid_exploding")
+            self.events.emit(AsteroidDestroyed())
 
     def _handle_projectile_asteroid_collisions(self, *projectile_groups):
         """Handle collisions between projectiles and asteroids."""
@@ -107,9 +138,9 @@ class CollisionManager:
 
     def _handle_projectile_asteroid_collision(self, sprite):
         """Handle collision between projectile and asteroids."""
-        if collision := pygame.sprite.spritecollideany(sprite, self.game.asteroids):
+        if collision := get_colliding_sprite(sprite, self.game.asteroids):
             collision.kill()
-            play_sound(self.game.sound_manager.game_sounds, "asteroid_exploding")
+            self.events.emit(AsteroidDestroyed())
             if isinstance(sprite, Missile):
                 sprite.explode()
 
@@ -134,7 +165,7 @@ class CollisionManager:
         if not ship.state.alive:
             return
 
-        if collision := pygame.sprite.spritecollideany(ship, self.game.powers):
+        if collision := get_colliding_sprite(ship, self.game.powers):
             self._activate_power(
                 player,
                 ship,
@@ -169,11 +200,11 @@ class CollisionManager:
 
     def check_bullet_alien_collisions(self):
         """Respond to player bullet-alien collisions."""
-        thunderbird_ship_collisions = pygame.sprite.groupcollide(
-            self.game.thunderbird_bullets, self.game.aliens, True, False
+        thunderbird_ship_collisions = get_group_collisions(
+            self.game.thunderbird_bullets, self.game.aliens, kill_a=True
         )
-        phoenix_ship_collisions = pygame.sprite.groupcollide(
-            self.game.phoenix_bullets, self.game.aliens, True, False
+        phoenix_ship_collisions = get_group_collisions(
+            self.game.phoenix_bullets, self.game.aliens, kill_a=True
         )
 
         # Thunderbird collisions
@@ -189,8 +220,7 @@ class CollisionManager:
         else:
             self.stats.thunderbird_score += score_increment
         hit_function()
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
+        self.events.emit(ScoreChanged())
 
     def _resolve_collision_cosmic_conflict(
         self, ship, hit_function, sprite_group, score_increment
@@ -202,7 +232,7 @@ class CollisionManager:
             if not ship.state.immune:
                 if isinstance(sprite, Missile):
                     sprite.explode()
-                    play_sound(self.game.sound_manager.game_sounds, "missile")
+                    self.events.emit(MissileExploded())
                 self._update_cosmic_conflict_scores(ship, hit_function, score_increment)
 
     def check_cosmic_conflict_collisions(self, thunderbird_hit, phoenix_hit):
@@ -231,10 +261,7 @@ class CollisionManager:
         any aliens have reached the bottom of the screen.
         """
         for ship in self.game.ships:
-            if (
-                pygame.sprite.spritecollideany(ship, self.game.aliens)
-                and not ship.state.immune
-            ):
+            if get_colliding_sprite(ship, self.game.aliens) and not ship.state.immune:
                 if ship is self.thunderbird_ship:
                     thunderbird_hit()
                 else:
@@ -254,19 +281,18 @@ class CollisionManager:
         if not self.game.singleplayer:
             self.stats.phoenix_score = max(self.stats.phoenix_score - 100, 0)
         self.stats.thunderbird_score = max(self.stats.thunderbird_score - 100, 0)
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
+        self.events.emit(ScoreChanged())
 
     def check_missile_alien_collisions(self):
         """Respond to missiles-alien collisions."""
         # Collisions with Thunderbird missiles
-        thunderbird_missile_collisions = pygame.sprite.groupcollide(
-            self.game.thunderbird_missiles, self.game.aliens, False, False
+        thunderbird_missile_collisions = get_group_collisions(
+            self.game.thunderbird_missiles, self.game.aliens
         )
 
         # Collisions with Phoenix missiles
-        phoenix_missile_collisions = pygame.sprite.groupcollide(
-            self.game.phoenix_missiles, self.game.aliens, False, False
+        phoenix_missile_collisions = get_group_collisions(
+            self.game.phoenix_missiles, self.game.aliens
         )
 
         # Handle Thunderbird missile collisions
@@ -274,14 +300,18 @@ class CollisionManager:
             self._handle_player_missile_collisions(
                 thunderbird_missile_collisions, "thunderbird"
             )
-            self._play_missile_sound(thunderbird_missile_collisions.values())
+            self._emit_missile_explosions(
+                thunderbird_missile_collisions.values(), "thunderbird"
+            )
 
         # Handle Phoenix missile collisions
         if not self.game.singleplayer and phoenix_missile_collisions:
             self._handle_player_missile_collisions(
                 phoenix_missile_collisions, "phoenix"
             )
-            self._play_missile_sound(phoenix_missile_collisions.values())
+            self._emit_missile_explosions(
+                phoenix_missile_collisions.values(), "phoenix"
+            )
 
     def check_laser_alien_collisions(self):
         """Respond to player laser-alien collisions."""
@@ -291,9 +321,7 @@ class CollisionManager:
         }
 
         for laser, player in laser_collisions.items():
-            collided_aliens = pygame.sprite.groupcollide(
-                laser, self.game.aliens, False, False
-            )
+            collided_aliens = get_group_collisions(laser, self.game.aliens)
 
             for aliens in collided_aliens.values():
                 for alien in aliens:
@@ -310,14 +338,14 @@ class CollisionManager:
             alien.last_hit_time = current_time
             self._handle_boss_alien_collision(alien, player)
 
-    def _play_missile_sound(self, aliens):
-        """Helper method that plays the missile sound when
-        colliding with normal aliens.
+    def _emit_missile_explosions(self, aliens, player):
+        """Helper method that reports the missile explosions
+        on normal aliens.
         """
         for alien_list in aliens:
             for alien in alien_list:
                 if not isinstance(alien, BossAlien):
-                    play_sound(self.game.sound_manager.game_sounds, "missile")
+                    self.events.emit(MissileExploded(player))
 
     def _handle_player_missile_collisions(self, player_missile_collisions, player):
         """This method handles what happens with the score and the aliens
@@ -344,9 +372,7 @@ class CollisionManager:
     def _handle_ship_alien_bullet_collision(self, ship, hit_method):
         """Handle collision between ship and alien bullet."""
         if ship.state.alive and not ship.state.immune:
-            if collision := pygame.sprite.spritecollideany(
-                ship, self.game.alien_bullet
-            ):
+            if collision := get_colliding_sprite(ship, self.game.alien_bullet):
                 self._process_ship_bullet_collision(ship, hit_method, collision)
 
     def _process_ship_bullet_collision(self, ship, hit_method, collision):
@@ -364,7 +390,7 @@ class CollisionManager:
         """Destroy the boss alien and update game stats."""
         boss.destroy_alien()
         self.game.aliens.remove(boss)
-        play_sound(self.game.sound_manager.game_sounds, "boss_exploding")
+        self.events.emit(AlienKilled(player, boss=True, position=boss.rect.center))
 
     def _update_player_score(self, player):
         """Update player's score based on the boss points."""
@@ -373,9 +399,6 @@ class CollisionManager:
         else:
             self.stats.phoenix_score += self.settings.boss_points
 
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
-
     def _handle_alien_hits(self, player_ship_collisions, player):
         """Handles what happens with the score and the aliens after they have been hit."""
         max_hit_count = ALIENS_HP_MAP.get(self.stats.level, 3)
@@ -405,17 +428,13 @@ class CollisionManager:
                 self.phoenix_ship.aliens_killed += 1
 
         alien.destroy_alien()
-        play_sound(self.game.sound_manager.game_sounds, "alien_exploding")
         self.game.aliens.remove(alien)
-
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
+        self.events.emit(AlienKilled(player, position=alien.rect.center))
 
     def _check_missile_ex_collision(self, aliens, player, missile):
         """Check collisions between aliens and missile explosion."""
-        for ex_frame in missile.destroy_anim.ex_frames:
-            ex_rect = ex_frame.get_rect(center=missile.rect.center)
-            self._handle_missile_explosion_collision(aliens, player, missile, ex_rect)
+        ex_rect = missile.explosion_rect()
+        self._handle_missile_explosion_collision(aliens, player, missile, ex_rect)
 
     def _handle_missile_explosion_collision(self, aliens, player, missile, ex_rect):
         """Handle collision between missile explosion and aliens."""
@@ -427,8 +446,9 @@ class CollisionManager:
 
     def _hande_missile_explosion_with_bosses(self, alien, player, missile):
         """Handle collision between missile explosion and bosses."""
-        if (missile, alien) not in self.handled_collisions:
-            play_sound(self.game.sound_manager.game_sounds, "missile")
+        hit_bosses = self.handled_collisions.setdefault(missile, set())
+        if alien not in hit_bosses:
+            self.events.emit(MissileExploded(player))
             alien.hit_count += 5
             self._handle_boss_alien_collision(alien, player)
-            self.handled_collisions[(missile, alien)] = True
+            hit_bosses.add(alien)
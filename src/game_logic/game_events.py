@@ -0,0 +1,108 @@
+"""
+The 'game_events' module contains the gameplay events and the EventBus class
+that delivers them. The game logic emits the events while it runs and the
+sound, scoreboard and FX subscribers handle them once per frame.
+Events that leave an effect on screen carry the position of the effect.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class AlienKilled:
+    """An alien or a boss was destroyed by a player."""
+
+    player: str
+    boss: bool = False
+    position: Optional[tuple] = None
+
+
+@dataclass(frozen=True)
+class AsteroidDestroyed:
+    """An asteroid was destroyed."""
+
+
+@dataclass(frozen=True)
+class ShieldHit:
+    """A ship shield destroyed an alien, a bullet or an asteroid."""
+
+    target: str
+    position: Optional[tuple] = None
+
+
+@dataclass(frozen=True)
+class ShipHit:
+    """A player ship was destroyed."""
+
+    player: str
+
+
+@dataclass(frozen=True)
+class MissileExploded:
+    """A missile exploded on a target."""
+
+    player: Optional[str] = None
+    position: Optional[tuple] = None
+
+
+@dataclass(frozen=True)
+class PowerCollected:
+    """A player picked up a power, a penalty, a health or a weapon power."""
+
+    player: str
+    power: str
+
+
+@dataclass(frozen=True)
+class WeaponFired:
+    """A player fired bullets, a missile or a laser."""
+
+    weapon: str
+
+
+@dataclass(frozen=True)
+class LaserStatus:
+    """The laser became ready, or the player tried to fire it too early."""
+
+    ready: bool
+
+
+@dataclass(frozen=True)
+class ScoreChanged:
+    """The score of a player changed."""
+
+
+@dataclass(frozen=True)
+class AmmoChanged:
+    """The number of missiles or of remaining bullets changed."""
+
+    ammo: str
+
+
+class EventBus:
+    """The EventBus class queues the events of the current frame and hands
+    them to the subscribers when the frame is dispatched. Identical events
+    are only delivered once per frame.
+    """
+
+    def __init__(self):
+        self.queue = []
+        self.subscribers = []
+
+    def subscribe(self, handler):
+        """Add a handler that receives the list of events of every frame."""
+        self.subscribers.append(handler)
+
+    def emit(self, event):
+        """Queue an event for the end of the frame."""
+        self.queue.append(event)
+
+    def dispatch(self):
+        """Send the queued events to the subscribers and empty the queue."""
+        if not self.queue:
+            return
+        events = list(dict.fromkeys(self.queue))
+        self.queue.clear()
+        for handler in self.subscribers:
+            handler(events)
@@ -5,13 +5,15 @@ related to the screen, images, game modes, speed, and various entities
 such as ships, aliens, bosses, and asteroids.
 """
 
+import pygame
+
 from src.utils.constants import (
     BACKGROUNDS,
     GAME_CONSTANTS,
     OTHER,
 )
 from src.utils.game_utils import load_images
-from src.utils.game_dataclasses import GameModes, UIOptions
+from src.utils.game_dataclasses import GameModes, UIOptions, WorldBounds
 
 
 class Settings:
@@ -42,6 +44,9 @@ class Settings:
         """Initialize screen settings."""
         self.screen_width = 1260
         self.screen_height = 700
+        self.bounds = WorldBounds(
+            pygame.Rect(0, 0, self.screen_width, self.screen_height)
+        )
 
     def _init_images(self):
         """Initialize images for the game."""
@@ -85,6 +90,7 @@ class Settings:
             "endless_onslaught",
         ]
         self.ui_options = UIOptions()
+        self.difficulty = "EASY"
         self.speedup_scale = 0.2
         self.missiles_speed = 5.0
         self.immune_time = 5000
@@ -0,0 +1,222 @@
+"""
+The 'game_state' module contains the GameState class that takes snapshots
+of a running game and restores them, for rollbacks, retries and replays.
+"""
+
+import random
+import weakref
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Optional
+
+import pygame
+
+from src.animations.asteroid_atlas import AsteroidAtlas
+
+# Objects held by an entity that are saved with it. Every other attribute
+# is shared with the rest of the game and only its reference is saved.
+ENTITY_OWNED = ("motion", "animation", "anims", "state")
+SETTINGS_OWNED = ("game_modes", "ui_options")
+
+# The attributes of the game and of its managers that change while playing.
+GAME_ATTRIBUTES = ("pause_time", "match_pause_time", "match_start_time")
+MANAGER_ATTRIBUTES = {
+    "weapons_manager": ("weapons",),
+    "powers_manager": ("last_power_up_time",),
+    "asteroids_manager": ("last_asteroid_time",),
+    "alien_bullets_manager": ("last_alien_bullet_time",),
+    "gameplay_manager": (
+        "last_increase_time",
+        "last_decrease_time",
+        "last_level_time",
+        "level_time",
+    ),
+    "collision_handler": ("handled_collisions",),
+}
+
+# Kept by pygame in every sprite, the groups are restored by adding to them.
+SPRITE_GROUPS_ATTRIBUTE = "_Sprite__g"
+
+Owned = namedtuple("Owned", ["instance", "fields"])
+
+_slot_names = {}
+
+
+@dataclass
+class GameSnapshot:
+    """The state of a game at one moment, made by GameState.snapshot."""
+
+    random_state: tuple
+    game: dict
+    stats: dict
+    settings: dict
+    ships: list
+    groups: list
+    managers: dict
+    fleet: Optional[tuple] = None
+    asteroid_phase: Optional[int] = None
+
+
+def get_slot_names(cls):
+    """Return the names of the slots of a class and of its bases."""
+    if cls not in _slot_names:
+        names = []
+        for base in cls.__mro__:
+            slots = base.__dict__.get("__slots__", ())
+            names.extend(
+                name
+                for name in ((slots,) if isinstance(slots, str) else slots)
+                if name not in ("__dict__", "__weakref__")
+            )
+        _slot_names[cls] = tuple(names)
+    return _slot_names[cls]
+
+
+def copy_value(value):
+    """Return a copy of the values that are changed in place, the rects,
+    the sets and the dicts, and the value itself for every other one.
+    """
+    value_type = type(value)
+    if value_type is pygame.Rect or value_type is set:
+        return value.copy()
+    if value_type is dict:
+        return {key: copy_value(item) for key, item in value.items()}
+    if value_type is weakref.WeakKeyDictionary:
+        return weakref.WeakKeyDictionary(
+            (key, copy_value(item)) for key, item in value.items()
+        )
+    return value
+
+
+def capture_fields(instance, owned=()):
+    """Return the attributes of an object. The owned objects are
+    captured with it, the other attributes are copied with copy_value.
+    """
+    fields = dict(getattr(instance, "__dict__", ()))
+    for name in get_slot_names(type(instance)):
+        value = getattr(instance, name, fields)
+        if value is not fields:
+            fields[name] = value
+    fields.pop(SPRITE_GROUPS_ATTRIBUTE, None)
+
+    for name, value in fields.items():
+        if name in owned and value is not None:
+            fields[name] = Owned(value, capture_fields(value))
+        else:
+            fields[name] = copy_value(value)
+    return fields
+
+
+def restore_fields(instance, fields):
+    """Set the attributes of an object from its captured fields.
+    The snapshot is left unchanged, so it can be restored again.
+    """
+    for name, value in fields.items():
+        if type(value) is Owned:
+            restore_fields(value.instance, value.fields)
+            value = value.instance
+        else:
+            value = copy_value(value)
+        setattr(instance, name, value)
+
+
+class GameState:
+    """Takes snapshots of the simulation of a game and restores them.
+    A snapshot holds the stats, the settings, the ships, every sprite
+    group, the timers of the managers and the random number generators.
+    The sprites are kept in the snapshot and reused when it is restored,
+    only their attributes are copied, and the images are shared.
+    """
+
+    def __init__(self, game):
+        self.game = game
+
+    def snapshot(self):
+        """Return the state of the game."""
+        game = self.game
+        return GameSnapshot(
+            random_state=random.getstate(),
+            game={name: getattr(game, name) for name in GAME_ATTRIBUTES},
+            stats=capture_fields(game.stats),
+            settings=capture_fields(game.settings, SETTINGS_OWNED),
+            ships=[
+                (ship, capture_fields(ship, ENTITY_OWNED))
+                for ship in (game.thunderbird_ship, game.phoenix_ship)
+            ],
+            groups=[
+                (
+                    group,
+                    [
+                        (sprite, capture_fields(sprite, ENTITY_OWNED))
+                        for sprite in group
+                    ],
+                )
+                for group in game.sprite_groups
+            ],
+            managers={
+                manager_name: {
+                    name: copy_value(getattr(getattr(game, manager_name), name))
+                    for name in names
+                }
+                for manager_name, names in MANAGER_ATTRIBUTES.items()
+            },
+            fleet=self._capture_fleet(),
+            asteroid_phase=(
+                AsteroidAtlas.shared.phase if AsteroidAtlas.shared else None
+            ),
+        )
+
+    def restore(self, snapshot):
+        """Put the game back in the state of a snapshot."""
+        game = self.game
+        random.setstate(snapshot.random_state)
+        for name, value in snapshot.game.items():
+            setattr(game, name, value)
+        restore_fields(game.stats, snapshot.stats)
+        restore_fields(game.settings, snapshot.settings)
+        for ship, fields in snapshot.ships:
+            restore_fields(ship, fields)
+
+        for group, sprites in snapshot.groups:
+            group.empty()
+            for sprite, fields in sprites:
+                restore_fields(sprite, fields)
+            group.add(*(sprite for sprite, _ in sprites))
+
+        for manager_name, fields in snapshot.managers.items():
+            restore_fields(getattr(game, manager_name), fields)
+        self._restore_fleet(snapshot.fleet)
+        if snapshot.asteroid_phase is not None and AsteroidAtlas.shared:
+            AsteroidAtlas.shared.phase = snapshot.asteroid_phase
+
+        self._render_hud()
+
+    def _capture_fleet(self):
+        """Return the arrays of the fleet engine, None without it."""
+        engine = self.game.aliens_manager.fleet_engine
+        if engine is None:
+            return None
+        return (
+            engine.fleet.copy(),
+            engine.sprites,
+            engine.indexes,
+            engine.rng.bit_generator.state,
+        )
+
+    def _restore_fleet(self, fleet):
+        """Put back the arrays of the fleet engine."""
+        engine = self.game.aliens_manager.fleet_engine
+        if engine is None or fleet is None:
+            return
+        fleet_array, engine.sprites, engine.indexes, rng_state = fleet
+        engine.fleet = fleet_array.copy()
+        engine.rng.bit_generator.state = rng_state
+
+    def _render_hud(self):
+        """Render the scoreboard for the restored stats."""
+        score_board = self.game.score_board
+        score_board.render_scores()
+        score_board.render_missiles_num()
+        score_board.render_high_score()
+        score_board.prep_level()
+        score_board.create_health()
@@ -9,7 +9,9 @@ import pygame
 from src.entities.projectiles.missile import Missile
 from src.entities.projectiles.laser import Laser
 from src.entities.projectiles.player_bullets import Firebird, Thunderbolt
-from src.utils.game_utils import play_sound, play_music
+from src.utils.constants import INPUT_BITS
+from src.utils.game_utils import play_sound
+from src.utils.key_bindings import build_key_table, load_key_bindings
 
 
 class PlayerInput:
@@ -21,16 +23,39 @@ class PlayerInput:
         self.ui_options = ui_options
         self.thunderbird = self.game.thunderbird_ship
         self.phoenix = self.game.phoenix_ship
+        self.ships = {"thunderbird": self.thunderbird, "phoenix": self.phoenix}
+        # The bullets of every ship and the names of their settings.
+        self.firing_ships = (
+            (
+                self.thunderbird,
+                game.thunderbird_bullets,
+                Thunderbolt,
+                "thunderbird_bullets_allowed",
+                "thunderbird_bullet_count",
+            ),
+            (
+                self.phoenix,
+                game.phoenix_bullets,
+                Firebird,
+                "phoenix_bullets_allowed",
+                "phoenix_bullet_count",
+            ),
+        )
 
-    def check_keydown_events(
-        self,
-        event,
-        reset_game,
-        run_menu,
-        game_menu,
-        fire_missile_method,
-        fire_laser_method,
-    ):
+        # The input bits of the keys held by every player, and of the
+        # keys pressed since the last tick.
+        self.input_bits = dict.fromkeys(self.ships, 0)
+        self.pressed_bits = dict.fromkeys(self.ships, 0)
+        self.key_bindings = {}
+        self.key_table = {}
+        self.set_key_bindings(load_key_bindings())
+
+    def set_key_bindings(self, bindings):
+        """Use new key bindings and rebuild the key table."""
+        self.key_bindings = bindings
+        self.key_table = build_key_table(bindings)
+
+    def check_keydown_events(self, event, reset_game, run_menu, game_menu):
         """Respond to keys being pressed."""
         match event.key:
             # If the game is paused, check for Q, P, R, ESC and M keys
@@ -49,8 +74,7 @@ class PlayerInput:
                 self.ui_options.paused = not self.ui_options.paused
             case pygame.K_ESCAPE if self.ui_options.paused:
                 play_sound(self.game.sound_manager.game_sounds, "keypress")
-                play_music(self.game.sound_manager.menu_music, "menu")
-                self.game.sound_manager.current_sound = "menu"
+                self.game.sound_manager.play_menu_music("menu")
                 game_menu()
                 self.ui_options.paused = not self.ui_options.paused
             case pygame.K_m if self.ui_options.paused:
@@ -66,144 +90,103 @@ class PlayerInput:
 
             # If the game is not paused, check for player keypresses
             case _ if not self.ui_options.paused:
-                self._handle_thunderbird_controls(
-                    event, fire_missile_method, fire_laser_method
-                )
+                self._press_player_key(event.key)
 
-                # Phoenix controls
-                if not self.game.singleplayer:
-                    self._handle_phoenix_controls(
-                        event, fire_missile_method, fire_laser_method
-                    )
+    def _press_player_key(self, key):
+        """Set the input bit of a player key, if the ship of the player
+        can be controlled.
+        """
+        binding = self.key_table.get(key)
+        if binding is None:
+            return
+        player, bit = binding
+        ship = self.ships[player]
+        if (
+            (player == "phoenix" and self.game.singleplayer)
+            or not ship.state.alive
+            or ship.state.warping
+            or ship.state.exploding
+        ):
+            return
+        self.input_bits[player] |= bit
+        self.pressed_bits[player] |= bit
 
     def check_keyup_events(self, event):
         """Respond to keys being released."""
-        # Thunderbird controls
-        if self.thunderbird.state.alive:
-            match event.key:
-                # Thunderbird controls
-                case pygame.K_d:
-                    self.thunderbird.moving_flags["right"] = False
-                case pygame.K_a:
-                    self.thunderbird.moving_flags["left"] = False
-                case pygame.K_w:
-                    self.thunderbird.moving_flags["up"] = False
-                case pygame.K_s:
-                    self.thunderbird.moving_flags["down"] = False
-                case pygame.K_SPACE:
-                    self.thunderbird.state.firing = False
-                case pygame.K_c:
-                    self.thunderbird.laser_fired = False
-
-        # Phoenix controls
-        if not self.game.singleplayer and self.phoenix.state.alive:
-            match event.key:
-                case pygame.K_RIGHT:
-                    self.phoenix.moving_flags["right"] = False
-                case pygame.K_LEFT:
-                    self.phoenix.moving_flags["left"] = False
-                case pygame.K_UP:
-                    self.phoenix.moving_flags["up"] = False
-                case pygame.K_DOWN:
-                    self.phoenix.moving_flags["down"] = False
-                case pygame.K_RETURN:
-                    self.phoenix.state.firing = False
-                case pygame.K_RSHIFT:
-                    self.phoenix.laser_fired = False
+        binding = self.key_table.get(event.key)
+        if binding is not None:
+            player, bit = binding
+            self.input_bits[player] &= ~bit
+
+    def update_ships(self, fire_missile_method, fire_laser_method):
+        """Apply the input bits of the players to their ships, once per tick."""
+        for player, ship in self.ships.items():
+            self.apply_input_bits(
+                ship,
+                self.input_bits[player],
+                fire_missile_method,
+                fire_laser_method,
+                pressed=self.pressed_bits[player],
+            )
+            self.pressed_bits[player] = 0
 
     def handle_ship_firing(self, fire_bullet_method):
         """Handles the ship firing."""
         current_time = pygame.time.get_ticks()
-        ships = {
-            "thunderbird": (
-                self.thunderbird,
-                self.game.thunderbird_bullets,
-                self.game.settings.thunderbird_bullets_allowed,
-                Thunderbolt,
-                self.game.settings.thunderbird_bullet_count,
-            ),
-            "phoenix": (
-                self.phoenix,
-                self.game.phoenix_bullets,
-                self.game.settings.phoenix_bullets_allowed,
-                Firebird,
-                self.game.settings.phoenix_bullet_count,
-            ),
-        }
-
-        for ship_data in ships.values():
-            ship, bullets, bullets_allowed, bullet_class, bullet_count = ship_data
+        for ship, bullets, bullet_class, allowed, count in self.firing_ships:
             if ship.state.firing and current_time - ship.last_bullet_time > 200:
                 fire_bullet_method(
                     bullets,
-                    bullets_allowed,
+                    getattr(self.settings, allowed),
                     bullet_class=bullet_class,
-                    num_bullets=bullet_count,
+                    num_bullets=getattr(self.settings, count),
                     ship=ship,
                 )
                 ship.last_bullet_time = current_time
 
-    def _handle_thunderbird_controls(
-        self, event, fire_missile_method, fire_laser_method
+    @staticmethod
+    def get_input_bits(ship, missile=False, laser=False):
+        """Return the controls of a ship for this tick as input bits.
+        The missile and the laser are only set on the tick they are fired.
+        """
+        bits = 0
+        for direction, moving in ship.moving_flags.items():
+            if moving:
+                bits |= INPUT_BITS[direction]
+        if ship.state.firing:
+            bits |= INPUT_BITS["fire"]
+        if missile:
+            bits |= INPUT_BITS["missile"]
+        if laser:
+            bits |= INPUT_BITS["laser"]
+        return bits
+
+    def apply_input_bits(
+        self, ship, bits, fire_missile_method, fire_laser_method, pressed=None
     ):
-        """Handle Thunderbird controls."""
-        if (
-            not self.thunderbird.state.alive
-            or self.thunderbird.state.warping
-            or self.thunderbird.state.exploding
-        ):
-            return
-        match event.key:
-            case pygame.K_SPACE:
-                self.thunderbird.state.firing = True
-            case pygame.K_d:
-                self.thunderbird.moving_flags["right"] = True
-            case pygame.K_a:
-                self.thunderbird.moving_flags["left"] = True
-            case pygame.K_w:
-                self.thunderbird.moving_flags["up"] = True
-            case pygame.K_s:
-                self.thunderbird.moving_flags["down"] = True
-            case pygame.K_x:
-                fire_missile_method(
-                    self.game.thunderbird_missiles,
-                    self.thunderbird,
-                    missile_class=Missile,
-                )
-            case pygame.K_c:
-                fire_laser_method(
-                    self.game.thunderbird_laser, self.thunderbird, laser_class=Laser
-                )
-                self.thunderbird.laser_fired = True
+        """Set the controls of a ship from its input bits and fire
+        the missile and the laser when their bits are in pressed, the bits
+        of the keys pressed since the last tick, all the bits by default.
+        """
+        if pressed is None:
+            pressed = bits
+        for direction in ship.moving_flags:
+            ship.moving_flags[direction] = bool(bits & INPUT_BITS[direction])
+        ship.state.firing = bool(bits & INPUT_BITS["fire"])
+        ship.laser_fired = bool(bits & INPUT_BITS["laser"])
 
-    def _handle_phoenix_controls(self, event, fire_missile_method, fire_laser_method):
-        """Handle Phoenix controls."""
-        if (
-            not self.phoenix.state.alive
-            or self.phoenix.state.warping
-            or self.phoenix.state.exploding
-        ):
+        if not ship.state.alive or ship.state.warping or ship.state.exploding:
             return
-        match event.key:
-            case pygame.K_RETURN:
-                self.phoenix.state.firing = True
-            case pygame.K_LEFT:
-                self.phoenix.moving_flags["left"] = True
-            case pygame.K_RIGHT:
-                self.phoenix.moving_flags["right"] = True
-            case pygame.K_UP:
-                self.phoenix.moving_flags["up"] = True
-            case pygame.K_DOWN:
-                self.phoenix.moving_flags["down"] = True
-            case pygame.K_RCTRL:
-                fire_missile_method(
-                    self.game.phoenix_missiles, self.phoenix, missile_class=Missile
-                )
-            case pygame.K_RSHIFT:
-                fire_laser_method(
-                    self.game.phoenix_laser, self.phoenix, laser_class=Laser
-                )
-                self.phoenix.laser_fired = True
+        if pressed & INPUT_BITS["missile"]:
+            fire_missile_method(
+                getattr(self.game, f"{ship.ship_type}_missiles"),
+                ship,
+                missile_class=Missile,
+            )
+        if pressed & INPUT_BITS["laser"]:
+            fire_laser_method(
+                getattr(self.game, f"{ship.ship_type}_laser"), ship, laser_class=Laser
+            )
 
     def reset_ship_flags(self):
         """Reset movement flags and firing state for the ships."""
@@ -217,3 +200,5 @@ class PlayerInput:
         self.phoenix.moving_flags["down"] = False
         self.phoenix.state.firing = False
         self.thunderbird.state.firing = False
+        self.input_bits = dict.fromkeys(self.ships, 0)
+        self.pressed_bits = dict.fromkeys(self.ships, 0)
@@ -8,6 +8,7 @@ import pygame
 
 from src.entities.alien_entities.alien_bullets import AlienBullet, BossBullet
 from src.entities.alien_entities.aliens import BossAlien
+from src.utils.game_utils import remove_sprites_below
 
 
 class AlienBulletsManager:
@@ -70,6 +71,4 @@ class AlienBulletsManager:
     def update_alien_bullets(self):
         """Update alien bullets and remove bullets that went off screen."""
         self.alien_bullet.update()
-        for bullet in self.alien_bullet.copy():
-            if bullet.rect.y > self.settings.screen_height:
-                self.alien_bullet.remove(bullet)
+        remove_sprites_below(self.alien_bullet, self.settings.bounds.rect.bottom)
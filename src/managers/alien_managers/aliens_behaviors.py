@@ -20,19 +20,27 @@ class AlienMovement:
     of a fleet of aliens and bosses in a game.
     """
 
+    __slots__ = (
+        "alien",
+        "direction",
+        "last_direction_change",
+        "direction_change_delay",
+        "time_offset",
+        "amplitude",
+        "frequency",
+    )
+
     def __init__(self, alien, game):
         self.alien = alien
-        self.settings = game.settings
 
-        self.direction = self.settings.alien_direction
+        self.direction = game.settings.alien_direction
         self.last_direction_change = pygame.time.get_ticks()
         self.direction_change_delay = 0
 
-        self.sins = {
-            "time_offset": random.uniform(0, 2 * math.pi),
-            "amplitude": random.randint(1, 2),
-            "frequency": random.uniform(0.001, 0.005),
-        }
+        # The sine wave of the vertical movement.
+        self.time_offset = random.uniform(0, 2 * math.pi)
+        self.amplitude = random.randint(1, 2)
+        self.frequency = random.uniform(0.001, 0.005)
 
     def update_horizontal_position(self):
         """Update the horizontal position of the alien and
@@ -52,10 +60,10 @@ class AlienMovement:
         create random movement.
         """
         now = pygame.time.get_ticks()
-        current_time = now + self.sins["time_offset"]
+        current_time = now + self.time_offset
         self.alien.rect.y = round(
             self.alien.rect.y
-            + self.sins["amplitude"] * math.sin(self.sins["frequency"] * current_time)
+            + self.amplitude * math.sin(self.frequency * current_time)
             + 0.1
         )
 
@@ -66,22 +74,22 @@ class AlienAnimation:
     based on the current level in the game.
     """
 
+    __slots__ = ("scale", "frame_counter", "current_frame", "frames", "image")
+
+    # Frames shared by every alien, loaded once per level prefix.
+    frames_cache = {}
+    frame_update_rate = 6
+
     def __init__(self, game, alien, scale=1.0):
-        self.alien = alien
-        self.game = game
         self.scale = scale
-
-        self.frame_update_rate = 6
         self.frame_counter = 0
         self.current_frame = 0
 
-        self.frames = {}
-
         level_prefix = LEVEL_PREFIX.get(game.stats.level // 4 + 1, "Alien7")
-        if level_prefix not in self.frames:
-            self.frames[level_prefix] = load_alien_images(level_prefix)
+        if level_prefix not in self.frames_cache:
+            self.frames_cache[level_prefix] = load_alien_images(level_prefix)
 
-        self.frames = self.frames[level_prefix]
+        self.frames = self.frames_cache[level_prefix]
         self.image = self.frames[self.current_frame]
 
     def _update_scale(self):
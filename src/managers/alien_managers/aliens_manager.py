@@ -4,6 +4,8 @@ the creation and update of aliens and bosses in the game.
 """
 
 from src.entities.alien_entities.aliens import Alien, BossAlien
+from src.managers.alien_managers.fleet_engine import FleetEngine
+from src.utils.constants import USE_FLEET_ENGINE
 
 
 class AliensManager:
@@ -17,6 +19,11 @@ class AliensManager:
         self.settings = settings
         self.screen = screen
         self.stats = game.stats
+        self.fleet_engine = (
+            FleetEngine(settings)
+            if USE_FLEET_ENGINE and FleetEngine.is_available()
+            else None
+        )
 
     def create_fleet(self, rows):
         """Create the fleet of aliens."""
@@ -39,6 +46,10 @@ class AliensManager:
 
     def update_aliens(self):
         """Update the positions of all aliens in the fleet."""
+        if self.fleet_engine is not None:
+            self.fleet_engine.update(self.aliens)
+            return
+
         self._check_fleet_edges()
         self.aliens.update()
 
@@ -0,0 +1,227 @@
+"""
+The 'fleet_engine' module contains the FleetEngine class that updates
+the whole alien fleet at once using NumPy arrays. The engine is only
+used when USE_FLEET_ENGINE is on and NumPy is installed, otherwise the
+aliens are updated one by one.
+"""
+
+import time
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.entities.alien_entities.aliens import BossAlien
+
+FLEET_FIELDS = [
+    ("x_pos", "f8"),
+    ("x", "i8"),
+    ("y", "i8"),
+    ("width", "i8"),
+    ("direction", "i8"),
+    ("last_change", "i8"),
+    ("delay", "i8"),
+    ("time_offset", "f8"),
+    ("amplitude", "f8"),
+    ("frequency", "f8"),
+    ("frozen", "?"),
+    ("frozen_start", "f8"),
+    ("immune", "?"),
+    ("immune_start", "f8"),
+    ("frame_counter", "i8"),
+    ("frame", "i8"),
+    ("frame_count", "i8"),
+    ("frame_rate", "i8"),
+    ("boss", "?"),
+]
+
+
+class FleetEngine:
+    """This class keeps the state of every alien in the group in one
+    NumPy array and advances the fleet with a few vectorized operations
+    per frame, instead of calling update on every alien. The positions
+    are written back to the sprite rects for drawing and collisions,
+    the other attributes only when they change, so the sprites can still
+    be saved and inspected as usual.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.rng = np.random.default_rng()
+        self.sprites = []
+        self.indexes = {}
+        self.fleet = np.zeros(0, dtype=FLEET_FIELDS)
+
+    def seed(self, seed):
+        """Draw the random numbers of the fleet from the given seed."""
+        self.rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def is_available():
+        """Return True if NumPy can be imported."""
+        return np is not None
+
+    @staticmethod
+    def _read_sprite(sprite):
+        """Return the fleet record of a sprite."""
+        motion = sprite.motion
+        boss = isinstance(sprite, BossAlien)
+        animation = None if boss else sprite.animation
+        return (
+            sprite.x_pos,
+            sprite.rect.x,
+            sprite.rect.y,
+            sprite.rect.width,
+            motion.direction,
+            motion.last_direction_change,
+            motion.direction_change_delay,
+            motion.time_offset,
+            motion.amplitude,
+            motion.frequency,
+            sprite.frozen_state,
+            sprite.frozen_start_time,
+            sprite.immune_state,
+            getattr(sprite, "immune_start_time", 0),
+            animation.frame_counter if animation else 0,
+            animation.current_frame if animation else 0,
+            len(animation.frames) if animation else 1,
+            animation.frame_update_rate if animation else 1,
+            boss,
+        )
+
+    def _sync(self, sprites):
+        """Match the fleet arrays with the sprites in the group. Aliens that
+        were already in the fleet keep their records, new ones are read.
+        """
+        old_indexes = [self.indexes.get(sprite, -1) for sprite in sprites]
+        fleet = np.zeros(len(sprites), dtype=FLEET_FIELDS)
+
+        kept = np.array(old_indexes, dtype=np.int64)
+        mask = kept >= 0
+        fleet[mask] = self.fleet[kept[mask]]
+
+        for i in np.flatnonzero(~mask).tolist():
+            sprite = sprites[i]
+            fleet[i] = self._read_sprite(sprite)
+            sprite.fleet = self
+
+        self.fleet = fleet
+        self.sprites = sprites
+        self.indexes = {sprite: i for i, sprite in enumerate(sprites)}
+
+    def refresh_timers(self, sprite):
+        """Read the frozen and immune state of a sprite after it changed."""
+        i = self.indexes.get(sprite)
+        if i is None:
+            return
+        record = self.fleet[i]
+        record["frozen"] = sprite.frozen_state
+        record["frozen_start"] = sprite.frozen_start_time
+        record["immune"] = sprite.immune_state
+        record["immune_start"] = getattr(sprite, "immune_start_time", 0)
+
+    def update(self, aliens):
+        """Advance every alien in the group by one frame."""
+        sprites = aliens.sprites()
+        if sprites != self.sprites:
+            self._sync(sprites)
+        if not sprites:
+            return
+
+        fleet = self.fleet
+        screen_rect = self.settings.bounds.rect
+        speed = self.settings.alien_speed
+        now = time.time()
+        ticks = pygame.time.get_ticks()
+        boss = fleet["boss"]
+
+        # Fleet edges, checked before the aliens move.
+        at_edge = self._at_edge(fleet, screen_rect)
+        fleet["direction"][at_edge] *= -1
+        at_top = ~at_edge & ~boss & (fleet["y"] <= screen_rect.top)
+        # Rects round half away from zero when given a float.
+        top_y = fleet["y"][at_top] + speed
+        fleet["y"][at_top] = np.trunc(top_y + np.copysign(0.5, top_y))
+
+        unfrozen = fleet["frozen"] & (
+            now - fleet["frozen_start"] > self.settings.frozen_time
+        )
+        fleet["frozen"][unfrozen] = False
+        active = ~fleet["frozen"]
+        regular = active & ~boss
+
+        fleet["x_pos"][active] += speed * fleet["direction"][active]
+        fleet["x"][active] = np.round(fleet["x_pos"][active])
+
+        fleet["frame_counter"][regular] += 1
+        next_frame = regular & (fleet["frame_counter"] % fleet["frame_rate"] == 0)
+        fleet["frame"][next_frame] = (fleet["frame"][next_frame] + 1) % fleet[
+            "frame_count"
+        ][next_frame]
+        fleet["frame_counter"][next_frame] = 0
+
+        fleet["y"][regular] = np.round(
+            fleet["y"][regular]
+            + fleet["amplitude"][regular]
+            * np.sin(
+                fleet["frequency"][regular] * (ticks + fleet["time_offset"][regular])
+            )
+            + 0.1
+        )
+
+        due = active & (ticks - fleet["last_change"] > fleet["delay"])
+        turn = due & ~self._at_edge(fleet, screen_rect)
+        fleet["direction"][turn] *= -1
+        fleet["last_change"][due] = ticks
+        fleet["delay"][due] = self.rng.integers(5000, 15001, np.count_nonzero(due))
+
+        immune = regular & fleet["immune"]
+        immune_over = immune & (
+            now - fleet["immune_start"] > self.settings.alien_immune_time
+        )
+        fleet["immune"][immune_over] = False
+
+        self._write_back(at_edge | turn, due, unfrozen, immune, immune_over, next_frame)
+
+    @staticmethod
+    def _at_edge(fleet, screen_rect):
+        """Return a mask of the aliens touching the left or right edge."""
+        return (fleet["x"] + fleet["width"] >= screen_rect.right) | (fleet["x"] <= 0)
+
+    def _write_back(self, turned, due, unfrozen, immune, immune_over, next_frame):
+        """Copy the new state of the fleet to the sprites."""
+        sprites = self.sprites
+        fleet = self.fleet
+
+        for sprite, x_pos, x, y in zip(
+            sprites, fleet["x_pos"].tolist(), fleet["x"].tolist(), fleet["y"].tolist()
+        ):
+            sprite.x_pos = x_pos
+            sprite.rect.topleft = (x, y)
+
+        for i in np.flatnonzero(turned).tolist():
+            sprites[i].motion.direction = int(fleet["direction"][i])
+
+        for i in np.flatnonzero(due).tolist():
+            motion = sprites[i].motion
+            motion.last_direction_change = int(fleet["last_change"][i])
+            motion.direction_change_delay = int(fleet["delay"][i])
+
+        for i in np.flatnonzero(unfrozen).tolist():
+            sprites[i].frozen_state = False
+
+        for i in np.flatnonzero(next_frame).tolist():
+            animation = sprites[i].animation
+            animation.frame_counter = 0
+            animation.current_frame = int(fleet["frame"][i])
+            animation.image = animation.frames[animation.current_frame]
+            sprites[i].image = animation.image
+
+        for i in np.flatnonzero(immune).tolist():
+            sprites[i].draw_immune()
+
+        for i in np.flatnonzero(immune_over).tolist():
+            sprites[i].immune_state = False
@@ -5,7 +5,9 @@ the update and creation of asteroids."""
 import random
 import pygame
 
+from src.animations.asteroid_atlas import AsteroidAtlas
 from src.entities.asteroid import Asteroid
+from src.utils.game_utils import remove_sprites_below
 
 
 class AsteroidsManager:
@@ -40,10 +42,10 @@ class AsteroidsManager:
 
     def update_asteroids(self):
         """Update asteroids and remove asteroids that went off screen."""
+        if self.game.asteroids:
+            AsteroidAtlas.get().advance()
         self.game.asteroids.update()
-        for asteroid in self.game.asteroids.copy():
-            if asteroid.rect.y > self.settings.screen_height:
-                self.game.asteroids.remove(asteroid)
+        remove_sprites_below(self.game.asteroids, self.settings.bounds.rect.bottom)
 
     def handle_asteroids(self, create_at_high_levels=True, force_creation=False):
         """Create, update, and check collisions for asteroids.
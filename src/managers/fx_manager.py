@@ -0,0 +1,120 @@
+"""
+The 'fx_manager' module contains the FXManager class that plays the
+short-lived effects of the game: the destroyed aliens, the boss explosions,
+the missile explosions and the shields that pop.
+"""
+
+import pygame
+
+from src.game_logic.game_events import AlienKilled, ShieldHit, MissileExploded
+from src.utils.animation_constants import (
+    destroy_frames,
+    missile_ex_frames,
+    shield_frames,
+)
+from src.utils.constants import FX_POOL_SIZE, FX_FRAME_RATES, BOSS_EXPLOSION_SCALE
+
+
+def build_timeline(frames, frame_rate):
+    """Return the image shown at every tick of an animation, with the
+    offset that centers it on the position of the effect.
+    """
+    return [
+        (frame, (-(frame.get_width() // 2), -(frame.get_height() // 2)))
+        for frame in frames
+        for _ in range(frame_rate)
+    ]
+
+
+class Effect:
+    """An animation played once at a fixed position."""
+
+    def __init__(self):
+        self.timeline = None
+        self.tick = 0
+        self.x_pos = 0
+        self.y_pos = 0
+
+    def start(self, timeline, position):
+        """Start playing the animation from its first frame."""
+        self.timeline = timeline
+        self.tick = 0
+        self.x_pos, self.y_pos = position
+
+    def blit_args(self):
+        """Return the image and the position to draw it at."""
+        image, (x_offset, y_offset) = self.timeline[self.tick]
+        return image, (self.x_pos + x_offset, self.y_pos + y_offset)
+
+
+class FXManager:
+    """The FXManager class owns a pool of effects, starts them when
+    the gameplay events of a frame are dispatched and updates and
+    draws the ones that are playing all at once.
+    """
+
+    def __init__(self, game, pool_size=FX_POOL_SIZE):
+        self.screen = game.screen
+        self.timelines = self._build_timelines()
+        self.pool = [Effect() for _ in range(pool_size)]
+        self.active = []
+
+    @staticmethod
+    def _build_timelines():
+        """Build the timeline of every kind of effect."""
+        boss_frames = [
+            pygame.transform.smoothscale_by(frame, BOSS_EXPLOSION_SCALE)
+            for frame in destroy_frames
+        ]
+        frames = {
+            "alien_destroyed": destroy_frames,
+            "boss_explosion": boss_frames,
+            "missile_explosion": missile_ex_frames,
+            "shield_pop": shield_frames,
+        }
+        return {
+            kind: build_timeline(frames[kind], frame_rate)
+            for kind, frame_rate in FX_FRAME_RATES.items()
+        }
+
+    def spawn(self, kind, position):
+        """Start an effect of the given kind, centered on the position."""
+        effect = self.pool.pop() if self.pool else self.active.pop(0)
+        effect.start(self.timelines[kind], position)
+        self.active.append(effect)
+
+    def handle_events(self, events):
+        """Start the effects of the gameplay events of a frame."""
+        for event in events:
+            match event:
+                case AlienKilled(boss=True, position=position) if position is not None:
+                    self.spawn("boss_explosion", position)
+                case AlienKilled(position=position) if position is not None:
+                    self.spawn("alien_destroyed", position)
+                case MissileExploded(position=position) if position is not None:
+                    self.spawn("missile_explosion", position)
+                case ShieldHit(position=position) if position is not None:
+                    self.spawn("shield_pop", position)
+
+    def update(self):
+        """Advance the effects and return the finished ones to the pool."""
+        playing = []
+        for effect in self.active:
+            effect.tick += 1
+            if effect.tick < len(effect.timeline):
+                playing.append(effect)
+            else:
+                self.pool.append(effect)
+        self.active = playing
+
+    def draw(self):
+        """Draw every effect that is playing."""
+        if self.active:
+            self.screen.blits(
+                [effect.blit_args() for effect in self.active], doreturn=False
+            )
+
+    def clear(self):
+        """Stop every effect."""
+        self.pool.extend(self.active)
+        self.active = []
@@ -3,7 +3,6 @@ The 'game_over_manager' module contains the EndGameManager class that manages
 game ending related tasks.
 """
 
-from src.utils.game_utils import play_music
 from src.utils.constants import GAME_MODE_SCORE_KEYS
 
 
@@ -54,11 +53,8 @@ class EndGameManager:
 
     def _play_game_over_sound(self):
         if not self.game.ui_options.game_over_sound_played:
-            play_music(self.game.sound_manager.menu_music, self.ending_music)
+            self.game.sound_manager.play_menu_music(self.ending_music)
             self.game.ui_options.game_over_sound_played = True
-            self.game.sound_manager.current_sound = self.game.sound_manager.menu_music[
-                self.ending_music
-            ]
 
     def return_to_game_menu(self):
         """End the current game, save the current high score and return to game menu."""
@@ -85,9 +81,10 @@ class EndGameManager:
             self._display_endgame("thunder_win")
 
     def _check_high_score_saved(self):
-        """Save the high score for the current game_mode."""
+        """Record the match and save the high score for the current game_mode."""
         if not self.game.ui_options.high_score_saved:
             game_mode = self.settings.game_modes.game_mode or "normal"
             high_score_key = GAME_MODE_SCORE_KEYS.get(game_mode, "high_scores")
+            self.game.high_score_manager.record_match(high_score_key)
             self.game.high_score_manager.save_high_score(high_score_key)
             self.game.ui_options.high_score_saved = True
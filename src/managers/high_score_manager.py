@@ -3,10 +3,17 @@ The 'high_score_manager' module contains the HighScoreManager class
 that is used to manage the saving and deletion of the high scores.
 """
 
-import json
-
-from src.utils.constants import SINGLE_PLAYER_FILE, MULTI_PLAYER_FILE
+import pygame
+
+from src.utils.constants import (
+    SINGLE_PLAYER_FILE,
+    MULTI_PLAYER_FILE,
+    USE_SQLITE_LEADERBOARD,
+    LEADERBOARD_DB_FILE,
+)
 from src.utils.game_utils import display_message, get_player_name
+from src.utils.high_score_store import HighScoreStore
+from src.utils.leaderboard_db import Leaderboard
 
 
 class HighScoreManager:
@@ -16,23 +23,23 @@ class HighScoreManager:
         self.game = game
         self.stats = game.stats
         self.screen = game.screen
+        self.store = (
+            Leaderboard(LEADERBOARD_DB_FILE)
+            if USE_SQLITE_LEADERBOARD
+            else HighScoreStore()
+        )
         self.high_scores_file = (
             SINGLE_PLAYER_FILE if self.game.singleplayer else MULTI_PLAYER_FILE
         )
 
+    def get_scores(self, score_key):
+        """Return the high scores for a score key, highest first."""
+        return self.store.get_scores(self.high_scores_file, score_key)
+
     def save_high_score(self, score_key):
-        """Save the high score to a JSON file."""
-        filename = self.high_scores_file
+        """Save the high score in the high score store."""
         if self.stats.high_score <= 0:
             return
-        try:
-            with open(filename, "r", encoding="utf-8") as score_file:
-                high_scores = json.load(score_file)
-        except json.JSONDecodeError:
-            high_scores = {"high_scores": []}
-
-        scores = high_scores.get(score_key, [])
-        new_score = self.stats.high_score
 
         while True:
             player_name = get_player_name(
@@ -42,6 +49,7 @@ class HighScoreManager:
                 self.stats.high_score,
                 self.game.settings.game_end_img,
                 self.game.settings.game_end_rect,
+                self.game.display_manager,
             )
 
             if player_name is None:
@@ -49,47 +57,48 @@ class HighScoreManager:
             if player_name == "":
                 player_name = "Player"
 
-            for i, score in enumerate(scores):
-                if score["name"] == player_name:
-                    message = (
-                        f"A high score with the name '{player_name}' already exists."
-                    )
-                    display_message(self.screen, message, 2)
-                    break
+            if self.store.has_name(self.high_scores_file, score_key, player_name):
+                message = f"A high score with the name '{player_name}' already exists."
+                display_message(self.screen, message, 2, self.game.display_manager)
             else:
                 break
 
-        new_entry = {"name": player_name, "score": new_score}
-
-        # Check if new score matches an existing score
-        for i, score in enumerate(scores):
-            if score["score"] == new_score:
-                scores[i] = new_entry
-                break
-        else:
-            scores.append(new_entry)
+        self.store.add_score(
+            self.high_scores_file,
+            score_key,
+            player_name,
+            self.stats.high_score,
+        )
 
-        # Sort scores by score value in descending order
-        scores = sorted(scores, key=lambda x: x["score"], reverse=True)[:10]
-        high_scores[score_key] = scores
+    def record_match(self, score_key):
+        """Add the finished match to the match history of its mode."""
+        self.store.record_match(
+            self.high_scores_file,
+            score_key,
+            self.stats.thunderbird_score + self.stats.phoenix_score,
+            self.get_match_details(),
+        )
 
-        with open(filename, "w", encoding="utf-8") as score_file:
-            json.dump(high_scores, score_file)
+    def get_match_details(self):
+        """Return the details of the finished match for the match history."""
+        duration = (
+            pygame.time.get_ticks()
+            - self.game.match_start_time
+            - self.game.match_pause_time
+        )
+        ships = [self.game.thunderbird_ship]
+        if not self.game.singleplayer:
+            ships.append(self.game.phoenix_ship)
+        return {
+            "ship": ", ".join(ship.ship_name for ship in ships),
+            "difficulty": self.game.settings.difficulty,
+            "level": self.stats.level,
+            "duration": duration / 1000,
+        }
 
     def delete_high_scores(self, score_key):
         """Delete the high scores for a specified score key."""
-        filename = self.high_scores_file
-        try:
-            with open(filename, "r", encoding="utf-8") as score_file:
-                high_scores = json.load(score_file)
-        except json.JSONDecodeError:
-            high_scores = {"high_scores": []}
-
-        if score_key in high_scores:
-            del high_scores[score_key]
-
-        with open(filename, "w", encoding="utf-8") as score_file:
-            json.dump(high_scores, score_file)
+        self.store.delete_scores(self.high_scores_file, score_key)
 
     def update_high_score_filename(self):
         """Update highscore filename based on the game."""
@@ -0,0 +1,133 @@
+"""
+The 'memory_manager' module contains the MemoryManager class that samples
+the memory of the game and flags what keeps growing, to find the leaks of
+long sessions.
+"""
+
+import gc
+import time
+import tracemalloc
+from collections import Counter, deque
+
+import pygame
+
+from src.entities.alien_entities.aliens import Alien, BossAlien
+from src.entities.projectiles.laser import Laser
+from src.entities.projectiles.missile import Missile
+from src.utils.constants import (
+    MEMORY_FILE,
+    MEMORY_GROWTH_SAMPLES,
+    MEMORY_SAMPLE_INTERVAL,
+    MEMORY_TOP_ALLOCATIONS,
+    USE_MEMORY_PROFILING,
+)
+from src.utils.telemetry_writer import TelemetryWriter
+
+# The classes whose live instances are counted in every sample.
+COUNTED_CLASSES = {
+    "Alien": Alien,
+    "BossAlien": BossAlien,
+    "Missile": Missile,
+    "Laser": Laser,
+}
+
+
+def count_live_objects():
+    """Return the number of live instances of the counted classes and of
+    the surfaces. The garbage is collected first, since the sprites that
+    refer to themselves are only freed by the collector. The surfaces are
+    not tracked by it, so they are found among the objects referring to them.
+    """
+    gc.collect()
+    objects = gc.get_objects()
+    types = Counter(map(type, objects))
+    counts = {
+        name: sum(count for cls, count in types.items() if issubclass(cls, counted))
+        for name, counted in COUNTED_CLASSES.items()
+    }
+    counts["Surface"] = len(
+        {
+            id(referent)
+            for referent in gc.get_referents(*objects)
+            if isinstance(referent, pygame.Surface)
+        }
+    )
+    return counts
+
+
+def get_growing(samples):
+    """Return the names of the counts that grew in every one of the samples."""
+    samples = list(samples)
+    if len(samples) < 2:
+        return []
+    return [
+        name
+        for name in samples[-1]
+        if all(
+            previous[name] < current[name]
+            for previous, current in zip(samples, samples[1:])
+        )
+    ]
+
+
+class MemoryManager:
+    """Every sample interval, the MemoryManager records the memory traced
+    by tracemalloc and the number of live aliens, bosses, missiles, lasers
+    and surfaces. The counts that grew over the last samples are flagged,
+    along with the lines that allocated the most since the first sample.
+    When memory profiling is off, nothing is traced.
+    """
+
+    def __init__(self, game, enabled=USE_MEMORY_PROFILING, writer=None):
+        self.game = game
+        self.enabled = enabled
+        self.writer = writer
+        self.samples = deque(maxlen=MEMORY_GROWTH_SAMPLES)
+        self.first_snapshot = None
+        self.last_sample_time = pygame.time.get_ticks()
+
+        if enabled:
+            if writer is None:
+                self.writer = TelemetryWriter(MEMORY_FILE)
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    def update(self):
+        """Take a sample when the sample interval has passed."""
+        if not self.enabled:
+            return
+
+        now = pygame.time.get_ticks()
+        if now - self.last_sample_time >= MEMORY_SAMPLE_INTERVAL:
+            self.last_sample_time = now
+            self.sample()
+
+    def sample(self):
+        """Record the memory of the game and return the record."""
+        traced, peak = tracemalloc.get_traced_memory()
+        counts = {"traced_kb": traced // 1024, **count_live_objects()}
+        self.samples.append(counts)
+        if self.first_snapshot is None and tracemalloc.is_tracing():
+            self.first_snapshot = tracemalloc.take_snapshot()
+
+        record = {
+            "time": round(time.time(), 3),
+            "level": self.game.stats.level,
+            "mode": self.game.settings.game_modes.game_mode,
+            "peak_kb": peak // 1024,
+            **counts,
+        }
+        if len(self.samples) == self.samples.maxlen:
+            growing = get_growing(self.samples)
+            if growing:
+                record["growing"] = growing
+            if growing and self.first_snapshot is not None:
+                record["top_allocations"] = self._get_top_allocations()
+        if self.writer is not None:
+            self.writer.write(record)
+        return record
+
+    def _get_top_allocations(self):
+        """Return the lines that allocated the most since the first sample."""
+        stats = tracemalloc.take_snapshot().compare_to(self.first_snapshot, "lineno")
+        return [str(stat) for stat in stats[:MEMORY_TOP_ALLOCATIONS]]
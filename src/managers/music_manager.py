@@ -0,0 +1,112 @@
+"""
+The 'music_manager' module contains the MusicManager class which plays
+the background music and handles the transitions between tracks.
+"""
+
+import io
+import threading
+
+import pygame
+
+from src.utils.constants import MUSIC_FADE_MS, MAX_MUSIC_LEVEL
+
+
+class MusicManager:
+    """This class plays the level music. Tracks are looked up from a level
+    index built once per music dict, the next track is read into memory on
+    a background thread, and track changes fade out the current track
+    and fade in the next one on a later frame instead of loading it
+    while the next fleet is spawned.
+    """
+
+    def __init__(self, fade_ms=MUSIC_FADE_MS):
+        self.fade_ms = fade_ms
+        self.level_indexes = {}
+        self.preloaded = {}
+        self.current_track = None
+        self.pending_track = None
+        self._lock = threading.Lock()
+
+    def level_index(self, music_dict):
+        """Return a dict that maps every level to the track played on it."""
+        key = tuple(music_dict.items())
+        if key not in self.level_indexes:
+            index = {}
+            for level_range, track in music_dict.items():
+                for level in level_range:
+                    if level > MAX_MUSIC_LEVEL:
+                        break
+                    index.setdefault(level, track)
+            self.level_indexes[key] = index
+        return self.level_indexes[key]
+
+    def track_for_level(self, music_dict, level):
+        """Return the track for the given level, or None if there is none."""
+        return self.level_index(music_dict).get(level)
+
+    def play(self, track):
+        """Switch to the given track. If music is already playing, it is
+        faded out and the new track starts from update().
+        """
+        if track is None:
+            return
+
+        if pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(self.fade_ms)
+            self.pending_track = track
+        else:
+            self._start(track)
+
+    def play_now(self, track):
+        """Switch to the given track right away, without waiting for
+        the current one to fade out. The pending track is dropped.
+        """
+        self.cancel_pending()
+        if track is not None:
+            self._start(track)
+
+    def update(self):
+        """Start the pending track once the previous one has faded out."""
+        if self.pending_track is not None and not pygame.mixer.music.get_busy():
+            self._start(self.pending_track)
+
+    def _start(self, track):
+        """Load and play a track, using its preloaded data when available."""
+        with self._lock:
+            data = self.preloaded.pop(track, None)
+
+        if data is not None:
+            pygame.mixer.music.load(io.BytesIO(data), track)
+        else:
+            pygame.mixer.music.load(track)
+        pygame.mixer.music.play(-1, fade_ms=self.fade_ms)
+
+        self.current_track = track
+        self.pending_track = None
+
+    def preload(self, track):
+        """Read a track into memory on a background thread."""
+        if track is None or track == self.current_track:
+            return
+        with self._lock:
+            if track in self.preloaded:
+                return
+
+        thread = threading.Thread(target=self._read_track, args=(track,), daemon=True)
+        thread.start()
+
+    def _read_track(self, track):
+        """Read the track file and keep only the most recent preload."""
+        try:
+            with open(track, "rb") as track_file:
+                data = track_file.read()
+        except OSError:
+            return
+
+        with self._lock:
+            self.preloaded.clear()
+            self.preloaded[track] = data
+
+    def cancel_pending(self):
+        """Forget the track waiting for the fade out to finish."""
+        self.pending_track = None
@@ -0,0 +1,252 @@
+"""
+The 'network_manager' module contains the NetHost and NetClient classes
+that let two players play Cosmic Conflict over the network.
+
+The host runs the game and plays the Thunderbird, the client plays the
+Phoenix. Every tick the client sends its input bits to the host and the
+host sends back a snapshot of the ships and of their projectiles.
+"""
+
+import socket
+import struct
+from collections import deque
+
+from src.utils.constants import (
+    NET_INPUT_REDUNDANCY,
+    NET_SNAPSHOT_HISTORY,
+    PLAYER_HEALTH_ATTRS,
+)
+from src.utils.net_format import (
+    BULLET,
+    FIRST_PROJECTILE_ID,
+    INPUT_PACKET,
+    LASER,
+    MAX_NET_ID,
+    MISSILE,
+    SHIP,
+    SHIP_IDS,
+    SNAPSHOT_PACKET,
+    decode_input,
+    decode_ship_flags,
+    decode_snapshot,
+    encode_input,
+    encode_ship_flags,
+    encode_snapshot,
+    get_packet_type,
+)
+from src.utils.net_link import UdpEndpoint
+
+# The sprite groups of every ship that are sent in the snapshots.
+PROJECTILE_GROUPS = (("bullets", BULLET), ("missiles", MISSILE), ("laser", LASER))
+
+
+class NetHost:
+    """Runs the game for a remote player. The first client that sends an
+    input plays the Phoenix, its inputs are applied to the ship before
+    the game logic of a tick and a snapshot is sent to it after.
+    A snapshot only holds the changes since the last snapshot that the
+    client acknowledged, and everything when there is none.
+    """
+
+    def __init__(self, game, endpoint=None):
+        self.game = game
+        self.endpoint = endpoint or UdpEndpoint()
+        self.client_address = None
+        self.tick = 0
+        self.acked_tick = 0
+        self.last_input = 0
+        # The entities the client has after every snapshot sent to it.
+        self.history = {}
+        self.net_ids = {}
+        self.next_id = FIRST_PROJECTILE_ID
+
+    def receive_inputs(self):
+        """Apply the new inputs of the client to the Phoenix, in order."""
+        for packet, address in self.endpoint.receive():
+            if get_packet_type(packet) != INPUT_PACKET:
+                continue
+            if self.client_address is None:
+                self.client_address = address
+            elif address != self.client_address:
+                continue
+            try:
+                ack_tick, sequence, inputs = decode_input(packet)
+            except (ValueError, struct.error):
+                continue
+
+            if ack_tick in self.history:
+                self.acked_tick = max(self.acked_tick, ack_tick)
+
+            # The packet repeats the last inputs, only the new ones are applied.
+            first_sequence = sequence - len(inputs) + 1
+            for input_sequence, bits in enumerate(inputs, first_sequence):
+                if input_sequence > self.last_input:
+                    self._apply_input(bits)
+                    self.last_input = input_sequence
+
+    def _apply_input(self, bits):
+        """Apply one tick of input to the Phoenix."""
+        self.game.player_input.apply_input_bits(
+            self.game.phoenix_ship,
+            bits,
+            self.game.weapons_manager.fire_missile,
+            self.game.weapons_manager.fire_laser,
+        )
+
+    def send_snapshot(self):
+        """Send the changes of this tick to the client."""
+        if self.client_address is None:
+            return
+
+        self.tick += 1
+        baseline_tick = self.acked_tick if self.acked_tick in self.history else 0
+        packet, state = encode_snapshot(
+            self.tick,
+            baseline_tick,
+            self.history.get(baseline_tick, {}),
+            self.capture(),
+        )
+        self.history[self.tick] = state
+        self.history.pop(self.tick - NET_SNAPSHOT_HISTORY, None)
+        self.endpoint.send(packet, self.client_address)
+
+    def capture(self):
+        """Return the entities of the game for this tick."""
+        stats = self.game.stats
+        entities = {}
+        for ship_type, net_id in SHIP_IDS.items():
+            ship = getattr(self.game, f"{ship_type}_ship")
+            entities[net_id] = (
+                SHIP,
+                (
+                    ship.rect.x,
+                    ship.rect.y,
+                    encode_ship_flags(ship.state),
+                    getattr(stats, PLAYER_HEALTH_ATTRS[ship_type]),
+                    ship.missiles_num,
+                    getattr(stats, f"{ship_type}_score"),
+                ),
+            )
+
+        # The projectiles keep their ids for as long as they exist.
+        net_ids = {}
+        for owner, ship_type in enumerate(SHIP_IDS):
+            for group_name, kind in PROJECTILE_GROUPS:
+                for sprite in getattr(self.game, f"{ship_type}_{group_name}"):
+                    net_id = self.net_ids.get(sprite) or self._get_new_id()
+                    net_ids[sprite] = net_id
+                    entities[net_id] = (kind, (owner, sprite.rect.x, sprite.rect.y))
+        self.net_ids = net_ids
+        return entities
+
+    def _get_new_id(self):
+        """Return an id that no projectile is using."""
+        used_ids = set(self.net_ids.values())
+        while True:
+            net_id = self.next_id
+            self.next_id = net_id + 1 if net_id < MAX_NET_ID else FIRST_PROJECTILE_ID
+            if net_id not in used_ids:
+                return net_id
+
+    def close(self):
+        """Stop hosting the game."""
+        self.endpoint.close()
+
+
+class NetClient:
+    """Plays the Phoenix in a game run by a remote host. Every input is
+    sent with the ones before it, so that it survives lost packets, and
+    with the tick of the last snapshot received, which the host uses
+    as the baseline of the next snapshots.
+    """
+
+    def __init__(self, game, host_address, endpoint=None):
+        self.game = game
+        host, port = host_address
+        self.host_address = (socket.gethostbyname(host), port)
+        self.endpoint = endpoint or UdpEndpoint()
+        self.sequence = 0
+        self.inputs = deque(maxlen=NET_INPUT_REDUNDANCY)
+        self.tick = 0
+        self.history = {}
+        self.entities = {}
+
+    def send_input(self, bits):
+        """Send the input bits of this tick to the host."""
+        self.sequence += 1
+        self.inputs.append(bits)
+        self.endpoint.send(
+            encode_input(self.tick, self.sequence, self.inputs), self.host_address
+        )
+
+    def receive_snapshots(self):
+        """Rebuild the entities from the snapshots of the host. The
+        snapshots older than the last one or with an unknown baseline
+        are ignored. Return True when a newer snapshot arrived.
+        """
+        received = False
+        for packet, address in self.endpoint.receive():
+            if (
+                address != self.host_address
+                or get_packet_type(packet) != SNAPSHOT_PACKET
+            ):
+                continue
+            try:
+                tick, baseline_tick, removed, updates = decode_snapshot(packet)
+            except (ValueError, struct.error):
+                continue
+
+            baseline = self.history.get(baseline_tick) if baseline_tick else {}
+            if tick <= self.tick or baseline is None:
+                continue
+
+            entities = dict(baseline)
+            for net_id in removed:
+                entities.pop(net_id, None)
+            entities.update(updates)
+
+            self.history[tick] = entities
+            for old_tick in [
+                old_tick
+                for old_tick in self.history
+                if old_tick <= tick - NET_SNAPSHOT_HISTORY
+            ]:
+                del self.history[old_tick]
+            self.tick = tick
+            self.entities = entities
+            received = True
+        return received
+
+    def apply_snapshot(self):
+        """Move the ships of the game to the last snapshot and update
+        their states, health, missiles and scores.
+        """
+        stats = self.game.stats
+        for ship_type, net_id in SHIP_IDS.items():
+            if net_id not in self.entities:
+                continue
+            _, (x_pos, y_pos, flags, health, missiles, score) = self.entities[net_id]
+            ship = getattr(self.game, f"{ship_type}_ship")
+            ship.x_pos, ship.y_pos = float(x_pos), float(y_pos)
+            ship.rect.topleft = (x_pos, y_pos)
+            for name, value in decode_ship_flags(flags).items():
+                setattr(ship.state, name, value)
+            ship.missiles_num = missiles
+            setattr(stats, PLAYER_HEALTH_ATTRS[ship_type], health)
+            setattr(stats, f"{ship_type}_score", score)
+
+    def get_projectiles(self):
+        """Return the kind, the owner and the position of every projectile
+        in the last snapshot.
+        """
+        owners = tuple(SHIP_IDS)
+        projectiles = []
+        for kind, fields in self.entities.values():
+            if kind != SHIP:
+                owner, x_pos, y_pos = fields
+                projectiles.append((kind, owners[owner], (x_pos, y_pos)))
+        return projectiles
+
+    def close(self):
+        """Leave the game."""
+        self.endpoint.close()
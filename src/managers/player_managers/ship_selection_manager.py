@@ -123,7 +123,7 @@ class ShipSelection:
         descriptions = (
             THUNDER_SHIP_DESCRIPTIONS if ship_type == 1 else PHOENIX_SHIP_DESCRIPTIONS
         )
-        if ship_rect.collidepoint(pygame.mouse.get_pos()):
+        if ship_rect.collidepoint(self.game.display_manager.get_mouse_pos()):
             display_description(self.screen, descriptions[index], 60, 140)
 
     def handle_ship_selection(self, mouse_pos):
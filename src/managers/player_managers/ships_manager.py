@@ -5,6 +5,7 @@ maintaining ship states, and resetting ships.
 """
 
 from src.entities.player_entities.player_ships import Thunderbird, Phoenix
+from src.game_logic.game_events import ShipHit
 from src.utils.game_utils import play_sound
 
 
@@ -33,19 +34,18 @@ class ShipsManager:
     def _destroy_ship(self, ship):
         """Destroy the given ship."""
         ship.explode()
-        play_sound(self.game.sound_manager.game_sounds, "explode")
         ship.state.shielded = False
 
         if ship == self.thunderbird_ship:
             self._update_thunderbird_stats()
+            self.game.events.emit(ShipHit("thunderbird"))
         elif ship == self.phoenix_ship:
             self._update_phoenix_stats()
+            self.game.events.emit(ShipHit("phoenix"))
 
         ship.set_immune()
         ship.center_ship()
 
-        self.game.score_board.create_health()
-
         if self.settings.game_modes.last_bullet:
             self.game.gameplay_manager.check_remaining_bullets()
 
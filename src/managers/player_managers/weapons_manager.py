@@ -4,10 +4,10 @@ the creation and behavior of player weapons available in the game.
 """
 
 import time
-import pygame
 
+from src.game_logic.game_events import WeaponFired, LaserStatus, AmmoChanged
 from src.utils.constants import WEAPONS
-from src.utils.game_utils import play_sound, display_custom_message, load_single_image
+from src.utils.game_utils import load_single_image, remove_sprites_outside
 
 
 class WeaponsManager:
@@ -19,8 +19,7 @@ class WeaponsManager:
         self.game_modes = self.settings.game_modes
         self.screen = game.screen
         self.sound_manager = game.sound_manager
-        self.draw_laser_message = False
-        self.display_time = 0
+        self.events = game.events
         self.thunderbird_ship = self.game.thunderbird_ship
         self.phoenix_ship = self.game.phoenix_ship
         self.game_modes = self.settings.game_modes
@@ -78,12 +77,10 @@ class WeaponsManager:
         else:
             all_projectiles = self.multiplayer_projectiles
 
+        screen_rect = self.settings.bounds.rect
         for projectiles in all_projectiles:
             projectiles.update()
-
-            for projectile in projectiles.copy():
-                if not self.screen.get_rect().colliderect(projectile.rect):
-                    projectiles.remove(projectile)
+            remove_sprites_outside(projectiles, screen_rect)
 
     def fire_bullet(self, bullets, bullets_allowed, bullet_class, num_bullets, ship):
         """Create new player bullets."""
@@ -108,20 +105,20 @@ class WeaponsManager:
                 new_bullet.rect.centery = ship.rect.centery + offset
                 if self.game_modes.last_bullet:
                     ship.remaining_bullets -= 1
-                    self.game.score_board.render_bullets_num()
+                    self.events.emit(AmmoChanged("bullets"))
                 bullet_fired = True
 
         if bullet_fired:
-            play_sound(self.sound_manager.game_sounds, "bullet")
+            self.events.emit(WeaponFired("bullet"))
 
     def fire_missile(self, missiles, ship, missile_class):
         """Fire a missile from the given ship and update the missiles number."""
         if ship.missiles_num > 0:
             new_missile = missile_class(self, ship)
-            play_sound(self.sound_manager.game_sounds, "missile_launch")
+            self.events.emit(WeaponFired("missile"))
             missiles.add(new_missile)
             ship.missiles_num -= 1
-            self.game.score_board.render_missiles_num(ship)
+            self.events.emit(AmmoChanged("missiles"))
 
     def fire_laser(self, lasers, ship, laser_class):
         """Fire a laser from the ship."""
@@ -138,8 +135,7 @@ class WeaponsManager:
         on the required kill count.
         """
         if self.game_modes.last_bullet:
-            self.draw_laser_message = True
-            play_sound(self.sound_manager.game_sounds, "laser_not_ready")
+            self.events.emit(LaserStatus(ready=False))
             return
 
         if ship.aliens_killed >= self.settings.required_kill_count:
@@ -147,10 +143,9 @@ class WeaponsManager:
             lasers.add(new_laser)
             ship.aliens_killed = 0
             ship.laser_ready = False
-            play_sound(self.sound_manager.game_sounds, "fire_laser")
+            self.events.emit(WeaponFired("laser"))
         else:
-            self.draw_laser_message = True
-            play_sound(self.sound_manager.game_sounds, "laser_not_ready")
+            self.events.emit(LaserStatus(ready=False))
 
     def update_normal_laser_status(self):
         """Check the status of the normal laser."""
@@ -162,7 +157,7 @@ class WeaponsManager:
                     ship.laser_ready = True
                     ship.laser_ready_msg = True
                     ship.laser_ready_start_time = current_time
-                    play_sound(self.sound_manager.game_sounds, "laser_ready")
+                    self.events.emit(LaserStatus(ready=True))
 
                 if (
                     ship.laser_ready
@@ -183,10 +178,9 @@ class WeaponsManager:
             ship.last_laser_time = time.time()
             self.game.pause_time = 0
             ship.laser_ready = False
-            play_sound(self.sound_manager.game_sounds, "fire_laser")
+            self.events.emit(WeaponFired("laser"))
         else:
-            self.draw_laser_message = True
-            play_sound(self.sound_manager.game_sounds, "laser_not_ready")
+            self.events.emit(LaserStatus(ready=False))
 
     def update_timed_laser_status(self):
         """Check the status of the timed laser."""
@@ -198,7 +192,7 @@ class WeaponsManager:
                     if not ship.laser_ready:
                         ship.laser_ready = True
                         ship.laser_ready_start_time = current_time
-                        play_sound(self.sound_manager.game_sounds, "laser_ready")
+                        self.events.emit(LaserStatus(ready=True))
 
                     if (
                         ship.laser_ready
@@ -207,30 +201,6 @@ class WeaponsManager:
                         ship.laser_ready = False
                         ship.last_laser_usage = current_time
 
-    def check_laser_availability(self):
-        """Check the laser availability for each ship and
-        display a message if the laser is ready or not.
-        """
-        for ship in self.game.ships:
-            if ship.laser_ready and ship.state.alive:
-                if self.game_modes.cosmic_conflict:
-                    display_custom_message(self.screen, "Ready!", ship, cosmic=True)
-                else:
-                    display_custom_message(self.screen, "Ready!", ship)
-
-            if self.draw_laser_message and ship.laser_fired:
-                if self.game_modes.last_bullet:
-                    display_custom_message(self.screen, "Not available!", ship)
-                elif self.game_modes.cosmic_conflict:
-                    display_custom_message(self.screen, "Not Ready!", ship, cosmic=True)
-                else:
-                    display_custom_message(self.screen, "Not Ready!", ship)
-
-        current_time = pygame.time.get_ticks()
-        if self.draw_laser_message and current_time > self.display_time + 1500:
-            self.draw_laser_message = False
-            self.display_time = current_time
-
     def update_laser_status(self):
         """Update laser status for the one of the lasers, based
         on the game mode."""
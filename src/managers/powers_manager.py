@@ -7,8 +7,16 @@ import time
 import random
 
 from src.entities.powers import Power
+from src.game_logic.game_events import (
+    PowerCollected,
+    ScoreChanged,
+    AmmoChanged,
+)
 from src.utils.constants import POWER_DOWN_ATTRIBUTES, PLAYER_HEALTH_ATTRS
-from src.utils.game_utils import play_sound, display_custom_message
+from src.utils.game_utils import (
+    display_custom_message,
+    remove_sprites_below,
+)
 
 
 class PowerEffectsManager:
@@ -21,6 +29,7 @@ class PowerEffectsManager:
         self.screen = game.screen
         self.score_board = score_board
         self.stats = stats
+        self.events = game.events
 
         self.settings = game.settings
         self.thunderbird_ship = game.thunderbird_ship
@@ -96,28 +105,28 @@ class PowerEffectsManager:
         effect_choice = random.choice(self.powerup_choices + self.penalty_choices)
         self._check_power_name(effect_choice, player)
         effect_choice(player)
-        self._play_power_sound(
-            effect_choice, self.powerup_choices, self.penalty_choices
+        self._emit_power_collected(
+            player, effect_choice, self.powerup_choices, self.penalty_choices
         )
 
-    def _play_power_sound(self, effect_choice, powerup_choices, penalty_choices):
-        """Play a sound effect based on the given effect choice,
-        considering available power-ups and penalties.
+    def _emit_power_collected(
+        self, player, effect_choice, powerup_choices, penalty_choices
+    ):
+        """Report the power picked up by the player, telling apart
+        the freeze power, the other power-ups and the penalties.
         """
         if effect_choice in powerup_choices:
             if effect_choice.__name__ == self.freeze_enemies.__name__:
-                play_sound(self.game.sound_manager.game_sounds, "freeze")
+                self.events.emit(PowerCollected(player, "freeze"))
             else:
-                play_sound(self.game.sound_manager.game_sounds, "power_up")
+                self.events.emit(PowerCollected(player, "power_up"))
         elif effect_choice in penalty_choices:
-            play_sound(self.game.sound_manager.game_sounds, "penalty")
+            self.events.emit(PowerCollected(player, "penalty"))
 
     def update_powers(self):
         """Update powers and remove the ones that went off screen."""
         self.game.powers.update()
-        for power in self.game.powers.copy():
-            if power.rect.y > self.settings.screen_height:
-                self.game.powers.remove(power)
+        remove_sprites_below(self.game.powers, self.settings.bounds.rect.bottom)
 
     def _check_power_name(self, effect_choice, player):
         """Check what power was picked up and set the power name
@@ -155,13 +164,12 @@ class PowerEffectsManager:
             current_hp = getattr(self.stats, health_attr)
             if current_hp < self.stats.max_hp:
                 setattr(self.stats, health_attr, current_hp + 1)
-            self.score_board.create_health()
-            play_sound(self.game.sound_manager.game_sounds, "health")
+            self.events.emit(PowerCollected(player, "health"))
 
     def weapon_power_up(self, player, weapon_name):
         """Changes the given player's weapon."""
         self.game.weapons_manager.set_weapon(player, weapon_name)
-        play_sound(self.game.sound_manager.game_sounds, "weapon")
+        self.events.emit(PowerCollected(player, "weapon"))
 
     # Penalties
     def decrease_ship_speed(self, player):
@@ -226,8 +234,7 @@ class PowerEffectsManager:
         setattr(
             self.stats, f"{player}_score", getattr(self.stats, f"{player}_score") + 550
         )
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
+        self.events.emit(ScoreChanged())
 
     def change_ship_size(self, player):
         """Make the specified player smaller (for a period of time)."""
@@ -275,7 +282,7 @@ class PowerEffectsManager:
     def increase_missiles_num(self, player):
         """Increases the number of missiles for the specified player."""
         getattr(self, f"{player}_ship").missiles_num += 1
-        self.score_board.render_missiles_num()
+        self.events.emit(AmmoChanged("missiles"))
 
     def draw_ship_shield(self, player):
         """Activates the shield on the specified player."""
@@ -295,7 +302,7 @@ class PowerEffectsManager:
         """Power up special for the Last Bullet game mode, it increases
         the remaining bullets number by one for the specified player."""
         getattr(self, f"{player}_ship").remaining_bullets += 1
-        self.score_board.render_bullets_num()
+        self.events.emit(AmmoChanged("bullets"))
 
     def manage_power_downs(self):
         """Set the power down states of the ship to False after a period of time."""
@@ -7,28 +7,36 @@ import datetime
 import pickle
 import os
 import sys
-
-import tkinter as tk
-from tkinter import messagebox
+import time
 
 import pygame
 
 from src.entities.alien_entities.aliens import Alien, BossAlien
+from src.managers.ui_managers.display_manager import RESIZE_EVENTS
+from src.ui.dialog import ConfirmDialog
 from src.utils.constants import (
     DATA_KEYS,
     ATTRIBUTE_MAPPING,
+    SAVE_SLOTS_NUM,
+    SLOTS_TOP,
     SLOT_HEIGHT,
     TEXT_PADDING_X,
     TEXT_PADDING_Y,
     SELECTED_SLOT_COLOR,
     BORDER_WIDTH,
+    SAVE_MESSAGE_DURATION,
+    GAME_MODE_DISPLAY_NAMES,
 )
+from src.utils.game_dataclasses import SaveSlot
 from src.utils.game_utils import (
     set_attribute,
     display_simple_message,
+    render_simple_text,
     play_sound,
     create_save_dir,
 )
+from src.utils.save_format import decode_save, is_save_format
+from src.utils.save_writer import SaveWriter, SAVE_COMPLETED_EVENT
 
 
 class SaveLoadSystem:
@@ -43,20 +51,27 @@ class SaveLoadSystem:
 
         self.data = {}
         create_save_dir(self.save_folder)
+        self.save_writer = SaveWriter(self.save_folder, self.file_extension)
+        self.save_message = None
+        self.save_message_time = 0
 
         self.font = pygame.font.SysFont("verdana", 22)
+        self.details_font = pygame.font.SysFont("verdana", 15)
         self.text_color = (225, 225, 225)
+        self.confirm_dialog = ConfirmDialog(game, self.text_color)
 
         self.center_x = self.screen.get_width() // 2
+        self.buttons_y = SLOTS_TOP + SAVE_SLOTS_NUM * SLOT_HEIGHT
+        self.slots = []
 
         self.cancel_text = self.font.render("Exit", True, self.text_color)
         self.delete_text = self.font.render("Clear Saves", True, self.text_color)
 
         self.cancel_rect = self.cancel_text.get_rect(
-            center=(self.screen.get_width() // 2 + 100, 465)
+            center=(self.screen.get_width() // 2 + 100, self.buttons_y)
         )
         self.delete_rect = self.delete_text.get_rect(
-            center=(self.screen.get_width() // 2 - 100, 465)
+            center=(self.screen.get_width() // 2 - 100, self.buttons_y)
         )
 
         self.set_screen_title_position()
@@ -142,6 +157,7 @@ class SaveLoadSystem:
             "asteroid_speed": settings.asteroid_speed,
             "asteroid_freq": settings.asteroid_freq,
             "speedup_scale": settings.speedup_scale,
+            "difficulty": settings.difficulty,
         }
 
         for data_name, data_value in data_names.items():
@@ -189,71 +205,126 @@ class SaveLoadSystem:
         )
 
     def prepare_sprite_data_for_serialization(self):
-        """Prepare the sprite data for serialization."""
+        """Prepare the sprite data for serialization. Only the logical state
+        of the aliens is stored, the images are rebuilt when loading.
+        """
         alien_sprites = self.data["aliens"]
+        now = time.time()
 
         return {
             "alien_sprites": [
                 {
-                    "rect": sprite.rect,
-                    "size": sprite.image.get_size(),
-                    "image": pygame.image.tostring(sprite.image, "RGBA"),
+                    "type": "boss" if isinstance(sprite, BossAlien) else "alien",
                     "is_baby": (
                         False if isinstance(sprite, BossAlien) else sprite.is_baby
                     ),
-                    "type": "boss" if isinstance(sprite, BossAlien) else "alien",
-                    "location": sprite.rect.x,
+                    "location": sprite.x_pos,
+                    "y": sprite.rect.y,
                     "hit_count": sprite.hit_count,
                     "last_bullet_time": sprite.last_bullet_time,
                     "immune_state": (
-                        sprite.immune_state if isinstance(sprite, Alien) else None
+                        sprite.immune_state if isinstance(sprite, Alien) else False
                     ),
                     "frozen_state": sprite.frozen_state,
+                    "frozen_time": (
+                        now - sprite.frozen_start_time if sprite.frozen_state else 0
+                    ),
+                    "immune_time": (
+                        now - sprite.immune_start_time
+                        if isinstance(sprite, Alien) and sprite.immune_state
+                        else 0
+                    ),
+                    "direction": sprite.motion.direction,
                 }
                 for sprite in alien_sprites
             ],
         }
 
     def save_data(self, name, save_date):
-        """Saves the current game data to a file."""
-        file_path = os.path.join(self.save_folder, f"{name}.{self.file_extension}")
+        """Takes a snapshot of the current game data and passes it to
+        the save writer, which writes it to a file in the background.
+        """
         sprite_data = self.prepare_sprite_data_for_serialization()
 
         game_data = {
-            "sprite_data": sprite_data,
             **{key: self.data[key] for key in DATA_KEYS},
             "save_date": save_date,
         }
-        with open(file_path, "wb") as file:
-            pickle.dump(game_data, file)
+        metadata = {
+            "timestamp": time.time(),
+            "level": self.data["level"],
+            "mode": self.data["game_mode"],
+            "score": self.data["thunderbird_score"] + self.data["phoenix_score"],
+            "ship": self.data["thunder_ship_name"],
+        }
+        self.save_writer.save(name, game_data, sprite_data["alien_sprites"], metadata)
+
+    def handle_save_completed(self, event):
+        """Show the result of a save that finished in the background."""
+        if event.success:
+            self.save_message = ("Game Saved!", "lightblue")
+        else:
+            self.save_message = ("Save failed!", "red")
+        self.save_message_time = pygame.time.get_ticks()
+        self.refresh_slots()
+
+    def draw_save_message(self):
+        """Draw the save result message for a short time."""
+        if self.save_message is None:
+            return
+
+        if pygame.time.get_ticks() - self.save_message_time > SAVE_MESSAGE_DURATION:
+            self.save_message = None
+            return
+
+        text, color = self.save_message
+        message_surface, message_rect = render_simple_text(
+            text, self.font, color, self.screen.get_width() // 2, 600
+        )
+        self.screen.blit(message_surface, message_rect)
 
     def load_data(self, name):
         """Loads game data from a file and updates the game state."""
         file_path = os.path.join(self.save_folder, f"{name}.{self.file_extension}")
         try:
             with open(file_path, "rb") as file:
-                loaded_data = pickle.load(file)
+                loaded_data = self.decode_save_data(file.read())
                 self.update_game_state_from_data(loaded_data)
                 self.restore_sprites_from_data(loaded_data)
         except FileNotFoundError:
             play_sound(self.game.sound_manager.game_sounds, "empty_save")
 
+    @staticmethod
+    def decode_save_data(blob):
+        """Decode the content of a save file. Save files written before
+        the binary format are loaded with the legacy pickle loader.
+        """
+        if is_save_format(blob):
+            return decode_save(blob)
+        return pickle.loads(blob)
+
     def restore_sprites_from_data(self, loaded_data):
         """Restores the game sprites based on the provided data."""
         sprite_data = loaded_data["sprite_data"]
         alien_sprites = self.game.aliens
         alien_sprites.empty()
+        now = time.time()
 
         for sprite_state in sprite_data.get("alien_sprites", []):
-            size = sprite_state["size"]
-
             sprite = self.create_alien_sprite(
                 sprite_state["type"], sprite_state, self.game
             )
 
-            sprite.size = size
-            sprite.rect = sprite_state["rect"]
-            sprite.image = pygame.image.fromstring(sprite_state["image"], size, "RGBA")
+            if "image" in sprite_state:
+                self._restore_legacy_sprite(sprite, sprite_state)
+            else:
+                sprite.rect.x = round(sprite_state["location"])
+                sprite.rect.y = sprite_state["y"]
+                sprite.hit_count = sprite_state["hit_count"]
+                sprite.frozen_start_time = now - sprite_state["frozen_time"]
+                sprite.immune_start_time = now - sprite_state["immune_time"]
+                sprite.motion.direction = sprite_state["direction"]
+
             sprite.x_pos = sprite_state["location"]
             sprite.frozen_state = sprite_state["frozen_state"]
             sprite.immune_state = sprite_state["immune_state"]
@@ -261,6 +332,14 @@ class SaveLoadSystem:
 
             alien_sprites.add(sprite)
 
+    @staticmethod
+    def _restore_legacy_sprite(sprite, sprite_state):
+        """Restore the rect and image of a sprite from a legacy save file."""
+        size = sprite_state["size"]
+        sprite.size = size
+        sprite.rect = sprite_state["rect"]
+        sprite.image = pygame.image.fromstring(sprite_state["image"], size, "RGBA")
+
     def create_alien_sprite(self, sprite_type, sprite_state, game):
         """Create an alien sprite based on the given sprite type and state."""
         if sprite_type == "boss":
@@ -276,6 +355,9 @@ class SaveLoadSystem:
     def update_game_state_from_data(self, loaded_data):
         """Updates the game state based on the loaded data."""
         for key in DATA_KEYS:
+            if key not in loaded_data:
+                # Older saves keep the current value of the newer keys.
+                continue
             if key in ATTRIBUTE_MAPPING:
                 attributes = ATTRIBUTE_MAPPING[key]
                 set_attribute(self.game, attributes, loaded_data[key])
@@ -294,16 +376,13 @@ class SaveLoadSystem:
         """Displays the save or the load menu, allowing the user
         to select and interact with available save slots.
         """
-        # Create the save directory and get the list of save files
         self.menu_running = True
 
-        save_files = self._get_save_files()
+        self.refresh_slots()
         slot_selected = 0
-        slot_rects = []
 
         while self.menu_running:
             # Handle events
-            self.game.screen_manager.update_window_mode()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
@@ -312,10 +391,10 @@ class SaveLoadSystem:
                 elif event.type == pygame.KEYDOWN:
                     if event.key in [pygame.K_UP, pygame.K_w]:
                         play_sound(self.game.sound_manager.game_sounds, "keypress")
-                        slot_selected = (slot_selected - 1) % 3
+                        slot_selected = (slot_selected - 1) % len(self.slots)
                     elif event.key in [pygame.K_DOWN, pygame.K_s]:
                         play_sound(self.game.sound_manager.game_sounds, "keypress")
-                        slot_selected = (slot_selected + 1) % 3
+                        slot_selected = (slot_selected + 1) % len(self.slots)
                     elif event.key == pygame.K_RETURN:
                         self._handle_save_slot_action(self.font, slot_selected, save)
                         return
@@ -323,16 +402,16 @@ class SaveLoadSystem:
                         play_sound(self.game.sound_manager.game_sounds, "keypress")
                         return
                     elif event.key == pygame.K_f:
-                        self.game.screen_manager.toggle_window_mode()
+                        self.game.display_manager.toggle_fullscreen()
                     elif event.key == pygame.K_F1:
                         self.game.sound_manager.toggle_mute_music("menu")
                     elif event.key == pygame.K_F2:
                         self.game.sound_manager.toggle_mute_sfx()
 
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-                    for i, rect in enumerate(slot_rects):
-                        if rect.collidepoint(mouse_x, mouse_y):
+                    mouse_x, mouse_y = self.game.display_manager.get_mouse_pos()
+                    for i, slot in enumerate(self.slots):
+                        if slot.rect.collidepoint(mouse_x, mouse_y):
                             slot_selected = i
                             self._handle_save_slot_action(
                                 self.font, slot_selected, save
@@ -350,74 +429,94 @@ class SaveLoadSystem:
                             self._delete_all_save_files()
                         else:
                             play_sound(self.game.sound_manager.game_sounds, "click")
-                elif event.type == pygame.VIDEORESIZE:
-                    self.game.screen_manager.resize_screen(event.size)
-                    self.game.screen_manager.update_buttons()
+                elif event.type in RESIZE_EVENTS:
+                    self.game.display_manager.request_resize()
+                elif event.type == SAVE_COMPLETED_EVENT:
+                    self.handle_save_completed(event)
 
             # Render the display
             self.screen.blit(self.game.bg_img, [0, 0])
             self.display_screen_title(save)
-            self._draw_save_slots(
-                self.font,
-                self.text_color,
-                self.center_x,
-                save_files,
-                slot_selected,
-                slot_rects,
-            )
+            self._draw_save_slots(slot_selected)
             self.screen.blit(self.cancel_text, self.cancel_rect)
             self.screen.blit(self.delete_text, self.delete_rect)
             self.game.screen_manager.draw_cursor()
-            pygame.display.flip()
-
-    def _get_save_files(self):
-        """Get the list of save files from the specified save folder."""
-        file_list = os.listdir(self.save_folder)
-        return [
-            f
-            for f in file_list
-            if os.path.isfile(os.path.join(self.save_folder, f))
-            and f.endswith(self.file_extension)
-        ]
+            self.game.display_manager.present()
 
-    def _get_save_status_text(self, slot_number, save_files):
-        """Get the status text for the specified save slot number."""
-        save_file_name = f"save{slot_number}.save"
-        if save_file_name not in save_files:
-            return "Empty"
+    def refresh_slots(self):
+        """Rebuild the save slots from the save index and render their text.
+        This runs when the menu opens and after a save or delete,
+        not on every frame.
+        """
+        save_index = self.save_writer.get_index()
+        self.slots = []
+
+        for slot_number in range(1, SAVE_SLOTS_NUM + 1):
+            slot = SaveSlot(f"save{slot_number}", save_index.get(f"save{slot_number}"))
+            status_text = self._get_save_status_text(slot_number, save_index)
+            slot.title = self.font.render(
+                f"Save File {slot_number}: {status_text}", True, self.text_color
+            )
+            if details_text := self._get_save_details_text(slot.metadata):
+                slot.details = self.details_font.render(
+                    details_text, True, self.text_color
+                )
+            self.slots.append(slot)
 
-        try:
-            save_file_path = os.path.join(self.save_folder, save_file_name)
-            save_date = os.path.getmtime(save_file_path)
-            save_date_str = datetime.datetime.fromtimestamp(save_date).strftime(
-                "%d %b %Y  %I:%M %p"
+        self.update_slot_positions()
+
+    def update_slot_positions(self):
+        """Position the save slots based on the current screen width."""
+        for i, slot in enumerate(self.slots):
+            title_rect = slot.title.get_rect(
+                center=(self.center_x, SLOTS_TOP + i * SLOT_HEIGHT)
             )
-            return f"Saved On: {save_date_str}"
-        except FileNotFoundError:
+            slot.rect = title_rect
+            if slot.details:
+                slot.rect = title_rect.union(
+                    slot.details.get_rect(midtop=title_rect.midbottom)
+                )
+
+    def _get_save_status_text(self, slot_number, save_index):
+        """Get the status text for the specified save slot number."""
+        slot_metadata = save_index.get(f"save{slot_number}")
+        if slot_metadata is None:
             return "Empty"
 
-    def _draw_save_slots(
-        self, font, text_color, center_x, save_files, slot_selected, slot_rects
-    ):
-        """Display the save slots on the screen."""
-        for i, slot_number in enumerate(range(1, 4)):
-            status_text = self._get_save_status_text(slot_number, save_files)
-            text = font.render(
-                f"Save File {slot_number}: {status_text}", True, text_color
-            )
-            text_rect = text.get_rect(center=(center_x, 300 + i * SLOT_HEIGHT))
-            slot_rects.append(text_rect)
+        save_date_str = datetime.datetime.fromtimestamp(
+            slot_metadata["timestamp"]
+        ).strftime("%d %b %Y  %I:%M %p")
+        return f"Saved On: {save_date_str}"
 
-            self.screen.blit(text, text_rect)
+    def _get_save_details_text(self, slot_metadata):
+        """Get the level, mode, score and ship text for a save slot.
+        Returns None for empty slots and saves made before the index existed.
+        """
+        if slot_metadata is None or slot_metadata.get("level") is None:
+            return None
+
+        game_mode = slot_metadata["mode"]
+        details = [
+            f"Level {slot_metadata['level']}",
+            GAME_MODE_DISPLAY_NAMES.get(game_mode, game_mode.replace("_", " ").upper()),
+            f"Score: {slot_metadata.get('score', 0):,}",
+        ]
+        if slot_metadata.get("ship"):
+            details.append(slot_metadata["ship"])
 
-            rect = pygame.Rect(
-                text_rect.left - TEXT_PADDING_X,
-                text_rect.top - TEXT_PADDING_Y,
-                text_rect.width + 2 * TEXT_PADDING_X,
-                text_rect.height + 2 * TEXT_PADDING_Y,
-            )
+        return "  |  ".join(details)
+
+    def _draw_save_slots(self, slot_selected):
+        """Display the save slots on the screen."""
+        for i, slot in enumerate(self.slots):
+            self.screen.blit(slot.title, slot.title.get_rect(midtop=slot.rect.midtop))
+            if slot.details:
+                self.screen.blit(
+                    slot.details, slot.details.get_rect(midbottom=slot.rect.midbottom)
+                )
 
             if i == slot_selected:
+                rect = slot.rect.inflate(2 * TEXT_PADDING_X, 2 * TEXT_PADDING_Y)
                 pygame.draw.rect(self.screen, SELECTED_SLOT_COLOR, rect, BORDER_WIDTH)
 
     def _handle_save_slot_action(self, font, slot_selected, save):
@@ -429,8 +528,7 @@ class SaveLoadSystem:
 
     def _handle_save_action(self, font, slot_selected):
         """Handle the action when saving the game."""
-        save_files = self._get_save_files()
-        if f"save{slot_selected + 1}.save" in save_files:
+        if not self.slots[slot_selected].is_empty:
             if confirm_overwrite := self._show_confirmation_popup(
                 delete_save_files=False
             ):
@@ -442,54 +540,55 @@ class SaveLoadSystem:
 
     def _handle_load_action(self, font, slot_selected):
         """Handle the action when loading the game from a save file."""
-        save_files = self._get_save_files()
-        if f"save{slot_selected + 1}.save" in save_files:
+        if not self.slots[slot_selected].is_empty:
             play_sound(self.game.sound_manager.game_sounds, "load_game")
             self.load_data(f"save{slot_selected + 1}")
             self.game.game_loaded = True
-            display_simple_message(self.screen, "Game Loaded!", font, "lightblue", 1000)
+            self.game.telemetry.record_event("load", slot=f"save{slot_selected + 1}")
+            display_simple_message(
+                self.screen,
+                "Game Loaded!",
+                font,
+                "lightblue",
+                1000,
+                self.game.display_manager,
+            )
         else:
             play_sound(self.game.sound_manager.game_sounds, "empty_save")
-            display_simple_message(self.screen, "Empty save slot", font, "red", 500)
+            display_simple_message(
+                self.screen,
+                "Empty save slot",
+                font,
+                "red",
+                500,
+                self.game.display_manager,
+            )
 
     def _save_game(self, font, slot_selected):
         """Save the game state and display a message."""
         play_sound(self.game.sound_manager.game_sounds, "click")
         save_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.save_data(f"save{slot_selected + 1}", save_date=save_date)
-        display_simple_message(self.screen, "Game Saved!", font, "lightblue", 1000)
 
     def _delete_all_save_files(self):
         """Deletes all save files from the save folder."""
-        save_files = self._get_save_files()
-
-        for save_file in save_files:
-            save_file_path = os.path.join(self.save_folder, save_file)
-            os.remove(save_file_path)
+        self.save_writer.clear()
+        self.save_writer.wait()
+        self.refresh_slots()
 
     def _show_confirmation_popup(self, delete_save_files=True):
         """Display a confirmation popup."""
-        root = tk.Tk()
-        root.withdraw()
-
         if delete_save_files:
-            user_response = messagebox.askyesno(
-                "Confirmation", "Delete all save files?"
-            )
-        else:
-            user_response = messagebox.askyesno(
-                "Confirmation", "Overwrite this save file?"
-            )
-
-        root.destroy()
-        return user_response
+            return self.confirm_dialog.ask("Delete all save files?")
+        return self.confirm_dialog.ask("Overwrite this save file?")
 
     def update_rect_positions(self):
         """Update the positions of UI elements based on the current screen width."""
         self.center_x = self.screen.get_width() // 2
 
-        self.cancel_rect.center = (self.screen.get_width() // 2 + 100, 465)
-        self.delete_rect.center = (self.screen.get_width() // 2 - 100, 465)
+        self.cancel_rect.center = (self.screen.get_width() // 2 + 100, self.buttons_y)
+        self.delete_rect.center = (self.screen.get_width() // 2 - 100, self.buttons_y)
+        self.update_slot_positions()
 
     def set_screen_title_position(self):
         """Set the location of the screen title images on the screen."""
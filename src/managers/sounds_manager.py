@@ -20,10 +20,45 @@ from src.utils.game_utils import (
     set_sounds_volume,
     set_music_volume,
     load_music_files,
-    play_music,
     display_muted_state_message,
     play_sound,
+    voice_allocator,
 )
+from src.managers.music_manager import MusicManager
+from src.game_logic.game_events import (
+    AlienKilled,
+    AsteroidDestroyed,
+    ShieldHit,
+    ShipHit,
+    MissileExploded,
+    PowerCollected,
+    WeaponFired,
+    LaserStatus,
+)
+
+WEAPON_SOUNDS = {"bullet": "bullet", "missile": "missile_launch", "laser": "fire_laser"}
+
+
+def get_event_sound(event):
+    """Return the name of the sound played for a gameplay event, if any."""
+    match event:
+        case AlienKilled(boss=True):
+            return "boss_exploding"
+        case AlienKilled() | ShieldHit(target="alien" | "bullet"):
+            return "alien_exploding"
+        case AsteroidDestroyed() | ShieldHit(target="asteroid"):
+            return "asteroid_exploding"
+        case ShipHit():
+            return "explode"
+        case MissileExploded():
+            return "missile"
+        case PowerCollected(power=power):
+            return power
+        case WeaponFired(weapon=weapon):
+            return WEAPON_SOUNDS.get(weapon)
+        case LaserStatus(ready=ready):
+            return "laser_ready" if ready else "laser_not_ready"
+    return None
 
 
 class SoundManager:
@@ -47,7 +82,11 @@ class SoundManager:
             self.meteor_music,
         ) = ({}, {}, {}, {}, {}, {}, {})
 
+        self.voice_allocator = voice_allocator
+        self.music_manager = MusicManager()
         self.current_sound = None
+        # Off in headless matches, which play no music.
+        self.music_enabled = True
         self.draw_muted_message = False
         self.display_muted_time = 0
 
@@ -76,6 +115,10 @@ class SoundManager:
             self.game_sounds = load_sound_files(GAME_SOUNDS)
             self.loading_screen.update(100)
 
+        # Build the level -> track indexes while the loading screen is shown.
+        for music_dict in self._get_music_dicts().values():
+            self.music_manager.level_index(music_dict)
+
     def load_menu_sounds(self):
         """Load the sound files for the menu while displaying the loading screen."""
         while not (self.menu_sounds and self.menu_music):
@@ -100,16 +143,43 @@ class SoundManager:
 
     def prepare_level_music(self):
         """This method determines the appropriate background music
-        to play based on the current game mode and level.
+        to play based on the current game mode and level, and preloads
+        the track for the next level.
         """
-        music_to_play = self._set_level_music()
+        if not self.music_enabled:
+            return
 
-        for key, sound_name in music_to_play.items():
-            if self.stats.level in key:
-                if sound_name != self.current_sound:
-                    play_music(music_to_play, key)
-                    self.current_sound = sound_name
-                return
+        music_to_play = self._set_level_music()
+        track = self.music_manager.track_for_level(music_to_play, self.stats.level)
+
+        if track is not None and track != self.current_sound:
+            self.music_manager.play(track)
+            self.current_sound = track
+
+        next_track = self.music_manager.track_for_level(
+            music_to_play, self.stats.level + 1
+        )
+        if next_track != track:
+            self.music_manager.preload(next_track)
+
+    def play_menu_music(self, music_name):
+        """Play one of the menu tracks, like the menu or the game over music."""
+        track = self.menu_music.get(music_name)
+        self.music_manager.play_now(track)
+        self.current_sound = track
+
+    def update_music(self):
+        """Start the pending music track once the previous one faded out."""
+        self.music_manager.update()
+
+    def play_event_sounds(self, events):
+        """Play the sounds of the gameplay events of a frame,
+        each sound only once.
+        """
+        sounds = dict.fromkeys(get_event_sound(event) for event in events)
+        for sound_name in sounds:
+            if sound_name is not None:
+                play_sound(self.game_sounds, sound_name)
 
     def _prepare_gameplay_sounds_volume(self):
         """Prepare the volume for specific sounds."""
@@ -167,6 +237,7 @@ class SoundManager:
         self.draw_muted_message = True
 
         if self.game.sfx_muted:
+            self.voice_allocator.stop_all()
             play_sound(self.menu_sounds, "is_muted")
         elif not self.game.sfx_muted:
             play_sound(self.menu_sounds, "is_unmuted")
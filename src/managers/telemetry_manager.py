@@ -0,0 +1,128 @@
+"""
+The 'telemetry_manager' module contains the TelemetryManager class that
+measures the frames of the game and records them with the game events.
+"""
+
+import time
+
+import pygame
+
+from src.utils.constants import (
+    TELEMETRY_FILE,
+    TELEMETRY_INTERVAL,
+    TELEMETRY_STALL_TIME,
+    USE_TELEMETRY,
+)
+from src.utils.game_utils import render_counts, voice_allocator
+from src.utils.telemetry_writer import TelemetryWriter
+
+
+def get_percentile(sorted_values, percent):
+    """Return the value that the given percent of the sorted values are under."""
+    index = min(len(sorted_values) - 1, len(sorted_values) * percent // 100)
+    return sorted_values[index]
+
+
+class TelemetryManager:
+    """Once per interval, the TelemetryManager records the frame rate, the
+    percentiles of the frame times, the stalls, the entity counts, the level,
+    the game mode and how many sounds were played and texts rendered. The
+    level changes and the window resizes are noticed between two frames and
+    recorded as events, like the saves and the loads. When telemetry is off,
+    nothing is measured.
+    """
+
+    def __init__(self, game, enabled=USE_TELEMETRY, writer=None):
+        self.game = game
+        self.enabled = enabled
+        self.writer = writer
+        if enabled and writer is None:
+            self.writer = TelemetryWriter(TELEMETRY_FILE)
+
+        self.frame_times = []
+        self.skip_next_frame = False
+        self.interval_start = pygame.time.get_ticks()
+        self.sound_plays = voice_allocator.plays
+        self.text_renders = render_counts["text"]
+        self.level = game.stats.level
+        self.window_size = game.display_manager.window.get_size()
+
+    def update(self, frame_time):
+        """Measure a frame that took frame_time milliseconds to run."""
+        if not self.enabled:
+            return
+
+        if self.skip_next_frame:
+            self.skip_next_frame = False
+        else:
+            self.frame_times.append(frame_time)
+        self._check_changes()
+
+        now = pygame.time.get_ticks()
+        if now - self.interval_start >= TELEMETRY_INTERVAL:
+            self._record_interval(now)
+
+    def skip_frame(self):
+        """Leave the next frame out, when it waited for the player."""
+        self.skip_next_frame = True
+
+    def record_event(self, event, **details):
+        """Record an event of the game with its details."""
+        if self.enabled:
+            self.writer.write(
+                {"time": round(time.time(), 3), "event": event, **details}
+            )
+
+    def _check_changes(self):
+        """Record the level changes and the window resizes."""
+        game = self.game
+        if game.stats.level != self.level:
+            self.level = game.stats.level
+            self.record_event(
+                "level", level=self.level, mode=game.settings.game_modes.game_mode
+            )
+
+        window_size = game.display_manager.window.get_size()
+        if window_size != self.window_size:
+            self.window_size = window_size
+            self.record_event(
+                "resize",
+                size=list(window_size),
+                fullscreen=game.display_manager.full_screen,
+            )
+
+    def _record_interval(self, now):
+        """Record the frames of the interval that ended and start a new one."""
+        game = self.game
+        frame_times = sorted(self.frame_times)
+        record = {
+            "time": round(time.time(), 3),
+            "fps": round(len(frame_times) * 1000 / (now - self.interval_start), 1),
+            "level": game.stats.level,
+            "mode": game.settings.game_modes.game_mode,
+            "active": game.stats.game_active,
+            "aliens": len(game.aliens),
+            "alien_bullets": len(game.alien_bullet),
+            "bullets": len(game.thunderbird_bullets) + len(game.phoenix_bullets),
+            "missiles": len(game.thunderbird_missiles) + len(game.phoenix_missiles),
+            "asteroids": len(game.asteroids),
+            "powers": len(game.powers),
+            "sound_plays": voice_allocator.plays - self.sound_plays,
+            "text_renders": render_counts["text"] - self.text_renders,
+        }
+        if frame_times:
+            record["frame_ms"] = {
+                "p50": get_percentile(frame_times, 50),
+                "p95": get_percentile(frame_times, 95),
+                "p99": get_percentile(frame_times, 99),
+                "max": frame_times[-1],
+            }
+            record["stalls"] = sum(
+                frame_time > TELEMETRY_STALL_TIME for frame_time in frame_times
+            )
+        self.writer.write(record)
+
+        self.frame_times = []
+        self.interval_start = now
+        self.sound_plays = voice_allocator.plays
+        self.text_renders = render_counts["text"]
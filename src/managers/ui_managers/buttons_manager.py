@@ -7,8 +7,10 @@ import sys
 import pygame
 
 from src.ui.button import Button
+from src.ui.layout import Layout
 
 from src.utils.constants import (
+    BUTTON_LAYOUT,
     BUTTON_NAMES,
     GAME_MODE_SCORE_KEYS,
     DIFFICULTIES,
@@ -34,118 +36,61 @@ class GameButtonsManager:
 
         self._create_game_buttons()
         self._create_menu_buttons()
+        self.layout = Layout(BUTTON_LAYOUT)
+        self.update_layout()
 
     def _create_game_buttons(self):
         """Create buttons for the game menu."""
-        self.play = Button(self, self.button_imgs["play_button"], (0, 0), center=True)
-        self.load_game = Button(
-            self,
-            self.button_imgs["load_game"],
-            (self.play.rect.centerx - 74, self.play.rect.bottom - 4),
-        )
-        self.select_ship = Button(
-            self,
-            self.button_imgs["select_ship"],
-            (self.load_game.rect.centerx - 74, self.load_game.rect.bottom - 4),
-        )
+        self.play = Button(self, self.button_imgs["play_button"], (0, 0))
+        self.load_game = Button(self, self.button_imgs["load_game"], (0, 0))
+        self.select_ship = Button(self, self.button_imgs["select_ship"], (0, 0))
         # Difficulty buttons
-        self.difficulty = Button(
-            self,
-            self.button_imgs["difficulty"],
-            (self.select_ship.rect.centerx - 74, self.select_ship.rect.bottom - 4),
-        )
-        self.easy = Button(
-            self,
-            self.button_imgs["easy"],
-            (self.difficulty.rect.right - 10, self.difficulty.rect.y),
-        )
-        self.medium = Button(
-            self,
-            self.button_imgs["medium"],
-            (self.easy.rect.right - 5, self.easy.rect.y),
-        )
-        self.hard = Button(
-            self,
-            self.button_imgs["hard"],
-            (self.medium.rect.right - 5, self.medium.rect.y),
-        )
+        self.difficulty = Button(self, self.button_imgs["difficulty"], (0, 0))
+        self.easy = Button(self, self.button_imgs["easy"], (0, 0))
+        self.medium = Button(self, self.button_imgs["medium"], (0, 0))
+        self.hard = Button(self, self.button_imgs["hard"], (0, 0))
 
         # Game mode buttons
-        self.game_modes = Button(
-            self,
-            self.button_imgs["game_modes"],
-            (self.difficulty.rect.centerx - 74, self.difficulty.rect.bottom - 4),
-        )
+        self.game_modes = Button(self, self.button_imgs["game_modes"], (0, 0))
         self.normal = Button(
-            self,
-            self.button_imgs["normal"],
-            (self.game_modes.rect.right - 8, self.game_modes.rect.y),
-            GAME_MODES_DESCRIPTIONS[0],
+            self, self.button_imgs["normal"], (0, 0), GAME_MODES_DESCRIPTIONS[0]
         )
         self.endless = Button(
-            self,
-            self.button_imgs["endless"],
-            (self.normal.rect.right - 5, self.normal.rect.y),
-            GAME_MODES_DESCRIPTIONS[1],
+            self, self.button_imgs["endless"], (0, 0), GAME_MODES_DESCRIPTIONS[1]
         )
         self.slow_burn = Button(
-            self,
-            self.button_imgs["slow_burn"],
-            (self.endless.rect.right - 5, self.endless.rect.y),
-            GAME_MODES_DESCRIPTIONS[2],
+            self, self.button_imgs["slow_burn"], (0, 0), GAME_MODES_DESCRIPTIONS[2]
         )
         self.meteor_madness = Button(
             self,
             self.button_imgs["meteor_madness"],
-            (self.normal.rect.left, self.slow_burn.rect.bottom),
+            (0, 0),
             GAME_MODES_DESCRIPTIONS[3],
         )
         self.boss_rush = Button(
-            self,
-            self.button_imgs["boss_rush"],
-            (self.meteor_madness.rect.right - 5, self.meteor_madness.rect.y),
-            GAME_MODES_DESCRIPTIONS[4],
+            self, self.button_imgs["boss_rush"], (0, 0), GAME_MODES_DESCRIPTIONS[4]
         )
         self.last_bullet = Button(
-            self,
-            self.button_imgs["last_bullet"],
-            (self.boss_rush.rect.right - 5, self.boss_rush.rect.y),
-            GAME_MODES_DESCRIPTIONS[5],
+            self, self.button_imgs["last_bullet"], (0, 0), GAME_MODES_DESCRIPTIONS[5]
         )
         self.cosmic_conflict = Button(
             self,
             self.button_imgs["cosmic_conflict"],
-            (self.slow_burn.rect.right - 5, self.slow_burn.rect.y),
+            (0, 0),
             GAME_MODES_DESCRIPTIONS[6],
         )
         self.one_life_reign = Button(
             self,
             self.button_imgs["one_life_reign"],
-            (self.last_bullet.rect.right - 5, self.last_bullet.rect.y),
+            (0, 0),
             GAME_MODES_DESCRIPTIONS[7],
         )
 
         # High scores and other game menu buttons
-        self.high_scores = Button(
-            self,
-            self.button_imgs["high_scores"],
-            (self.game_modes.rect.centerx - 74, self.game_modes.rect.bottom - 4),
-        )
-        self.delete_scores = Button(
-            self,
-            self.button_imgs["delete_scores"],
-            (self.high_scores.rect.left - 85, self.high_scores.rect.y),
-        )
-        self.menu = Button(
-            self,
-            self.button_imgs["menu_button"],
-            (self.high_scores.rect.centerx - 74, self.high_scores.rect.bottom - 4),
-        )
-        self.quit = Button(
-            self,
-            self.button_imgs["quit_button"],
-            (self.menu.rect.centerx - 74, self.menu.rect.bottom - 4),
-        )
+        self.high_scores = Button(self, self.button_imgs["high_scores"], (0, 0))
+        self.delete_scores = Button(self, self.button_imgs["delete_scores"], (0, 0))
+        self.menu = Button(self, self.button_imgs["menu_button"], (0, 0))
+        self.quit = Button(self, self.button_imgs["quit_button"], (0, 0))
 
         # Lists containing the game buttons, difficulty buttons and game mode buttons
         self.game_buttons = [
@@ -172,23 +117,18 @@ class GameButtonsManager:
 
     def _create_menu_buttons(self):
         """Create the buttons for the main menu."""
-        self.single = Button(
-            self,
-            self.button_imgs["single_player"],
-            (0, 0),
-            center=False,
-            menu_button=True,
-        )
-        self.multi = Button(
-            self,
-            self.button_imgs["multiplayer"],
-            (self.single.rect.centerx - 100, self.single.rect.bottom - 4),
-        )
-        self.menu_quit = Button(
-            self,
-            self.button_imgs["menu_quit_button"],
-            (self.multi.rect.centerx - 100, self.multi.rect.bottom - 4),
-        )
+        self.single = Button(self, self.button_imgs["single_player"], (0, 0))
+        self.multi = Button(self, self.button_imgs["multiplayer"], (0, 0))
+        self.menu_quit = Button(self, self.button_imgs["menu_quit_button"], (0, 0))
+
+    def update_layout(self, changed=None):
+        """Place the buttons on the screen following the button layout.
+        When the names of the rects that changed are given, only the
+        buttons that depend on them are placed again.
+        """
+        rects = {name: getattr(self, name).rect for name in self.layout.rules}
+        rects["screen"] = self.screen.get_rect()
+        return self.layout.apply(rects, changed)
 
     def display_description(self):
         """Display the description of the game mode button currently
@@ -198,7 +138,7 @@ class GameButtonsManager:
             # Create a smaller rectangle for collision detection
             # to avoid triggering for adjacent buttons
             collision_rect = button.rect.inflate(-5, 0)
-            if collision_rect.collidepoint(pygame.mouse.get_pos()):
+            if collision_rect.collidepoint(self.game.display_manager.get_mouse_pos()):
                 button.show_button_info()
 
     def draw_difficulty_buttons(self):
@@ -306,13 +246,16 @@ class GameButtonsManager:
         self.gm_options.game_mode = selected_game_mode
         self.ui_options.show_game_modes = False
 
-    def handle_difficulty_button(self, speedup_scale, max_alien_speed):
+    def handle_difficulty_button(self, difficulty):
         """Set the game difficulty (speed-up scale)."""
 
         def handle():
-            """Set the speedup scale and hide the difficulty options UI."""
-            self.game.settings.speedup_scale = speedup_scale
-            self.game.settings.max_alien_speed = max_alien_speed
+            """Set the difficulty and its speedup scale and hide
+            the difficulty options UI.
+            """
+            self.game.settings.difficulty = difficulty
+            self.game.settings.speedup_scale = DIFFICULTIES[difficulty]
+            self.game.settings.max_alien_speed = DIFFICULTIES[f"MAX_{difficulty}"]
             self.ui_options.show_difficulty = False
 
         return handle
@@ -344,15 +287,9 @@ class GameButtonsManager:
             self.cosmic_conflict: self.handle_cosmic_conflict_button,
             self.one_life_reign: self.handle_one_life_reign_button,
             self.normal: self.handle_normal_button,
-            self.easy: self.handle_difficulty_button(
-                DIFFICULTIES["EASY"], DIFFICULTIES["MAX_EASY"]
-            ),
-            self.medium: self.handle_difficulty_button(
-                DIFFICULTIES["MEDIUM"], DIFFICULTIES["MAX_MEDIUM"]
-            ),
-            self.hard: self.handle_difficulty_button(
-                DIFFICULTIES["HARD"], DIFFICULTIES["MAX_HARD"]
-            ),
+            self.easy: self.handle_difficulty_button("EASY"),
+            self.medium: self.handle_difficulty_button("MEDIUM"),
+            self.hard: self.handle_difficulty_button("HARD"),
             self.difficulty: self.handle_difficulty_toggle,
             self.delete_scores: self.handle_delete_button,
             self.select_ship: self.handle_ship_selection_button,
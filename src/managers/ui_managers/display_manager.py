@@ -0,0 +1,108 @@
+"""
+The 'display_manager' module contains the DisplayManager class that owns
+the game window and the logical canvas that the game is drawn on.
+"""
+
+import pygame
+
+from src.utils.constants import DISPLAY_SCALING
+
+# The window events after which the canvas is scaled to a new window size.
+RESIZE_EVENTS = (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED)
+
+
+class DisplayManager:
+    """The game is drawn on a canvas that always has the logical size of the
+    settings. Once per frame the canvas is scaled to the largest area of the
+    window with the same aspect ratio, the rest of the window stays black.
+    Positions in the window, like the mouse, are mapped back to the canvas.
+    The window only changes on resize events and when fullscreen is toggled,
+    the size of the desktop is read once when the game starts. The resize
+    events of a frame are handled once, with the last size of the window.
+    """
+
+    def __init__(self, settings, scaling=DISPLAY_SCALING):
+        self.logical_size = (settings.screen_width, settings.screen_height)
+        self.scaling = scaling
+        self.window_flag = pygame.RESIZABLE
+        self.full_screen = False
+        self.desktop_size = pygame.display.get_desktop_sizes()[0]
+        # The size the window gets back when leaving fullscreen.
+        self.window_size = self.logical_size
+        self.window = pygame.display.set_mode(self.logical_size, self.window_flag)
+        # The canvas uses the pixel format of the window for fast blits.
+        self.canvas = pygame.Surface(self.logical_size, 0, self.window)
+        self.viewport = self.window.get_rect()
+        self.target = None
+        self.resize_pending = False
+        self._update_viewport()
+
+    def set_mode(self, size, flag):
+        """Open the window with a new size and mode."""
+        self.window_flag = flag
+        self.window = pygame.display.set_mode(size, flag)
+        self._update_viewport()
+
+    def toggle_fullscreen(self):
+        """Switch between fullscreen and the resizable window."""
+        self.full_screen = not self.full_screen
+        if self.full_screen:
+            self.window_size = self.window.get_size()
+            self.set_mode(self.desktop_size, pygame.FULLSCREEN)
+        else:
+            self.set_mode(self.window_size, pygame.RESIZABLE)
+
+    def request_resize(self):
+        """Follow the size of the window when the next frame is presented."""
+        self.resize_pending = True
+
+    def resize(self):
+        """Scale the canvas to the new size of the window."""
+        self.resize_pending = False
+        self.window = pygame.display.get_surface()
+        self._update_viewport()
+
+    def _update_viewport(self):
+        """Find the area of the window that the canvas is scaled to."""
+        window_rect = self.window.get_rect()
+        width, height = self.logical_size
+        scale = min(window_rect.width / width, window_rect.height / height)
+        if self.scaling == "integer" and scale >= 1:
+            scale = int(scale)
+
+        self.viewport = pygame.Rect(
+            0, 0, max(1, round(width * scale)), max(1, round(height * scale))
+        )
+        self.viewport.center = window_rect.center
+        self.window.fill("black")
+        # A scaled canvas is written straight into this part of the window.
+        self.target = (
+            None
+            if self.viewport.size == self.logical_size
+            else self.window.subsurface(self.viewport)
+        )
+
+    def present(self):
+        """Show the canvas in the window."""
+        if self.resize_pending:
+            self.resize()
+
+        if self.target is None:
+            self.window.blit(self.canvas, self.viewport)
+        elif self.scaling == "smooth":
+            pygame.transform.smoothscale(self.canvas, self.viewport.size, self.target)
+        else:
+            pygame.transform.scale(self.canvas, self.viewport.size, self.target)
+        pygame.display.flip()
+
+    def to_canvas(self, position):
+        """Return the position on the canvas of a position in the window."""
+        width, height = self.logical_size
+        return (
+            (position[0] - self.viewport.x) * width // self.viewport.width,
+            (position[1] - self.viewport.y) * height // self.viewport.height,
+        )
+
+    def get_mouse_pos(self):
+        """Return the position of the mouse on the canvas."""
+        return self.to_canvas(pygame.mouse.get_pos())
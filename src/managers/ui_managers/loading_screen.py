@@ -5,6 +5,8 @@ that manages the loading screen.
 
 import pygame
 
+from src.utils.game_utils import update_display
+
 
 class LoadingScreen:
     """Manages the loading screen for the game,
@@ -12,8 +14,9 @@ class LoadingScreen:
     bar and drawing it on the screen.
     """
 
-    def __init__(self, screen):
+    def __init__(self, screen, display=None):
         self.screen = screen
+        self.display = display
         self.load_bar_width = 400
         self.load_bar_height = 25
         self.load_percent = 0
@@ -58,4 +61,4 @@ class LoadingScreen:
                 (screen_height - self.text.get_height()) // 2 - 40,
             ),
         )
-        pygame.display.update()
+        update_display(self.display)
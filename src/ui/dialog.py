@@ -0,0 +1,116 @@
+"""
+The 'dialog' module contains the ConfirmDialog class that asks the player
+a yes or no question over the current frame of the game.
+"""
+
+import sys
+
+import pygame
+
+from src.managers.ui_managers.display_manager import RESIZE_EVENTS
+from src.utils.constants import (
+    BORDER_WIDTH,
+    DIALOG_BUTTON_SIZE,
+    DIALOG_COLOR,
+    DIALOG_OVERLAY_ALPHA,
+    DIALOG_PADDING,
+    SELECTED_SLOT_COLOR,
+)
+
+# The dialog leaves the other events in the queue for the menu that opened it.
+DIALOG_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, *RESIZE_EVENTS]
+
+
+class ConfirmDialog:
+    """A modal dialog with a question and the Yes and No buttons. It runs
+    its own loop until the player answers, with the frame it was opened on
+    dimmed behind it. The panel of every question is rendered only once.
+    """
+
+    def __init__(self, game, text_color=(225, 225, 225)):
+        self.game = game
+        self.screen = game.screen
+        self.text_color = text_color
+        self.font = pygame.font.SysFont("verdana", 20)
+        self.overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, DIALOG_OVERLAY_ALPHA))
+        self.panels = {}
+
+    def get_panel(self, question):
+        """Return the panel of a question, its rect and the rects
+        of its buttons on the screen, rendering it the first time.
+        """
+        if question not in self.panels:
+            self.panels[question] = self._render_panel(question)
+        return self.panels[question]
+
+    def _render_panel(self, question):
+        """Render the question and the buttons on a panel at the center
+        of the screen.
+        """
+        text = self.font.render(question, True, self.text_color)
+        button_width, button_height = DIALOG_BUTTON_SIZE
+        width = max(text.get_width(), button_width * 2 + DIALOG_PADDING)
+        width += DIALOG_PADDING * 2
+        height = text.get_height() + button_height + DIALOG_PADDING * 3
+
+        panel = pygame.Surface((width, height))
+        panel.fill(DIALOG_COLOR)
+        pygame.draw.rect(panel, SELECTED_SLOT_COLOR, panel.get_rect(), BORDER_WIDTH)
+        panel.blit(text, text.get_rect(midtop=(width // 2, DIALOG_PADDING)))
+
+        panel_rect = panel.get_rect(center=self.screen.get_rect().center)
+        buttons = {}
+        for answer, label, x_pos in (
+            (True, "Yes", width // 2 - DIALOG_PADDING // 2 - button_width),
+            (False, "No", width // 2 + DIALOG_PADDING // 2),
+        ):
+            rect = pygame.Rect(
+                (x_pos, height - DIALOG_PADDING - button_height), DIALOG_BUTTON_SIZE
+            )
+            pygame.draw.rect(panel, self.text_color, rect, BORDER_WIDTH)
+            label_surface = self.font.render(label, True, self.text_color)
+            panel.blit(label_surface, label_surface.get_rect(center=rect.center))
+            buttons[answer] = rect.move(panel_rect.topleft)
+
+        return panel, panel_rect, buttons
+
+    def ask(self, question):
+        """Show the question until the player answers it.
+        Return True when the answer is yes.
+        """
+        panel, panel_rect, buttons = self.get_panel(question)
+        background = self.screen.copy()
+        background.blit(self.overlay, (0, 0))
+        clock = pygame.time.Clock()
+
+        while True:
+            for event in pygame.event.get(DIALOG_EVENTS):
+                answer = self._get_answer(event, buttons)
+                if answer is not None:
+                    return answer
+
+            self.screen.blit(background, (0, 0))
+            self.screen.blit(panel, panel_rect)
+            self.game.screen_manager.draw_cursor()
+            self.game.display_manager.present()
+            clock.tick(60)
+
+    def _get_answer(self, event, buttons):
+        """Return the answer given by an event, None if it isn't one."""
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_y, pygame.K_RETURN):
+                return True
+            if event.key in (pygame.K_n, pygame.K_ESCAPE):
+                return False
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            position = self.game.display_manager.to_canvas(event.pos)
+            for answer, rect in buttons.items():
+                if rect.collidepoint(position):
+                    return answer
+        elif event.type in RESIZE_EVENTS:
+            self.game.display_manager.request_resize()
+        return None
@@ -0,0 +1,40 @@
+"""
+The 'layout' module contains the Layout class that places the rects of
+the user interface from a table of rules.
+"""
+
+
+class Layout:
+    """Places rects relative to other rects. Every rule moves one point of
+    a rect to an x and a y taken from points of its anchors. When only some
+    rects changed, the rules of the rects that don't depend on them are
+    skipped, and a rect that doesn't move doesn't update its dependents.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+
+    def apply(self, rects, changed=None):
+        """Place the rects, following the rules in order. Only the rects
+        that depend on the changed names are placed when they are given.
+        Return the names of the rects that moved.
+        """
+        dirty = None if changed is None else set(changed)
+        moved = []
+        for name, (point, x_rule, y_rule) in self.rules.items():
+            x_anchor, x_point, x_offset = x_rule
+            y_anchor, y_point, y_offset = y_rule
+            if dirty is not None and x_anchor not in dirty and y_anchor not in dirty:
+                continue
+
+            position = (
+                getattr(rects[x_anchor], x_point) + x_offset,
+                getattr(rects[y_anchor], y_point) + y_offset,
+            )
+            if getattr(rects[name], point) != position:
+                setattr(rects[name], point, position)
+                moved.append(name)
+                if dirty is not None:
+                    dirty.add(name)
+
+        return moved
@@ -7,12 +7,22 @@ import pygame.font
 
 from pygame.sprite import Group
 from src.entities.player_entities.player_health import Heart
+from src.game_logic.game_events import (
+    AlienKilled,
+    ScoreChanged,
+    ShipHit,
+    PowerCollected,
+    AmmoChanged,
+    LaserStatus,
+)
 
 from src.utils.game_utils import (
     load_single_image,
     get_boss_rush_title,
     draw_image,
     render_bullet_num,
+    render_font_text,
+    display_custom_message,
 )
 
 
@@ -37,6 +47,9 @@ class ScoreBoard:
         self.missiles_icon = load_single_image("other/missile_icon.png")
         self.phoenix_missiles_icon = load_single_image("other/phoenix_missile_icon.png")
 
+        # When a player last tried to fire a laser that was not ready.
+        self.laser_message_time = None
+
         # Prepare the initial score and player health images.
         self.prep_level()
         self.render_scores()
@@ -44,6 +57,34 @@ class ScoreBoard:
         self.render_high_score()
         self.create_health()
 
+    def handle_events(self, events):
+        """Render the parts of the HUD changed by the gameplay events
+        of a frame, each part only once.
+        """
+        scores = health = missiles = bullets = False
+        for event in events:
+            match event:
+                case AlienKilled() | ScoreChanged():
+                    scores = True
+                case ShipHit() | PowerCollected(power="health"):
+                    health = True
+                case AmmoChanged(ammo="missiles"):
+                    missiles = True
+                case AmmoChanged(ammo="bullets"):
+                    bullets = True
+                case LaserStatus(ready=False):
+                    self.laser_message_time = pygame.time.get_ticks()
+
+        if scores:
+            self.render_scores()
+            self.update_high_score()
+        if health:
+            self.create_health()
+        if missiles:
+            self.render_missiles_num()
+        if bullets:
+            self.render_bullets_num()
+
     def render_scores(self):
         """Render the scores for the ships and display them on the screen."""
         self._render_ship_scores("Thunderbird", self.stats.thunderbird_score, -200)
@@ -53,7 +94,7 @@ class ScoreBoard:
         """Render the score for a ship and update the corresponding attributes."""
         rounded_score = round(score)
         score_str = f"{ship_name}: {rounded_score:,}"
-        score_img = self.font.render(score_str, True, self.text_color, None)
+        score_img = render_font_text(self.font, score_str, True, self.text_color, None)
         score_rect = score_img.get_rect()
 
         score_rect.right = self.level_rect.centerx + offset_x
@@ -101,8 +142,8 @@ class ScoreBoard:
 
         for missile in ship_missiles:
             missiles_str = str(missile.missiles_num)
-            rend_missiles_num = self.font.render(
-                missiles_str, True, (71, 71, 71, 255), None
+            rend_missiles_num = render_font_text(
+                self.font, missiles_str, True, (71, 71, 71, 255), None
             )
             missiles_rect = rend_missiles_num.get_rect()
             missiles_img_rect = self.missiles_icon.get_rect()
@@ -125,8 +166,8 @@ class ScoreBoard:
         """
         high_score = round(self.stats.high_score)
         high_score_str = f"High Score: {high_score:,}"
-        self.high_score_image = self.font.render(
-            high_score_str, True, self.text_color, None
+        self.high_score_image = render_font_text(
+            self.font, high_score_str, True, self.text_color, None
         )
 
         # Set the position of the high score image.
@@ -158,7 +199,9 @@ class ScoreBoard:
         level_str = level_titles.get(
             self.settings.game_modes.game_mode, f"Level {str(self.stats.level)}"
         )
-        self.level_image = self.font.render(level_str, True, self.level_color, None)
+        self.level_image = render_font_text(
+            self.font, level_str, True, self.level_color, None
+        )
         self._position_level_image(self.level_image)
 
     def _position_level_image(self, level_image):
@@ -222,6 +265,7 @@ class ScoreBoard:
         self.draw_high_score()
         self.draw_player_health()
         self.draw_bullets_info()
+        self.draw_laser_messages()
 
     def draw_player_scores(self):
         """Draw player scores to the screen."""
@@ -277,3 +321,30 @@ class ScoreBoard:
             self.thunderbird_health.draw(self.screen)
         if self.phoenix_ship.state.alive and not self.game.singleplayer:
             self.phoenix_health.draw(self.screen)
+
+    def draw_laser_messages(self):
+        """Draw "Ready!" next to the ships with a ready laser and, for 1.5
+        seconds after a laser was fired too early, "Not Ready!" next to
+        the ships that hold the laser key.
+        """
+        game_modes = self.settings.game_modes
+        if (
+            self.laser_message_time is not None
+            and pygame.time.get_ticks() > self.laser_message_time + 1500
+        ):
+            self.laser_message_time = None
+
+        for ship in self.game.ships:
+            if ship.laser_ready and ship.state.alive:
+                if game_modes.cosmic_conflict:
+                    display_custom_message(self.screen, "Ready!", ship, cosmic=True)
+                else:
+                    display_custom_message(self.screen, "Ready!", ship)
+
+            if self.laser_message_time is not None and ship.laser_fired:
+                if game_modes.last_bullet:
+                    display_custom_message(self.screen, "Not available!", ship)
+                elif game_modes.cosmic_conflict:
+                    display_custom_message(self.screen, "Not Ready!", ship, cosmic=True)
+                else:
+                    display_custom_message(self.screen, "Not Ready!", ship)
@@ -9,7 +9,6 @@ The constants include the following:
 - 'shield_frames': a list of frames used for shield animations.
 - 'immune_frames': a list of frames used for immune animations.
 - 'explosion_frames': a list of frames used for explosion animations.
-- 'asteroid_frames': a list of frames used for asteroid sprites.
 - 'empower_frames': a list of frames used for empower animations.
 """
 
@@ -29,8 +28,6 @@ immune_frames_cosmic = load_frames("immune/immune-0{}.png", 11, start=1, rotate=
 
 explosion_frames = load_frames("explosion/explosion1_{:04d}.png", 89, start=2)
 
-asteroid_frames = load_frames("asteroid/Asteroid-A-09-{:03d}.png", 120)
-
 empower_frames = load_frames("empower/empower-0{}.png", 6, start=1)
 
 missile_frames = load_frames("projectiles/missiles/missile-0{}.png", 9, start=1)
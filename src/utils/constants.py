@@ -28,6 +28,65 @@ BUTTON_NAMES = [
     "load_game",
 ]
 
+# Layout of the buttons, in the order they are placed. Each button moves one
+# point of its rect to an x and a y taken from the rects of other buttons,
+# or of the "screen": (point, (anchor, x point, x offset), (anchor, y point, y offset))
+BUTTON_LAYOUT = {
+    # Game menu
+    "play": ("center", ("screen", "centerx", 0), ("screen", "centery", -150)),
+    "load_game": ("topleft", ("play", "centerx", -74), ("play", "bottom", -4)),
+    "select_ship": (
+        "topleft",
+        ("load_game", "centerx", -74),
+        ("load_game", "bottom", -4),
+    ),
+    "difficulty": (
+        "topleft",
+        ("select_ship", "centerx", -74),
+        ("select_ship", "bottom", -4),
+    ),
+    "easy": ("topleft", ("difficulty", "right", -10), ("difficulty", "y", 0)),
+    "medium": ("topleft", ("easy", "right", -5), ("easy", "y", 0)),
+    "hard": ("topleft", ("medium", "right", -5), ("medium", "y", 0)),
+    "game_modes": (
+        "topleft",
+        ("difficulty", "centerx", -74),
+        ("difficulty", "bottom", -4),
+    ),
+    "normal": ("topleft", ("game_modes", "right", -8), ("game_modes", "y", 0)),
+    "endless": ("topleft", ("normal", "right", -5), ("normal", "y", 0)),
+    "slow_burn": ("topleft", ("endless", "right", -5), ("endless", "y", 0)),
+    "cosmic_conflict": ("topleft", ("slow_burn", "right", -5), ("slow_burn", "y", 0)),
+    "meteor_madness": ("topleft", ("normal", "left", 0), ("slow_burn", "bottom", 0)),
+    "boss_rush": (
+        "topleft",
+        ("meteor_madness", "right", -5),
+        ("meteor_madness", "y", 0),
+    ),
+    "last_bullet": ("topleft", ("boss_rush", "right", -5), ("boss_rush", "y", 0)),
+    "one_life_reign": (
+        "topleft",
+        ("last_bullet", "right", -5),
+        ("last_bullet", "y", 0),
+    ),
+    "high_scores": (
+        "topleft",
+        ("game_modes", "centerx", -74),
+        ("game_modes", "bottom", -4),
+    ),
+    "delete_scores": (
+        "topleft",
+        ("high_scores", "left", -85),
+        ("high_scores", "y", 0),
+    ),
+    "menu": ("topleft", ("high_scores", "centerx", -74), ("high_scores", "bottom", -4)),
+    "quit": ("topleft", ("menu", "centerx", -74), ("menu", "bottom", -4)),
+    # Main menu
+    "single": ("center", ("screen", "centerx", 0), ("screen", "centery", -80)),
+    "multi": ("topleft", ("single", "centerx", -100), ("single", "bottom", -4)),
+    "menu_quit": ("topleft", ("multi", "centerx", -100), ("multi", "bottom", -4)),
+}
+
 # PLAYER_CONTROLS
 
 # Player2 controls
@@ -347,6 +406,41 @@ METEOR_MADNESS_MUSIC = {range(1, 999): "meteor_madness/meteor_music.mp3"}
 
 MUSIC_LIST = ["menu", "game_over"]
 
+# Fade time (ms) used when switching between music tracks and the highest
+# level included in the level -> track index.
+MUSIC_FADE_MS = 800
+MAX_MUSIC_LEVEL = 999
+
+# Mixer channel pools used by the voice allocator. Each pool reserves a number
+# of channels, has a priority used for voice stealing and a minimum interval
+# (in milliseconds) between two plays of the same sound.
+SOUND_CHANNEL_POOLS = {
+    "ui": {"channels": 2, "priority": 4, "min_interval": 0},
+    "player": {"channels": 4, "priority": 3, "min_interval": 0},
+    "explosions": {"channels": 4, "priority": 2, "min_interval": 60},
+    "weapons": {"channels": 2, "priority": 1, "min_interval": 50},
+}
+
+# Dict used to map sounds to their channel pool, sounds that are
+# not in this dict are played in the "player" pool.
+SOUND_CATEGORIES = {
+    "bullet": "weapons",
+    "missile_launch": "weapons",
+    "fire_laser": "weapons",
+    "alien_exploding": "explosions",
+    "asteroid_exploding": "explosions",
+    "missile": "explosions",
+    "click": "ui",
+    "click_menu": "ui",
+    "keypress": "ui",
+    "quit_effect": "ui",
+    "is_muted": "ui",
+    "is_unmuted": "ui",
+    "select_ship": "ui",
+    "empty_save": "ui",
+    "load_game": "ui",
+}
+
 # Dict used to map alien images to game level.
 LEVEL_PREFIX = {
     1: "Alien1",
@@ -377,6 +471,52 @@ DIFFICULTIES = {
     "MAX_MEDIUM": 3.6,
     "MAX_HARD": 3.8,
 }
+# Asteroid animation frames. When the rotation steps are set (30 or 60 for
+# example), the asteroids spin using rotated copies of the first frame
+# instead of the full animation.
+ASTEROID_FRAMES = "asteroid/Asteroid-A-09-{:03d}.png"
+ASTEROID_FRAMES_NUM = 120
+ASTEROID_ROTATION_STEPS = 0
+
+# Short-lived effects drawn by the FXManager. When every effect of the pool
+# is playing, the oldest one is reused. The frame rates are the number of
+# game frames that each frame of the animation stays on screen.
+FX_POOL_SIZE = 64
+FX_FRAME_RATES = {
+    "alien_destroyed": 2,
+    "boss_explosion": 3,
+    "missile_explosion": 5,
+    "shield_pop": 1,
+}
+BOSS_EXPLOSION_SCALE = 2.5
+
+# How the canvas of the game is scaled to the window: "integer" scales it by
+# whole multiples only, "nearest" fills the window and "smooth" filters it.
+DISPLAY_SCALING = "nearest"
+
+# Update the aliens with the NumPy fleet engine. NumPy is not a dependency of
+# the game, so this is off by default and ignored when NumPy is missing.
+USE_FLEET_ENGINE = False
+
+# Entity types that collide using the shape of their image instead of their
+# rect. The masks are only checked after the rects collide. When a precise
+# entity hits a rect entity, the rect of the second one is used as its shape.
+MASK_COLLISIONS = {
+    "Alien": False,
+    "BossAlien": True,
+    "AlienBullet": False,
+    "BossBullet": False,
+    "Asteroid": True,
+    "Laser": True,
+    "Missile": False,
+    "Thunderbolt": False,
+    "Firebird": False,
+    "Power": False,
+    "Thunderbird": False,
+    "Phoenix": False,
+    "Shield": False,
+}
+
 # used to map each key with the game mode, for saving the high scores
 GAME_MODE_SCORE_KEYS = {
     "boss_rush": "boss_rush_scores",
@@ -463,6 +603,7 @@ DATA_KEYS = [
     "asteroid_speed",
     "asteroid_freq",
     "speedup_scale",
+    "difficulty",
 ]
 
 ATTRIBUTE_MAPPING = {
@@ -503,16 +644,124 @@ ATTRIBUTE_MAPPING = {
     "phoenix_weapon_current": ("weapons_manager", "weapons", "phoenix", "current"),
 }
 
-SLOT_HEIGHT = 50
+SAVE_SLOTS_NUM = 4
+SLOTS_TOP = 270
+SLOT_HEIGHT = 60
 TEXT_PADDING_X = 10
 TEXT_PADDING_Y = 5
 SELECTED_SLOT_COLOR = (173, 216, 230)
 BORDER_WIDTH = 2
 
+# Save file format, the version is bumped when the layout of the file changes.
+SAVE_MAGIC = b"AOSAVE"
+SAVE_FORMAT_VERSION = 2
+SAVE_INDEX_FILE = "save_index.json"
+SAVE_MESSAGE_DURATION = 1000
+
+# Confirmation dialogs
+DIALOG_PADDING = 24
+DIALOG_BUTTON_SIZE = (90, 36)
+DIALOG_COLOR = (2, 24, 49)
+DIALOG_OVERLAY_ALPHA = 150
+
+# Bits of the controls of a player for one tick. The network clients send
+# their controls to the host as these bits.
+INPUT_BITS = {
+    "right": 1,
+    "left": 2,
+    "up": 4,
+    "down": 8,
+    "fire": 16,
+    "missile": 32,
+    "laser": 64,
+}
+
+# Keys of the players, by action, named like the pygame key constants
+# without the K_ prefix. The key bindings file of the user overrides them.
+KEY_BINDINGS_FILE = "key_bindings.json"
+DEFAULT_KEY_BINDINGS = {
+    "thunderbird": {
+        "right": "d",
+        "left": "a",
+        "up": "w",
+        "down": "s",
+        "fire": "SPACE",
+        "missile": "x",
+        "laser": "c",
+    },
+    "phoenix": {
+        "right": "RIGHT",
+        "left": "LEFT",
+        "up": "UP",
+        "down": "DOWN",
+        "fire": "RETURN",
+        "missile": "RCTRL",
+        "laser": "RSHIFT",
+    },
+}
+
+# Netcode of Cosmic Conflict. The snapshots sent by the host never exceed
+# the packet size, the entities that don't fit are sent in the next ticks.
+NET_MAX_PACKET_SIZE = 1200
+NET_SNAPSHOT_HISTORY = 64
+NET_INPUT_REDUNDANCY = 4
+
+# Match farm. The bot matches run on a simulated clock at the game frame rate
+# and end after the frame limit. A frame is over budget when its game logic
+# takes longer than one frame.
+FARM_FRAME_RATE = 60
+FARM_MAX_FRAMES = 18000
+FARM_FRAME_BUDGET = 1 / FARM_FRAME_RATE
+FARM_GAME_MODES = (
+    "normal",
+    "endless_onslaught",
+    "slow_burn",
+    "meteor_madness",
+    "boss_rush",
+    "last_bullet",
+    "one_life_reign",
+    "cosmic_conflict",
+)
+FARM_DIFFICULTIES = ("EASY", "MEDIUM", "HARD")
+# Loadouts of the Thunderbird and the Phoenix, named like in the ship selection.
+FARM_LOADOUTS = (
+    ("regular_thunder", "regular_phoenix"),
+    ("slow_thunder", "fast_phoenix"),
+    ("artillery_thunder", "artillery_phoenix"),
+)
+# The bot dodges the alien bullets and asteroids closer than this distance
+# and fires a missile at a boss in front of it with this chance per frame.
+BOT_DODGE_DISTANCE = 160
+BOT_MISSILE_CHANCE = 0.02
+
+# Telemetry. When it is on, a JSON line with the frame times and the entity
+# counts is written every interval (in milliseconds), with a line for every
+# level change, save, load and window resize. The file is rotated when it
+# gets too big, and the frames longer than the stall time count as stalls.
+USE_TELEMETRY = False
+TELEMETRY_FILE = "telemetry.jsonl"
+TELEMETRY_INTERVAL = 1000
+TELEMETRY_MAX_BYTES = 1_000_000
+TELEMETRY_BACKUPS = 3
+TELEMETRY_STALL_TIME = 50
+
+# Memory profiling, off by default since tracemalloc slows the game down.
+# Every sample interval the traced memory and the live entities and surfaces
+# are counted, and the counts that grew over the last growth samples are
+# flagged with the code that allocated the most since the first sample.
+USE_MEMORY_PROFILING = False
+MEMORY_FILE = "memory.jsonl"
+MEMORY_SAMPLE_INTERVAL = 10_000
+MEMORY_GROWTH_SAMPLES = 6
+MEMORY_TOP_ALLOCATIONS = 5
+
 # HIGH SCORES related constants
 SINGLE_PLAYER_FILE = "single_high_score.json"
 MULTI_PLAYER_FILE = "high_score.json"
-DEFAULT_HIGH_SCORES = {"high_scores": [0] * 10}
+# The SQLite leaderboard also keeps the history of every match,
+# the JSON files are imported into it the first time they are used.
+USE_SQLITE_LEADERBOARD = False
+LEADERBOARD_DB_FILE = "leaderboard.db"
 RANK_POSITIONS = {1: "1st", 2: "2nd", 3: "3rd"}
 
 # Ships settings
@@ -1,8 +1,11 @@
 """
-The 'game_dataclasses' module contains the UIOptions, GameModes and
-ShipStates data classes taht are used in different parts of the game."""
+The 'game_dataclasses' module contains the UIOptions, GameModes, ShipStates,
+SaveSlot and WorldBounds data classes taht are used in different parts of the game."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pygame
 
 
 @dataclass
@@ -11,7 +14,6 @@ class UIOptions:
 
     paused: bool = False
     show_difficulty: bool = False
-    resizable: bool = False
     high_score_saved: bool = False
     show_high_scores: bool = False
     show_game_modes: bool = False
@@ -49,3 +51,35 @@ class ShipStates:
     scaled: bool = False
     scaled_weapon: bool = False
     firing: bool = False
+
+
+@dataclass
+class SaveSlot:
+    """Represents a save slot in the save/load menu, with its metadata
+    and the text surfaces rendered for it."""
+
+    name: str
+    metadata: Optional[dict] = None
+    title: Optional[pygame.Surface] = None
+    details: Optional[pygame.Surface] = None
+    rect: Optional[pygame.Rect] = None
+
+    @property
+    def is_empty(self):
+        """Return True if nothing is saved in this slot."""
+        return self.metadata is None
+
+
+@dataclass
+class WorldBounds:
+    """Holds the screen rect and the game mode flags that sprites read
+    every frame. It is refreshed once per frame and when the screen is
+    resized, so the sprites don't have to look them up one by one."""
+
+    rect: pygame.Rect = field(default_factory=pygame.Rect)
+    cosmic_conflict: bool = False
+
+    def refresh(self, screen, game_modes):
+        """Read the screen rect and the game mode flags."""
+        self.rect = screen.get_rect()
+        self.cosmic_conflict = game_modes.cosmic_conflict
@@ -2,7 +2,7 @@
 
 import os
 import sys
-import json
+import weakref
 import pygame
 
 from src.utils.constants import (
@@ -12,11 +12,12 @@ from src.utils.constants import (
     BOSS_RUSH,
     ALIEN_BULLETS_IMG,
     BOSS_BULLETS_IMG,
-    SINGLE_PLAYER_FILE,
-    MULTI_PLAYER_FILE,
-    DEFAULT_HIGH_SCORES,
     RANK_POSITIONS,
+    SOUND_CHANNEL_POOLS,
+    SOUND_CATEGORIES,
+    MASK_COLLISIONS,
 )
+from src.utils.voice_allocator import VoiceAllocator
 
 if hasattr(sys, "_MEIPASS"):
     # Running as a PyInstaller bundle
@@ -36,6 +37,16 @@ else:
         os.path.join(os.path.dirname(__file__), "..", "..", "game_assets", "sounds")
     )
 
+# Shared allocator used to pick a mixer channel for every sound effect.
+voice_allocator = VoiceAllocator(SOUND_CHANNEL_POOLS, SOUND_CATEGORIES)
+
+# Number of texts rendered, read by the telemetry.
+render_counts = {"text": 0}
+
+# Collision masks, kept for as long as their image is alive.
+image_masks = weakref.WeakKeyDictionary()
+rect_masks = {}
+
 # IMAGE RELATED FINCTIONS
 
 
@@ -96,6 +107,16 @@ def draw_image(screen, image, rect):
     screen.blit(image, rect)
 
 
+def update_display(display=None):
+    """Show the frame in the window, through the display manager of the game
+    when there is one.
+    """
+    if display is None:
+        pygame.display.flip()
+    else:
+        display.present()
+
+
 def resize_image(image, screen_size=None):
     """Resizes an image to match the current screen size."""
     if screen_size is None:
@@ -192,29 +213,10 @@ def set_music_volume(music, volume):
         pygame.mixer.music.set_volume(volume)
 
 
-def get_available_channels():
-    """Returns a list of available sound channels."""
-    num_channels = pygame.mixer.get_num_channels()
-    available_channels = []
-    for channel_num in range(num_channels):
-        channel = pygame.mixer.Channel(channel_num)
-        if not channel.get_busy():
-            available_channels.append(channel)
-    return available_channels
-
-
 def play_sound(sounds_list, sound_name):
-    """Plays a certain sound located in the 'sounds_list' on an available sound channel."""
-    if sound_name == "bullet":
-        channel = pygame.mixer.Channel(7)
-    elif sound_name == "alien_exploding":
-        channel = pygame.mixer.Channel(6)
-    elif available_channels := get_available_channels():
-        channel = available_channels[0]
-    else:
-        channel = pygame.mixer.Channel(1)
-
-    channel.play(sounds_list[sound_name])
+    """Plays a certain sound located in the 'sounds_list' on a channel
+    chosen by the voice allocator."""
+    return voice_allocator.play(sounds_list[sound_name], sound_name)
 
 
 # MISC FUNCTIONS:
@@ -226,6 +228,18 @@ def create_save_dir(save_folder):
         os.makedirs(save_folder)
 
 
+def write_atomic(file_path, data):
+    """Write the data to a temporary file, sync it to disk and rename it
+    over the target file, so the target is never left half written.
+    """
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, file_path)
+
+
 def set_attribute(obj, attribute_chain, value):
     """Set the attribute in the nested object."""
     for attribute in attribute_chain[:-1]:
@@ -236,9 +250,108 @@ def set_attribute(obj, attribute_chain, value):
         setattr(obj, attribute_chain[-1], value)
 
 
+def remove_sprites_below(group, bottom):
+    """Remove the sprites whose top went below the given y in one call."""
+    gone = [sprite for sprite in group.sprites() if sprite.rect.y > bottom]
+    if gone:
+        group.remove(*gone)
+
+
+def remove_sprites_outside(group, area):
+    """Remove the sprites that no longer touch the given area in one call."""
+    sprites = group.sprites()
+    inside = area.collidelistall([sprite.rect for sprite in sprites])
+    if len(inside) < len(sprites):
+        inside = set(inside)
+        group.remove(*[sprite for i, sprite in enumerate(sprites) if i not in inside])
+
+
+def get_mask(image):
+    """Return the collision mask of an image, creating it on first use."""
+    mask = image_masks.get(image)
+    if mask is None:
+        mask = image_masks[image] = pygame.mask.from_surface(image)
+    return mask
+
+
+def get_rect_mask(size):
+    """Return a filled collision mask of the given size."""
+    mask = rect_masks.get(size)
+    if mask is None:
+        mask = rect_masks[size] = pygame.mask.Mask(size, fill=True)
+    return mask
+
+
+def uses_mask(sprite):
+    """Return True if the sprite type collides using its image mask."""
+    return MASK_COLLISIONS.get(type(sprite).__name__, False)
+
+
+def get_sprite_mask(sprite):
+    """Return the mask of the sprite image, or of its rect for the sprite
+    types that do not use precise collisions.
+    """
+    if uses_mask(sprite):
+        return get_mask(sprite.image)
+    return get_rect_mask(sprite.rect.size)
+
+
+def masks_collide(rect, mask, sprite):
+    """Return True if a mask placed at the rect overlaps the sprite mask."""
+    offset = (sprite.rect.x - rect.x, sprite.rect.y - rect.y)
+    return mask.overlap(get_sprite_mask(sprite), offset) is not None
+
+
+def collide_precise(left, right):
+    """Check two sprites whose rects collide. The masks are only checked
+    when one of the sprite types uses precise collisions.
+    """
+    left_precise = uses_mask(left)
+    right_precise = uses_mask(right)
+    if not (left_precise or right_precise):
+        return True
+
+    left_mask = get_mask(left.image) if left_precise else get_rect_mask(left.rect.size)
+    right_mask = (
+        get_mask(right.image) if right_precise else get_rect_mask(right.rect.size)
+    )
+    offset = (right.rect.x - left.rect.x, right.rect.y - left.rect.y)
+    return left_mask.overlap(right_mask, offset) is not None
+
+
+def get_colliding_sprite(sprite, group):
+    """Returns the first sprite in the group that collides with the sprite."""
+    colliderect = sprite.rect.colliderect
+    for other in group:
+        if colliderect(other.rect) and collide_precise(sprite, other):
+            return other
+    return None
+
+
 def get_colliding_sprites(ship, bullets_or_missiles):
     """Returns the sprites that collide with the given ship."""
-    return pygame.sprite.spritecollide(ship, bullets_or_missiles, False)
+    return [
+        sprite
+        for sprite in pygame.sprite.spritecollide(ship, bullets_or_missiles, False)
+        if collide_precise(ship, sprite)
+    ]
+
+
+def get_group_collisions(group_a, group_b, kill_a=False):
+    """Returns a dict with the sprites from the first group that collide
+    with sprites from the second group, like pygame.sprite.groupcollide.
+    The rects are checked first, the masks only for the rect hits.
+    """
+    collisions = {}
+    for sprite, hits in pygame.sprite.groupcollide(
+        group_a, group_b, False, False
+    ).items():
+        hits = [hit for hit in hits if collide_precise(sprite, hit)]
+        if hits:
+            collisions[sprite] = hits
+            if kill_a:
+                sprite.kill()
+    return collisions
 
 
 def get_boss_rush_title(level):
@@ -265,7 +378,7 @@ def render_bullet_num(bullets, x_pos, y_pos, right_aligned=False):
     font = pygame.font.SysFont("", 25)
     text_color = (238, 75, 43)
     bullets_str = f"Remaining bullets: {bullets}" if bullets else ""
-    bullets_num_img = font.render(bullets_str, True, text_color, None)
+    bullets_num_img = render_font_text(font, bullets_str, True, text_color, None)
     bullets_num_rect = bullets_num_img.get_rect()
     bullets_num_rect.top = y_pos
 
@@ -277,13 +390,13 @@ def render_bullet_num(bullets, x_pos, y_pos, right_aligned=False):
     return bullets_num_img, bullets_num_rect
 
 
-def display_message(screen, message, duration):
+def display_message(screen, message, duration, display=None):
     """Display a message on the screen for a specified amount of time."""
     font = pygame.font.SysFont("verdana", 14)
-    text = font.render(message, True, (255, 255, 255))
+    text = render_font_text(font, message, True, (255, 255, 255))
     rect = text.get_rect(center=(screen.get_width() / 2, screen.get_height() / 2 - 50))
     screen.blit(text, rect)
-    pygame.display.flip()
+    update_display(display)
     pygame.time.wait(int(duration * 1000))
 
 
@@ -292,9 +405,9 @@ def display_custom_message(screen, message, ship, cosmic=False, powers=False):
     ship_rect = ship.rect
     font = pygame.font.SysFont("verdana", 10)
     if powers:
-        text = font.render(message, True, (173, 216, 230))
+        text = render_font_text(font, message, True, (173, 216, 230))
     else:
-        text = font.render(message, True, (255, 0, 0))
+        text = render_font_text(font, message, True, (255, 0, 0))
 
     if cosmic:
         text_rect = text.get_rect(top=ship_rect.top - 20, left=ship_rect.left + 5)
@@ -303,6 +416,12 @@ def display_custom_message(screen, message, ship, cosmic=False, powers=False):
     screen.blit(text, text_rect)
 
 
+def render_font_text(font, *args):
+    """Render a text with a font, the arguments are the ones of font.render."""
+    render_counts["text"] += 1
+    return font.render(*args)
+
+
 def render_text(text, font, color, start_pos, line_spacing, second_color=None):
     """Render text with new_lines and tabs."""
     lines = text.split("\n")
@@ -317,9 +436,9 @@ def render_text(text, font, color, start_pos, line_spacing, second_color=None):
         line = line.replace("\t", " " * tab_width)
 
         if i == 0 and second_color:
-            text_surface = font.render(line, True, second_color, None)
+            text_surface = render_font_text(font, line, True, second_color, None)
         else:
-            text_surface = font.render(line, True, color, None)
+            text_surface = render_font_text(font, line, True, color, None)
 
         text_rect = text_surface.get_rect(
             topleft=(start_pos[0], start_pos[1] + i * line_spacing)
@@ -407,19 +526,19 @@ def display_controls(controls_surface, surface):
 
 def render_simple_text(text, font, color, x, y):
     """Render a simple text."""
-    text_surface = font.render(text, True, color)
+    text_surface = render_font_text(font, text, True, color)
     text_rect = text_surface.get_rect()
     text_rect.center = (x, y)
     return text_surface, text_rect
 
 
-def display_simple_message(screen, text, font, color, delay_time):
+def display_simple_message(screen, text, font, color, delay_time, display=None):
     """Display a simple message on screen."""
     message_surface, message_rect = render_simple_text(
         text, font, color, screen.get_width() // 2, 600
     )
     screen.blit(message_surface, message_rect)
-    pygame.display.flip()
+    update_display(display)
     pygame.time.delay(delay_time)
 
 
@@ -438,26 +557,8 @@ def display_muted_state_message(screen, text):
 # HIGH SCORE RELATED FUNCTIONS:
 
 
-def load_high_scores(game):
-    """Load the high score data from the JSON file or create a new high score list."""
-    filename = SINGLE_PLAYER_FILE if game.singleplayer else MULTI_PLAYER_FILE
-    try:
-        with open(filename, "r", encoding="utf-8") as score_file:
-            high_scores = json.load(score_file)
-    except (FileNotFoundError, json.JSONDecodeError):
-        high_scores = DEFAULT_HIGH_SCORES
-    return high_scores
-
-
-def display_high_scores(game, screen, score_key, game_mode_name):
-    """Display the high scores on the screen."""
-    high_scores = load_high_scores(game)
-
-    try:
-        scores = high_scores[score_key]
-    except KeyError:
-        scores = []
-
+def render_high_scores(screen_size, scores, game_mode_name):
+    """Render the high scores table and return the surfaces and rects to blit."""
     ranked_entries = [
         (i + 1, entry["name"], entry["score"])
         for i, entry in enumerate(scores)
@@ -473,7 +574,7 @@ def display_high_scores(game, screen, score_key, game_mode_name):
     score_text = "\n".join(score_strings)
     rank_text = "\n".join(rank_strings)
 
-    screen_width, screen_height = screen.get_size()
+    screen_width, screen_height = screen_size
     center_x = int(screen_width / 2)
     center_y = int(screen_height / 2)
 
@@ -503,13 +604,15 @@ def display_high_scores(game, screen, score_key, game_mode_name):
         score_text, scores_font, "red", (score_x, score_y), int(screen_height * 0.05)
     )
 
-    for surfaces, rects in [
-        (text_surfaces, text_rects),
-        (rank_surfaces, rank_rects),
-        (scores_surfaces, scores_rects),
-    ]:
-        for surface, rect in zip(surfaces, rects):
-            screen.blit(surface, rect)
+    return [
+        (surface, rect)
+        for surfaces, rects in [
+            (text_surfaces, text_rects),
+            (rank_surfaces, rank_rects),
+            (scores_surfaces, scores_rects),
+        ]
+        for surface, rect in zip(surfaces, rects)
+    ]
 
 
 def draw_buttons(screen, button_info, font, text_color):
@@ -518,7 +621,7 @@ def draw_buttons(screen, button_info, font, text_color):
         pygame.draw.rect(
             screen, (0, 0, 0, 0), button["rect"]
         )  # Set background color to transparent
-        text_surface = font.render(button["label"], True, text_color)
+        text_surface = render_font_text(font, button["label"], True, text_color)
         text_x = button["rect"].centerx - text_surface.get_width() // 2
         text_y = button["rect"].centery - 13
         screen.blit(text_surface, (text_x, text_y))
@@ -526,14 +629,20 @@ def draw_buttons(screen, button_info, font, text_color):
 
 def render_label(screen, text, pos, text_font, text_color):
     """Render label on screen."""
-    text_surface = text_font.render(text, True, text_color)
+    text_surface = render_font_text(text_font, text, True, text_color)
     text_x = pos[0] - text_surface.get_width() // 2
     text_y = pos[1] - 18
     screen.blit(text_surface, (text_x, text_y))
 
 
 def get_player_name(
-    screen, background_image, cursor, high_score, game_end_img=None, game_end_rect=None
+    screen,
+    background_image,
+    cursor,
+    high_score,
+    game_end_img=None,
+    game_end_rect=None,
+    display=None,
 ):
     """Get the player name for the high score."""
 
@@ -578,8 +687,11 @@ def get_player_name(
                     player_name += event.unicode
 
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                mouse_pos = (
+                    event.pos if display is None else display.to_canvas(event.pos)
+                )
                 for button in button_info:
-                    if button["rect"].collidepoint(event.pos):
+                    if button["rect"].collidepoint(mouse_pos):
                         if button["label"] == "Close":
                             return None  # Exit loop without saving the name
                         if button["label"] == "Save":
@@ -592,13 +704,13 @@ def get_player_name(
         # Draw the input box and player name
         pygame.draw.rect(screen, text_color, input_box, 1)
         screen.blit(
-            font.render(player_name, True, pygame.Color(90, 90, 90)),
+            render_font_text(font, player_name, True, pygame.Color(90, 90, 90)),
             (input_box.x + 5, input_box.y),
         )
 
         # Draw the high score
-        high_score_surface = text_font.render(
-            f"High Score: {high_score}", True, text_color
+        high_score_surface = render_font_text(
+            text_font, f"High Score: {high_score}", True, text_color
         )
         screen.blit(
             high_score_surface,
@@ -618,4 +730,4 @@ def get_player_name(
         draw_buttons(screen, button_info, font, text_color)
         cursor()
 
-        pygame.display.flip()
+        update_display(display)
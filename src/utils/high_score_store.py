@@ -0,0 +1,130 @@
+"""
+The 'high_score_store' module contains the HighScoreStore class that keeps
+the high score tables in memory and writes them to disk in the background.
+"""
+
+import atexit
+import json
+import queue
+import threading
+
+from src.utils.game_utils import write_atomic
+
+
+class HighScoreStore:
+    """This class loads every high score file once and keeps its tables
+    sorted in memory, one table per game mode key. Changes are written
+    back to the file on a worker thread, several changes made before the
+    write happens are written together. The version number is increased
+    on every change, so rendered tables know when they are out of date.
+    """
+
+    def __init__(self, max_entries=10):
+        self.max_entries = max_entries
+        self.tables = {}
+        self.version = 0
+
+        self.jobs = queue.Queue()
+        self.pending = set()
+        self.thread = None
+        self._lock = threading.Lock()
+
+    def _load(self, filename):
+        """Return the tables of a high score file, loading it on first use.
+        The tables are cut to the maximum number of entries.
+        """
+        if filename not in self.tables:
+            try:
+                with open(filename, "r", encoding="utf-8") as score_file:
+                    data = json.load(score_file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                data = {}
+
+            self.tables[filename] = {
+                score_key: sorted(
+                    (entry for entry in entries if isinstance(entry, dict)),
+                    key=lambda entry: entry["score"],
+                    reverse=True,
+                )[: self.max_entries]
+                for score_key, entries in data.items()
+                if isinstance(entries, list)
+            }
+        return self.tables[filename]
+
+    def get_scores(self, filename, score_key):
+        """Return the sorted entries of a high score table."""
+        return list(self._load(filename).get(score_key, []))
+
+    def has_name(self, filename, score_key, name):
+        """Return True if the name already has an entry in the table."""
+        return any(
+            entry["name"] == name for entry in self.get_scores(filename, score_key)
+        )
+
+    def add_score(self, filename, score_key, name, score):
+        """Add a score to a table. An entry with the same score is replaced."""
+        new_entry = {"name": name, "score": score}
+
+        with self._lock:
+            scores = self._load(filename).setdefault(score_key, [])
+            for i, entry in enumerate(scores):
+                if entry["score"] == score:
+                    scores[i] = new_entry
+                    break
+            else:
+                index = next(
+                    (i for i, entry in enumerate(scores) if entry["score"] < score),
+                    len(scores),
+                )
+                scores.insert(index, new_entry)
+                del scores[self.max_entries :]
+
+        self._changed(filename)
+
+    def record_match(self, filename, score_key, score, match):
+        """The JSON files only keep the high scores, the match history
+        is only kept by the SQLite leaderboard.
+        """
+
+    def delete_scores(self, filename, score_key):
+        """Delete a high score table."""
+        with self._lock:
+            tables = self._load(filename)
+            if score_key not in tables:
+                return
+            del tables[score_key]
+
+        self._changed(filename)
+
+    def flush(self):
+        """Block until every pending change has been written."""
+        self.jobs.join()
+
+    def _changed(self, filename):
+        """Update the version and queue a write of the changed file."""
+        self.version += 1
+
+        with self._lock:
+            if filename in self.pending:
+                return
+            self.pending.add(filename)
+
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            atexit.register(self.flush)
+        self.jobs.put(filename)
+
+    def _run(self):
+        """Write the changed files one after the other."""
+        while True:
+            filename = self.jobs.get()
+            try:
+                with self._lock:
+                    self.pending.discard(filename)
+                    data = json.dumps(self.tables[filename]).encode("utf-8")
+                write_atomic(filename, data)
+            except OSError:
+                pass
+            finally:
+                self.jobs.task_done()
@@ -0,0 +1,53 @@
+"""
+The 'key_bindings' module loads the keys of the players from the key
+bindings file of the user and builds the table that gives the player and
+the input bit of every bound key.
+"""
+
+import json
+
+import pygame
+
+from src.utils.constants import DEFAULT_KEY_BINDINGS, INPUT_BITS, KEY_BINDINGS_FILE
+
+
+def get_key_code(key_name):
+    """Return the pygame key code of a key name, None if there is no such key."""
+    if not isinstance(key_name, str):
+        return None
+    key_code = getattr(pygame, f"K_{key_name}", None)
+    return key_code if isinstance(key_code, int) else None
+
+
+def load_key_bindings(file_path=KEY_BINDINGS_FILE):
+    """Return the key bindings of the players, the defaults updated with
+    the ones in the key bindings file. The unknown players, actions and
+    keys of the file are ignored.
+    """
+    bindings = {player: dict(keys) for player, keys in DEFAULT_KEY_BINDINGS.items()}
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            config = json.load(file)
+    except (OSError, ValueError):
+        return bindings
+    if not isinstance(config, dict):
+        return bindings
+
+    for player, keys in config.items():
+        if player not in bindings or not isinstance(keys, dict):
+            continue
+        for action, key_name in keys.items():
+            if action in INPUT_BITS and get_key_code(key_name) is not None:
+                bindings[player][action] = key_name
+    return bindings
+
+
+def build_key_table(bindings):
+    """Return the table that maps the key code of every bound key to the
+    player and the input bit of its action.
+    """
+    return {
+        get_key_code(key_name): (player, INPUT_BITS[action])
+        for player, keys in bindings.items()
+        for action, key_name in keys.items()
+    }
@@ -0,0 +1,181 @@
+"""
+The 'leaderboard_db' module contains the Leaderboard class that keeps
+the high scores and the match history in a local SQLite database.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    board TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    timestamp REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_rank ON matches (board, mode, score DESC);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    board TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    ship TEXT,
+    difficulty TEXT,
+    level INTEGER,
+    duration REAL,
+    timestamp REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_time ON history (board, mode, timestamp DESC);
+CREATE TABLE IF NOT EXISTS migrations (board TEXT PRIMARY KEY);
+"""
+
+
+class Leaderboard:
+    """This class stores the high scores and every finished match in
+    a SQLite database. It has the same interface as the HighScoreStore,
+    so it can be used in its place. The high score file name is used as the board name and
+    the score key as the mode. Top scores are read through the
+    (board, mode, score DESC) index, so only the requested rows are read.
+    A high score file is imported the first time its board is used.
+    """
+
+    def __init__(self, db_path, max_entries=10):
+        self.max_entries = max_entries
+        self.version = 0
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+        self.migrated = {
+            row["board"]
+            for row in self.connection.execute("SELECT board FROM migrations")
+        }
+
+    def _board(self, filename):
+        """Return the board name of a high score file, importing it on first use."""
+        board = os.path.basename(filename)
+        if board not in self.migrated:
+            self.migrate_json(filename)
+        return board
+
+    def migrate_json(self, filename):
+        """Import the tables of a JSON high score file into the database.
+        Each board is only imported once, a missing file is marked as imported.
+        """
+        board = os.path.basename(filename)
+        try:
+            with open(filename, "r", encoding="utf-8") as score_file:
+                data = json.load(score_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+
+        timestamp = time.time()
+        rows = [
+            (board, score_key, entry["name"], entry["score"], timestamp)
+            for score_key, entries in data.items()
+            if isinstance(entries, list)
+            for entry in entries
+            if isinstance(entry, dict)
+        ]
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO matches (board, mode, name, score, timestamp) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.connection.execute(
+                "INSERT OR IGNORE INTO migrations (board) VALUES (?)", (board,)
+            )
+        self.migrated.add(board)
+
+    def get_scores(self, filename, score_key):
+        """Return the top entries of a mode, highest first."""
+        rows = self.connection.execute(
+            "SELECT name, score FROM matches WHERE board = ? AND mode = ? "
+            "ORDER BY score DESC LIMIT ?",
+            (self._board(filename), score_key, self.max_entries),
+        )
+        return [{"name": row["name"], "score": row["score"]} for row in rows]
+
+    def has_name(self, filename, score_key, name):
+        """Return True if the name already has an entry in the top scores."""
+        return any(
+            entry["name"] == name for entry in self.get_scores(filename, score_key)
+        )
+
+    def add_score(self, filename, score_key, name, score):
+        """Add a high score to a mode."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO matches (board, mode, name, score, timestamp) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self._board(filename), score_key, name, score, time.time()),
+            )
+        self.version += 1
+
+    def record_match(self, filename, score_key, score, match):
+        """Add a finished match to the history of a mode. The match dict
+        holds the ship, difficulty, level and duration of the match.
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO history (board, mode, score, ship, difficulty, "
+                "level, duration, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._board(filename),
+                    score_key,
+                    score,
+                    match.get("ship"),
+                    match.get("difficulty"),
+                    match.get("level"),
+                    match.get("duration"),
+                    time.time(),
+                ),
+            )
+
+    def delete_scores(self, filename, score_key):
+        """Delete the scores and the match history of a mode."""
+        board = self._board(filename)
+        with self.connection:
+            deleted = sum(
+                self.connection.execute(
+                    f"DELETE FROM {table} WHERE board = ? AND mode = ?",
+                    (board, score_key),
+                ).rowcount
+                for table in ("matches", "history")
+            )
+        if deleted:
+            self.version += 1
+
+    def get_history(self, filename, score_key, limit=50):
+        """Return the most recent matches of a mode, newest first."""
+        rows = self.connection.execute(
+            "SELECT * FROM history WHERE board = ? AND mode = ? "
+            "ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (self._board(filename), score_key, limit),
+        )
+        return [dict(row) for row in rows]
+
+    def get_stats(self, filename, score_key):
+        """Return the number of matches, best and average score and the
+        average duration of a mode.
+        """
+        row = self.connection.execute(
+            "SELECT COUNT(*) AS matches, MAX(score) AS best_score, "
+            "AVG(score) AS average_score, AVG(duration) AS average_duration "
+            "FROM history WHERE board = ? AND mode = ?",
+            (self._board(filename), score_key),
+        ).fetchone()
+        return dict(row)
+
+    def flush(self):
+        """Every change is committed right away, nothing is pending."""
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
@@ -0,0 +1,206 @@
+"""
+The 'match_farm' module plays seeded bot matches headless on every core of
+the machine and sums up their results in a report, to catch the balance
+changes and the performance cliffs between two versions of the game.
+"""
+
+import itertools
+import multiprocessing
+import os
+import random
+from collections import defaultdict
+
+from src.alien_onslaught import AlienOnslaught
+from src.game_logic.bot_match import MatchConfig, MatchResult, run_match
+from src.utils.constants import (
+    FARM_DIFFICULTIES,
+    FARM_FRAME_BUDGET,
+    FARM_GAME_MODES,
+    FARM_LOADOUTS,
+    FARM_MAX_FRAMES,
+)
+
+# The game of a worker process and its state before the first match,
+# restored before every match.
+_worker_game = None
+_worker_baseline = None
+
+
+def make_configs(matches, seed=0, max_frames=FARM_MAX_FRAMES):
+    """Return the configs of the matches. They go through every difficulty,
+    game mode, loadout and number of players in turn, in a shuffled order,
+    and every match has its own seed.
+    """
+    combinations = [
+        (difficulty, game_mode, loadout, singleplayer)
+        for difficulty in FARM_DIFFICULTIES
+        for game_mode in FARM_GAME_MODES
+        for loadout in FARM_LOADOUTS
+        for singleplayer in (True, False)
+        # Cosmic Conflict needs two players.
+        if not (singleplayer and game_mode == "cosmic_conflict")
+    ]
+    seeds = random.Random(seed)
+    seeds.shuffle(combinations)
+    return [
+        MatchConfig(seeds.getrandbits(32), *combination, max_frames=max_frames)
+        for combination in itertools.islice(itertools.cycle(combinations), matches)
+    ]
+
+
+def _init_worker():
+    """Create the game of a worker process, without a window or sounds."""
+    global _worker_game, _worker_baseline  # pylint: disable=global-statement
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    # SDL turns SIGTERM into a quit event, so the pool could not
+    # terminate its workers and would hang when it is closed.
+    os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+    _worker_game = AlienOnslaught()
+    _worker_baseline = _worker_game.game_state.snapshot()
+
+
+def _play_match(config):
+    """Play a match in a worker process, from a fresh game. A match that
+    raises is reported with the "error" outcome, so the other matches
+    are still played.
+    """
+    try:
+        _worker_game.game_state.restore(_worker_baseline)
+        return run_match(_worker_game, config)
+    except Exception as error:  # pylint: disable=broad-except
+        return MatchResult(
+            config=config,
+            outcome="error",
+            level=0,
+            score=0,
+            frames=0,
+            frame_time=0.0,
+            worst_frame=0.0,
+            over_budget=0,
+            error=f"{type(error).__name__}: {error}",
+        )
+
+
+def run_farm(configs, processes=None, chunksize=4):
+    """Play the matches on a pool of worker processes, one per core by
+    default, and return their results in the order they finished.
+    """
+    with multiprocessing.Pool(processes, initializer=_init_worker) as pool:
+        return list(pool.imap_unordered(_play_match, configs, chunksize))
+
+
+def get_level_costs(results):
+    """Return the (level, frames, mean frame cost) of every level reached."""
+    level_costs = defaultdict(lambda: [0, 0.0])
+    for result in results:
+        for level, (frames, seconds) in result.level_costs.items():
+            level_costs[level][0] += frames
+            level_costs[level][1] += seconds
+    return [
+        (level, frames, seconds / frames)
+        for level, (frames, seconds) in sorted(level_costs.items())
+    ]
+
+
+def summarize(results):
+    """Return the rows of the report, one per difficulty, game mode,
+    loadout and number of players. The matches that raised are counted
+    in errors and left out of the other columns.
+    """
+    groups = defaultdict(list)
+    for result in results:
+        config = result.config
+        key = (
+            config.difficulty,
+            config.game_mode,
+            config.loadout,
+            1 if config.singleplayer else 2,
+        )
+        groups[key].append(result)
+
+    rows = []
+    for (difficulty, game_mode, loadout, players), group in sorted(groups.items()):
+        played = [result for result in group if result.outcome != "error"]
+        row = {
+            "difficulty": difficulty,
+            "game_mode": game_mode,
+            "loadout": "/".join(loadout[:players]),
+            "players": players,
+            "matches": len(played),
+            "errors": len(group) - len(played),
+            "win_rate": 0.0,
+            "mean_level": 0.0,
+            "max_level": 0,
+            "mean_frame_ms": 0.0,
+            "worst_frame_ms": 0.0,
+            "over_budget": 0,
+            "first_slow_level": None,
+            "peak_entities": {},
+        }
+        rows.append(row)
+        if not played:
+            continue
+
+        frames = sum(result.frames for result in played)
+        slow_levels = [
+            level
+            for level, _, cost in get_level_costs(played)
+            if cost > FARM_FRAME_BUDGET
+        ]
+        row.update(
+            {
+                "win_rate": sum(result.won for result in played) / len(played),
+                "mean_level": sum(result.level for result in played) / len(played),
+                "max_level": max(result.level for result in played),
+                "mean_frame_ms": sum(result.frame_time for result in played)
+                / frames
+                * 1000,
+                "worst_frame_ms": max(result.worst_frame for result in played) * 1000,
+                "over_budget": sum(result.over_budget for result in played),
+                "first_slow_level": slow_levels[0] if slow_levels else None,
+                "peak_entities": {
+                    name: max(result.peak_entities.get(name, 0) for result in played)
+                    for name in played[0].peak_entities
+                },
+            }
+        )
+    return rows
+
+
+def format_report(rows, level_costs):
+    """Return the report as text: a line for every row and the mean frame
+    cost of every level, with the levels over the frame budget marked.
+    """
+    lines = [
+        f"{'difficulty':<11}{'game mode':<19}{'loadout':<35}{'n':>5}"
+        f"{'win':>6}{'level':>7}{'max':>5}{'ms':>7}{'worst':>8}{'over':>6}"
+        f"{'aliens':>8}{'bullets':>8}{'err':>5}"
+    ]
+    for row in rows:
+        peak = row["peak_entities"]
+        lines.append(
+            f"{row['difficulty']:<11}{row['game_mode']:<19}{row['loadout']:<35}"
+            f"{row['matches']:>5}{row['win_rate']:>6.0%}{row['mean_level']:>7.1f}"
+            f"{row['max_level']:>5}{row['mean_frame_ms']:>7.2f}"
+            f"{row['worst_frame_ms']:>8.2f}{row['over_budget']:>6}"
+            f"{peak.get('aliens', 0):>8}{peak.get('alien_bullet', 0):>8}"
+            f"{row['errors']:>5}"
+        )
+
+    lines.append("")
+    lines.append(f"{'level':<8}{'frames':>10}{'ms':>8}")
+    for level, frames, cost in level_costs:
+        over = "  over budget" if cost > FARM_FRAME_BUDGET else ""
+        lines.append(f"{level:<8}{frames:>10}{cost * 1000:>8.2f}{over}")
+    return "\n".join(lines)
+
+
+def format_errors(results):
+    """Return a line for every match that raised, with its config."""
+    return [
+        f"seed {result.config.seed} {result.config.difficulty} "
+        f"{result.config.game_mode}: {result.error}"
+        for result in results
+        if result.outcome == "error"
+    ]
@@ -0,0 +1,160 @@
+"""
+The 'net_format' module contains the functions that encode and decode
+the packets of the Cosmic Conflict netcode.
+
+The clients send input packets with their last input bits, so that an
+input survives the loss of a few packets, and the tick of the last
+snapshot they received. The host sends snapshot packets with the entities
+that changed since a snapshot the client received, the baseline, and the
+ids of the entities that were removed since. A snapshot without baseline
+holds every entity.
+
+The entities of a snapshot are kept in a dict of net id to
+(kind, fields) tuples. The ships have fixed ids, the projectiles get
+their ids from the host.
+"""
+
+import struct
+
+from src.utils.constants import NET_MAX_PACKET_SIZE
+
+INPUT_PACKET = 1
+SNAPSHOT_PACKET = 2
+
+# type, last received snapshot tick, input sequence, number of inputs
+INPUT_HEADER = struct.Struct("<BIIB")
+
+# type, tick, baseline tick, number of removed ids, number of entities
+SNAPSHOT_HEADER = struct.Struct("<BIIHH")
+REMOVED_ID = struct.Struct("<H")
+
+# net id, kind
+ENTITY_HEADER = struct.Struct("<HB")
+
+SHIP, BULLET, MISSILE, LASER = range(4)
+
+ENTITY_RECORDS = {
+    # x position, y position, flags, hp, missiles, score. The hp is signed,
+    # it drops to -1 when the ship is destroyed.
+    SHIP: struct.Struct("<hhBbBI"),
+    # owner, x position, y position
+    BULLET: struct.Struct("<Bhh"),
+    MISSILE: struct.Struct("<Bhh"),
+    LASER: struct.Struct("<Bhh"),
+}
+
+# When a snapshot doesn't fit in a packet, the ships are sent first.
+ENTITY_PRIORITY = {SHIP: 0, LASER: 1, MISSILE: 2, BULLET: 3}
+
+SHIP_FLAGS = ("alive", "exploding", "warping", "shielded", "immune", "empowered")
+
+SHIP_IDS = {"thunderbird": 0, "phoenix": 1}
+FIRST_PROJECTILE_ID = len(SHIP_IDS)
+MAX_NET_ID = 0xFFFF
+
+
+def get_packet_type(packet):
+    """Return the type of a packet, None if it is empty."""
+    return packet[0] if packet else None
+
+
+def encode_input(ack_tick, sequence, inputs):
+    """Return an input packet with the input bits of the last ticks,
+    the last one is the input with the given sequence number.
+    """
+    return INPUT_HEADER.pack(INPUT_PACKET, ack_tick, sequence, len(inputs)) + bytes(
+        inputs
+    )
+
+
+def decode_input(packet):
+    """Return the acknowledged tick, the sequence number and the input bits
+    of an input packet.
+    """
+    packet_type, ack_tick, sequence, count = INPUT_HEADER.unpack_from(packet)
+    inputs = packet[INPUT_HEADER.size :]
+    if packet_type != INPUT_PACKET or len(inputs) != count:
+        raise ValueError("Invalid input packet")
+    return ack_tick, sequence, list(inputs)
+
+
+def encode_ship_flags(state):
+    """Pack the states of a ship into flag bits."""
+    return sum(1 << bit for bit, name in enumerate(SHIP_FLAGS) if getattr(state, name))
+
+
+def decode_ship_flags(flags):
+    """Return the states of a ship stored in flag bits."""
+    return {name: bool(flags & (1 << bit)) for bit, name in enumerate(SHIP_FLAGS)}
+
+
+def encode_snapshot(
+    tick, baseline_tick, baseline, entities, max_size=NET_MAX_PACKET_SIZE
+):
+    """Return a snapshot packet with the changes from the baseline to the
+    entities, and the entities as the client will have them once it gets
+    the packet. The changes that don't fit in the packet are left out.
+    """
+    removed = []
+    updates = []
+    size = SNAPSHOT_HEADER.size
+    state = dict(baseline)
+
+    for net_id in baseline:
+        if net_id not in entities and size + REMOVED_ID.size <= max_size:
+            removed.append(net_id)
+            size += REMOVED_ID.size
+            del state[net_id]
+
+    changed = sorted(
+        (
+            (net_id, entity)
+            for net_id, entity in entities.items()
+            if baseline.get(net_id) != entity
+        ),
+        key=lambda item: (ENTITY_PRIORITY[item[1][0]], item[0]),
+    )
+    for net_id, (kind, fields) in changed:
+        record = ENTITY_RECORDS[kind]
+        if size + ENTITY_HEADER.size + record.size > max_size:
+            continue
+        updates.append(ENTITY_HEADER.pack(net_id, kind) + record.pack(*fields))
+        size += ENTITY_HEADER.size + record.size
+        state[net_id] = (kind, fields)
+
+    header = SNAPSHOT_HEADER.pack(
+        SNAPSHOT_PACKET, tick, baseline_tick, len(removed), len(updates)
+    )
+    removed_ids = b"".join(REMOVED_ID.pack(net_id) for net_id in removed)
+    return header + removed_ids + b"".join(updates), state
+
+
+def decode_snapshot(packet):
+    """Return the tick, the baseline tick, the removed ids and the changed
+    entities of a snapshot packet.
+    """
+    packet_type, tick, baseline_tick, removed_count, update_count = (
+        SNAPSHOT_HEADER.unpack_from(packet)
+    )
+    if packet_type != SNAPSHOT_PACKET:
+        raise ValueError("Invalid snapshot packet")
+
+    offset = SNAPSHOT_HEADER.size
+    removed = []
+    for _ in range(removed_count):
+        removed.append(REMOVED_ID.unpack_from(packet, offset)[0])
+        offset += REMOVED_ID.size
+
+    updates = {}
+    for _ in range(update_count):
+        net_id, kind = ENTITY_HEADER.unpack_from(packet, offset)
+        offset += ENTITY_HEADER.size
+        record = ENTITY_RECORDS.get(kind)
+        if record is None:
+            raise ValueError(f"Unknown entity kind {kind}")
+        updates[net_id] = (kind, record.unpack_from(packet, offset))
+        offset += record.size
+
+    if offset != len(packet):
+        raise ValueError("Invalid snapshot packet")
+    return tick, baseline_tick, removed, updates
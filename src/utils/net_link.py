@@ -0,0 +1,108 @@
+"""
+The 'net_link' module contains the UDP endpoint used by the Cosmic Conflict
+netcode and the LinkSimulator class that adds latency and packet loss to
+an endpoint, to test the netcode on a bad connection over localhost.
+"""
+
+import heapq
+import itertools
+import random
+import socket
+import time
+
+MAX_DATAGRAM_SIZE = 65535
+
+
+class UdpEndpoint:
+    """A non-blocking UDP socket. The packets are sent right away and
+    received once per tick, without ever waiting for the network.
+    """
+
+    def __init__(self, address=("127.0.0.1", 0)):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        self.socket.bind(address)
+        self.address = self.socket.getsockname()
+
+    def send(self, packet, address):
+        """Send a packet. Packets that can't be sent are lost, like
+        any other UDP packet.
+        """
+        try:
+            self.socket.sendto(packet, address)
+        except OSError:
+            pass
+
+    def receive(self):
+        """Return the (packet, address) pairs received since the last call."""
+        packets = []
+        while True:
+            try:
+                packets.append(self.socket.recvfrom(MAX_DATAGRAM_SIZE))
+            except BlockingIOError:
+                return packets
+            except ConnectionResetError:
+                # Windows reports the packets sent to a closed port here.
+                continue
+
+    def close(self):
+        """Close the socket."""
+        self.socket.close()
+
+
+class LinkSimulator:
+    """Wraps an endpoint and delays or drops the packets it sends.
+    Every packet is delayed by the latency plus a random jitter, so the
+    packets can arrive out of order, and a share of them is dropped.
+    The delayed packets are sent when the endpoint is used after their
+    delivery time. A seed makes the simulated connection repeatable.
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        latency=0.0,
+        jitter=0.0,
+        loss=0.0,
+        seed=None,
+        clock=time.monotonic,
+    ):
+        self.endpoint = endpoint
+        self.address = endpoint.address
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.random = random.Random(seed)
+        self.clock = clock
+        self.delayed = []
+        self.order = itertools.count()
+        self.dropped = 0
+
+    def send(self, packet, address):
+        """Drop the packet or delay it before sending it."""
+        if self.random.random() < self.loss:
+            self.dropped += 1
+            return
+
+        delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+        heapq.heappush(
+            self.delayed, (self.clock() + delay, next(self.order), packet, address)
+        )
+        self.flush()
+
+    def flush(self):
+        """Send the delayed packets whose delivery time has come."""
+        now = self.clock()
+        while self.delayed and self.delayed[0][0] <= now:
+            _, _, packet, address = heapq.heappop(self.delayed)
+            self.endpoint.send(packet, address)
+
+    def receive(self):
+        """Return the packets received by the endpoint."""
+        self.flush()
+        return self.endpoint.receive()
+
+    def close(self):
+        """Close the endpoint, the delayed packets are lost."""
+        self.delayed.clear()
+        self.endpoint.close()
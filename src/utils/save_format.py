@@ -0,0 +1,118 @@
+"""
+The 'save_format' module contains the functions that encode and decode
+the binary save file format.
+
+A save file starts with a fixed header (magic bytes, format version,
+size of the game data block and number of aliens), followed by the game
+data as compressed JSON and one fixed size record for every alien.
+Only the logical state of the aliens is stored, their images are
+rebuilt from the frame cache when the game is loaded.
+"""
+
+import json
+import struct
+import zlib
+
+from src.utils.constants import SAVE_MAGIC, SAVE_FORMAT_VERSION
+
+
+HEADER = struct.Struct(f"<{len(SAVE_MAGIC)}sHII")
+
+# type, flags, x position, y position, hit count, last bullet time,
+# frozen elapsed time, immune elapsed time, direction
+ALIEN_RECORD = struct.Struct("<BBfhHIffb")
+
+ALIEN_TYPES = ("alien", "boss")
+
+BABY_FLAG = 1
+FROZEN_FLAG = 2
+IMMUNE_FLAG = 4
+
+
+def is_save_format(blob):
+    """Return True if the data was written in the binary save format."""
+    return blob.startswith(SAVE_MAGIC)
+
+
+def encode_alien(alien_state):
+    """Pack the state of one alien into a fixed size record."""
+    flags = (
+        (BABY_FLAG if alien_state["is_baby"] else 0)
+        | (FROZEN_FLAG if alien_state["frozen_state"] else 0)
+        | (IMMUNE_FLAG if alien_state["immune_state"] else 0)
+    )
+    return ALIEN_RECORD.pack(
+        ALIEN_TYPES.index(alien_state["type"]),
+        flags,
+        alien_state["location"],
+        alien_state["y"],
+        alien_state["hit_count"],
+        alien_state["last_bullet_time"],
+        alien_state["frozen_time"],
+        alien_state["immune_time"],
+        alien_state["direction"],
+    )
+
+
+def decode_alien(record):
+    """Unpack an alien record into a state dict."""
+    (
+        alien_type,
+        flags,
+        location,
+        y_pos,
+        hit_count,
+        last_bullet_time,
+        frozen_time,
+        immune_time,
+        direction,
+    ) = ALIEN_RECORD.unpack(record)
+
+    return {
+        "type": ALIEN_TYPES[alien_type],
+        "is_baby": bool(flags & BABY_FLAG),
+        "frozen_state": bool(flags & FROZEN_FLAG),
+        "immune_state": bool(flags & IMMUNE_FLAG),
+        "location": location,
+        "y": y_pos,
+        "hit_count": hit_count,
+        "last_bullet_time": last_bullet_time,
+        "frozen_time": frozen_time,
+        "immune_time": immune_time,
+        "direction": direction,
+    }
+
+
+def encode_save(game_data, alien_states):
+    """Return the bytes of a save file for the game data and aliens."""
+    data_block = zlib.compress(
+        json.dumps(game_data, separators=(",", ":")).encode("utf-8")
+    )
+    header = HEADER.pack(
+        SAVE_MAGIC, SAVE_FORMAT_VERSION, len(data_block), len(alien_states)
+    )
+    aliens_block = b"".join(encode_alien(state) for state in alien_states)
+
+    return header + data_block + aliens_block
+
+
+def decode_save(blob):
+    """Decode a save file into the same dict shape as the legacy saves."""
+    magic, version, data_size, alien_count = HEADER.unpack_from(blob)
+    if magic != SAVE_MAGIC:
+        raise ValueError("Not a save file")
+    if version != SAVE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported save file version: {version}")
+
+    offset = HEADER.size
+    game_data = json.loads(zlib.decompress(blob[offset : offset + data_size]))
+    offset += data_size
+
+    aliens_block = blob[offset : offset + alien_count * ALIEN_RECORD.size]
+    game_data["sprite_data"] = {
+        "alien_sprites": [
+            decode_alien(aliens_block[start : start + ALIEN_RECORD.size])
+            for start in range(0, len(aliens_block), ALIEN_RECORD.size)
+        ]
+    }
+    return game_data
@@ -0,0 +1,158 @@
+"""
+The 'save_writer' module contains the SaveWriter class that writes
+the save files on a background thread.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+
+import pygame
+
+from src.utils.constants import SAVE_INDEX_FILE
+from src.utils.game_utils import write_atomic
+from src.utils.save_format import encode_save
+
+SAVE_COMPLETED_EVENT = pygame.event.custom_type()
+
+
+class SaveWriter:
+    """This class writes save files on a worker thread and keeps the
+    metadata of every save slot in an index file next to the saves.
+    When a save is done, a SAVE_COMPLETED_EVENT is posted to the event queue.
+    """
+
+    def __init__(self, save_folder, file_extension):
+        self.save_folder = save_folder
+        self.file_extension = file_extension
+        self.index_path = os.path.join(save_folder, SAVE_INDEX_FILE)
+
+        self.jobs = queue.Queue()
+        self.thread = None
+        self._lock = threading.Lock()
+
+        self.index = self._read_index()
+        self._index_existing_saves()
+
+    def _read_index(self):
+        """Read the slot index file, or return an empty index."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _index_existing_saves(self):
+        """Add the save files missing from the index and drop the entries
+        of deleted files. This only runs once, when the writer is created.
+        """
+        try:
+            file_names = os.listdir(self.save_folder)
+        except FileNotFoundError:
+            file_names = []
+
+        suffix = f".{self.file_extension}"
+        slot_names = {
+            name[: -len(suffix)] for name in file_names if name.endswith(suffix)
+        }
+
+        for slot_name in set(self.index) - slot_names:
+            del self.index[slot_name]
+
+        for slot_name in slot_names - set(self.index):
+            file_path = os.path.join(self.save_folder, f"{slot_name}{suffix}")
+            self.index[slot_name] = {
+                "timestamp": os.path.getmtime(file_path),
+                "level": None,
+                "mode": None,
+            }
+
+    def get_index(self):
+        """Return a copy of the slot index."""
+        with self._lock:
+            return dict(self.index)
+
+    def save(self, slot_name, game_data, alien_states, metadata):
+        """Queue a snapshot of the game to be written to the given slot."""
+        self._submit(self._write_save, slot_name, game_data, alien_states, metadata)
+
+    def clear(self):
+        """Queue the removal of every save file and of the index entries."""
+        self._submit(self._delete_saves)
+
+    def wait(self):
+        """Block until every queued job has been written."""
+        self.jobs.join()
+
+    def _submit(self, job, *args):
+        """Queue a job, starting the worker thread on first use."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            # Let pending saves finish when the game exits.
+            atexit.register(self.wait)
+        self.jobs.put((job, args))
+
+    def _run(self):
+        """Run the queued jobs one after the other."""
+        while True:
+            job, args = self.jobs.get()
+            try:
+                job(*args)
+            except Exception:  # pylint: disable=broad-except
+                # A failed job must not stop the worker, or the jobs queued
+                # after it would never run and wait() would block forever.
+                pass
+            finally:
+                self.jobs.task_done()
+
+    def _write_save(self, slot_name, game_data, alien_states, metadata):
+        """Encode and write a save file, then update the index."""
+        file_path = os.path.join(self.save_folder, f"{slot_name}.{self.file_extension}")
+        try:
+            write_atomic(file_path, encode_save(game_data, alien_states))
+            with self._lock:
+                self.index[slot_name] = metadata
+            self._write_index()
+        except Exception as error:  # pylint: disable=broad-except
+            self._post_completed(slot_name, False, str(error))
+            return
+
+        self._post_completed(slot_name, True)
+
+    def _delete_saves(self):
+        """Delete every save file in the index and clear the index."""
+        with self._lock:
+            slot_names = list(self.index)
+            self.index.clear()
+
+        for slot_name in slot_names:
+            file_path = os.path.join(
+                self.save_folder, f"{slot_name}.{self.file_extension}"
+            )
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+        try:
+            self._write_index()
+        except OSError:
+            pass
+
+    def _write_index(self):
+        """Write the slot index to its file."""
+        with self._lock:
+            data = json.dumps(self.index).encode("utf-8")
+        write_atomic(self.index_path, data)
+
+    @staticmethod
+    def _post_completed(slot_name, success, error=None):
+        """Tell the main thread that a save has finished."""
+        pygame.event.post(
+            pygame.event.Event(
+                SAVE_COMPLETED_EVENT, slot=slot_name, success=success, error=error
+            )
+        )
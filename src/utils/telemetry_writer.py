@@ -0,0 +1,93 @@
+"""
+The 'telemetry_writer' module contains the TelemetryWriter class that
+writes the telemetry records to a rotating JSON lines file on a background
+thread.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+
+from src.utils.constants import TELEMETRY_BACKUPS, TELEMETRY_MAX_BYTES
+
+
+class TelemetryWriter:
+    """This class writes every record as one JSON line on a worker thread,
+    so writing never stalls the game loop. When the file grows over the
+    size limit it is renamed to a backup, file.1 being the newest, and the
+    oldest backup is deleted.
+    """
+
+    def __init__(
+        self, file_path, max_bytes=TELEMETRY_MAX_BYTES, backups=TELEMETRY_BACKUPS
+    ):
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+        self.records = queue.Queue()
+        self.thread = None
+        self.file = None
+
+    def write(self, record):
+        """Queue a record, a dict that can be encoded as JSON."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            # Let the queued records be written when the game exits.
+            atexit.register(self.wait)
+        self.records.put(record)
+
+    def wait(self):
+        """Block until every queued record has been written."""
+        self.records.join()
+
+    def _run(self):
+        """Write the queued records one after the other."""
+        while True:
+            record = self.records.get()
+            try:
+                self._write_line(json.dumps(record, separators=(",", ":")) + "\n")
+            except (OSError, TypeError, ValueError):
+                # Telemetry is best effort, the records that can't be
+                # written are dropped and the file is opened again.
+                self._close_file()
+            finally:
+                self.records.task_done()
+
+    def _write_line(self, line):
+        """Append a line to the file, rotating the file first when it is full."""
+        if self.file is None:
+            self.file = open(  # pylint: disable=consider-using-with
+                self.file_path, "a", encoding="utf-8"
+            )
+        elif self.file.tell() + len(line) > self.max_bytes:
+            self._rotate()
+        self.file.write(line)
+        self.file.flush()
+
+    def _close_file(self):
+        """Close the file if it is open."""
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+            self.file = None
+
+    def _rotate(self):
+        """Move the file to the first backup and open a new one."""
+        self._close_file()
+        for number in range(self.backups - 1, 0, -1):
+            backup = f"{self.file_path}.{number}"
+            if os.path.exists(backup):
+                os.replace(backup, f"{self.file_path}.{number + 1}")
+        if self.backups:
+            os.replace(self.file_path, f"{self.file_path}.1")
+        else:
+            os.remove(self.file_path)
+        self.file = open(  # pylint: disable=consider-using-with
+            self.file_path, "w", encoding="utf-8"
+        )
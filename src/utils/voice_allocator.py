@@ -0,0 +1,92 @@
+"""
+The 'voice_allocator' module contains the VoiceAllocator class that assigns
+sound effects to reserved mixer channels.
+"""
+
+import pygame
+
+
+class VoiceAllocator:
+    """Plays sound effects on channels reserved for their category.
+    When every channel in a pool is busy, the oldest voice with an equal
+    or lower priority is stopped and replaced. Repeated plays of the same
+    sound are rate limited, so a burst of identical sounds only produces a
+    bounded number of overlapping voices.
+    """
+
+    def __init__(self, channel_pools, sound_categories, default_category="player"):
+        self.channel_pools = channel_pools
+        self.sound_categories = sound_categories
+        self.default_category = default_category
+
+        self.channels = []
+        self.pools = {}
+        self.voices = {}
+        self.last_played = {}
+        # Number of sounds played, read by the telemetry.
+        self.plays = 0
+
+    def _init_channels(self):
+        """Reserve the mixer channels and split them between the pools."""
+        reserved = sum(pool["channels"] for pool in self.channel_pools.values())
+        # Keep two channels free for sounds played directly with Sound.play().
+        if pygame.mixer.get_num_channels() < reserved + 2:
+            pygame.mixer.set_num_channels(reserved + 2)
+        pygame.mixer.set_reserved(reserved)
+
+        self.channels = [pygame.mixer.Channel(i) for i in range(reserved)]
+        start = 0
+        for category, pool in self.channel_pools.items():
+            self.pools[category] = list(range(start, start + pool["channels"]))
+            start += pool["channels"]
+
+    def play(self, sound, sound_name):
+        """Play the sound on a channel from its category pool.
+        Returns the channel used, or None if the sound was dropped.
+        """
+        if not self.pools:
+            self._init_channels()
+
+        category = self.sound_categories.get(sound_name, self.default_category)
+        pool = self.channel_pools[category]
+        now = pygame.time.get_ticks()
+
+        last_time = self.last_played.get(sound_name)
+        if last_time is not None and now - last_time < pool["min_interval"]:
+            return None
+
+        channel_index = self._find_channel(category, pool["priority"])
+        if channel_index is None:
+            return None
+
+        channel = self.channels[channel_index]
+        channel.play(sound)
+        self.voices[channel_index] = (pool["priority"], now)
+        self.last_played[sound_name] = now
+        self.plays += 1
+        return channel
+
+    def _find_channel(self, category, priority):
+        """Return the index of a free channel, or of the voice to steal.
+        The category pool is checked first, then the pools with a lower priority.
+        """
+        candidates = self.pools[category] + [
+            index
+            for pool_name, indices in self.pools.items()
+            if self.channel_pools[pool_name]["priority"] < priority
+            for index in indices
+        ]
+
+        for index in candidates:
+            if not self.channels[index].get_busy():
+                return index
+
+        # Steal the lowest priority voice, the oldest one on ties.
+        return min(candidates, key=lambda i: self.voices.get(i, (0, 0)), default=None)
+
+    def stop_all(self):
+        """Stop every voice and forget the rate limit history."""
+        for channel in self.channels:
+            channel.stop()
+        self.voices.clear()
+        self.last_played.clear()
@@ -0,0 +1,89 @@
+"""
+This module tests the AsteroidAtlas class that holds the animation
+frames shared by every asteroid.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.animations.asteroid_atlas import AsteroidAtlas
+
+
+class AsteroidAtlasTests(unittest.TestCase):
+    """Test cases for the AsteroidAtlas class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.frames = []
+        for i in range(4):
+            frame = pygame.Surface((40, 40), pygame.SRCALPHA)
+            # A small square that moves inside the frame.
+            frame.fill((255, 0, 0, 255), pygame.Rect(10 + i, 15, 10, 10))
+            self.frames.append(frame)
+
+    def tearDown(self):
+        """Reset the shared atlas."""
+        AsteroidAtlas.shared = None
+
+    def test_pack(self):
+        """Test that the frames are cropped subsurfaces of one atlas."""
+        atlas = AsteroidAtlas(self.frames, 8)
+
+        self.assertEqual(len(atlas.frames), 4)
+        self.assertEqual(atlas.atlas.get_size(), (13 * 4, 10))
+        for frame in atlas.frames:
+            self.assertIs(frame.get_parent(), atlas.atlas)
+            self.assertEqual(frame.get_size(), (13, 10))
+
+        # The pixels keep their place relative to the center of the frame.
+        self.assertEqual(atlas.frames[0].get_at((0, 0)), (255, 0, 0, 255))
+        self.assertEqual(atlas.frames[0].get_at((12, 0)), (0, 0, 0, 0))
+        self.assertEqual(atlas.frames[3].get_at((12, 0)), (255, 0, 0, 255))
+
+    def test_table(self):
+        """Test that every tick of the cycle maps to a frame."""
+        atlas = AsteroidAtlas(self.frames, 8)
+
+        self.assertEqual(len(atlas.table), 8)
+        self.assertIs(atlas.table[0], atlas.frames[0])
+        self.assertIs(atlas.table[1], atlas.frames[0])
+        self.assertIs(atlas.table[2], atlas.frames[1])
+        self.assertIs(atlas.table[7], atlas.frames[3])
+
+    def test_advance_and_frame(self):
+        """Test that the shared phase wraps and offsets are applied."""
+        atlas = AsteroidAtlas(self.frames, 4)
+
+        for _ in range(3):
+            atlas.advance()
+        self.assertEqual(atlas.phase, 3)
+        self.assertIs(atlas.frame(0), atlas.frames[3])
+        self.assertIs(atlas.frame(-3), atlas.frames[0])
+
+        atlas.advance()
+        self.assertEqual(atlas.phase, 0)
+
+    def test_rotation_steps(self):
+        """Test that rotation steps replace the frames with rotated copies."""
+        frames_atlas = AsteroidAtlas(self.frames * 30, 120)
+        rotation_atlas = AsteroidAtlas(self.frames[:1], 120, rotation_steps=8)
+
+        self.assertEqual(len(rotation_atlas.frames), 8)
+        self.assertEqual(len(rotation_atlas.table), 120)
+        self.assertLess(rotation_atlas.memory_size(), frames_atlas.memory_size())
+
+    @patch("src.animations.asteroid_atlas.load_frames")
+    def test_get(self, mock_load_frames):
+        """Test that the shared atlas is loaded only once."""
+        mock_load_frames.return_value = self.frames
+
+        atlas = AsteroidAtlas.get()
+
+        self.assertIs(AsteroidAtlas.get(), atlas)
+        mock_load_frames.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
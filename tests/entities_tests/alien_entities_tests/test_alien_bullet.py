@@ -4,7 +4,9 @@ creating alien bullets in the game.
 """
 
 import unittest
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
+
+import pygame
 
 from src.entities.alien_entities.alien_bullets import AlienBullet
 
@@ -25,6 +27,30 @@ class TestAlienBullet(unittest.TestCase):
         self.assertIsNotNone(self.alien_bullet.image)
         self.assertIsNotNone(self.alien_bullet.rect)
 
+    def test_get_images(self):
+        """Test that the bullet images are loaded once, by the first bullet."""
+        images = {
+            f"alien_bullet{number}": pygame.Surface((10, 10)) for number in range(1, 8)
+        }
+        with patch.object(AlienBullet, "bullet_images", None), patch(
+            "src.entities.alien_entities.alien_bullets.load_alien_bullets",
+            return_value=images,
+        ) as mock_load:
+            AlienBullet(self.game)
+            AlienBullet(self.game)
+
+            mock_load.assert_called_once()
+            self.assertEqual(AlienBullet.bullet_images, images)
+
+    def test_shared_image(self):
+        """Test that the bullets share the image of their level."""
+        self.game.aliens.sprites.return_value[0].is_baby = False
+
+        bullet = AlienBullet(self.game)
+        other_bullet = AlienBullet(self.game)
+
+        self.assertIs(other_bullet.image, bullet.image)
+
     def test_scale_bullet(self):
         """Test the scaling of the bullet."""
         initial_width, initial_height = self.alien_bullet.image.get_size()
@@ -12,6 +12,8 @@ import random
 import pygame
 
 from src.entities.alien_entities.aliens import Alien
+from src.utils.animation_constants import alien_immune_frames
+from src.utils.game_dataclasses import WorldBounds
 
 
 class TestAlien(unittest.TestCase):
@@ -23,6 +25,7 @@ class TestAlien(unittest.TestCase):
         self.screen = MagicMock(spec=pygame.Surface)
         self.screen.get_rect.return_value = pygame.Rect(0, 0, 800, 600)
         self.game.screen = self.screen
+        self.game.settings.bounds = WorldBounds(pygame.Rect(0, 0, 800, 600))
         self.alien = Alien(self.game)
 
     def test_init(self):
@@ -41,8 +44,7 @@ class TestAlien(unittest.TestCase):
         self.assertEqual(self.alien.baby_location, 0)
         self.assertIsNotNone(self.alien.motion)
         self.assertIsNotNone(self.alien.animation)
-        self.assertIsNotNone(self.alien.destroy)
-        self.assertIsNotNone(self.alien.immune)
+        self.assertEqual(self.alien.immune_frame, 0)
         self.assertIsInstance(self.alien.image, pygame.Surface)
 
     def test_init_position(self):
@@ -81,9 +83,6 @@ class TestAlien(unittest.TestCase):
         # Test case: Alien not at the top edge of the screen
         self.alien.rect.top = 10
 
-        screen_rect = pygame.Rect(0, 0, 800, 600)
-        self.alien.screen.get_rect.return_value = screen_rect
-
         self.assertFalse(self.alien.check_top_edges())
 
     def test_update(self):
@@ -143,12 +142,17 @@ class TestAlien(unittest.TestCase):
 
     def test_destroy_alien(self):
         """Test the destroy_alien method."""
-        self.alien.destroy = MagicMock()
+        self.game.settings.game_modes.last_bullet = False
 
-        self.alien.destroy_alien()
+        with patch.object(Alien, "split_alien") as mock_split_alien:
+            with patch("random.random", return_value=0.05):
+                self.alien.destroy_alien()
+            mock_split_alien.assert_called_once()
 
-        self.alien.destroy.update_destroy_animation.assert_called_once()
-        self.alien.destroy.draw_animation.assert_called_once()
+            mock_split_alien.reset_mock()
+            with patch("random.random", return_value=0.5):
+                self.alien.destroy_alien()
+            mock_split_alien.assert_not_called()
 
     def test_split_alien(self):
         """Test the split_alien method."""
@@ -164,12 +168,9 @@ class TestAlien(unittest.TestCase):
 
     def test_upgrade(self):
         """Test the upgrade method."""
-        self.alien.immune = MagicMock()
-
         self.alien.upgrade()
 
         self.assertTrue(self.alien.immune_state)
-        self.assertEqual(self.alien.immune.immune_rect.center, self.alien.rect.center)
         self.assertNotEqual(self.alien.immune_start_time, 0)
 
     def test_freeze(self):
@@ -179,6 +180,28 @@ class TestAlien(unittest.TestCase):
         self.assertTrue(self.alien.frozen_state)
         self.assertNotEqual(self.alien.frozen_start_time, 0)
 
+    def test_freeze_updates_fleet(self):
+        """Test that the fleet engine is told about the new state."""
+        self.alien.fleet = MagicMock()
+
+        self.alien.freeze()
+        self.alien.upgrade()
+
+        self.assertEqual(self.alien.fleet.refresh_timers.call_count, 2)
+        self.alien.fleet.refresh_timers.assert_called_with(self.alien)
+
+    def test_draw_immune(self):
+        """Test the immune animation drawn around the alien."""
+        self.alien.immune_frame = len(alien_immune_frames) - 1
+
+        self.alien.draw_immune()
+
+        image = alien_immune_frames[-1]
+        self.screen.blit.assert_called_once_with(
+            image, image.get_rect(center=self.alien.rect.center)
+        )
+        self.assertEqual(self.alien.immune_frame, 0)
+
     def test_draw(self):
         """Test the draw method."""
         self.alien.draw()
@@ -4,11 +4,12 @@ alien bosses in the game.
 """
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pygame
 
 from src.entities.alien_entities.aliens import BossAlien
+from src.utils.game_dataclasses import WorldBounds
 
 
 class TestBossAlien(unittest.TestCase):
@@ -18,6 +19,7 @@ class TestBossAlien(unittest.TestCase):
         """Set up the test environment."""
         self.game = MagicMock()
         self.game.screen = pygame.Surface((800, 600))
+        self.game.settings.bounds = WorldBounds(self.game.screen.get_rect())
         self.boss_alien = BossAlien(self.game)
         self.boss_alien.destroy = MagicMock()
 
@@ -32,6 +34,18 @@ class TestBossAlien(unittest.TestCase):
         self.assertFalse(self.boss_alien.immune_state)
         self.assertTrue(self.boss_alien.is_alive)
 
+    def test_get_images(self):
+        """Test that the boss images are loaded once, by the first boss."""
+        with patch.object(BossAlien, "boss_images", None), patch(
+            "src.entities.alien_entities.aliens.load_boss_images",
+            return_value={"boss2": pygame.Surface((100, 100))},
+        ) as mock_load:
+            BossAlien(self.game)
+            BossAlien(self.game)
+
+            mock_load.assert_called_once()
+            self.assertEqual(BossAlien.boss_images, mock_load.return_value)
+
     def test_update_image_boss_rush(self):
         """Test the update of the image in boss rush."""
         self.boss_alien.settings.game_modes.boss_rush = True
@@ -134,8 +148,6 @@ class TestBossAlien(unittest.TestCase):
         self.boss_alien.destroy_alien()
 
         self.assertFalse(self.boss_alien.is_alive)
-        self.boss_alien.destroy.update_destroy_animation.assert_called_once()
-        self.boss_alien.destroy.draw_animation.assert_called_once()
 
     def test_freeze(self):
         """Test the freeze method."""
@@ -45,7 +45,7 @@ class TestBullet(unittest.TestCase):
 
     def test_update_cosmic_conflict_mode(self):
         """Test the update method in cosmic conflict mode."""
-        self.game.settings.game_modes.cosmic_conflict = True
+        self.game.settings.bounds.cosmic_conflict = True
         self.bullet.x_pos = self.ship.rect.x
         expected_x_pos = (
             self.ship.rect.x + self.game.settings.player_bullet_speed
@@ -60,7 +60,7 @@ class TestBullet(unittest.TestCase):
 
     def test_update_other_modes(self):
         """Test the update method in other modes."""
-        self.game.settings.game_modes.cosmic_conflict = False
+        self.game.settings.bounds.cosmic_conflict = False
         self.bullet.y_pos = self.ship.rect.y
         expected_y_pos = self.ship.rect.y - self.game.settings.player_bullet_speed
 
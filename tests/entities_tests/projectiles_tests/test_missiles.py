@@ -7,6 +7,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from src.entities.projectiles.missile import Missile
+from src.game_logic.game_events import MissileExploded
 
 
 class TestMissile(unittest.TestCase):
@@ -62,19 +63,29 @@ class TestMissile(unittest.TestCase):
         )
 
     def test_draw_missile_destroyed(self):
-        """Test the drawing of the missile while destroyed."""
+        """Test that the missile is not drawn once it exploded."""
         self.missile.is_destroyed = True
-        self.missile.destroy_anim.draw_explosion = MagicMock()
 
         self.missile.draw()
 
-        self.missile.destroy_anim.draw_explosion.assert_called_once()
+        self.game.screen.blit.assert_not_called()
 
     def test_explode(self):
-        """Test the explode method."""
+        """Test that the explosion is reported only once."""
+        self.missile.explode()
         self.missile.explode()
 
         self.assertTrue(self.missile.is_destroyed)
+        self.game.events.emit.assert_called_once_with(
+            MissileExploded(position=self.missile.rect.center)
+        )
+
+    def test_explosion_rect(self):
+        """Test the area destroyed by the explosion."""
+        explosion_rect = self.missile.explosion_rect()
+
+        self.assertEqual(explosion_rect.size, Missile.explosion_size)
+        self.assertEqual(explosion_rect.center, self.missile.rect.center)
 
     @patch("src.entities.projectiles.missile.pygame.transform.rotate")
     def test_set_missile_frames_cosmic_conflict(self, mock_rotate):
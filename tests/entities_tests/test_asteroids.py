@@ -21,10 +21,9 @@ class TestAsteroid(unittest.TestCase):
     def test_init(self):
         """Test the initialization of the Asteroid."""
         self.assertEqual(self.asteroid.speed, self.game.settings.asteroid_speed)
-        self.assertIsNotNone(self.asteroid.frames)
-        self.assertEqual(self.asteroid.current_frame, 0)
-        initial_image = self.asteroid.frames[0]
-        self.assertEqual(self.asteroid.image, initial_image)
+        self.assertIsNotNone(self.asteroid.atlas)
+        self.assertEqual(self.asteroid.phase_offset, -self.asteroid.atlas.phase)
+        self.assertIs(self.asteroid.image, self.asteroid.atlas.table[0])
 
     def test_initialize_position(self):
         """Test the _initialize_position method."""
@@ -40,18 +39,13 @@ class TestAsteroid(unittest.TestCase):
 
     def test_update(self):
         """Test the update method."""
-        initial_frame = self.asteroid.current_frame
         initial_y_pos = self.asteroid.y_pos
 
+        self.asteroid.atlas.advance()
         self.asteroid.update()
 
         # Verify frame update
-        self.assertEqual(
-            self.asteroid.current_frame, (initial_frame + 1) % len(self.asteroid.frames)
-        )
-        self.assertEqual(
-            self.asteroid.image, self.asteroid.frames[self.asteroid.current_frame]
-        )
+        self.assertIs(self.asteroid.image, self.asteroid.atlas.table[1])
 
         # Verify position update
         self.assertEqual(
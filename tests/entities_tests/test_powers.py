@@ -4,7 +4,7 @@ and penalties in the game.
 """
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pygame
 
@@ -22,7 +22,7 @@ class TestPower(unittest.TestCase):
     def test_init(self):
         """Test the initialization of the Power."""
         self.assertIsInstance(self.power.image, pygame.Surface)
-        self.assertIsInstance(self.power.health_image, pygame.Surface)
+        self.assertIsInstance(Power.get_images()["health"], pygame.Surface)
         self.assertIsInstance(self.power.speed, float)
         self.assertEqual(self.power.last_power_time, 0)
         self.assertIsInstance(self.power.rect, pygame.Rect)
@@ -32,6 +32,42 @@ class TestPower(unittest.TestCase):
         self.assertFalse(self.power.weapon)
         self.assertIsNone(self.power.weapon_name)
 
+    def test_shared_images(self):
+        """Test that every power uses the same images."""
+        other_power = Power(self.game)
+
+        self.assertIs(other_power.image, self.power.image)
+        self.assertIs(other_power.get_images(), self.power.get_images())
+
+    def test_get_images(self):
+        """Test that the power images are loaded once, by the first power."""
+        images = {"power": pygame.Surface((10, 10)), "health": pygame.Surface((10, 10))}
+        with patch.object(Power, "power_images", None), patch(
+            "src.entities.powers.load_images", return_value=images
+        ) as mock_load:
+            Power(self.game)
+            Power(self.game)
+
+            mock_load.assert_called_once()
+            self.assertEqual(Power.power_images, images)
+
+    def test_get_weapon_images(self):
+        """Test that the weapon images are only loaded for a weapon power up."""
+        images = {"blaster": pygame.Surface((10, 10))}
+        with patch.object(Power, "weapon_images", None), patch(
+            "src.entities.powers.load_images", return_value=images
+        ) as mock_load, patch(
+            "src.entities.powers.random.choice", return_value="blaster"
+        ):
+            self.power.make_health_power_up()
+            mock_load.assert_not_called()
+
+            self.power.make_weapon_power_up()
+            self.power.make_weapon_power_up()
+
+            mock_load.assert_called_once()
+            self.assertEqual(self.power.image, images["blaster"])
+
     def test_initialize_position(self):
         """Test the initialize_position method."""
         self.game.settings.screen_width = 700
@@ -50,7 +86,7 @@ class TestPower(unittest.TestCase):
         self.power.make_health_power_up()
 
         self.assertTrue(self.power.health)
-        self.assertEqual(self.power.image, self.power.health_image)
+        self.assertEqual(self.power.image, Power.get_images()["health"])
 
     def test_make_weapon_power_up(self):
         """Test the creation of a weapon power up."""
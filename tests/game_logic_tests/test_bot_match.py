@@ -0,0 +1,235 @@
+"""
+This module tests the BotPilot, the SimulatedClock and the functions
+that play a bot match headless.
+"""
+
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.alien_onslaught import AlienOnslaught
+from src.managers.alien_managers.fleet_engine import FleetEngine
+from src.game_logic.bot_match import (
+    BotPilot,
+    MatchConfig,
+    SimulatedClock,
+    get_outcome,
+    run_match,
+)
+from src.utils.constants import DIFFICULTIES, INPUT_BITS
+from src.utils.game_dataclasses import GameModes, ShipStates
+
+
+def make_sprite(x_pos, y_pos, size=(40, 40)):
+    """Return a sprite with a rect at the given position."""
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect((x_pos, y_pos), size)
+    return sprite
+
+
+class BotPilotTest(unittest.TestCase):
+    """Test cases for the BotPilot class."""
+
+    def setUp(self):
+        """Set up a game with two ships and empty sprite groups."""
+        self.game = MagicMock()
+        self.game.settings.game_modes = GameModes()
+        self.game.settings.screen_width = 1260
+        self.ship = make_sprite(600, 600)
+        self.ship.laser_ready = False
+        self.ship.missiles_num = 3
+        self.game.thunderbird_ship = self.ship
+        self.game.phoenix_ship = make_sprite(300, 600)
+        self.game.aliens = pygame.sprite.Group()
+        self.game.alien_bullet = pygame.sprite.Group()
+        self.game.asteroids = pygame.sprite.Group()
+        self.pilot = BotPilot(self.game, self.ship, seed=1)
+
+    def test_follow_closest_alien(self):
+        """Test that the bot moves under the closest alien and fires."""
+        self.game.aliens.add(make_sprite(800, 100), make_sprite(100, 100))
+
+        self.assertEqual(
+            self.pilot.get_input_bits(), INPUT_BITS["right"] | INPUT_BITS["fire"]
+        )
+
+    def test_dodge(self):
+        """Test that dodging a bullet comes before following the aliens."""
+        self.game.aliens.add(make_sprite(100, 100))
+        self.game.alien_bullet.add(make_sprite(610, 500, (10, 20)))
+
+        self.assertTrue(self.pilot.get_input_bits() & INPUT_BITS["right"])
+
+    def test_dodge_at_screen_side(self):
+        """Test that the bot never dodges into the side of the screen."""
+        self.ship.rect.right = 1260
+        self.game.asteroids.add(make_sprite(1200, 500))
+
+        self.assertTrue(self.pilot.get_input_bits() & INPUT_BITS["left"])
+
+    def test_cosmic_conflict(self):
+        """Test that the bot lines up with the other ship in Cosmic Conflict."""
+        self.game.settings.game_modes.cosmic_conflict = True
+        self.game.phoenix_ship.rect.y = 200
+
+        self.assertEqual(
+            self.pilot.get_input_bits(), INPUT_BITS["up"] | INPUT_BITS["fire"]
+        )
+
+    def test_weapons(self):
+        """Test that the laser is fired when ready and the missiles at bosses."""
+        self.ship.laser_ready = True
+        with patch("src.game_logic.bot_match.BossAlien", pygame.sprite.Sprite):
+            self.game.aliens.add(make_sprite(580, 100, (100, 100)))
+            self.pilot.random.random = MagicMock(return_value=0)
+
+            bits = self.pilot.get_input_bits()
+
+        self.assertTrue(bits & INPUT_BITS["laser"])
+        self.assertTrue(bits & INPUT_BITS["missile"])
+
+    def test_fly(self):
+        """Test that the controls are applied to the ship."""
+        self.pilot.fly()
+
+        self.game.player_input.apply_input_bits.assert_called_once_with(
+            self.ship,
+            INPUT_BITS["fire"],
+            self.game.weapons_manager.fire_missile,
+            self.game.weapons_manager.fire_laser,
+        )
+
+
+class SimulatedClockTest(unittest.TestCase):
+    """Test cases for the SimulatedClock class."""
+
+    def test_use(self):
+        """Test that the game timers read the clock while it is used."""
+        clock = SimulatedClock(frame_rate=50, start=10.0)
+
+        with clock.use():
+            clock.tick()
+            self.assertAlmostEqual(time.time(), 10.02)
+            self.assertEqual(pygame.time.get_ticks(), 10020)
+
+        self.assertGreater(time.time(), 1_000_000)
+
+
+class GetOutcomeTest(unittest.TestCase):
+    """Test cases for the get_outcome function."""
+
+    def setUp(self):
+        self.game = SimpleNamespace(
+            thunderbird_ship=SimpleNamespace(state=ShipStates()),
+            phoenix_ship=SimpleNamespace(state=ShipStates()),
+            settings=SimpleNamespace(game_modes=GameModes()),
+            stats=SimpleNamespace(level=1),
+            aliens=[],
+        )
+
+    def test_outcomes(self):
+        """Test the endings of the game modes."""
+        self.assertIsNone(get_outcome(self.game))
+
+        self.game.thunderbird_ship.state.alive = False
+        self.assertIsNone(get_outcome(self.game))
+        self.game.settings.game_modes.cosmic_conflict = True
+        self.assertEqual(get_outcome(self.game), "phoenix_win")
+
+        self.game.settings.game_modes.cosmic_conflict = False
+        self.game.phoenix_ship.state.alive = False
+        self.assertEqual(get_outcome(self.game), "defeat")
+
+    def test_boss_rush_victory(self):
+        """Test that Boss Rush is won after the last boss."""
+        self.game.settings.game_modes.boss_rush = True
+        self.game.stats.level = 15
+
+        self.assertEqual(get_outcome(self.game), "victory")
+
+
+class RunMatchTest(unittest.TestCase):
+    """Test cases for the run_match function, with a real game."""
+
+    @classmethod
+    def setUpClass(cls):
+        with patch("src.alien_onslaught.pygame.display.set_mode") as mock_display:
+            mock_display.return_value = pygame.Surface((1280, 700))
+            cls.game = AlienOnslaught()
+        cls.game.sound_manager.loading_screen = MagicMock()
+        cls.baseline = cls.game.game_state.snapshot()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def play(self, config):
+        """Play a match from a fresh game."""
+        self.game.game_state.restore(self.baseline)
+        return run_match(self.game, config)
+
+    def test_run_match(self):
+        """Test a short match with the settings of its config."""
+        config = MatchConfig(
+            seed=3,
+            difficulty="HARD",
+            game_mode="boss_rush",
+            loadout=("slow_thunder", "fast_phoenix"),
+            max_frames=120,
+        )
+
+        result = self.play(config)
+
+        settings = self.game.settings
+        self.assertEqual(result.outcome, "survived")
+        self.assertTrue(result.won)
+        self.assertEqual(result.frames, 120)
+        self.assertEqual(sum(frames for frames, _ in result.level_costs.values()), 120)
+        self.assertEqual(result.peak_entities["aliens"], 1)
+        self.assertEqual(settings.difficulty, "HARD")
+        self.assertEqual(settings.speedup_scale, DIFFICULTIES["HARD"])
+        self.assertEqual(settings.game_modes.game_mode, "boss_rush")
+        self.assertTrue(settings.game_modes.boss_rush)
+        self.assertEqual(settings.starting_thunder_hp, 5)
+        self.assertEqual(settings.starting_phoenix_ship_speed, 6.0)
+
+    def test_repeatable(self):
+        """Test that a seed plays the same match at any speed."""
+        config = MatchConfig(seed=5, singleplayer=True, max_frames=300)
+
+        first = self.play(config)
+        with patch("src.game_logic.bot_match.FARM_FRAME_BUDGET", 0):
+            time.sleep(0.01)
+            second = self.play(config)
+
+        self.assertEqual(
+            (first.outcome, first.level, first.score, first.peak_entities),
+            (second.outcome, second.level, second.score, second.peak_entities),
+        )
+        self.assertEqual(second.over_budget, 300)
+
+    @unittest.skipUnless(FleetEngine.is_available(), "NumPy is not installed")
+    def test_repeatable_fleet_engine(self):
+        """Test that a seed plays the same match with the fleet engine,
+        whatever the state its random generator was left in.
+        """
+        config = MatchConfig(seed=7, max_frames=600)
+        engine = FleetEngine(self.game.settings)
+
+        with patch.object(self.game.aliens_manager, "fleet_engine", engine):
+            first = self.play(config)
+            self.game.game_state.restore(self.baseline)
+            engine.rng.random(1000)
+            second = run_match(self.game, config)
+
+        self.assertEqual(
+            (first.outcome, first.level, first.score, first.peak_entities),
+            (second.outcome, second.level, second.score, second.peak_entities),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
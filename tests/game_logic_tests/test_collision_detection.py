@@ -3,12 +3,20 @@ This module tests the CollisionManager class which manages the
 collisions in the game.
 """
 
+import gc
 import unittest
 from unittest.mock import MagicMock, patch, call
 
 import pygame
 
 from src.game_logic.collision_detection import CollisionManager
+from src.game_logic.game_events import (
+    AlienKilled,
+    AsteroidDestroyed,
+    ShieldHit,
+    MissileExploded,
+    ScoreChanged,
+)
 from src.entities.projectiles.missile import Missile
 from src.entities.alien_entities.aliens import BossAlien
 
@@ -36,10 +44,9 @@ class TestCollisionManager(unittest.TestCase):
             self.collision_manager.thunderbird_ship, self.game.thunderbird_ship
         )
         self.assertEqual(self.collision_manager.phoenix_ship, self.game.phoenix_ship)
-        self.assertEqual(self.collision_manager.handled_collisions, {})
+        self.assertEqual(len(self.collision_manager.handled_collisions), 0)
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_handle_shielded_ship_collisions(self, mock_play_sound):
+    def test_handle_shielded_ship_collisions(self):
         """Test the shield collisions with aliens."""
         ships = MagicMock()
         aliens = MagicMock()
@@ -70,7 +77,7 @@ class TestCollisionManager(unittest.TestCase):
 
     def test_handle_alien_collisions_with_shielded_ship(self):
         """Test the shield collisions with aliens."""
-        self.collision_manager._destroy_alien_and_play_sound = MagicMock()
+        self.collision_manager._destroy_alien_with_shield = MagicMock()
         ship = MagicMock()
         aliens = MagicMock()
 
@@ -78,8 +85,8 @@ class TestCollisionManager(unittest.TestCase):
             ship, [aliens]
         )
 
-        self.collision_manager._destroy_alien_and_play_sound.assert_called_once_with(
-            aliens
+        self.collision_manager._destroy_alien_with_shield.assert_called_once_with(
+            aliens, ship
         )
 
     def test_handle_bullet_collisions_with_shielded_ship(self):
@@ -93,7 +100,7 @@ class TestCollisionManager(unittest.TestCase):
         )
 
         self.collision_manager._resolve_shield_collision.assert_called_once_with(
-            bullets, "alien_exploding", ship
+            bullets, "bullet", ship
         )
 
     def test_handle_asteroids_collisions_with_shielded_ship(self):
@@ -107,39 +114,63 @@ class TestCollisionManager(unittest.TestCase):
         )
 
         self.collision_manager._resolve_shield_collision.assert_called_once_with(
-            asteroids, "asteroid_exploding", ship
+            asteroids, "asteroid", ship
         )
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_destroy_alien_play_sound(self, mock_play_sound):
-        """Test the destroy_alien_play_sound_method."""
+    def test_shield_collides(self):
+        """Test the shield collisions with rects and with masks."""
+        ship = MagicMock()
+        ship.anims.shield_rect = pygame.Rect(0, 0, 20, 20)
+        ship.anims.shield_image = pygame.Surface((20, 20), pygame.SRCALPHA)
+        pygame.draw.circle(ship.anims.shield_image, (255, 255, 255), (10, 10), 10)
+
+        # The sprite only touches a corner of the shield rect.
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(18, 18, 5, 5)
+        sprite.image = pygame.Surface((5, 5))
+
+        with patch.dict(
+            "src.game_logic.collision_detection.MASK_COLLISIONS", {"Shield": False}
+        ):
+            self.assertTrue(self.collision_manager._shield_collides(ship, sprite))
+
+        with patch.dict(
+            "src.game_logic.collision_detection.MASK_COLLISIONS", {"Shield": True}
+        ):
+            self.assertFalse(self.collision_manager._shield_collides(ship, sprite))
+            sprite.rect.topleft = (12, 12)
+            self.assertTrue(self.collision_manager._shield_collides(ship, sprite))
+
+        sprite.rect.topleft = (30, 30)
+        self.assertFalse(self.collision_manager._shield_collides(ship, sprite))
+
+    def test_destroy_alien_with_shield(self):
+        """Test the destroy_alien_with_shield method."""
         alien = MagicMock()
+        ship = MagicMock()
 
-        self.collision_manager._destroy_alien_and_play_sound(alien)
+        self.collision_manager._destroy_alien_with_shield(alien, ship)
 
         alien.kill.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "alien_exploding"
+        self.game.events.emit.assert_called_once_with(
+            ShieldHit("alien", ship.anims.shield_rect.center)
         )
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_resolve_shield_collision(self, mock_play_sound):
+    def test_resolve_shield_collision(self):
         """Test the resolve_shield_collision method."""
         entity = MagicMock()
-        sound_key = "collision_sound"
         ship = MagicMock()
         ship.state.shielded = True
 
-        self.collision_manager._resolve_shield_collision(entity, sound_key, ship)
+        self.collision_manager._resolve_shield_collision(entity, "bullet", ship)
 
         entity.kill.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, sound_key
+        self.game.events.emit.assert_called_once_with(
+            ShieldHit("bullet", ship.anims.shield_rect.center)
         )
         self.assertFalse(ship.state.shielded)
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_check_asteroids_collisions_with_thunder_hit(self, mock_play_sound):
+    def test_check_asteroids_collisions_with_thunder_hit(self):
         """Test the asteroids collisions when the Thunderbird ship is hit."""
         asteroid = MagicMock()
         thunderbird_hit = MagicMock()
@@ -154,14 +185,11 @@ class TestCollisionManager(unittest.TestCase):
 
         thunderbird_hit.assert_called_once()
         asteroid.kill.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "asteroid_exploding"
-        )
+        self.game.events.emit.assert_called_once_with(AsteroidDestroyed())
 
         phoenix_hit.assert_not_called()
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_check_asteroids_collisions_with_both_ships_hit(self, mock_play_sound):
+    def test_check_asteroids_collisions_with_both_ships_hit(self):
         """Test the asteroids collisions when both ships are hit."""
         asteroid = MagicMock()
         thunderbird_hit = MagicMock()
@@ -178,10 +206,9 @@ class TestCollisionManager(unittest.TestCase):
         thunderbird_hit.assert_called_once()
         phoenix_hit.assert_called_once()
         self.assertTrue(asteroid.kill.call_count, 2)
-        self.assertTrue(mock_play_sound.call_count, 2)
+        self.assertTrue(self.game.events.emit.call_count, 2)
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_check_asteroids_collisions_with_missiles_and_lasers(self, mock_play_sound):
+    def test_check_asteroids_collisions_with_missiles_and_lasers(self):
         """Test the asteroids collisions with lasers and missiles."""
         # Mock objects
         thunder_missile = MagicMock(spec=Missile)
@@ -207,11 +234,9 @@ class TestCollisionManager(unittest.TestCase):
 
         # Assertions
         self.assertTrue(asteroid.kill.called)
-        mock_play_sound.assert_called_with(
-            self.game.sound_manager.game_sounds, "asteroid_exploding"
-        )
+        self.game.events.emit.assert_called_with(AsteroidDestroyed())
         self.assertTrue(asteroid.kill.call_count, 4)
-        self.assertTrue(mock_play_sound.call_count, 4)
+        self.assertTrue(self.game.events.emit.call_count, 4)
         self.assertTrue(thunder_missile.explode.called)
         self.assertTrue(phoenix_missile.explode.called)
 
@@ -359,8 +384,7 @@ class TestCollisionManager(unittest.TestCase):
 
         self.assertEqual(self.game.stats.phoenix_score, score_increment)
         self.assertTrue(hit_function.called)
-        self.assertTrue(self.game.score_board.render_scores.called)
-        self.assertTrue(self.game.score_board.update_high_score.called)
+        self.game.events.emit.assert_called_with(ScoreChanged())
 
         # Phoenix ship test case
         ship = self.phoenix_ship
@@ -371,12 +395,10 @@ class TestCollisionManager(unittest.TestCase):
 
         self.assertEqual(self.game.stats.thunderbird_score, score_increment)
         self.assertTrue(hit_function.called)
-        self.assertTrue(self.game.score_board.render_scores.called)
-        self.assertTrue(self.game.score_board.update_high_score.called)
+        self.game.events.emit.assert_called_with(ScoreChanged())
 
-    @patch("src.game_logic.collision_detection.play_sound")
     @patch("src.game_logic.collision_detection.get_colliding_sprites")
-    def test_resolve_collision_cosmic_conflict(self, mock_get_sprite, mock_play_sound):
+    def test_resolve_collision_cosmic_conflict(self, mock_get_sprite):
         """Test the handle_collision method."""
         mock_get_sprite.return_value = [MagicMock(spec=Missile)]
         missile = mock_get_sprite.return_value[0]
@@ -396,9 +418,7 @@ class TestCollisionManager(unittest.TestCase):
 
         mock_get_sprite.assert_called_once_with(ship, sprite_group)
         missile.explode.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "missile"
-        )
+        self.game.events.emit.assert_called_once_with(MissileExploded())
         self.collision_manager._update_cosmic_conflict_scores.assert_called_once_with(
             ship, hit_function, score_increment
         )
@@ -472,8 +492,7 @@ class TestCollisionManager(unittest.TestCase):
         alien.kill.assert_called_once()
         self.assertEqual(self.game.stats.thunderbird_score, 900)
         self.assertEqual(self.game.stats.phoenix_score, 900)
-        self.game.score_board.render_scores.assert_called_once()
-        self.game.score_board.update_high_score.assert_called_once()
+        self.game.events.emit.assert_called_once_with(ScoreChanged())
 
     def test_check_aliens_bottom_aliens_above_bottom(self):
         """Test the check_aliens_bottom when aliens have not
@@ -495,8 +514,7 @@ class TestCollisionManager(unittest.TestCase):
         self.assertEqual(self.game.stats.phoenix_score, 1000)
 
         alien.kill.assert_not_called()
-        self.game.score_board.render_scores.assert_not_called()
-        self.game.score_board.update_high_score.assert_not_called()
+        self.game.events.emit.assert_not_called()
 
     def test_check_missile_alien_collisions(self):
         """Test the check_missile_alien_collisions method."""
@@ -512,7 +530,7 @@ class TestCollisionManager(unittest.TestCase):
         phoenix_missile.rect = MagicMock()
 
         self.collision_manager._handle_player_missile_collisions = MagicMock()
-        self.collision_manager._play_missile_sound = MagicMock()
+        self.collision_manager._emit_missile_explosions = MagicMock()
         self.game.aliens = [alien]
 
         self.game.thunderbird_missiles = pygame.sprite.Group(thunder_missile)
@@ -521,11 +539,11 @@ class TestCollisionManager(unittest.TestCase):
         self.collision_manager.check_missile_alien_collisions()
 
         self.collision_manager._handle_player_missile_collisions.assert_called_once()
-        self.collision_manager._play_missile_sound.assert_called_once()
+        self.collision_manager._emit_missile_explosions.assert_called_once()
 
         # Multiplayer test case
         self.collision_manager._handle_player_missile_collisions.reset_mock()
-        self.collision_manager._play_missile_sound.reset_mock()
+        self.collision_manager._emit_missile_explosions.reset_mock()
         self.game.singleplayer = False
 
         self.collision_manager.check_missile_alien_collisions()
@@ -534,7 +552,7 @@ class TestCollisionManager(unittest.TestCase):
         self.assertEqual(
             self.collision_manager._handle_player_missile_collisions.call_count, 2
         )
-        self.assertEqual(self.collision_manager._play_missile_sound.call_count, 2)
+        self.assertEqual(self.collision_manager._emit_missile_explosions.call_count, 2)
 
     @patch("src.game_logic.collision_detection.time.time")
     def test_check_laser_alien_collisions(self, mock_time):
@@ -581,19 +599,16 @@ class TestCollisionManager(unittest.TestCase):
         self.assertEqual(boss_alien.hit_count, 1)
         self.assertEqual(boss_alien.last_hit_time, mock_time.return_value)
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_play_missile_sound(self, mock_play_sound):
-        """Test the play_missile_sound method."""
+    def test_emit_missile_explosions(self):
+        """Test the emit_missile_explosions method."""
         alien = MagicMock()
         boss_alien = MagicMock(spec=BossAlien)
 
         aliens = [[alien], [boss_alien]]
 
-        self.collision_manager._play_missile_sound(aliens)
+        self.collision_manager._emit_missile_explosions(aliens, "phoenix")
 
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "missile"
-        )
+        self.game.events.emit.assert_called_once_with(MissileExploded("phoenix"))
 
     def test_handle_player_missile_collisions(self):
         """Test the handle_player_missile_collisions method."""
@@ -638,7 +653,7 @@ class TestCollisionManager(unittest.TestCase):
             expected_calls,
         )
 
-    @patch("src.game_logic.collision_detection.pygame.sprite.spritecollideany")
+    @patch("src.game_logic.collision_detection.get_colliding_sprite")
     def test_check_alien_bullets_collisions(self, mock_collide):
         """Test the check_alien_bullets_collisions method."""
         # Collisions are happening and one ship is immune
@@ -680,8 +695,7 @@ class TestCollisionManager(unittest.TestCase):
         thunderbird_hit.assert_not_called()
         phoenix_hit.assert_not_called()
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_handle_boss_alien_collision(self, mock_play_sound):
+    def test_handle_boss_alien_collision(self):
         """Test the handle_boss_alien_collision method."""
         player = "thunderbird"
         self.game.settings.boss_hp = 10
@@ -698,7 +712,7 @@ class TestCollisionManager(unittest.TestCase):
         self.collision_manager._handle_boss_alien_collision(boss, player)
 
         boss.destroy_alien.assert_not_called()
-        mock_play_sound.assert_not_called()
+        self.game.events.emit.assert_not_called()
 
         # Case when the hit_count matches the boss hp so the
         # boss is destroyed.
@@ -707,16 +721,14 @@ class TestCollisionManager(unittest.TestCase):
         self.collision_manager._handle_boss_alien_collision(boss, player)
 
         boss.destroy_alien.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "boss_exploding"
+        self.game.events.emit.assert_called_once_with(
+            AlienKilled(player, boss=True, position=boss.rect.center)
         )
         self.game.aliens.remove.assert_called_once_with(boss)
         self.assertEqual(
             self.game.stats.thunderbird_score, self.game.settings.boss_points
         )
         self.assertEqual(self.game.stats.phoenix_score, 0)
-        self.game.score_board.render_scores.assert_called_once()
-        self.game.score_board.update_high_score.assert_called_once()
 
     def test_handle_alien_hits_boss_alien(self):
         """Test the handle_alien_hits with a boss."""
@@ -781,8 +793,7 @@ class TestCollisionManager(unittest.TestCase):
 
         self.collision_manager._handle_boss_alien_collision.assert_not_called()
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_update_stats(self, mock_play_sound):
+    def test_update_stats(self):
         """Test the update_stats method."""
         player1 = "thunderbird"
         player2 = "phoenix"
@@ -803,14 +814,14 @@ class TestCollisionManager(unittest.TestCase):
         )
         self.assertEqual(self.thunderbird_ship.aliens_killed, 1)
         alien.destroy_alien.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "alien_exploding"
+        self.game.events.emit.assert_called_once_with(
+            AlienKilled(player1, position=alien.rect.center)
         )
         self.game.aliens.remove.assert_called_once_with(alien)
 
         # Player2 test case
         alien.reset_mock()
-        mock_play_sound.reset_mock()
+        self.game.events.reset_mock()
         self.game.aliens.reset_mock()
 
         self.collision_manager._update_stats(alien, player2)
@@ -818,30 +829,18 @@ class TestCollisionManager(unittest.TestCase):
         self.assertEqual(self.game.stats.phoenix_score, self.game.settings.alien_points)
         self.assertEqual(self.phoenix_ship.aliens_killed, 1)
         alien.destroy_alien.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "alien_exploding"
+        self.game.events.emit.assert_called_once_with(
+            AlienKilled(player2, position=alien.rect.center)
         )
         self.game.aliens.remove.assert_called_once_with(alien)
 
-        # Assert that the methods were called for each player one time.
-        self.assertEqual(self.game.score_board.render_scores.call_count, 2)
-        self.assertEqual(self.game.score_board.update_high_score.call_count, 2)
-
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_check_missile_ex_collision_with_aliens(self, mock_play_sound):
+    def test_check_missile_ex_collision_with_aliens(self):
         """Test the check_missile_ex_collision with aliens."""
         player = "thunderbird"
 
         alien = MagicMock()
         missile = MagicMock()
-        missile.rect.center = (100, 100)
-
-        # mock ex_frame
-        ex_frame = MagicMock()
-        ex_frame.get_rect.return_value = MagicMock()
-        ex_frame.get_rect.return_value.colliderect.return_value = True
-
-        missile.destroy_anim.ex_frames = [ex_frame]
+        missile.explosion_rect.return_value.colliderect.return_value = True
 
         self.collision_manager._update_stats = MagicMock()
         self.collision_manager._handle_boss_alien_collision = MagicMock()
@@ -849,16 +848,14 @@ class TestCollisionManager(unittest.TestCase):
         self.collision_manager._check_missile_ex_collision([alien], player, missile)
 
         # Assertions
-        ex_frame.get_rect.assert_called_with(center=missile.rect.center)
-        ex_frame.get_rect.return_value.colliderect.assert_called_with(alien.rect)
+        missile.explosion_rect.return_value.colliderect.assert_called_with(alien.rect)
         self.collision_manager._update_stats.assert_called_with(alien, player)
-        self.assertEqual(self.collision_manager.handled_collisions, {})
+        self.assertEqual(len(self.collision_manager.handled_collisions), 0)
 
         self.collision_manager._handle_boss_alien_collision.assert_not_called()
-        mock_play_sound.assert_not_called()
+        self.game.events.emit.assert_not_called()
 
-    @patch("src.game_logic.collision_detection.play_sound")
-    def test_check_missile_ex_collision_with_alien_boss(self, mock_play_sound):
+    def test_check_missile_ex_collision_with_alien_boss(self):
         """Test the check_missile_ex_collision with aliens."""
         player = "thunderbird"
 
@@ -867,14 +864,7 @@ class TestCollisionManager(unittest.TestCase):
         boss.hit_count = 0
 
         missile = MagicMock()
-        missile.rect.center = (100, 100)
-
-        # mock ex_frame
-        ex_frame = MagicMock()
-        ex_frame.get_rect.return_value = MagicMock()
-        ex_frame.get_rect.return_value.colliderect.return_value = True
-
-        missile.destroy_anim.ex_frames = [ex_frame]
+        missile.explosion_rect.return_value.colliderect.return_value = True
 
         self.collision_manager._update_stats = MagicMock()
         self.collision_manager._handle_boss_alien_collision = MagicMock()
@@ -882,20 +872,35 @@ class TestCollisionManager(unittest.TestCase):
         self.collision_manager._check_missile_ex_collision([boss], player, missile)
 
         # Assertions
-        ex_frame.get_rect.assert_called_with(center=missile.rect.center)
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "missile"
-        )
+        self.game.events.emit.assert_called_once_with(MissileExploded(player))
         self.assertEqual(boss.hit_count, 5)
         self.collision_manager._handle_boss_alien_collision.assert_called_once_with(
             boss, player
         )
         self.assertEqual(
-            self.collision_manager.handled_collisions, {(missile, boss): True}
+            dict(self.collision_manager.handled_collisions), {missile: {boss}}
         )
 
         self.collision_manager._update_stats.assert_not_called()
 
+    def test_missile_explosion_hits_boss_once(self):
+        """Test that an explosion hits a boss once and is forgotten with
+        its missile."""
+        boss = MagicMock(spec=BossAlien)
+        boss.hit_count = 0
+        missile = MagicMock()
+        self.collision_manager._handle_boss_alien_collision = MagicMock()
+
+        for _ in range(3):
+            self.collision_manager._check_missile_ex_collision(
+                [boss], "phoenix", missile
+            )
+        del missile
+        gc.collect()
+
+        self.assertEqual(boss.hit_count, 5)
+        self.assertEqual(len(self.collision_manager.handled_collisions), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+"""
+This module tests the EventBus class that delivers the gameplay events
+to the sound and scoreboard subscribers.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from src.game_logic.game_events import AlienKilled, EventBus, ScoreChanged
+
+
+class EventBusTest(unittest.TestCase):
+    """Test cases for the EventBus class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.events = EventBus()
+        self.handler = MagicMock()
+        self.events.subscribe(self.handler)
+
+    def test_dispatch(self):
+        """Test that the events of a frame are delivered once, in order."""
+        self.events.emit(AlienKilled("thunderbird"))
+        self.events.emit(ScoreChanged())
+        self.events.emit(AlienKilled("thunderbird"))
+        self.events.emit(AlienKilled("phoenix"))
+
+        self.events.dispatch()
+
+        self.handler.assert_called_once_with(
+            [AlienKilled("thunderbird"), ScoreChanged(), AlienKilled("phoenix")]
+        )
+        self.assertEqual(self.events.queue, [])
+
+    def test_dispatch_no_events(self):
+        """Test that the subscribers are not called for an empty frame."""
+        self.events.dispatch()
+
+        self.handler.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,17 @@ class SettingsTestCase(unittest.TestCase):
         """Test the initialization of the screen settings."""
         self.assertEqual(self.settings.screen_width, 1260)
         self.assertEqual(self.settings.screen_height, 700)
+        self.assertEqual(self.settings.bounds.rect, (0, 0, 1260, 700))
+
+    def test_bounds_refresh(self):
+        """Test that the world bounds follow the screen and the game mode."""
+        screen = pygame.Surface((1400, 800))
+        game_modes = GameModes(cosmic_conflict=True)
+
+        self.settings.bounds.refresh(screen, game_modes)
+
+        self.assertEqual(self.settings.bounds.rect, (0, 0, 1400, 800))
+        self.assertTrue(self.settings.bounds.cosmic_conflict)
 
     def test_init_images(self):
         """Test the initialization of the images."""
@@ -52,6 +63,7 @@ class SettingsTestCase(unittest.TestCase):
         self.assertIsInstance(self.settings.ui_options, UIOptions)
 
         # Test initialization of other game-related settings
+        self.assertEqual(self.settings.difficulty, "EASY")
         self.assertEqual(self.settings.speedup_scale, 0.2)
         self.assertEqual(self.settings.missiles_speed, 5.0)
         self.assertEqual(self.settings.immune_time, 5000)
@@ -0,0 +1,153 @@
+"""
+This module tests the GameState class that takes snapshots of a game
+and restores them.
+"""
+
+import random
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.alien_onslaught import AlienOnslaught
+from src.entities.projectiles.missile import Missile
+from src.game_logic.game_state import (
+    GameState,
+    Owned,
+    capture_fields,
+    get_slot_names,
+    restore_fields,
+)
+
+
+def get_positions(game):
+    """Return the positions of the sprites in every group of the game."""
+    return [
+        sorted(sprite.rect.topleft for sprite in group) for group in game.sprite_groups
+    ]
+
+
+class GameStateTest(unittest.TestCase):
+    """Test cases for the GameState class."""
+
+    def setUp(self):
+        """Set up a game with aliens, a power and a missile."""
+        with patch("src.alien_onslaught.pygame.display.set_mode") as mock_display:
+            mock_display.return_value = pygame.Surface((1280, 700))
+            self.game = AlienOnslaught(singleplayer=False)
+        self.game.aliens_manager.create_fleet(2)
+        self.game.powers_manager.create_power_up_or_penalty()
+        self.game.weapons_manager.fire_missile(
+            self.game.thunderbird_missiles, self.game.thunderbird_ship, Missile
+        )
+        self.game_state = GameState(self.game)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def play(self, frames=20):
+        """Change the state of the game for a few frames."""
+        for _ in range(frames):
+            self.game.aliens_manager.update_aliens()
+            self.game.powers_manager.update_powers()
+            self.game.thunderbird_missiles.update()
+        self.game.powers_manager.create_power_up_or_penalty()
+        next(iter(self.game.aliens)).kill()
+        self.game.thunderbird_ship.rect.x += 50
+        self.game.thunderbird_ship.state.shielded = True
+        self.game.stats.thunderbird_score = 500
+        self.game.settings.game_modes.boss_rush = True
+
+    def test_restore(self):
+        """Test that restoring a snapshot puts the game back in its state."""
+        positions = get_positions(self.game)
+        aliens = set(self.game.aliens)
+        ship_rect = self.game.thunderbird_ship.rect.copy()
+
+        snapshot = self.game_state.snapshot()
+        self.play()
+        self.game_state.restore(snapshot)
+
+        self.assertEqual(get_positions(self.game), positions)
+        self.assertEqual(set(self.game.aliens), aliens)
+        self.assertEqual(self.game.thunderbird_ship.rect, ship_rect)
+        self.assertFalse(self.game.thunderbird_ship.state.shielded)
+        self.assertEqual(self.game.stats.thunderbird_score, 0)
+        self.assertFalse(self.game.settings.game_modes.boss_rush)
+
+    def test_restore_random_state(self):
+        """Test that the random numbers repeat after a restore."""
+        snapshot = self.game_state.snapshot()
+        numbers = [random.random() for _ in range(5)]
+
+        self.game_state.restore(snapshot)
+
+        self.assertEqual([random.random() for _ in range(5)], numbers)
+
+    def test_restore_twice(self):
+        """Test that a snapshot is left unchanged by restoring it."""
+        snapshot = self.game_state.snapshot()
+        self.play()
+        self.game_state.restore(snapshot)
+        positions = get_positions(self.game)
+
+        self.play()
+        self.game_state.restore(snapshot)
+
+        self.assertEqual(get_positions(self.game), positions)
+
+    def test_manager_timers(self):
+        """Test that the timers of the managers are restored."""
+        handled_collisions = self.game.collision_handler.handled_collisions
+        missile = Missile(self.game, self.game.thunderbird_ship)
+        self.game.powers_manager.last_power_up_time = 10
+        handled_collisions[missile] = {"boss"}
+        snapshot = self.game_state.snapshot()
+
+        self.game.powers_manager.last_power_up_time = 20
+        handled_collisions[missile].add("other boss")
+        self.game_state.restore(snapshot)
+
+        self.assertEqual(self.game.powers_manager.last_power_up_time, 10)
+        self.assertEqual(
+            self.game.collision_handler.handled_collisions[missile], {"boss"}
+        )
+
+
+class FieldsTest(unittest.TestCase):
+    """Test cases for the functions that capture and restore objects."""
+
+    def test_slotted_object(self):
+        """Test capturing an object with slots and owned objects."""
+
+        class Motion:
+            """An object owned by the entity."""
+
+            def __init__(self):
+                self.speed = 1
+
+        class Entity:
+            """An entity with slots."""
+
+            __slots__ = ("rect", "motion", "target")
+
+        entity = Entity()
+        entity.rect = pygame.Rect(0, 0, 10, 10)
+        entity.motion = Motion()
+        entity.target = target = Motion()
+
+        fields = capture_fields(entity, ("motion",))
+        entity.rect.x = 50
+        entity.motion.speed = 2
+        entity.target = None
+        restore_fields(entity, fields)
+
+        self.assertEqual(get_slot_names(Entity), ("rect", "motion", "target"))
+        self.assertIsInstance(fields["motion"], Owned)
+        self.assertEqual(entity.rect.x, 0)
+        self.assertEqual(entity.motion.speed, 1)
+        self.assertIs(entity.target, target)
+
+
+if __name__ == "__main__":
+    unittest.main()
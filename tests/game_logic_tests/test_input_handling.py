@@ -47,8 +47,6 @@ class TestPlayerInput(unittest.TestCase):
             MagicMock(),
             MagicMock(),
             MagicMock(),
-            MagicMock(),
-            MagicMock(),
         )
 
         mock_quit.assert_called_once()
@@ -66,7 +64,7 @@ class TestPlayerInput(unittest.TestCase):
         event_mock.key = pygame.K_p
 
         self.player_input.check_keydown_events(
-            event_mock, MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock()
+            event_mock, MagicMock(), MagicMock(), MagicMock()
         )
 
         self.assertEqual(self.game.ui_options.paused, True)
@@ -88,8 +86,6 @@ class TestPlayerInput(unittest.TestCase):
             reset_game_mock,
             MagicMock(),
             MagicMock(),
-            MagicMock(),
-            MagicMock(),
         )
 
         reset_game_mock.assert_called_once()
@@ -99,9 +95,8 @@ class TestPlayerInput(unittest.TestCase):
         )
         self.assertIsNone(self.game.sound_manager.current_sound)
 
-    @patch("src.game_logic.input_handling.play_music")
     @patch("src.game_logic.input_handling.play_sound")
-    def test_check_keydown_events_game_menu(self, mock_play_sound, mock_play_music):
+    def test_check_keydown_events_game_menu(self, mock_play_sound):
         """Test the ESC keypress event."""
         event_mock = MagicMock()
         event_mock.key = pygame.K_ESCAPE
@@ -114,17 +109,12 @@ class TestPlayerInput(unittest.TestCase):
             MagicMock(),
             MagicMock(),
             game_menu_mock,
-            MagicMock(),
-            MagicMock(),
         )
 
         mock_play_sound.assert_called_once_with(
             self.game.sound_manager.game_sounds, "keypress"
         )
-        mock_play_music.assert_called_once_with(
-            self.game.sound_manager.menu_music, "menu"
-        )
-        self.assertEqual(self.game.sound_manager.current_sound, "menu")
+        self.game.sound_manager.play_menu_music.assert_called_once_with("menu")
         game_menu_mock.assert_called_once()
         self.assertEqual(self.game.ui_options.paused, False)
 
@@ -145,8 +135,6 @@ class TestPlayerInput(unittest.TestCase):
                 MagicMock(),
                 run_menu_mock,
                 MagicMock(),
-                MagicMock(),
-                MagicMock(),
             )
 
             time_delay_mock.assert_called_with(300)
@@ -168,8 +156,6 @@ class TestPlayerInput(unittest.TestCase):
             MagicMock(),
             MagicMock(),
             MagicMock(),
-            MagicMock(),
-            MagicMock(),
         )
         mock_play_sound.assert_called_once_with(
             self.game.sound_manager.game_sounds, "keypress"
@@ -181,157 +167,79 @@ class TestPlayerInput(unittest.TestCase):
         )
         self.assertFalse(self.game.ui_options.paused)
 
-    def test_check_keydown_events_player_controls(self):
-        """Test if the appropriate functions for the player
-        controls are called."""
-        # Multiplayer and not paused test case
-        self.game.singleplayer = False
+    def set_ships_state(self, alive=True, warping=False, exploding=False):
+        """Set the state of both ships."""
+        for ship in (self.game.thunderbird_ship, self.game.phoenix_ship):
+            ship.state.alive = alive
+            ship.state.warping = warping
+            ship.state.exploding = exploding
+
+    def press_keys(self, *keys):
+        """Press the keys while the game is not paused."""
         self.game.ui_options.paused = False
+        for key in keys:
+            self.player_input.check_keydown_events(
+                MagicMock(key=key), MagicMock(), MagicMock(), MagicMock()
+            )
 
-        event_mock = MagicMock()
-        fire_missile_method = MagicMock()
-        fire_laser_method = MagicMock()
+    def test_check_keydown_events_player_controls(self):
+        """Test that the player keys set the input bits of their player."""
+        self.game.singleplayer = False
+        self.set_ships_state()
 
-        self.player_input._handle_thunderbird_controls = MagicMock()
-        self.player_input._handle_phoenix_controls = MagicMock()
+        self.press_keys(pygame.K_d, pygame.K_SPACE, pygame.K_x, pygame.K_LEFT)
 
-        self.player_input.check_keydown_events(
-            event_mock,
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            fire_missile_method,
-            fire_laser_method,
-        )
-
-        self.player_input._handle_thunderbird_controls.assert_called_once_with(
-            event_mock, fire_missile_method, fire_laser_method
-        )
-        self.player_input._handle_phoenix_controls.assert_called_once_with(
-            event_mock, fire_missile_method, fire_laser_method
+        self.assertEqual(
+            self.player_input.input_bits, {"thunderbird": 1 | 16 | 32, "phoenix": 2}
         )
+        self.assertEqual(self.player_input.pressed_bits, self.player_input.input_bits)
 
-        # Paused test case
-        self.player_input._handle_phoenix_controls.reset_mock()
-        self.player_input._handle_thunderbird_controls.reset_mock()
+        # The keys are ignored while the game is paused.
         self.game.ui_options.paused = True
-
         self.player_input.check_keydown_events(
-            event_mock,
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            fire_missile_method,
-            fire_laser_method,
+            MagicMock(key=pygame.K_w), MagicMock(), MagicMock(), MagicMock()
         )
+        self.assertEqual(self.player_input.input_bits["thunderbird"], 1 | 16 | 32)
 
-        self.player_input._handle_thunderbird_controls.assert_not_called()
-        self.player_input._handle_phoenix_controls.assert_not_called()
-
-        # Singleplayer test case
-        self.player_input._handle_phoenix_controls.reset_mock()
-        self.player_input._handle_thunderbird_controls.reset_mock()
-        self.game.ui_options.paused = False
+    def test_check_keydown_events_uncontrolled_ships(self):
+        """Test that the keys of a ship that can't be controlled and of
+        the Phoenix in singleplayer are ignored."""
         self.game.singleplayer = True
+        self.set_ships_state()
+        self.press_keys(pygame.K_UP)
 
-        self.player_input.check_keydown_events(
-            event_mock,
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            fire_missile_method,
-            fire_laser_method,
-        )
+        self.game.singleplayer = False
+        self.set_ships_state(warping=True)
+        self.press_keys(pygame.K_w, pygame.K_RSHIFT)
 
-        self.player_input._handle_thunderbird_controls.assert_called_once_with(
-            event_mock, fire_missile_method, fire_laser_method
-        )
-        self.player_input._handle_phoenix_controls.assert_not_called()
+        self.assertEqual(self.player_input.input_bits, {"thunderbird": 0, "phoenix": 0})
 
-    def test_check_keyup_events_thunderbird_controls(self):
-        """Test the keyup events for the thunderbird controls."""
-        self.game.thunderbird_ship.moving_flags = {
-            "right": True,
-            "left": True,
-            "up": True,
-            "down": True,
-        }
-        self.game.singleplayer = True
-        self.game.thunderbird_ship.state.firing = True
-        self.game.thunderbird_ship.state.laser_fired = True
-        self.game.thunderbird_ship.state.alive = True
+    def test_check_keyup_events(self):
+        """Test that releasing a key clears its input bit."""
+        self.game.singleplayer = False
+        self.set_ships_state()
+        self.press_keys(pygame.K_a, pygame.K_c, pygame.K_DOWN, pygame.K_RETURN)
 
-        event_mock = MagicMock()
+        for key in (pygame.K_a, pygame.K_RETURN, pygame.K_q):
+            self.player_input.check_keyup_events(MagicMock(key=key))
 
-        # Simulate releasing different keys
-        keys_to_release = [
-            pygame.K_d,
-            pygame.K_a,
-            pygame.K_w,
-            pygame.K_s,
-            pygame.K_SPACE,
-            pygame.K_c,
-        ]
-        for key in keys_to_release:
-            event_mock.key = key
-            self.player_input.check_keyup_events(event_mock)
-
-            # Add assertions to verify the corresponding flags/state are updated correctly
-            if key == pygame.K_d:
-                self.assertFalse(self.game.thunderbird_ship.moving_flags["right"])
-            elif key == pygame.K_a:
-                self.assertFalse(self.game.thunderbird_ship.moving_flags["left"])
-            elif key == pygame.K_w:
-                self.assertFalse(self.game.thunderbird_ship.moving_flags["up"])
-            elif key == pygame.K_s:
-                self.assertFalse(self.game.thunderbird_ship.moving_flags["down"])
-            elif key == pygame.K_SPACE:
-                self.assertFalse(self.game.thunderbird_ship.state.firing)
-            elif key == pygame.K_c:
-                self.assertFalse(self.game.thunderbird_ship.laser_fired)
-
-    def test_check_keyup_events_phoenix_controls(self):
-        """Test the keyup events for the Phoenix controls."""
-        self.game.phoenix_ship.moving_flags = {
-            "right": True,
-            "left": True,
-            "up": True,
-            "down": True,
-        }
+        self.assertEqual(
+            self.player_input.input_bits, {"thunderbird": 64, "phoenix": 8}
+        )
 
-        self.player_input.game.singleplayer = False
-        self.game.phoenix_ship.state.alive = True
-        self.game.phoenix_ship.state.firing = True
-        self.game.phoenix_ship.state.laser_fired = True
+    def test_set_key_bindings(self):
+        """Test that the key table is rebuilt with the new bindings."""
+        self.game.singleplayer = False
+        self.set_ships_state()
+        bindings = {"thunderbird": {"fire": "j"}, "phoenix": {"fire": "KP0"}}
 
-        event_mock = MagicMock()
+        self.player_input.set_key_bindings(bindings)
+        self.press_keys(pygame.K_SPACE, pygame.K_j, pygame.K_KP0)
 
-        # Simulate releasing different keys
-        keys_to_release = [
-            pygame.K_RIGHT,
-            pygame.K_LEFT,
-            pygame.K_UP,
-            pygame.K_DOWN,
-            pygame.K_RETURN,
-            pygame.K_RSHIFT,
-        ]
-        for key in keys_to_release:
-            event_mock.key = key
-            self.player_input.check_keyup_events(event_mock)
-
-            # Add assertions to verify the corresponding flags/state are updated correctly
-            if key == pygame.K_RIGHT:
-                self.assertFalse(self.game.phoenix_ship.moving_flags["right"])
-            elif key == pygame.K_LEFT:
-                self.assertFalse(self.game.phoenix_ship.moving_flags["left"])
-            elif key == pygame.K_UP:
-                self.assertFalse(self.game.phoenix_ship.moving_flags["up"])
-            elif key == pygame.K_DOWN:
-                self.assertFalse(self.game.phoenix_ship.moving_flags["down"])
-            elif key == pygame.K_RETURN:
-                self.assertFalse(self.game.phoenix_ship.state.firing)
-            elif key == pygame.K_RSHIFT:
-                self.assertFalse(self.game.phoenix_ship.laser_fired)
+        self.assertEqual(self.player_input.key_bindings, bindings)
+        self.assertEqual(
+            self.player_input.input_bits, {"thunderbird": 16, "phoenix": 16}
+        )
 
     @patch("src.game_logic.input_handling.pygame.time.get_ticks")
     def test_handle_ship_firing(self, mock_get_ticks):
@@ -376,112 +284,42 @@ class TestPlayerInput(unittest.TestCase):
 
         fire_bullet_method_mock.assert_not_called()
 
-    def test_handle_thunderbird_controls(self):
-        """Test the handle_thunderbird_controls."""
-        self.game.thunderbird_ship.moving_flags = {
-            "right": False,
-            "left": False,
-            "up": False,
-            "down": False,
-        }
-        event_mock = MagicMock()
-        fire_missile_method_mock = MagicMock()
-        fire_laser_method_mock = MagicMock()
-
-        self.game.thunderbird_ship.state.alive = True
-        self.game.thunderbird_ship.state.warping = False
-        self.game.thunderbird_ship.state.exploding = False
-        self.game.thunderbird_ship.state.firing = False
-        self.game.thunderbird_ship.laser_firing = False
-
-        # Simulate different keypresses
-        keys_to_press = [
-            pygame.K_SPACE,
-            pygame.K_d,
-            pygame.K_a,
-            pygame.K_w,
-            pygame.K_s,
-            pygame.K_x,
-            pygame.K_c,
-        ]
-        for key in keys_to_press:
-            event_mock.key = key
-            self.player_input._handle_thunderbird_controls(
-                event_mock, fire_missile_method_mock, fire_laser_method_mock
-            )
+    def test_update_ships(self):
+        """Test that the input bits of the players are applied to their
+        ships and the missiles and lasers only fired once per keypress."""
+        self.game.singleplayer = False
+        self.set_ships_state()
+        self.game.thunderbird_ship.ship_type = "thunderbird"
+        self.game.phoenix_ship.ship_type = "phoenix"
+        for ship in (self.game.thunderbird_ship, self.game.phoenix_ship):
+            ship.moving_flags = dict.fromkeys(("right", "left", "up", "down"), False)
+        fire_missile_method, fire_laser_method = MagicMock(), MagicMock()
+
+        self.press_keys(pygame.K_SPACE, pygame.K_d, pygame.K_x, pygame.K_UP)
+        self.press_keys(pygame.K_RSHIFT)
+        for _ in range(2):
+            self.player_input.update_ships(fire_missile_method, fire_laser_method)
 
-        # Assertions
         self.assertTrue(self.game.thunderbird_ship.state.firing)
         self.assertTrue(self.game.thunderbird_ship.moving_flags["right"])
-        self.assertTrue(self.game.thunderbird_ship.moving_flags["left"])
-        self.assertTrue(self.game.thunderbird_ship.moving_flags["up"])
-        self.assertTrue(self.game.thunderbird_ship.moving_flags["down"])
+        self.assertFalse(self.game.thunderbird_ship.laser_fired)
+        self.assertTrue(self.game.phoenix_ship.moving_flags["up"])
+        self.assertFalse(self.game.phoenix_ship.state.firing)
+        # The laser key is held, so the "Not Ready!" message stays.
+        self.assertTrue(self.game.phoenix_ship.laser_fired)
 
-        fire_missile_method_mock.assert_called_once_with(
-            self.player_input.game.thunderbird_missiles,
+        fire_missile_method.assert_called_once_with(
+            self.game.thunderbird_missiles,
             self.game.thunderbird_ship,
             missile_class=Missile,
         )
-        fire_laser_method_mock.assert_called_once_with(
-            self.player_input.game.thunderbird_laser,
-            self.game.thunderbird_ship,
-            laser_class=Laser,
-        )
-        self.assertTrue(self.game.thunderbird_ship.laser_fired)
-
-    def test_handle_phoenix_controls(self):
-        """Test the handle_phoenix_controls method."""
-        self.game.phoenix_ship.moving_flags = {
-            "right": False,
-            "left": False,
-            "up": False,
-            "down": False,
-        }
-        event_mock = MagicMock()
-        fire_missile_method_mock = MagicMock()
-        fire_laser_method_mock = MagicMock()
-
-        self.game.phoenix_ship.state.alive = True
-        self.game.phoenix_ship.state.warping = False
-        self.game.phoenix_ship.state.exploding = False
-        self.game.phoenix_ship.state.firing = False
-        self.game.phoenix_ship.laser_firing = False
-
-        keys_to_press = [
-            pygame.K_RETURN,
-            pygame.K_LEFT,
-            pygame.K_RIGHT,
-            pygame.K_UP,
-            pygame.K_DOWN,
-            pygame.K_RCTRL,
-            pygame.K_RSHIFT,
-        ]
-        for key in keys_to_press:
-            event_mock.key = key
-            self.player_input._handle_phoenix_controls(
-                event_mock, fire_missile_method_mock, fire_laser_method_mock
-            )
-
-        # Assertions
-        self.assertTrue(self.game.phoenix_ship.state.firing)
-        self.assertTrue(self.game.phoenix_ship.moving_flags["right"])
-        self.assertTrue(self.game.phoenix_ship.moving_flags["left"])
-        self.assertTrue(self.game.phoenix_ship.moving_flags["up"])
-        self.assertTrue(self.game.phoenix_ship.moving_flags["down"])
-
-        fire_missile_method_mock.assert_called_once_with(
-            self.player_input.game.phoenix_missiles,
-            self.game.phoenix_ship,
-            missile_class=Missile,
+        fire_laser_method.assert_called_once_with(
+            self.game.phoenix_laser, self.game.phoenix_ship, laser_class=Laser
         )
-        fire_laser_method_mock.assert_called_once_with(
-            self.player_input.game.phoenix_laser,
-            self.game.phoenix_ship,
-            laser_class=Laser,
+        self.assertEqual(
+            self.player_input.pressed_bits, {"thunderbird": 0, "phoenix": 0}
         )
 
-        self.assertTrue(self.game.phoenix_ship.laser_fired)
-
     def test_reset_ship_flags(self):
         """Test the reset_ship_flags method."""
         self.game.thunderbird_ship.moving_flags = {
@@ -511,6 +349,69 @@ class TestPlayerInput(unittest.TestCase):
         self.assertFalse(self.game.phoenix_ship.moving_flags["down"])
         self.assertFalse(self.game.phoenix_ship.state.firing)
         self.assertFalse(self.game.thunderbird_ship.state.firing)
+        self.assertEqual(self.player_input.input_bits, {"thunderbird": 0, "phoenix": 0})
+
+    def test_get_input_bits(self):
+        """Test the input bits of a ship."""
+        ship = MagicMock()
+        ship.moving_flags = {"right": True, "left": False, "up": True, "down": False}
+        ship.state.firing = True
+
+        bits = self.player_input.get_input_bits(ship, missile=True)
+
+        self.assertEqual(bits, 1 | 4 | 16 | 32)
+        ship.state.firing = False
+        self.assertEqual(self.player_input.get_input_bits(ship, laser=True), 1 | 4 | 64)
+
+    def test_apply_input_bits(self):
+        """Test setting the controls of a ship from its input bits."""
+        ship = self.game.phoenix_ship
+        ship.ship_type = "phoenix"
+        ship.moving_flags = {"right": False, "left": False, "up": False, "down": False}
+        ship.state.alive = True
+        ship.state.warping = False
+        ship.state.exploding = False
+        fire_missile, fire_laser = MagicMock(), MagicMock()
+        self.player_input.apply_input_bits(
+            ship, 2 | 8 | 16 | 32, fire_missile, fire_laser
+        )
+
+        self.assertEqual(
+            ship.moving_flags,
+            {"right": False, "left": True, "up": False, "down": True},
+        )
+        self.assertTrue(ship.state.firing)
+        self.assertFalse(ship.laser_fired)
+        fire_missile.assert_called_once_with(
+            self.game.phoenix_missiles, ship, missile_class=Missile
+        )
+        fire_laser.assert_not_called()
+
+        # A ship that can't be controlled doesn't fire.
+        ship.state.warping = True
+        self.player_input.apply_input_bits(ship, 32 | 64, fire_missile, fire_laser)
+
+        self.assertTrue(ship.laser_fired)
+        self.assertFalse(ship.state.firing)
+        fire_missile.assert_called_once()
+        fire_laser.assert_not_called()
+
+    def test_apply_input_bits_pressed(self):
+        """Test that the missile and the laser are only fired when their
+        keys were just pressed."""
+        ship = self.game.thunderbird_ship
+        ship.ship_type = "thunderbird"
+        ship.moving_flags = {"right": False, "left": False, "up": False, "down": False}
+        self.set_ships_state()
+        fire_missile, fire_laser = MagicMock(), MagicMock()
+
+        self.player_input.apply_input_bits(
+            ship, 32 | 64, fire_missile, fire_laser, pressed=32
+        )
+
+        self.assertTrue(ship.laser_fired)
+        fire_missile.assert_called_once()
+        fire_laser.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -16,12 +16,14 @@ from src.game_logic.game_stats import GameStats
 from src.game_logic.collision_detection import CollisionManager
 from src.game_logic.input_handling import PlayerInput
 from src.game_logic.gameplay_handler import GameplayHandler
+from src.game_logic.game_state import GameState
 
 from src.ui.scoreboards import ScoreBoard
 
 from src.managers.powers_manager import PowerEffectsManager
 from src.managers.asteroids_manager import AsteroidsManager
 from src.managers.sounds_manager import SoundManager
+from src.managers.fx_manager import FXManager
 from src.managers.game_over_manager import EndGameManager
 from src.managers.alien_managers.alien_bullets_manager import AlienBulletsManager
 from src.managers.alien_managers.aliens_manager import AliensManager
@@ -31,6 +33,11 @@ from src.managers.ui_managers.buttons_manager import GameButtonsManager
 from src.managers.player_managers.weapons_manager import WeaponsManager
 from src.managers.player_managers.ships_manager import ShipsManager
 from src.managers.save_load_manager import SaveLoadSystem
+from src.managers.high_score_manager import HighScoreManager
+from src.managers.memory_manager import MemoryManager
+from src.managers.telemetry_manager import TelemetryManager
+from src.utils.save_writer import SAVE_COMPLETED_EVENT
+from src.managers.player_managers.ship_selection_manager import ShipSelection
 
 from src.entities.player_entities.player_ships import Thunderbird, Phoenix
 
@@ -188,29 +195,80 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.assertIsInstance(self.game.aliens_manager, AliensManager)
         self.assertIsInstance(self.game.gameplay_manager, GameplayHandler)
         self.assertIsInstance(self.game.game_over_manager, EndGameManager)
-        self.assertIsInstance(self.game.save_load_manager, SaveLoadSystem)
+        self.assertIsInstance(self.game.fx_manager, FXManager)
+        self.assertIsInstance(self.game.game_state, GameState)
+        self.assertIsInstance(self.game.telemetry, TelemetryManager)
+        self.assertIsInstance(self.game.memory_manager, MemoryManager)
+        self.assertIn(self.game.fx_manager.handle_events, self.game.events.subscribers)
 
         self.assertEqual(self.game.screen_manager.singleplayer, self.game.singleplayer)
         self.assertEqual(self.game.aliens_manager.aliens, self.game.aliens)
         self.assertEqual(self.game.game_over_manager.screen, self.game.screen)
 
+    @patch("src.alien_onslaught.pygame.display.set_mode")
+    def test_lazy_managers(self, mock_display):
+        """Test that the parts not needed by the menu are created on first use."""
+        mock_display.return_value = pygame.Surface((1280, 700))
+        game = AlienOnslaught()
+        lazy = {
+            "save_load_manager": SaveLoadSystem,
+            "high_score_manager": HighScoreManager,
+            "ship_selection": ShipSelection,
+            "second_bg": pygame.Surface,
+            "third_bg": pygame.Surface,
+            "fourth_bg": pygame.Surface,
+        }
+
+        for name, cls in lazy.items():
+            self.assertNotIn(name, vars(game))
+            created = getattr(game, name)
+            self.assertIsInstance(created, cls)
+            self.assertIs(getattr(game, name), created)
+
+    @patch("src.alien_onslaught.pygame.display.set_mode")
+    def test_frames_keep_save_system_lazy(self, mock_display):
+        """Test that drawing the menu and the game frames doesn't create
+        the save system, and that its message is drawn once it exists.
+        """
+        mock_display.return_value = pygame.Surface((1280, 700))
+        game = AlienOnslaught()
+        game.display_manager.present = MagicMock()
+
+        game._update_screen()
+        game.stats.game_active = True
+        game._update_screen()
+
+        self.assertNotIn("save_load_manager", vars(game))
+
+        game.save_load_manager = MagicMock()
+        game._update_screen()
+
+        game.save_load_manager.draw_save_message.assert_called_once()
+
+    def test_handle_background_change_loads_current_level(self):
+        """Test that only the background of the current level is loaded."""
+        self.game.stats.level = 17
+
+        self.game._handle_background_change()
+
+        self.assertEqual(self.game.bg_img, self.game.third_bg)
+        self.assertNotIn("second_bg", vars(self.game))
+
     @mock.patch.object(AlienOnslaught, "MENU_RUNNING", new_callable=mock.PropertyMock)
-    @patch("src.alien_onslaught.play_music")
     @patch("src.alien_onslaught.pygame.display.flip")
-    def test_run_menu(self, mock_flip, mock_play_music, mock_menu_running):
+    def test_run_menu(self, mock_flip, mock_menu_running):
         """Test the run_menu method."""
         mock_menu_running.side_effect = [True, False]
         self.game.handle_menu_events = MagicMock()
 
-        self.game.run_menu()
+        with patch("pygame.display.Info") as mock_info:
+            self.game.run_menu()
 
         # Assertions
         self.game.sound_manager.load_sounds.assert_called_once_with("menu_sounds")
-        mock_play_music.assert_called_once_with(
-            self.game.sound_manager.menu_music, "menu"
-        )
+        self.game.sound_manager.play_menu_music.assert_called_once_with("menu")
         self.game.handle_menu_events.assert_called_once()
-        self.game.screen_manager.update_window_mode.assert_called_once()
+        mock_info.assert_not_called()
         self.game.screen_manager.draw_menu_objects.assert_called_once_with(
             self.game.bg_img, self.game.bg_img_rect
         )
@@ -238,9 +296,12 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         mock_keydown_event.key = pygame.K_f
         mock_get.return_value = [mock_keydown_event]
 
-        self.game.handle_menu_events()
+        with patch.object(
+            self.game.display_manager, "toggle_fullscreen"
+        ) as mock_toggle:
+            self.game.handle_menu_events()
 
-        self.game.screen_manager.toggle_window_mode.assert_called_once()
+        mock_toggle.assert_called_once()
 
     @patch("src.alien_onslaught.pygame.event.get")
     def test_handle_mousebuttondown_event_single(self, mock_get):
@@ -312,23 +373,10 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         mock_videoresize_event.type = pygame.VIDEORESIZE
         mock_get.return_value = [mock_videoresize_event]
 
-        self.game.handle_menu_resize_screen_event = MagicMock()
-
-        self.game.handle_menu_events()
-
-        self.game.handle_menu_resize_screen_event.assert_called_once_with(
-            mock_videoresize_event.size
-        )
-
-    def test_handle_menu_resize_screen_event(self):
-        """Test the handle_menu_resize_screen_event method."""
-        mock_size = (1260, 800)
+        with patch.object(self.game.display_manager, "request_resize") as mock_resize:
+            self.game.handle_menu_events()
 
-        self.game.handle_menu_resize_screen_event(mock_size)
-
-        self.game.screen_manager.resize_screen.assert_called_once_with(mock_size)
-        self.game.screen_manager.update_buttons.assert_called_once()
-        self.game.screen_manager.create_controls.assert_called_once()
+        mock_resize.assert_called_once()
 
     def test_start_single_player_game(self):
         """Test the start_single_player_game method."""
@@ -387,6 +435,33 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         )
         self.game.run_game.assert_called_once()
 
+    def test_start_headless_match(self):
+        """Test the start_headless_match method."""
+        self.game._set_singleplayer_variables = MagicMock()
+        self.game._reset_game = MagicMock()
+        self.game.run_game = MagicMock()
+
+        self.game.start_headless_match(singleplayer=True)
+
+        self.assertTrue(self.game.singleplayer)
+        self.game._set_singleplayer_variables.assert_called_once()
+        self.game.sound_manager.load_sounds.assert_called_once_with("gameplay_sounds")
+        self.assertFalse(self.game.sound_manager.music_enabled)
+        self.game._reset_game.assert_called_once()
+        self.game.run_game.assert_not_called()
+
+    def test_update_simulation(self):
+        """Test the update_simulation method."""
+        self.game._handle_game_logic = MagicMock()
+        self.game._update_screen = MagicMock()
+        self.game.events = MagicMock()
+
+        self.game.update_simulation()
+
+        self.game._handle_game_logic.assert_called_once()
+        self.game.events.dispatch.assert_called_once()
+        self.game._update_screen.assert_not_called()
+
     def test__update_background(self):
         """Test the _update_background method."""
         i = 100
@@ -450,13 +525,19 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.game._handle_game_logic = MagicMock()
         self.game._update_screen = MagicMock()
         self.game._check_for_pause = MagicMock()
+        self.game.player_input = MagicMock()
 
-        self.game.run_game()
+        with patch("pygame.display.Info") as mock_info:
+            self.game.run_game()
 
         # Assert that the methods are called as expected
         self.game.check_events.assert_called_once()
+        self.game.player_input.update_ships.assert_called_once_with(
+            self.game.weapons_manager.fire_missile,
+            self.game.weapons_manager.fire_laser,
+        )
         self.game.game_over_manager.check_game_over.assert_called_once()
-        self.game.screen_manager.update_window_mode.assert_called_once()
+        mock_info.assert_not_called()
 
         self.game._update_background.assert_called()
         self.game._handle_game_logic.assert_called()
@@ -487,7 +568,6 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.game.check_events.assert_called_once()
         self.game._update_screen.assert_called_once()
         self.assertEqual(self.game.game_over_manager.check_game_over.call_count, 2)
-        self.game.screen_manager.update_window_mode.assert_called_once()
         self.game.screen.blit.assert_called_once_with(self.game.bg_img, [0, 0])
 
         self.game._update_background.assert_not_called()
@@ -535,7 +615,6 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         )
         self.game.ships_manager.update_ship_state.assert_called_once()
         self.game.weapons_manager.update_laser_status.assert_called_once()
-        self.game.weapons_manager.check_laser_availability.assert_called_once()
         self.game.collision_handler.handle_shielded_ship_collisions.assert_called_once_with(
             self.game.ships,
             self.game.aliens,
@@ -561,7 +640,7 @@ class AlienOnslaughtTestCase(unittest.TestCase):
 
         with patch(
             "src.alien_onslaught.pygame.event.get", return_value=[keydown_event]
-        ):
+        ), patch.object(self.game.display_manager, "toggle_fullscreen") as mock_toggle:
             self.game.check_events()
 
         self.game.player_input.check_keydown_events.assert_called_once_with(
@@ -569,9 +648,8 @@ class AlienOnslaughtTestCase(unittest.TestCase):
             self.game._reset_game,
             self.game.run_menu,
             self.game.game_over_manager.return_to_game_menu,
-            self.game.weapons_manager.fire_missile,
-            self.game.weapons_manager.fire_laser,
         )
+        mock_toggle.assert_called_once()
 
     def test_check_events_keyup(self):
         """Test the keyup events in the check_events method."""
@@ -593,8 +671,8 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.game.stats.game_active = True
         self.game._check_buttons = MagicMock()
 
-        with patch(
-            "src.alien_onslaught.pygame.mouse.get_pos", return_value=(100, 200)
+        with patch.object(
+            self.game.display_manager, "get_mouse_pos", return_value=(100, 200)
         ), patch(
             "src.alien_onslaught.pygame.event.get", return_value=[mousebuttondown_event]
         ):
@@ -609,12 +687,30 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         """Test the VIDEORESIZE event in the check_events method."""
         videoresize_event = pygame.event.Event(pygame.VIDEORESIZE, size=(1280, 700))
 
-        with patch("pygame.event.get", return_value=[videoresize_event]):
+        with patch("pygame.event.get", return_value=[videoresize_event]), patch.object(
+            self.game.display_manager, "request_resize"
+        ) as mock_resize:
             self.game.check_events()
 
         # Assertions
-        self.game.screen_manager.resize_screen.assert_called_once_with((1280, 700))
-        self.game.screen_manager.update_buttons.assert_called_once()
+        mock_resize.assert_called_once()
+
+    def test_check_events_save_completed(self):
+        """Test that a finished save is shown and recorded."""
+        save_event = pygame.event.Event(
+            SAVE_COMPLETED_EVENT, slot="save1", success=True
+        )
+        self.game.telemetry = MagicMock()
+
+        with patch("pygame.event.get", return_value=[save_event]):
+            self.game.check_events()
+
+        self.game.save_load_manager.handle_save_completed.assert_called_once_with(
+            save_event
+        )
+        self.game.telemetry.record_event.assert_called_once_with(
+            "save", slot="save1", success=True
+        )
 
     @patch("src.alien_onslaught.play_sound")
     @patch("src.alien_onslaught.pygame.time.delay")
@@ -823,6 +919,7 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.game.score_board.create_health.assert_called_once()
 
         self.game.sound_manager.prepare_level_music.assert_called_once()
+        self.assertEqual(self.game.match_pause_time, 0)
         mock_play_sound.assert_called_once_with(
             self.game.sound_manager.game_sounds, "warp"
         )
@@ -981,6 +1078,26 @@ class AlienOnslaughtTestCase(unittest.TestCase):
 
             self.assertEqual(self.game.pause_time, expected_pause_time)
 
+    @mock.patch("src.alien_onslaught.pygame.time.get_ticks")
+    def test_check_for_pause_match_time(self, mock_get_ticks):
+        """Test that the time paused in the match is kept when
+        the pause time is reset by the timed weapons and powers.
+        """
+        mock_get_ticks.side_effect = [1000, 4000, 5000, 6000]
+        self.game.telemetry = MagicMock()
+        self.game.check_events = MagicMock(
+            side_effect=lambda: setattr(self.game.ui_options, "paused", False)
+        )
+
+        self.game.ui_options.paused = True
+        self.game._check_for_pause()
+        self.game.pause_time = 0
+        self.game.ui_options.paused = True
+        self.game._check_for_pause()
+
+        self.assertEqual(self.game.pause_time, 1000)
+        self.assertEqual(self.game.match_pause_time, 4000)
+
 
 if __name__ == "__main__":
     unittest.main()
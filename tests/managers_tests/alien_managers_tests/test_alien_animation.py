@@ -22,8 +22,6 @@ class AlienAnimationTestCase(unittest.TestCase):
 
     def test_init(self):
         """Test the initialization of the class."""
-        self.assertEqual(self.animation.alien, self.alien)
-        self.assertEqual(self.animation.game, self.game)
         self.assertEqual(self.animation.scale, 1.0)
         self.assertEqual(self.animation.frame_update_rate, 6)
         self.assertEqual(self.animation.frame_counter, 0)
@@ -111,13 +111,13 @@ class AlienBulletsManagerTestCase(unittest.TestCase):
 
     def test_update_alien_bullets(self):
         """Test the update of the alien bullets."""
-        self.game.settings.screen_height = 780
+        self.game.settings.bounds.rect.bottom = 780
         bullet1 = MagicMock()
         bullet1.rect.y = 200
         bullet2 = MagicMock()
         bullet2.rect.y = 800
 
-        self.manager.alien_bullet.copy.return_value = [bullet1, bullet2]
+        self.manager.alien_bullet.sprites.return_value = [bullet1, bullet2]
 
         self.manager.update_alien_bullets()
 
@@ -55,6 +55,7 @@ class AliensManagerTest(unittest.TestCase):
 
     def test_update_aliens(self):
         """Test the update of aliens."""
+        self.manager.fleet_engine = None
         self.manager._check_fleet_edges = MagicMock()
         self.game.aliens.update = MagicMock()
 
@@ -64,6 +65,18 @@ class AliensManagerTest(unittest.TestCase):
         self.manager._check_fleet_edges.assert_called_once()
         self.game.aliens.update.assert_called_once()
 
+    def test_update_aliens_fleet_engine(self):
+        """Test that the fleet engine updates the aliens when it is available."""
+        self.manager.fleet_engine = MagicMock()
+        self.manager._check_fleet_edges = MagicMock()
+        self.game.aliens.update = MagicMock()
+
+        self.manager.update_aliens()
+
+        self.manager.fleet_engine.update.assert_called_once_with(self.game.aliens)
+        self.manager._check_fleet_edges.assert_not_called()
+        self.game.aliens.update.assert_not_called()
+
     def test__check_fleet_edges(self):
         """Test the check_fleet_edges method."""
         alien1 = MagicMock(spec=Alien)
@@ -59,11 +59,9 @@ class AlienMovementTestCase(unittest.TestCase):
     @patch("pygame.time.get_ticks", return_value=3000)
     def test_update_vertical_position(self, _):
         """Test the update vertical position method."""
-        self.alien_movement.sins = {
-            "time_offset": 1 * math.pi,
-            "amplitude": 12,
-            "frequency": 0.003,
-        }
+        self.alien_movement.time_offset = 1 * math.pi
+        self.alien_movement.amplitude = 12
+        self.alien_movement.frequency = 0.003
         self.alien.rect.y = -2
 
         self.alien_movement.update_vertical_position()
@@ -0,0 +1,146 @@
+"""
+This module tests the FleetEngine class that updates the alien fleet
+with NumPy arrays.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.entities.alien_entities.aliens import Alien, BossAlien
+from src.managers.alien_managers.fleet_engine import FleetEngine
+from src.utils.game_dataclasses import WorldBounds
+
+
+@unittest.skipUnless(FleetEngine.is_available(), "NumPy is not installed")
+class FleetEngineTest(unittest.TestCase):
+    """Test cases for the FleetEngine class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.game = MagicMock()
+        self.settings = self.game.settings
+        self.settings.bounds = WorldBounds(pygame.Rect(0, 0, 800, 600))
+        self.settings.screen_width = 800
+        self.settings.alien_speed = 2.0
+        self.settings.alien_direction = 1
+        self.settings.frozen_time = 4
+        self.settings.alien_immune_time = 30
+
+        self.aliens = pygame.sprite.Group()
+        self.engine = FleetEngine(self.settings)
+
+    def _add_alien(self, x_pos, y_pos, boss=False):
+        """Create an alien that does not change direction on its own."""
+        alien = BossAlien(self.game) if boss else Alien(self.game)
+        alien.x_pos = float(x_pos)
+        alien.rect.topleft = (x_pos, y_pos)
+        alien.motion.direction_change_delay = 10**9
+        alien.motion.amplitude = 0
+        self.aliens.add(alien)
+        return alien
+
+    @patch("src.managers.alien_managers.fleet_engine.pygame.time.get_ticks")
+    def test_update_moves_aliens(self, mock_get_ticks):
+        """Test that the aliens and bosses move along their direction."""
+        mock_get_ticks.return_value = 1000
+        alien = self._add_alien(100, 200)
+        boss = self._add_alien(300, 50, boss=True)
+        boss.motion.direction_change_delay = 10**9
+
+        self.engine.update(self.aliens)
+        self.engine.update(self.aliens)
+
+        self.assertEqual(alien.x_pos, 104.0)
+        self.assertEqual(alien.rect.topleft, (104, 200))
+        self.assertEqual(boss.rect.x, 304)
+        self.assertIs(alien.fleet, self.engine)
+
+    @patch("src.managers.alien_managers.fleet_engine.pygame.time.get_ticks")
+    def test_update_edges(self, mock_get_ticks):
+        """Test that aliens at the edges turn around and the ones at
+        the top move down.
+        """
+        mock_get_ticks.return_value = 1000
+        alien = self._add_alien(800 - 40, 200)
+        top_alien = self._add_alien(100, -10)
+
+        self.engine.update(self.aliens)
+
+        self.assertEqual(alien.motion.direction, -1)
+        self.assertLess(alien.rect.x, 800 - 40)
+        self.assertEqual(top_alien.rect.y, -8)
+
+    @patch("src.managers.alien_managers.fleet_engine.pygame.time.get_ticks")
+    def test_frozen_aliens(self, mock_get_ticks):
+        """Test that frozen aliens stay in place until the time runs out."""
+        mock_get_ticks.return_value = 1000
+        alien = self._add_alien(100, 200)
+        self.engine.update(self.aliens)
+
+        alien.freeze()
+        self.engine.update(self.aliens)
+        self.assertEqual(alien.rect.x, 102)
+
+        alien.frozen_start_time -= self.settings.frozen_time + 1
+        self.engine.refresh_timers(alien)
+        self.engine.update(self.aliens)
+
+        self.assertFalse(alien.frozen_state)
+        self.assertEqual(alien.rect.x, 104)
+
+    @patch("src.managers.alien_managers.fleet_engine.pygame.time.get_ticks")
+    def test_random_direction_change(self, mock_get_ticks):
+        """Test that the direction changes when the delay has passed."""
+        mock_get_ticks.return_value = 1000
+        alien = self._add_alien(100, 200)
+        alien.motion.last_direction_change = 0
+        alien.motion.direction_change_delay = 500
+
+        self.engine.update(self.aliens)
+
+        self.assertEqual(alien.motion.direction, -1)
+        self.assertEqual(alien.motion.last_direction_change, 1000)
+        self.assertTrue(5000 <= alien.motion.direction_change_delay <= 15000)
+
+    def test_seed(self):
+        """Test that a seed gives the same random numbers every time."""
+        self.engine.seed(7)
+        first = self.engine.rng.random(5)
+        self.engine.seed(7)
+
+        self.assertEqual(list(self.engine.rng.random(5)), list(first))
+
+    @patch("src.managers.alien_managers.fleet_engine.pygame.time.get_ticks")
+    def test_sync(self, mock_get_ticks):
+        """Test that removed aliens leave the fleet and survivors keep their state."""
+        mock_get_ticks.return_value = 1000
+        first = self._add_alien(100, 200)
+        second = self._add_alien(300, 200)
+        self.engine.update(self.aliens)
+
+        first.kill()
+        second.x_pos = 0.0
+        self.engine.update(self.aliens)
+
+        self.assertEqual(self.engine.sprites, [second])
+        self.assertEqual(len(self.engine.fleet), 1)
+        self.assertEqual(second.x_pos, 304.0)
+
+    @patch("src.managers.alien_managers.fleet_engine.pygame.time.get_ticks")
+    def test_animation(self, mock_get_ticks):
+        """Test that the alien image changes every few frames."""
+        mock_get_ticks.return_value = 1000
+        alien = self._add_alien(100, 200)
+        rate = alien.animation.frame_update_rate
+
+        for _ in range(rate):
+            self.engine.update(self.aliens)
+
+        self.assertEqual(alien.animation.current_frame, 1)
+        self.assertIs(alien.image, alien.animation.frames[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ manage the ships in the game.
 import unittest
 from unittest.mock import MagicMock, patch
 
+from src.game_logic.game_events import ShipHit
 from src.managers.player_managers.ships_manager import ShipsManager
 
 
@@ -70,8 +71,7 @@ class TestShipsManager(unittest.TestCase):
         self.ships_manager.phoenix_ship_hit()
         self.ships_manager._destroy_ship.assert_not_called()
 
-    @patch("src.managers.player_managers.ships_manager.play_sound")
-    def test_destroy_ship_thunderbird(self, mock_play_sound):
+    def test_destroy_ship_thunderbird(self):
         """Test the destroying of the Thunderbird ship."""
         self.game.settings.game_modes.last_bullet = False
         ship_mock = MagicMock()
@@ -81,14 +81,11 @@ class TestShipsManager(unittest.TestCase):
         self.ships_manager._destroy_ship(ship_mock)
 
         ship_mock.explode.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "explode"
-        )
+        self.game.events.emit.assert_called_once_with(ShipHit("thunderbird"))
         self.assertEqual(self.ships_manager.thunderbird_ship.state.shielded, False)
         self.ships_manager._update_thunderbird_stats.assert_called_once()
         ship_mock.set_immune.assert_called_once()
         ship_mock.center_ship.assert_called_once()
-        self.game.score_board.create_health.assert_called_once()
         self.game.gameplay_manager.check_remaining_bullets.assert_not_called()
 
         self.game.settings.game_modes.last_bullet = True
@@ -97,8 +94,7 @@ class TestShipsManager(unittest.TestCase):
 
         self.game.gameplay_manager.check_remaining_bullets.assert_called_once()
 
-    @patch("src.managers.player_managers.ships_manager.play_sound")
-    def test_destroy_ship_phoenix(self, mock_play_sound):
+    def test_destroy_ship_phoenix(self):
         """Test the destroying of the Phoenix ship."""
         self.game.settings.game_modes.last_bullet = False
         ship_mock = MagicMock()
@@ -108,14 +104,11 @@ class TestShipsManager(unittest.TestCase):
         self.ships_manager._destroy_ship(ship_mock)
 
         ship_mock.explode.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "explode"
-        )
+        self.game.events.emit.assert_called_once_with(ShipHit("phoenix"))
         self.assertEqual(self.ships_manager.phoenix_ship.state.shielded, False)
         self.ships_manager._update_phoenix_stats.assert_called_once()
         ship_mock.set_immune.assert_called_once()
         ship_mock.center_ship.assert_called_once()
-        self.game.score_board.create_health.assert_called_once()
         self.game.gameplay_manager.check_remaining_bullets.assert_not_called()
 
         self.game.settings.game_modes.last_bullet = True
@@ -9,6 +9,7 @@ from unittest.mock import patch, MagicMock, call
 
 import pygame
 
+from src.game_logic.game_events import WeaponFired, LaserStatus, AmmoChanged
 from src.utils.constants import WEAPONS
 from src.managers.player_managers.weapons_manager import WeaponsManager
 
@@ -47,8 +48,6 @@ class WeaponsManagerTest(unittest.TestCase):
         self.assertEqual(self.weapons_manager.game_modes, self.game.settings.game_modes)
         self.assertEqual(self.weapons_manager.screen, self.game.screen)
         self.assertEqual(self.weapons_manager.sound_manager, self.game.sound_manager)
-        self.assertFalse(self.weapons_manager.draw_laser_message)
-        self.assertEqual(self.weapons_manager.display_time, 0)
         self.assertEqual(
             self.weapons_manager.thunderbird_ship, self.game.thunderbird_ship
         )
@@ -162,9 +161,12 @@ class WeaponsManagerTest(unittest.TestCase):
         in singleplayer.
         """
         self.game.singleplayer = True
+        self.game.settings.bounds.rect = pygame.Rect(0, 0, 800, 600)
         projectile_mock1 = MagicMock()
+        projectile_mock1.rect = pygame.Rect(100, 100, 10, 10)
         projectile_mock2 = MagicMock()
-        self.weapons_manager.singleplayer_projectiles[0].copy.return_value = [
+        projectile_mock2.rect = pygame.Rect(100, -50, 10, 10)
+        self.weapons_manager.singleplayer_projectiles[0].sprites.return_value = [
             projectile_mock1,
             projectile_mock2,
         ]
@@ -172,10 +174,11 @@ class WeaponsManagerTest(unittest.TestCase):
         self.weapons_manager.update_projectiles()
 
         self.weapons_manager.singleplayer_projectiles[0].update.assert_called()
+        self.weapons_manager.singleplayer_projectiles[0].remove.assert_called_once_with(
+            projectile_mock2
+        )
 
-        self.assertTrue(self.weapons_manager.singleplayer_projectiles[0].copy.called)
-
-        self.assertFalse(self.weapons_manager.multiplayer_projectiles[0].copy.called)
+        self.assertFalse(self.weapons_manager.multiplayer_projectiles[0].sprites.called)
         self.assertFalse(self.weapons_manager.multiplayer_projectiles[0].remove.called)
 
     def test_remove_out_of_screen_projectiles_multiplayer(self):
@@ -183,14 +186,17 @@ class WeaponsManagerTest(unittest.TestCase):
         in multiplayer.
         """
         self.game.singleplayer = False
+        self.game.settings.bounds.rect = pygame.Rect(0, 0, 800, 600)
 
         self.weapons_manager.update_projectiles()
 
         self.weapons_manager.multiplayer_projectiles[0].update.assert_called()
 
-        self.assertTrue(self.weapons_manager.multiplayer_projectiles[0].copy.called)
+        self.assertTrue(self.weapons_manager.multiplayer_projectiles[0].sprites.called)
 
-        self.assertFalse(self.weapons_manager.singleplayer_projectiles[0].copy.called)
+        self.assertFalse(
+            self.weapons_manager.singleplayer_projectiles[0].sprites.called
+        )
         self.assertFalse(self.weapons_manager.singleplayer_projectiles[0].remove.called)
 
     def test_fire_bullet_ship_disarmed(self):
@@ -211,8 +217,7 @@ class WeaponsManagerTest(unittest.TestCase):
         bullet_class_mock.assert_not_called()
         self.game.sound_manager.game_sounds.assert_not_called()
 
-    @patch("src.managers.player_managers.weapons_manager.play_sound")
-    def test_fire_bullet_max_bullets_reached(self, mock_play_sound):
+    def test_fire_bullet_max_bullets_reached(self):
         """Test the fire_bullet method when the ship fired the maximum
         number of bullets allowed on screen.
         """
@@ -231,10 +236,9 @@ class WeaponsManagerTest(unittest.TestCase):
 
         bullets_mock.add.assert_not_called()
         bullet_class_mock.assert_not_called()
-        mock_play_sound.assert_not_called()
+        self.game.events.emit.assert_not_called()
 
-    @patch("src.managers.player_managers.weapons_manager.play_sound")
-    def test_fire_bullet(self, mock_play_sound):
+    def test_fire_bullet(self):
         """Test the fire_bullet method when the ship successfully
         fires bullets.
         """
@@ -255,14 +259,12 @@ class WeaponsManagerTest(unittest.TestCase):
             bullets_mock, bullets_allowed, bullet_class_mock, num_bullets, ship_mock
         )
 
-        self.game.score_board.render_bullets_num.assert_not_called()
         bullet_class_mock.assert_called_once_with(self.weapons_manager, ship_mock)
         bullets_mock.add.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "bullet"
-        )
+        self.game.events.emit.assert_called_once_with(WeaponFired("bullet"))
 
         # Case when last_bullet game mode is active.
+        self.game.events.emit.reset_mock()
         self.weapons_manager.game_modes.last_bullet = True
 
         self.weapons_manager.fire_bullet(
@@ -270,10 +272,11 @@ class WeaponsManagerTest(unittest.TestCase):
         )
 
         self.assertEqual(ship_mock.remaining_bullets, 1)
-        self.game.score_board.render_bullets_num.assert_called_once()
+        self.game.events.emit.assert_has_calls(
+            [call(AmmoChanged("bullets")), call(WeaponFired("bullet"))]
+        )
 
-    @patch("src.managers.player_managers.weapons_manager.play_sound")
-    def test_fire_missile_no_missiles(self, mock_play_sound):
+    def test_fire_missile_no_missiles(self):
         """Test the fire_missile method when the player has no
         missiles left.
         """
@@ -285,10 +288,9 @@ class WeaponsManagerTest(unittest.TestCase):
         self.weapons_manager.fire_missile(missiles_mock, ship_mock, missile_class_mock)
 
         missiles_mock.add.assert_not_called()
-        mock_play_sound.assert_not_called()
+        self.game.events.emit.assert_not_called()
 
-    @patch("src.managers.player_managers.weapons_manager.play_sound")
-    def test_fire_missile(self, mock_play_sound):
+    def test_fire_missile(self):
         """Test the fire_missile method when the player successfully
         launches a missile.
         """
@@ -301,15 +303,13 @@ class WeaponsManagerTest(unittest.TestCase):
 
         missile_class_mock.assert_called_once_with(self.weapons_manager, ship_mock)
         missiles_mock.add.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "missile_launch"
+        self.game.events.emit.assert_has_calls(
+            [call(WeaponFired("missile")), call(AmmoChanged("missiles"))]
         )
         self.assertEqual(ship_mock.missiles_num, 1)
-        self.game.score_board.render_missiles_num.assert_called_once_with(ship_mock)
 
-    @patch("src.managers.player_managers.weapons_manager.play_sound")
     @patch("src.managers.player_managers.weapons_manager.time.time")
-    def test_timed_laser(self, mock_time, mock_play_sound):
+    def test_timed_laser(self, mock_time):
         """Test the timed_laser method."""
         # Laser ready (the player successfully fires the laser.)
         lasers_mock = MagicMock()
@@ -327,30 +327,21 @@ class WeaponsManagerTest(unittest.TestCase):
         self.assertEqual(ship_mock.last_laser_time, mock_time.return_value)
         self.assertEqual(self.game.pause_time, 0)
         self.assertFalse(ship_mock.laser_ready)
-        self.assertFalse(self.weapons_manager.draw_laser_message)
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "fire_laser"
-        )
+        self.game.events.emit.assert_called_once_with(WeaponFired("laser"))
 
         # Laser not ready, the player does not fire the laser because
         # not enought time has passed.
-        mock_play_sound.reset_mock()
-        self.weapons_manager.draw_laser_message = False
+        self.game.events.emit.reset_mock()
         self.weapons_manager._timed_laser(lasers_mock, ship_mock, laser_class_mock)
 
-        self.assertTrue(self.weapons_manager.draw_laser_message)
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "laser_not_ready"
-        )
+        self.game.events.emit.assert_called_once_with(LaserStatus(ready=False))
 
-    @patch("src.managers.player_managers.weapons_manager.play_sound")
-    def test_normal_laser(self, mock_play_sound):
+    def test_normal_laser(self):
         """Test the normal_laser method."""
         lasers_mock = MagicMock()
         ship_mock = MagicMock()
         laser_class_mock = MagicMock()
         self.game.settings.game_modes.last_bullet = False
-        self.weapons_manager.draw_laser_message = False
         ship_mock.aliens_killed = 5
         self.game.settings.required_kill_count = 5
 
@@ -361,38 +352,26 @@ class WeaponsManagerTest(unittest.TestCase):
         lasers_mock.add.assert_called_once()
         self.assertEqual(ship_mock.aliens_killed, 0)
         self.assertFalse(ship_mock.laser_ready)
-        self.assertFalse(self.weapons_manager.draw_laser_message)
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "fire_laser"
-        )
+        self.game.events.emit.assert_called_once_with(WeaponFired("laser"))
 
         # Case when ship tries to fire the laser and is not ready yet.
-        mock_play_sound.reset_mock()
+        self.game.events.emit.reset_mock()
         ship_mock.aliens_killed = 4
-        self.weapons_manager.draw_laser_message = False
 
         self.weapons_manager._normal_laser(lasers_mock, ship_mock, laser_class_mock)
 
-        self.assertTrue(self.weapons_manager.draw_laser_message)
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "laser_not_ready"
-        )
+        self.game.events.emit.assert_called_once_with(LaserStatus(ready=False))
 
-    @patch("src.managers.player_managers.weapons_manager.play_sound")
-    def test_normal_laser_last_bullet(self, mock_play_sound):
+    def test_normal_laser_last_bullet(self):
         """Test the functionality of the normal laser in the last_bullet game mode."""
         lasers_mock = MagicMock()
         ship_mock = MagicMock()
         laser_class_mock = MagicMock()
         self.game.settings.game_modes.last_bullet = True
-        self.weapons_manager.draw_laser_message = False
 
         self.weapons_manager.fire_laser(lasers_mock, ship_mock, laser_class_mock)
 
-        self.assertTrue(self.weapons_manager.draw_laser_message)
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "laser_not_ready"
-        )
+        self.game.events.emit.assert_called_once_with(LaserStatus(ready=False))
         lasers_mock.add.assert_not_called()
 
     def test_fire_laser(self):
@@ -424,9 +403,8 @@ class WeaponsManagerTest(unittest.TestCase):
         )
         self.weapons_manager._timed_laser.assert_not_called()
 
-    @patch("src.managers.player_managers.weapons_manager.play_sound")
     @patch("src.managers.player_managers.weapons_manager.time.time")
-    def test_update_normal_laser_status_laser_ready(self, mock_time, mock_play_sound):
+    def test_update_normal_laser_status_laser_ready(self, mock_time):
         """Test the update of the laser status when the laser is available."""
         ship_mock = MagicMock()
         self.game.ships = [ship_mock]
@@ -441,9 +419,7 @@ class WeaponsManagerTest(unittest.TestCase):
         self.assertTrue(ship_mock.laser_ready)
         self.assertTrue(ship_mock.laser_ready_msg)
         self.assertEqual(ship_mock.laser_ready_start_time, time.time())
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "laser_ready"
-        )
+        self.game.events.emit.assert_called_once_with(LaserStatus(ready=True))
 
     def test_update_normal_laser_status_laser_not_ready(self):
         """Test the update of the laser status when the laser is not ready."""
@@ -460,9 +436,8 @@ class WeaponsManagerTest(unittest.TestCase):
         self.assertFalse(ship_mock.laser_ready)
         self.assertFalse(ship_mock.laser_ready_msg)
 
-    @patch("src.managers.player_managers.weapons_manager.play_sound")
     @patch("src.managers.player_managers.weapons_manager.time.time")
-    def test_update_timed_laser_status_laser_ready(self, mock_time, mock_play_sound):
+    def test_update_timed_laser_status_laser_ready(self, mock_time):
         """Test the update of the timed laser status when the laser is ready."""
         ship_mock = MagicMock()
         self.game.ships = [ship_mock]
@@ -475,9 +450,7 @@ class WeaponsManagerTest(unittest.TestCase):
 
         self.assertTrue(ship_mock.laser_ready)
         self.assertEqual(ship_mock.laser_ready_start_time, time.time())
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "laser_ready"
-        )
+        self.game.events.emit.assert_called_once_with(LaserStatus(ready=True))
 
     @patch("src.managers.player_managers.weapons_manager.time.time")
     def test_update_timed_laser_status_laser_not_ready(self, mock_time):
@@ -521,106 +494,6 @@ class WeaponsManagerTest(unittest.TestCase):
         self.weapons_manager.update_timed_laser_status.assert_not_called()
         self.weapons_manager.update_normal_laser_status.assert_called_once()
 
-    @patch("pygame.time.get_ticks")
-    @patch("src.managers.player_managers.weapons_manager.display_custom_message")
-    def test_check_laser_availability_laser_ready_cosmic_conflict(
-        self, mock_display_laser, mock_get_ticks
-    ):
-        """Test the check_laser_availability method when in cosmic conflict."""
-        # Mock the necessary attributes and methods
-        ship_mock = MagicMock()
-        self.game.ships = [ship_mock]
-        mock_get_ticks.return_value = 2500
-        self.weapons_manager.draw_laser_message = True
-        self.weapons_manager.display_time = 500
-        self.game.settings.game_modes.cosmic_conflict = True
-        ship_mock.laser_ready = True
-        ship_mock.laser_fired = False
-
-        self.weapons_manager.check_laser_availability()
-
-        mock_display_laser.assert_called_once_with(
-            self.game.screen, "Ready!", ship_mock, cosmic=True
-        )
-        self.assertFalse(self.weapons_manager.draw_laser_message)
-        self.assertEqual(self.weapons_manager.display_time, mock_get_ticks.return_value)
-
-    @patch("pygame.time.get_ticks")
-    @patch("src.managers.player_managers.weapons_manager.display_custom_message")
-    def test_check_laser_availability_laser_not_ready(
-        self, mock_display_laser, mock_get_ticks
-    ):
-        """Test the check_laser availability when the laser is not ready"""
-        ship_mock = MagicMock()
-        self.game.ships = [ship_mock]
-        mock_get_ticks.return_value = 2500
-        self.weapons_manager.draw_laser_message = True
-        self.weapons_manager.display_time = 500
-        self.game.settings.game_modes.cosmic_conflict = False
-        self.game.settings.game_modes.last_bullet = False
-        ship_mock.laser_ready = False
-        ship_mock.laser_fired = True
-
-        self.weapons_manager.check_laser_availability()
-
-        mock_display_laser.assert_called_once_with(
-            self.game.screen, "Not Ready!", ship_mock
-        )
-        self.assertFalse(self.weapons_manager.draw_laser_message)
-        self.assertEqual(self.weapons_manager.display_time, mock_get_ticks.return_value)
-
-    @patch("pygame.time.get_ticks")
-    @patch("src.managers.player_managers.weapons_manager.display_custom_message")
-    def test_check_laser_availability_laser_not_ready_last_bullet(
-        self, mock_display_laser, mock_get_ticks
-    ):
-        """Test the check_laser availability when the laser is not ready in the
-        last bullet game mode.
-        """
-        ship_mock = MagicMock()
-        self.game.ships = [ship_mock]
-        mock_get_ticks.return_value = 2500
-        self.weapons_manager.draw_laser_message = True
-        self.weapons_manager.display_time = 500
-        self.game.settings.game_modes.cosmic_conflict = False
-        self.game.settings.game_modes.last_bullet = True
-        ship_mock.laser_ready = False
-        ship_mock.laser_fired = True
-
-        self.weapons_manager.check_laser_availability()
-
-        mock_display_laser.assert_called_once_with(
-            self.game.screen, "Not available!", ship_mock
-        )
-        self.assertFalse(self.weapons_manager.draw_laser_message)
-        self.assertEqual(self.weapons_manager.display_time, mock_get_ticks.return_value)
-
-    @patch("pygame.time.get_ticks")
-    @patch("src.managers.player_managers.weapons_manager.display_custom_message")
-    def test_check_laser_availability_laser_not_ready_cosmic(
-        self, mock_display_laser, mock_get_ticks
-    ):
-        """Test the check_laser availability when the laser is not ready in the
-        cosmic_conflict game mode.
-        """
-        ship_mock = MagicMock()
-        self.game.ships = [ship_mock]
-        mock_get_ticks.return_value = 2500
-        self.weapons_manager.draw_laser_message = True
-        self.weapons_manager.display_time = 500
-        self.game.settings.game_modes.cosmic_conflict = True
-        self.game.settings.game_modes.last_bullet = False
-        ship_mock.laser_ready = False
-        ship_mock.laser_fired = True
-
-        self.weapons_manager.check_laser_availability()
-
-        mock_display_laser.assert_called_once_with(
-            self.game.screen, "Not Ready!", ship_mock, cosmic=True
-        )
-        self.assertFalse(self.weapons_manager.draw_laser_message)
-        self.assertEqual(self.weapons_manager.display_time, mock_get_ticks.return_value)
-
 
 if __name__ == "__main__":
     unittest.main()
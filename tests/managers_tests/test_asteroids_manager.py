@@ -4,7 +4,7 @@ to handle the asteroids in the game.
 """
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pygame
 
@@ -32,16 +32,18 @@ class TestAsteroidsManager(unittest.TestCase):
         """Test the update of the asteroid."""
         asteroid = MagicMock()
         asteroid.rect.y = 500
-        self.game.settings.screen_height = 400
+        self.game.settings.bounds.rect.bottom = 400
 
         # Create a mock group that behaves like pygame.sprite.Group
         asteroids_group = MagicMock()
-        asteroids_group.copy.return_value = [asteroid]
+        asteroids_group.sprites.return_value = [asteroid]
 
         self.game.asteroids = asteroids_group
 
-        self.asteroids_manager.update_asteroids()
+        with patch("src.managers.asteroids_manager.AsteroidAtlas") as mock_atlas:
+            self.asteroids_manager.update_asteroids()
 
+        mock_atlas.get.return_value.advance.assert_called_once()
         asteroids_group.update.assert_called_once()
         asteroids_group.remove.assert_called_with(asteroid)
 
@@ -0,0 +1,129 @@
+"""
+This module tests the FXManager class that plays the short-lived
+effects of the game.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+import pygame
+
+from src.game_logic.game_events import (
+    AlienKilled,
+    MissileExploded,
+    ShieldHit,
+    ScoreChanged,
+)
+from src.managers.fx_manager import FXManager, build_timeline
+from src.utils.constants import FX_FRAME_RATES
+
+
+class TestFXManager(unittest.TestCase):
+    """Test cases for the FXManager class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.game = MagicMock()
+        self.fx_manager = FXManager(self.game, pool_size=2)
+
+    def test_build_timeline(self):
+        """Test that every frame is shown for the frame rate, centered."""
+        frames = [pygame.Surface((10, 20)), pygame.Surface((30, 40))]
+
+        timeline = build_timeline(frames, 2)
+
+        self.assertEqual(
+            timeline,
+            [
+                (frames[0], (-5, -10)),
+                (frames[0], (-5, -10)),
+                (frames[1], (-15, -20)),
+                (frames[1], (-15, -20)),
+            ],
+        )
+
+    def test_handle_events(self):
+        """Test that the events with a position start an effect."""
+        self.fx_manager.spawn = MagicMock()
+
+        self.fx_manager.handle_events(
+            [
+                AlienKilled("thunderbird", position=(10, 10)),
+                AlienKilled("phoenix", boss=True, position=(20, 20)),
+                MissileExploded(position=(30, 30)),
+                MissileExploded("phoenix"),
+                ShieldHit("bullet", (40, 40)),
+                ScoreChanged(),
+            ]
+        )
+
+        self.assertEqual(
+            [call.args for call in self.fx_manager.spawn.call_args_list],
+            [
+                ("alien_destroyed", (10, 10)),
+                ("boss_explosion", (20, 20)),
+                ("missile_explosion", (30, 30)),
+                ("shield_pop", (40, 40)),
+            ],
+        )
+
+    def test_update(self):
+        """Test that finished effects go back to the pool."""
+        self.fx_manager.spawn("alien_destroyed", (100, 100))
+        self.assertEqual(len(self.fx_manager.pool), 1)
+
+        duration = len(self.fx_manager.timelines["alien_destroyed"])
+        for _ in range(duration - 1):
+            self.fx_manager.update()
+        self.assertEqual(len(self.fx_manager.active), 1)
+
+        self.fx_manager.update()
+        self.assertEqual(self.fx_manager.active, [])
+        self.assertEqual(len(self.fx_manager.pool), 2)
+
+    def test_spawn_reuses_oldest(self):
+        """Test that the oldest effect is reused when the pool is empty."""
+        self.fx_manager.spawn("alien_destroyed", (0, 0))
+        oldest = self.fx_manager.active[0]
+        self.fx_manager.spawn("shield_pop", (0, 0))
+
+        self.fx_manager.spawn("missile_explosion", (50, 60))
+
+        self.assertEqual(len(self.fx_manager.active), 2)
+        self.assertIs(self.fx_manager.active[-1], oldest)
+        self.assertIs(oldest.timeline, self.fx_manager.timelines["missile_explosion"])
+        self.assertEqual(oldest.tick, 0)
+
+    def test_draw(self):
+        """Test that the effects are drawn in one batch."""
+        self.fx_manager.draw()
+        self.game.screen.blits.assert_not_called()
+
+        self.fx_manager.spawn("alien_destroyed", (100, 100))
+        self.fx_manager.spawn("missile_explosion", (200, 200))
+
+        self.fx_manager.draw()
+
+        self.game.screen.blits.assert_called_once_with(
+            [effect.blit_args() for effect in self.fx_manager.active],
+            doreturn=False,
+        )
+        image, position = self.fx_manager.active[0].blit_args()
+        self.assertEqual(image.get_rect(topleft=position).center, (100, 100))
+
+    def test_clear(self):
+        """Test that clear stops every effect."""
+        self.fx_manager.spawn("alien_destroyed", (0, 0))
+
+        self.fx_manager.clear()
+
+        self.assertEqual(self.fx_manager.active, [])
+        self.assertEqual(len(self.fx_manager.pool), 2)
+
+    def test_timelines(self):
+        """Test that every kind of effect has a timeline."""
+        self.assertEqual(set(self.fx_manager.timelines), set(FX_FRAME_RATES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ behaviors.
 """
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pygame
 
@@ -129,10 +129,9 @@ class TestEndGameManager(unittest.TestCase):
         already played before."""
         self.game.ui_options.game_over_sound_played = True
 
-        with patch("src.managers.game_over_manager.play_music") as mock_play_music:
-            self.end_game_manager._play_game_over_sound()
+        self.end_game_manager._play_game_over_sound()
 
-        mock_play_music.assert_not_called()
+        self.game.sound_manager.play_menu_music.assert_not_called()
 
     def test_play_game_over_sound_first_time(self):
         """Test the play game over sound when the sound
@@ -141,17 +140,30 @@ class TestEndGameManager(unittest.TestCase):
         self.game.ui_options.game_over_sound_played = False
         self.end_game_manager.ending_music = "game_over"
 
-        with patch("src.managers.game_over_manager.play_music") as mock_play_music:
-            self.end_game_manager._play_game_over_sound()
+        self.end_game_manager._play_game_over_sound()
 
-        mock_play_music.assert_called_with(
-            self.game.sound_manager.menu_music, "game_over"
-        )
+        self.game.sound_manager.play_menu_music.assert_called_with("game_over")
         self.assertEqual(self.game.ui_options.game_over_sound_played, True)
+
+    def test_check_high_score_saved(self):
+        """Test that the match is recorded before the high score is saved,
+        once per game over.
+        """
+        self.game.high_score_manager = MagicMock()
+        self.game.ui_options.high_score_saved = False
+        self.settings.game_modes.game_mode = "endless_onslaught"
+
+        self.end_game_manager._check_high_score_saved()
+        self.end_game_manager._check_high_score_saved()
+
         self.assertEqual(
-            self.game.sound_manager.current_sound,
-            self.game.sound_manager.menu_music["game_over"],
+            self.game.high_score_manager.method_calls,
+            [
+                call.record_match("endless_scores"),
+                call.save_high_score("endless_scores"),
+            ],
         )
+        self.assertTrue(self.game.ui_options.high_score_saved)
 
     def test_set_game_end_position(self):
         """Test te positioning of the ending text on screen."""
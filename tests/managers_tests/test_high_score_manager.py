@@ -24,32 +24,16 @@ class HighScoreManagerTest(unittest.TestCase):
         self.assertEqual(self.hs_manager.screen, self.game.screen)
         self.assertEqual(self.hs_manager.high_scores_file, "high_score.json")
 
-    @patch("builtins.open")
-    @patch("json.load")
-    @patch("json.dump")
     @patch("src.managers.high_score_manager.get_player_name")
-    def test_save_high_score(
-        self, mock_get_player_name, mock_json_dump, mock_json_load, mock_open
-    ):
+    def test_save_high_score(self, mock_get_player_name):
         """Test the saving of the high score."""
         mock_get_player_name.return_value = "Ake"
-        mock_open.return_value.__enter__.return_value = (
-            mock_open  # Mock the file object
-        )
-
-        # Set up the necessary mock objects and values
-        high_scores = {"score_key": []}
-        mock_json_load.return_value = high_scores
+        self.hs_manager.store = MagicMock()
+        self.hs_manager.store.has_name.return_value = False
 
         self.game.stats.high_score = 100
         self.hs_manager.save_high_score("score_key")
 
-        # Verify that the file was opened and read
-        mock_open.has_any_call(self.hs_manager.high_scores_file, "r", encoding="utf-8")
-
-        # Verify that json.load was called with the opened file
-        mock_json_load.assert_called_once_with(mock_open)
-
         # Verify that get_player_name was called
         mock_get_player_name.assert_called_once_with(
             self.game.screen,
@@ -58,48 +42,120 @@ class HighScoreManagerTest(unittest.TestCase):
             self.game.stats.high_score,
             self.game.settings.game_end_img,
             self.game.settings.game_end_rect,
+            self.game.display_manager,
+        )
+
+        # Verify that the high score entry was added to the store
+        self.hs_manager.store.add_score.assert_called_once_with(
+            self.hs_manager.high_scores_file,
+            "score_key",
+            "Ake",
+            100,
         )
 
-        # Verify that the high score entry was added or updated
-        expected_entry = {"name": "Ake", "score": 100}
-        self.assertIn(expected_entry, high_scores["score_key"])
+    @patch("src.managers.high_score_manager.display_message")
+    @patch("src.managers.high_score_manager.get_player_name")
+    def test_save_high_score_existing_name(
+        self, mock_get_player_name, mock_display_message
+    ):
+        """Test that an existing name asks for another name."""
+        mock_get_player_name.side_effect = ["Ake", ""]
+        self.hs_manager.store = MagicMock()
+        self.hs_manager.store.has_name.side_effect = [True, False]
+
+        self.game.stats.high_score = 100
+        self.hs_manager.save_high_score("score_key")
 
-        # Verify that the file was opened for writing and the data was dumped
-        mock_open.assert_called_with(
-            self.hs_manager.high_scores_file, "w", encoding="utf-8"
+        mock_display_message.assert_called_once()
+        self.hs_manager.store.add_score.assert_called_once_with(
+            self.hs_manager.high_scores_file,
+            "score_key",
+            "Player",
+            100,
         )
-        mock_json_dump.assert_called_once_with(high_scores, mock_open)
 
-    @patch("builtins.open")
-    @patch("json.load")
-    @patch("json.dump")
-    def test_delete_high_scores(self, mock_json_dump, mock_json_load, mock_open):
-        """Test the delete_high_scores method."""
-        mock_open.return_value.__enter__.return_value = (
-            mock_open  # Mock the file object
+    @patch("src.managers.high_score_manager.get_player_name")
+    def test_record_match(self, mock_get_player_name):
+        """Test that every finished match is recorded, without a high score
+        or a player name.
+        """
+        self.hs_manager.store = MagicMock()
+        self.hs_manager.get_match_details = MagicMock()
+        self.game.stats.high_score = 0
+        self.game.stats.thunderbird_score = 300
+        self.game.stats.phoenix_score = 200
+
+        self.hs_manager.record_match("score_key")
+
+        self.hs_manager.store.record_match.assert_called_once_with(
+            self.hs_manager.high_scores_file,
+            "score_key",
+            500,
+            self.hs_manager.get_match_details.return_value,
         )
+        mock_get_player_name.assert_not_called()
+
+    def test_save_high_score_no_score(self):
+        """Test that a score of zero is not saved."""
+        self.hs_manager.store = MagicMock()
+        self.game.stats.high_score = 0
 
-        # Set up the necessary mock objects
-        high_scores = {"score_key1": [], "score_key2": []}
-        mock_json_load.return_value = high_scores
+        self.hs_manager.save_high_score("score_key")
+
+        self.hs_manager.store.add_score.assert_not_called()
+
+    @patch("src.managers.high_score_manager.pygame.time.get_ticks")
+    def test_get_match_details(self, mock_get_ticks):
+        """Test the get_match_details method."""
+        mock_get_ticks.return_value = 95000
+        # The pause time is reset by the timed weapons and powers.
+        self.game.pause_time = 0
+        self.game.match_pause_time = 15000
+        self.game.match_start_time = 20000
+        self.game.settings.difficulty = "MEDIUM"
+        self.game.stats.level = 7
+        self.game.thunderbird_ship.ship_name = "Thunderbird_2"
+        self.game.phoenix_ship.ship_name = "Phoenix_1"
+
+        details = self.hs_manager.get_match_details()
+
+        self.assertEqual(
+            details,
+            {
+                "ship": "Thunderbird_2, Phoenix_1",
+                "difficulty": "MEDIUM",
+                "level": 7,
+                "duration": 60.0,
+            },
+        )
+
+        self.game.singleplayer = True
+        self.game.settings.difficulty = "HARD"
+        details = self.hs_manager.get_match_details()
+
+        self.assertEqual(details["ship"], "Thunderbird_2")
+        self.assertEqual(details["difficulty"], "HARD")
+
+    def test_delete_high_scores(self):
+        """Test the delete_high_scores method."""
+        self.hs_manager.store = MagicMock()
 
-        # Delete the high scores for the "score_key1"
         self.hs_manager.delete_high_scores("score_key1")
 
-        # Verify that the file was opened and read
-        mock_open.has_any_call(self.hs_manager.high_scores_file, "r", encoding="utf-8")
+        self.hs_manager.store.delete_scores.assert_called_once_with(
+            self.hs_manager.high_scores_file, "score_key1"
+        )
 
-        # Verify that json.load was called with the opened file
-        mock_json_load.assert_called_once_with(mock_open)
+    def test_get_scores(self):
+        """Test the get_scores method."""
+        self.hs_manager.store = MagicMock()
 
-        # Verify that the high scores for "score_key1" were deleted
-        self.assertNotIn("score_key1", high_scores)
+        scores = self.hs_manager.get_scores("score_key")
 
-        # Verify that the file was opened for writing and the data was dumped
-        mock_open.assert_called_with(
-            self.hs_manager.high_scores_file, "w", encoding="utf-8"
+        self.hs_manager.store.get_scores.assert_called_once_with(
+            self.hs_manager.high_scores_file, "score_key"
         )
-        mock_json_dump.assert_called_once_with(high_scores, mock_open)
+        self.assertEqual(scores, self.hs_manager.store.get_scores.return_value)
 
     def test_update_high_score_filename(self):
         """Test the update_high_score_filename method."""
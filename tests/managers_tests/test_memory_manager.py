@@ -0,0 +1,137 @@
+"""
+This module tests the MemoryManager class that samples the memory of the
+game and flags what keeps growing.
+"""
+
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.managers.memory_manager import (
+    COUNTED_CLASSES,
+    MemoryManager,
+    count_live_objects,
+    get_growing,
+)
+from src.utils.constants import MEMORY_GROWTH_SAMPLES, MEMORY_SAMPLE_INTERVAL
+
+
+class Thing:
+    """A class whose instances are counted."""
+
+
+class SmallThing(Thing):
+    """A subclass of Thing."""
+
+
+class MemoryManagerTest(unittest.TestCase):
+    """Test cases for the MemoryManager class."""
+
+    def setUp(self):
+        """Set up a game and a fake clock."""
+        self.game = MagicMock()
+        self.game.stats.level = 3
+        self.game.settings.game_modes.game_mode = "endless_onslaught"
+        self.writer = MagicMock()
+
+        self.ticks = 0
+        ticks_patch = patch(
+            "src.managers.memory_manager.pygame.time.get_ticks",
+            side_effect=lambda: self.ticks,
+        )
+        ticks_patch.start()
+        self.addCleanup(ticks_patch.stop)
+
+    def make_manager(self, enabled=False):
+        """Return a MemoryManager writing to the mocked writer."""
+        return MemoryManager(self.game, enabled=enabled, writer=self.writer)
+
+    def test_count_live_objects(self):
+        """Test that the instances of the counted classes are counted."""
+        things = [Thing(), SmallThing(), SmallThing()]
+        surfaces = [pygame.Surface((1, 1)) for _ in range(3)]
+
+        with patch.dict(COUNTED_CLASSES, {"Thing": Thing}, clear=True):
+            counts = count_live_objects()
+
+        self.assertEqual(counts["Thing"], len(things))
+        self.assertGreaterEqual(counts["Surface"], len(surfaces))
+
+    def test_get_growing(self):
+        """Test that only the counts that always grew are returned."""
+        samples = [
+            {"Alien": 10, "Missile": 1},
+            {"Alien": 12, "Missile": 3},
+            {"Alien": 15, "Missile": 3},
+        ]
+
+        self.assertEqual(get_growing(samples), ["Alien"])
+        self.assertEqual(get_growing(samples[:1]), [])
+
+    def test_update_waits_for_interval(self):
+        """Test that the samples are taken once per interval."""
+        memory = self.make_manager(enabled=True)
+        memory.sample = MagicMock()
+
+        self.ticks = MEMORY_SAMPLE_INTERVAL - 1
+        memory.update()
+        memory.sample.assert_not_called()
+
+        self.ticks = MEMORY_SAMPLE_INTERVAL
+        memory.update()
+        memory.sample.assert_called_once()
+
+    @patch("src.managers.memory_manager.count_live_objects")
+    def test_sample_flags_growth(self, count_live_objects_mock):
+        """Test that the counts that kept growing are flagged."""
+        count_live_objects_mock.side_effect = [
+            {"Alien": 50 + number, "Missile": 2}
+            for number in range(MEMORY_GROWTH_SAMPLES)
+        ]
+        memory = self.make_manager()
+
+        records = [memory.sample() for _ in range(MEMORY_GROWTH_SAMPLES)]
+
+        self.assertNotIn("growing", records[-2])
+        self.assertEqual(records[-1]["growing"], ["Alien"])
+        self.assertEqual(records[-1]["level"], 3)
+        self.assertEqual(records[-1]["mode"], "endless_onslaught")
+        self.assertEqual(self.writer.write.call_count, MEMORY_GROWTH_SAMPLES)
+
+    @patch("src.managers.memory_manager.count_live_objects")
+    def test_sample_top_allocations(self, count_live_objects_mock):
+        """Test that the lines that allocated the most are recorded with
+        the growth when tracemalloc is on."""
+        count_live_objects_mock.side_effect = [
+            {"Alien": number} for number in range(MEMORY_GROWTH_SAMPLES)
+        ]
+        was_tracing = tracemalloc.is_tracing()
+        memory = self.make_manager(enabled=True)
+        if not was_tracing:
+            self.addCleanup(tracemalloc.stop)
+
+        kept = []
+        for _ in range(MEMORY_GROWTH_SAMPLES):
+            kept.append(bytearray(10_000))
+            record = memory.sample()
+
+        self.assertTrue(tracemalloc.is_tracing())
+        self.assertIn("Alien", record["growing"])
+        self.assertTrue(record["top_allocations"])
+
+    def test_disabled(self):
+        """Test that nothing is traced or sampled when profiling is off."""
+        memory = MemoryManager(self.game, enabled=False)
+        memory.sample = MagicMock()
+        self.ticks = MEMORY_SAMPLE_INTERVAL * 2
+
+        memory.update()
+
+        self.assertIsNone(memory.writer)
+        memory.sample.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
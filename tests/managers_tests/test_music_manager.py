@@ -0,0 +1,149 @@
+"""
+This module tests the MusicManager class that plays the level music
+and handles the transitions between tracks.
+"""
+
+import unittest
+from unittest.mock import patch, mock_open
+
+from src.managers.music_manager import MusicManager
+
+
+class MusicManagerTests(unittest.TestCase):
+    """Test cases for the MusicManager class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.music_patch = patch("src.managers.music_manager.pygame.mixer.music")
+        self.mock_music = self.music_patch.start()
+        self.mock_music.get_busy.return_value = False
+        self.music_manager = MusicManager(fade_ms=500)
+        self.music_dict = {range(1, 3): "first", range(3, 10): "second"}
+
+    def tearDown(self):
+        """Clean up the patches."""
+        self.music_patch.stop()
+
+    def test_level_index(self):
+        """Test that every level is mapped to its track."""
+        index = self.music_manager.level_index(self.music_dict)
+
+        self.assertEqual(index[1], "first")
+        self.assertEqual(index[2], "first")
+        self.assertEqual(index[3], "second")
+        self.assertNotIn(10, index)
+
+    def test_level_index_is_cached(self):
+        """Test that the index is only built once per music dict."""
+        index = self.music_manager.level_index(self.music_dict)
+
+        self.assertIs(self.music_manager.level_index(self.music_dict), index)
+
+    def test_track_for_level(self):
+        """Test the track lookup for a level."""
+        self.assertEqual(
+            self.music_manager.track_for_level(self.music_dict, 5), "second"
+        )
+        self.assertIsNone(self.music_manager.track_for_level(self.music_dict, 50))
+
+    def test_play_when_idle(self):
+        """Test that a track starts right away when no music is playing."""
+        self.music_manager.play("first")
+
+        self.mock_music.load.assert_called_once_with("first")
+        self.mock_music.play.assert_called_once_with(-1, fade_ms=500)
+        self.assertEqual(self.music_manager.current_track, "first")
+
+    def test_play_when_busy(self):
+        """Test that the current track is faded out before the next one starts."""
+        self.mock_music.get_busy.return_value = True
+
+        self.music_manager.play("second")
+
+        self.mock_music.fadeout.assert_called_once_with(500)
+        self.mock_music.load.assert_not_called()
+        self.assertEqual(self.music_manager.pending_track, "second")
+
+    def test_play_now(self):
+        """Test that a track starts right away and the pending one is dropped."""
+        self.mock_music.get_busy.return_value = True
+        self.music_manager.pending_track = "second"
+
+        self.music_manager.play_now("menu")
+
+        self.mock_music.fadeout.assert_not_called()
+        self.mock_music.load.assert_called_once_with("menu")
+        self.assertEqual(self.music_manager.current_track, "menu")
+        self.assertIsNone(self.music_manager.pending_track)
+
+        self.music_manager.pending_track = "second"
+        self.music_manager.play_now(None)
+
+        self.assertEqual(self.mock_music.load.call_count, 1)
+        self.assertIsNone(self.music_manager.pending_track)
+
+    def test_update_starts_pending_track(self):
+        """Test that the pending track starts once the fade out is done."""
+        self.music_manager.pending_track = "second"
+        self.mock_music.get_busy.return_value = True
+
+        self.music_manager.update()
+        self.mock_music.load.assert_not_called()
+
+        self.mock_music.get_busy.return_value = False
+        self.music_manager.update()
+
+        self.mock_music.load.assert_called_once_with("second")
+        self.assertIsNone(self.music_manager.pending_track)
+        self.assertEqual(self.music_manager.current_track, "second")
+
+    def test_start_uses_preloaded_data(self):
+        """Test that preloaded track data is played from memory."""
+        self.music_manager.preloaded["second"] = b"data"
+
+        self.music_manager.play("second")
+
+        buffer, namehint = self.mock_music.load.call_args[0]
+        self.assertEqual(buffer.read(), b"data")
+        self.assertEqual(namehint, "second")
+        self.assertNotIn("second", self.music_manager.preloaded)
+
+    def test_read_track(self):
+        """Test that reading a track keeps only the latest preload."""
+        self.music_manager.preloaded["first"] = b"old"
+
+        with patch("builtins.open", mock_open(read_data=b"new")):
+            self.music_manager._read_track("second")
+
+        self.assertEqual(self.music_manager.preloaded, {"second": b"new"})
+
+    def test_read_track_missing_file(self):
+        """Test that a missing track file is ignored."""
+        with patch("builtins.open", side_effect=OSError):
+            self.music_manager._read_track("missing")
+
+        self.assertEqual(self.music_manager.preloaded, {})
+
+    @patch("src.managers.music_manager.threading.Thread")
+    def test_preload(self, mock_thread):
+        """Test that preloading starts a background thread."""
+        self.music_manager.preload("second")
+
+        mock_thread.assert_called_once_with(
+            target=self.music_manager._read_track, args=("second",), daemon=True
+        )
+        mock_thread.return_value.start.assert_called_once()
+
+    @patch("src.managers.music_manager.threading.Thread")
+    def test_preload_skips_current_track(self, mock_thread):
+        """Test that the current or missing tracks are not preloaded."""
+        self.music_manager.current_track = "first"
+
+        self.music_manager.preload("first")
+        self.music_manager.preload(None)
+
+        mock_thread.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
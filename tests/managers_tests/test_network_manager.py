@@ -0,0 +1,228 @@
+"""
+This module tests the NetHost and NetClient classes that play
+Cosmic Conflict over the network, using sockets on localhost.
+"""
+
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pygame
+
+from src.game_logic.input_handling import PlayerInput
+from src.managers.network_manager import NetClient, NetHost
+from src.utils.game_dataclasses import ShipStates
+from src.utils.net_format import BULLET, MISSILE, encode_input
+from src.utils.net_link import LinkSimulator
+
+
+def make_game():
+    """Return a game with the ships and the projectiles of Cosmic Conflict."""
+    game = MagicMock()
+    for ship_type, x_pos in (("thunderbird", 10), ("phoenix", 1200)):
+        ship = MagicMock()
+        ship.ship_type = ship_type
+        ship.rect = pygame.Rect(x_pos, 350, 40, 40)
+        ship.state = ShipStates()
+        ship.missiles_num = 3
+        ship.moving_flags = {"right": False, "left": False, "up": False, "down": False}
+        setattr(game, f"{ship_type}_ship", ship)
+        for group_name in ("bullets", "missiles", "laser"):
+            setattr(game, f"{ship_type}_{group_name}", pygame.sprite.Group())
+    game.stats = SimpleNamespace(
+        thunderbird_hp=3, phoenix_hp=3, thunderbird_score=0, phoenix_score=0
+    )
+    game.player_input = PlayerInput(game, game.ui_options)
+    return game
+
+
+def add_projectile(group, x_pos, y_pos):
+    """Add a projectile at the given position to a group."""
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(x_pos, y_pos, 5, 10)
+    group.add(sprite)
+    return sprite
+
+
+def wait_until(condition, timeout=1.0):
+    """Wait for the packets on localhost until the condition is met."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class NetworkManagerTest(unittest.TestCase):
+    """Test cases for the NetHost and NetClient classes."""
+
+    def setUp(self):
+        """Set up a host and a client on localhost."""
+        self.host_game = make_game()
+        self.client_game = make_game()
+        self.host = NetHost(self.host_game)
+        self.client = NetClient(self.client_game, self.host.endpoint.address)
+
+    def tearDown(self):
+        self.host.close()
+        self.client.close()
+
+    def connect(self):
+        """Send inputs to the host until one of them arrives."""
+        wait_until(
+            lambda: self.client.send_input(0)
+            or self.host.receive_inputs()
+            or self.host.client_address is not None
+        )
+
+    def exchange(self):
+        """Send a snapshot to the client and an input back."""
+        self.host.send_snapshot()
+        wait_until(self.client.receive_snapshots)
+        self.client.send_input(0)
+        wait_until(lambda: self.host.receive_inputs() or self.host.acked_tick)
+
+    def test_inputs_reach_host(self):
+        """Test that the inputs of the client control the Phoenix."""
+        self.host_game.weapons_manager = MagicMock()
+        phoenix = self.host_game.phoenix_ship
+
+        self.client.send_input(1 | 16)
+        self.client.send_input(1 | 16 | 32)
+        self.client.send_input(2)
+        wait_until(lambda: self.host.receive_inputs() or self.host.last_input == 3)
+
+        self.assertEqual(self.host.client_address, self.client.endpoint.address)
+        self.assertTrue(phoenix.moving_flags["left"])
+        self.assertFalse(phoenix.moving_flags["right"])
+        self.assertFalse(phoenix.state.firing)
+        # Every packet repeats the missile, it is only fired once.
+        self.host_game.weapons_manager.fire_missile.assert_called_once()
+
+    def test_snapshot_reaches_client(self):
+        """Test that the client gets the ships and projectiles of the host."""
+        self.connect()
+        self.host_game.thunderbird_ship.rect.topleft = (60, 200)
+        self.host_game.stats.phoenix_score = 1500
+        self.host_game.phoenix_ship.state.shielded = True
+        add_projectile(self.host_game.thunderbird_bullets, 100, 300)
+        add_projectile(self.host_game.phoenix_missiles, 900, 320)
+
+        self.exchange()
+        self.client.apply_snapshot()
+
+        thunderbird = self.client_game.thunderbird_ship
+        self.assertEqual(thunderbird.rect.topleft, (60, 200))
+        self.assertEqual((thunderbird.x_pos, thunderbird.y_pos), (60.0, 200.0))
+        self.assertEqual(self.client_game.stats.phoenix_score, 1500)
+        self.assertTrue(self.client_game.phoenix_ship.state.shielded)
+        self.assertCountEqual(
+            self.client.get_projectiles(),
+            [(BULLET, "thunderbird", (100, 300)), (MISSILE, "phoenix", (900, 320))],
+        )
+
+    def test_ship_destroyed(self):
+        """Test that the snapshot of a destroyed ship reaches the client."""
+        self.connect()
+        self.host_game.stats.phoenix_hp = -1
+        self.host_game.phoenix_ship.state.alive = False
+
+        self.exchange()
+        self.client.apply_snapshot()
+
+        self.assertEqual(self.client_game.stats.phoenix_hp, -1)
+        self.assertFalse(self.client_game.phoenix_ship.state.alive)
+
+    def test_delta_snapshots(self):
+        """Test that the snapshots after an acknowledged one only hold
+        the changes, and the projectiles that were removed.
+        """
+        self.connect()
+        bullet = add_projectile(self.host_game.thunderbird_bullets, 100, 300)
+        add_projectile(self.host_game.phoenix_bullets, 900, 300)
+        self.exchange()
+        self.assertEqual(self.host.acked_tick, 1)
+
+        bullet.kill()
+        self.host_game.phoenix_ship.rect.y = 400
+        self.host.send_snapshot()
+        wait_until(self.client.receive_snapshots)
+
+        self.assertEqual(self.client.tick, 2)
+        self.assertEqual(self.client.entities, self.host.history[2])
+        self.assertEqual(len(self.client.get_projectiles()), 1)
+
+    def test_lossy_link(self):
+        """Test that the client catches up with the host on a link that
+        loses and reorders packets.
+        """
+        self.host.endpoint = LinkSimulator(
+            self.host.endpoint, latency=0.002, jitter=0.002, loss=0.3, seed=3
+        )
+        self.client.endpoint = LinkSimulator(
+            self.client.endpoint, latency=0.002, jitter=0.002, loss=0.3, seed=4
+        )
+        self.connect()
+        bullets = self.host_game.thunderbird_bullets
+
+        for tick in range(60):
+            add_projectile(bullets, tick, 600)
+            for bullet in bullets:
+                bullet.rect.y -= 10
+            self.host.receive_inputs()
+            self.host.send_snapshot()
+            time.sleep(0.001)
+            self.client.receive_snapshots()
+            self.client.send_input(tick % 2)
+
+        def caught_up():
+            # The delayed packets are sent when the simulated link is used.
+            self.host.endpoint.flush()
+            self.client.receive_snapshots()
+            return self.client.tick == self.host.tick
+
+        self.host.endpoint.loss = self.client.endpoint.loss = 0
+        for _ in range(5):
+            self.host.receive_inputs()
+            self.host.send_snapshot()
+            wait_until(caught_up)
+            self.client.send_input(0)
+            time.sleep(0.005)
+
+        self.assertGreater(self.host.endpoint.dropped, 0)
+        self.assertEqual(self.client.tick, self.host.tick)
+        self.assertEqual(self.client.entities, self.host.capture())
+
+
+class NetHostTest(unittest.TestCase):
+    """Test cases for the NetHost class without a client."""
+
+    def test_no_snapshot_without_client(self):
+        """Test that nothing is sent before a client connected."""
+        endpoint = MagicMock()
+        host = NetHost(make_game(), endpoint)
+
+        host.send_snapshot()
+
+        endpoint.send.assert_not_called()
+        self.assertEqual(host.tick, 0)
+
+    def test_ignores_other_addresses(self):
+        """Test that only the first client controls the Phoenix."""
+        endpoint = MagicMock()
+        endpoint.receive.return_value = [
+            (encode_input(0, 1, [0]), ("127.0.0.1", 1000)),
+            (encode_input(0, 2, [1, 1]), ("127.0.0.1", 2000)),
+            (b"\x01\x00", ("127.0.0.1", 1000)),
+        ]
+        game = make_game()
+        host = NetHost(game, endpoint)
+
+        host.receive_inputs()
+
+        self.assertEqual(host.client_address, ("127.0.0.1", 1000))
+        self.assertFalse(game.phoenix_ship.moving_flags["right"])
+        self.assertEqual(host.last_input, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ import time
 import unittest
 from unittest.mock import MagicMock, patch, call
 
+from src.game_logic.game_events import PowerCollected, ScoreChanged, AmmoChanged
 from src.managers.powers_manager import PowerEffectsManager
 
 
@@ -64,13 +65,13 @@ class TestPowerEffectsManager(unittest.TestCase):
 
     def test_update_powers(self):
         """Test the update of the powers."""
-        self.game.settings.screen_height = 700
+        self.game.settings.bounds.rect.bottom = 700
         power1 = MagicMock()
         power2 = MagicMock()
         power1.rect.y = 50
         power2.rect.y = 2000
 
-        self.game.powers.copy.return_value = [power1, power2]
+        self.game.powers.sprites.return_value = [power1, power2]
 
         self.power_effects_manager.update_powers()
 
@@ -89,8 +90,7 @@ class TestPowerEffectsManager(unittest.TestCase):
         self.power_effects_manager.create_power_up_or_penalty()
         self.assertEqual(self.game.powers.add.call_count, 2)
 
-    @patch("src.managers.powers_manager.play_sound")
-    def test_weapon_power_up(self, mock_play_sound):
+    def test_weapon_power_up(self):
         """Test the weapon power up."""
         self.power_effects_manager.weapon_power_up("phoenix", "fire_bullet")
 
@@ -98,9 +98,8 @@ class TestPowerEffectsManager(unittest.TestCase):
             "phoenix", "fire_bullet"
         )
 
-        # Check if the appropriate sound effect was played
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "weapon"
+        self.game.events.emit.assert_called_once_with(
+            PowerCollected("phoenix", "weapon")
         )
 
     def test_freeze_enemies(self):
@@ -115,8 +114,7 @@ class TestPowerEffectsManager(unittest.TestCase):
         for alien in mock_aliens:
             alien.freeze.assert_called_once()
 
-    @patch("src.managers.powers_manager.play_sound")
-    def test_health_power_up(self, mock_play_sound):
+    def test_health_power_up(self):
         """Test the health power-up."""
         player = "thunderbird"
 
@@ -126,22 +124,19 @@ class TestPowerEffectsManager(unittest.TestCase):
         self.power_effects_manager.health_power_up(player)
 
         self.assertEqual(self.game.stats.thunderbird_hp, 5)
-        self.power_effects_manager.score_board.create_health.assert_called_once()
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "health"
+        self.game.events.emit.assert_called_once_with(
+            PowerCollected(player, "health")
         )
 
-        self.power_effects_manager.score_board.create_health.reset_mock()
-        mock_play_sound.reset_mock()
+        self.game.events.emit.reset_mock()
 
         # Test if the hp remains the same when it reached the max value.
         self.power_effects_manager.health_power_up(player)
         self.assertEqual(self.game.stats.thunderbird_hp, 5)
 
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "health"
+        self.game.events.emit.assert_called_once_with(
+            PowerCollected(player, "health")
         )
-        self.power_effects_manager.score_board.create_health.assert_called_once()
 
     def test_update_power_choices(self):
         """Test the update_power_choices method."""
@@ -156,7 +151,7 @@ class TestPowerEffectsManager(unittest.TestCase):
     def test_apply_powerup_or_penalty(self):
         """Test the apply power up or penalty for the other power ups."""
         self.power_effects_manager._check_power_name = MagicMock()
-        self.power_effects_manager._play_power_sound = MagicMock()
+        self.power_effects_manager._emit_power_collected = MagicMock()
         self.power_effects_manager.increase_ship_speed = MagicMock()
         player = "thunderbird"
 
@@ -169,32 +164,31 @@ class TestPowerEffectsManager(unittest.TestCase):
             mock_choice.return_value, player
         )
         self.power_effects_manager.increase_ship_speed.assert_called_once_with(player)
-        self.power_effects_manager._play_power_sound.assert_called_once_with(
+        self.power_effects_manager._emit_power_collected.assert_called_once_with(
+            player,
             mock_choice.return_value,
             self.power_effects_manager.powerup_choices,
             self.power_effects_manager.penalty_choices,
         )
 
-    @patch("src.managers.powers_manager.play_sound")
-    def test_play_power_sound_penalty(self, mock_play_sound):
-        """Test the play_power_sound method for the penalties."""
+    def test_emit_power_collected_penalty(self):
+        """Test the _emit_power_collected method for the penalties."""
         mock_disarm_ship = MagicMock(name="disarm_ship")
         self.power_effects_manager.disarm_ship = mock_disarm_ship
         penalty_choices = [self.power_effects_manager.disarm_ship]
         powerup_choices = MagicMock()
 
         mock_choice = mock_disarm_ship
-        self.power_effects_manager._play_power_sound(
-            mock_choice, powerup_choices, penalty_choices
+        self.power_effects_manager._emit_power_collected(
+            "thunderbird", mock_choice, powerup_choices, penalty_choices
         )
 
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "penalty"
+        self.game.events.emit.assert_called_once_with(
+            PowerCollected("thunderbird", "penalty")
         )
 
-    @patch("src.managers.powers_manager.play_sound")
-    def test_play_power_sound_freeze(self, mock_play_sound):
-        """Test the play_power_sound method for the penalties."""
+    def test_emit_power_collected_freeze(self):
+        """Test the _emit_power_collected method for the penalties."""
         mock_freeze_enemies = MagicMock(name="freeze_enemies")
         mock_freeze_enemies.__name__ = "freeze_enemies"
         self.power_effects_manager.freeze_enemies = mock_freeze_enemies
@@ -203,17 +197,16 @@ class TestPowerEffectsManager(unittest.TestCase):
 
         mock_choice = mock_freeze_enemies
 
-        self.power_effects_manager._play_power_sound(
-            mock_choice, powerup_choices, penalty_choices
+        self.power_effects_manager._emit_power_collected(
+            "thunderbird", mock_choice, powerup_choices, penalty_choices
         )
 
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "freeze"
+        self.game.events.emit.assert_called_once_with(
+            PowerCollected("thunderbird", "freeze")
         )
 
-    @patch("src.managers.powers_manager.play_sound")
-    def test_play_power_sound_power_up(self, mock_play_sound):
-        """Test the play_power_sound method for the power ups."""
+    def test_emit_power_collected_power_up(self):
+        """Test the _emit_power_collected method for the power ups."""
         mock_increase_ship_speed = MagicMock(name="increase_ship_speed")
         mock_increase_ship_speed.__name__ = "increase_ship_speed"
         self.power_effects_manager.increase_ship_speed = mock_increase_ship_speed
@@ -222,12 +215,12 @@ class TestPowerEffectsManager(unittest.TestCase):
 
         mock_choice = mock_increase_ship_speed
 
-        self.power_effects_manager._play_power_sound(
-            mock_choice, powerup_choices, penalty_choices
+        self.power_effects_manager._emit_power_collected(
+            "thunderbird", mock_choice, powerup_choices, penalty_choices
         )
 
-        mock_play_sound.assert_called_once_with(
-            self.game.sound_manager.game_sounds, "power_up"
+        self.game.events.emit.assert_called_once_with(
+            PowerCollected("thunderbird", "power_up")
         )
 
     def test__check_power_name(self):
@@ -482,8 +475,7 @@ class TestPowerEffectsManager(unittest.TestCase):
         self.power_effects_manager.bonus_points(player)
 
         self.assertEqual(self.game.stats.thunderbird_score, 1550)
-        self.game.score_board.render_scores.assert_called_once()
-        self.game.score_board.update_high_score.assert_called_once()
+        self.game.events.emit.assert_called_once_with(ScoreChanged())
 
     def test_change_ship_size(self):
         """Test the change ship size power up."""
@@ -594,7 +586,7 @@ class TestPowerEffectsManager(unittest.TestCase):
             self.power_effects_manager.thunderbird_ship.missiles_num,
             initial_missiles + 1,
         )
-        self.game.score_board.render_missiles_num.assert_called_once()
+        self.game.events.emit.assert_called_once_with(AmmoChanged("missiles"))
 
     def test_draw_ship_shield(self):
         """Test for the draw shiled power up."""
@@ -653,7 +645,7 @@ class TestPowerEffectsManager(unittest.TestCase):
             initial_bullets + 1,
         )
 
-        self.game.score_board.render_bullets_num.assert_called_once()
+        self.game.events.emit.assert_called_once_with(AmmoChanged("bullets"))
 
     def test_get_powerup_choices_normal(self):
         """Test the get power up choices method."""
@@ -13,7 +13,8 @@ import pygame
 from src.managers.save_load_manager import SaveLoadSystem
 from src.entities.alien_entities.aliens import Alien, BossAlien
 
-from src.utils.constants import ATTRIBUTE_MAPPING
+from src.utils.constants import ATTRIBUTE_MAPPING, SAVE_SLOTS_NUM
+from src.utils.game_dataclasses import SaveSlot
 
 from src.game_logic.game_settings import Settings
 from src.game_logic.game_stats import GameStats
@@ -64,6 +65,17 @@ class TestSaveLoadSystem(unittest.TestCase):
         self.assertIsInstance(self.save_load_manager.cancel_rect, pygame.Rect)
         self.assertIsInstance(self.save_load_manager.delete_rect, pygame.Rect)
 
+    @staticmethod
+    def _make_slots(*saved_slots):
+        """Return save slots where the given slot names contain a save."""
+        return [
+            SaveSlot(
+                f"save{number}",
+                {"timestamp": 0} if f"save{number}" in saved_slots else None,
+            )
+            for number in range(1, SAVE_SLOTS_NUM + 1)
+        ]
+
     def test_get_data(self):
         """Test the get_data helper method."""
         # Set up data
@@ -307,8 +319,11 @@ class TestSaveLoadSystem(unittest.TestCase):
             self.save_load_manager.data["speedup_scale"],
             self.game.settings.speedup_scale,
         )
+        self.assertEqual(
+            self.save_load_manager.data["difficulty"], self.game.settings.difficulty
+        )
 
-        self.assertEqual(len(self.save_load_manager.data), 58)
+        self.assertEqual(len(self.save_load_manager.data), 59)
 
     def test_update_alien_states(self):
         """Test the update_alien_states method."""
@@ -371,34 +386,31 @@ class TestSaveLoadSystem(unittest.TestCase):
             self.game.weapons_manager.set_weapon.call_args_list, expected_calls
         )
 
-    @patch("src.managers.save_load_manager.pygame.image.tostring")
-    def test_prepare_sprite_data_for_serialization(self, mock_tostring):
+    @patch("src.managers.save_load_manager.time.time", return_value=1000.0)
+    def test_prepare_sprite_data_for_serialization(self, _mock_time):
         """Test the prepare_sprite_data_for_serialization method."""
-        # Set up the mock data for the pygame.image.tostring call
-        mock_tostring.side_effect = lambda img, format: img
         alien = MagicMock(spec=Alien)
         alien.rect = MagicMock(x=100, y=200)
-        alien.image = MagicMock(
-            get_size=MagicMock(return_value=(30, 40)),
-            tostring=MagicMock(return_value=b"sample_image_data"),
-        )
+        alien.x_pos = 100.5
         alien.is_baby = False
         alien.hit_count = 3
         alien.last_bullet_time = 123
         alien.immune_state = False
+        alien.immune_start_time = 0
         alien.frozen_state = True
+        alien.frozen_start_time = 998.0
+        alien.motion = MagicMock(direction=-1)
 
         boss_alien = MagicMock(spec=BossAlien)
         boss_alien.rect = MagicMock(x=300, y=400)
-        boss_alien.image = MagicMock(
-            get_size=MagicMock(return_value=(50, 60)),
-            tostring=MagicMock(return_value=b"another_image_data"),
-        )
+        boss_alien.x_pos = 300.0
         boss_alien.is_baby = True
         boss_alien.hit_count = 1
         boss_alien.last_bullet_time = 2923
         boss_alien.immune_state = False
         boss_alien.frozen_state = False
+        boss_alien.frozen_start_time = 0
+        boss_alien.motion = MagicMock(direction=1)
 
         sprite_data = {
             "aliens": [
@@ -416,60 +428,104 @@ class TestSaveLoadSystem(unittest.TestCase):
         expected_data = {
             "alien_sprites": [
                 {
-                    "rect": alien.rect,
-                    "size": (30, 40),
-                    "image": alien.image,
-                    "is_baby": False,
                     "type": "alien",
-                    "location": 100,
+                    "is_baby": False,
+                    "location": 100.5,
+                    "y": 200,
                     "hit_count": 3,
                     "last_bullet_time": 123,
                     "immune_state": False,
                     "frozen_state": True,
+                    "frozen_time": 2.0,
+                    "immune_time": 0,
+                    "direction": -1,
                 },
                 {
-                    "rect": boss_alien.rect,
-                    "size": (50, 60),
-                    "image": boss_alien.image,
-                    "is_baby": False,
                     "type": "boss",
-                    "location": 300,
+                    "is_baby": False,
+                    "location": 300.0,
+                    "y": 400,
                     "hit_count": 1,
                     "last_bullet_time": 2923,
-                    "immune_state": None,
+                    "immune_state": False,
                     "frozen_state": False,
+                    "frozen_time": 0,
+                    "immune_time": 0,
+                    "direction": 1,
                 },
             ],
         }
 
         self.assertEqual(result, expected_data)
 
-    @patch("src.managers.save_load_manager.pickle.dump")
-    @patch("src.managers.save_load_manager.os.path.join")
-    def test_save_data(self, mock_join, mock_pickle_dump):
-        """Test the save_data method."""
-        self.save_load_manager.prepare_sprite_data_for_serialization = MagicMock()
+    @patch("src.managers.save_load_manager.time.time", return_value=1000.0)
+    def test_save_data(self, _mock_time):
+        """Test that save_data passes a snapshot of the game to the writer."""
+        self.save_load_manager.prepare_sprite_data_for_serialization = MagicMock(
+            return_value={"alien_sprites": ["alien_state"]}
+        )
+        self.save_load_manager.save_writer = MagicMock()
         self.save_load_manager.get_current_game_stats()
 
-        mock_open_func = MagicMock()
-
-        with patch("builtins.open", mock_open_func):
-            self.save_load_manager.save_data("save1", MagicMock())
+        self.save_load_manager.save_data("save1", "2024-01-01 10:00:00")
 
-        mock_open_func.assert_called_once()
-        mock_join.assert_called_once_with(
-            self.save_load_manager.save_folder, "save1.save"
+        slot_name, game_data, alien_states, metadata = (
+            self.save_load_manager.save_writer.save.call_args[0]
+        )
+        self.assertEqual(slot_name, "save1")
+        self.assertEqual(game_data["level"], self.game.stats.level)
+        self.assertEqual(game_data["save_date"], "2024-01-01 10:00:00")
+        self.assertNotIn("aliens", game_data)
+        self.assertEqual(alien_states, ["alien_state"])
+        self.assertEqual(
+            metadata,
+            {
+                "timestamp": 1000.0,
+                "level": self.game.stats.level,
+                "mode": self.game.settings.game_modes.game_mode,
+                "score": 0,
+                "ship": self.game.thunderbird_ship.ship_name,
+            },
+        )
+
+    @patch("src.managers.save_load_manager.pygame.time.get_ticks", return_value=500)
+    def test_handle_save_completed(self, _mock_ticks):
+        """Test that a finished save shows the result message."""
+        self.save_load_manager.handle_save_completed(MagicMock(success=True))
+        self.assertEqual(
+            self.save_load_manager.save_message, ("Game Saved!", "lightblue")
         )
-        mock_pickle_dump.assert_called_once()
 
-    @patch("src.managers.save_load_manager.pickle.load")
+        self.save_load_manager.handle_save_completed(MagicMock(success=False))
+        self.assertEqual(self.save_load_manager.save_message, ("Save failed!", "red"))
+        self.assertEqual(self.save_load_manager.save_message_time, 500)
+
+    @patch("src.managers.save_load_manager.pygame.time.get_ticks")
+    def test_draw_save_message(self, mock_ticks):
+        """Test that the save message is drawn until it expires."""
+        self.save_load_manager.screen = MagicMock()
+        self.save_load_manager.save_message = ("Game Saved!", "lightblue")
+        self.save_load_manager.save_message_time = 0
+
+        mock_ticks.return_value = 500
+        self.save_load_manager.draw_save_message()
+        self.save_load_manager.screen.blit.assert_called_once()
+
+        mock_ticks.return_value = 2000
+        self.save_load_manager.draw_save_message()
+        self.save_load_manager.screen.blit.assert_called_once()
+        self.assertIsNone(self.save_load_manager.save_message)
+
+    @patch("src.managers.save_load_manager.decode_save")
     @patch("src.managers.save_load_manager.os.path.join")
-    def test_load_data(self, mock_join, mock_pickle_load):
+    def test_load_data(self, mock_join, mock_decode_save):
         """Test the load_data method."""
         self.save_load_manager.update_game_state_from_data = MagicMock()
         self.save_load_manager.restore_sprites_from_data = MagicMock()
 
         mock_open_func = MagicMock()
+        mock_file = mock_open_func.return_value.__enter__.return_value
+        mock_file.read.return_value = b"AOSAVE..."
         with patch("builtins.open", mock_open_func):
             self.save_load_manager.load_data("save1")
 
@@ -477,11 +533,55 @@ class TestSaveLoadSystem(unittest.TestCase):
         mock_join.assert_called_once_with(
             self.save_load_manager.save_folder, "save1.save"
         )
-        mock_pickle_load.assert_called_once()
+        mock_decode_save.assert_called_once_with(b"AOSAVE...")
 
         self.save_load_manager.update_game_state_from_data.assert_called_once()
         self.save_load_manager.restore_sprites_from_data.assert_called_once()
 
+    @patch("src.managers.save_load_manager.pickle.loads")
+    def test_decode_save_data_legacy(self, mock_pickle_loads):
+        """Test that legacy save files are loaded with pickle."""
+        result = self.save_load_manager.decode_save_data(b"legacy pickle data")
+
+        mock_pickle_loads.assert_called_once_with(b"legacy pickle data")
+        self.assertEqual(result, mock_pickle_loads.return_value)
+
+    @patch("src.managers.save_load_manager.time.time", return_value=1000.0)
+    def test_restore_sprites_from_state(self, _mock_time):
+        """Test that sprites are rebuilt from their logical state."""
+        self.game.stats.level = 1
+        loaded_data = {
+            "sprite_data": {
+                "alien_sprites": [
+                    {
+                        "type": "alien",
+                        "is_baby": False,
+                        "location": 150.5,
+                        "y": 80,
+                        "hit_count": 2,
+                        "last_bullet_time": 128,
+                        "immune_state": True,
+                        "frozen_state": False,
+                        "frozen_time": 0,
+                        "immune_time": 1.5,
+                        "direction": -1,
+                    },
+                ]
+            }
+        }
+
+        self.save_load_manager.restore_sprites_from_data(loaded_data)
+
+        sprite = self.game.aliens.add.call_args[0][0]
+        self.assertIsInstance(sprite, Alien)
+        self.assertEqual(sprite.x_pos, 150.5)
+        self.assertEqual((sprite.rect.x, sprite.rect.y), (150, 80))
+        self.assertEqual(sprite.hit_count, 2)
+        self.assertTrue(sprite.immune_state)
+        self.assertEqual(sprite.immune_start_time, 998.5)
+        self.assertEqual(sprite.motion.direction, -1)
+        self.assertIsInstance(sprite.image, pygame.Surface)
+
     @patch("src.managers.save_load_manager.pygame.image.fromstring")
     def test_restore_sprites_from_data(self, mock_fromstring):
         """Test the restore_sprites_from_data method."""
@@ -625,6 +725,7 @@ class TestSaveLoadSystem(unittest.TestCase):
             "asteroid_speed": 6,
             "asteroid_freq": 4,
             "speedup_scale": 1.2,
+            "difficulty": "HARD",
         }
 
         self.save_load_manager.update_game_state_from_data(loaded_data)
@@ -645,6 +746,18 @@ class TestSaveLoadSystem(unittest.TestCase):
         self.assertEqual(self.game.settings.thunderbird_bullet_speed, 15)
         self.assertEqual(self.game.settings.alien_speed, 5)
         self.assertEqual(self.game.settings.alien_bullet_speed, 8)
+        self.assertEqual(self.game.settings.difficulty, "HARD")
+
+    @patch("src.managers.save_load_manager.set_attribute")
+    def test_update_game_state_from_old_data(self, mock_set_attribute):
+        """Test that a save made before a data key was added still loads."""
+        self.game.settings.difficulty = "MEDIUM"
+
+        self.save_load_manager.update_game_state_from_data({"level": 4})
+
+        mock_set_attribute.assert_not_called()
+        self.assertEqual(self.game.stats.level, 4)
+        self.assertEqual(self.game.settings.difficulty, "MEDIUM")
 
     @patch("src.managers.save_load_manager.pygame")
     def test_handle_save_load_menu(self, mock_pygame):
@@ -653,11 +766,9 @@ class TestSaveLoadSystem(unittest.TestCase):
         self.save_load_manager.screen = MagicMock()
 
         with patch("src.managers.save_load_manager.pygame.display.flip"):
-            self.save_load_manager._get_save_files = MagicMock(
-                return_value=["save1.save", "save2.save", "save3.save"]
-            )
+            self.save_load_manager.refresh_slots = MagicMock()
             self.save_load_manager._draw_save_slots = MagicMock()
-            mock_pygame.display.flip.side_effect = lambda: setattr(
+            self.game.display_manager.present.side_effect = lambda: setattr(
                 self.save_load_manager, "menu_running", False
             )
 
@@ -665,7 +776,7 @@ class TestSaveLoadSystem(unittest.TestCase):
             self.save_load_manager.handle_save_load_menu(save=True)
 
             # Make assertions based on expected calls and interactions
-            self.save_load_manager._get_save_files.assert_called_once()
+            self.save_load_manager.refresh_slots.assert_called_once()
             # self.game.screen.fill.assert_called_once_with((0, 0, 0))
             self.save_load_manager._draw_save_slots.assert_called_once()
 
@@ -674,13 +785,19 @@ class TestSaveLoadSystem(unittest.TestCase):
                 call(
                     self.font.render.return_value,
                     self.font.render.return_value.get_rect(
-                        center=(self.game.screen.get_width() // 2 + 100, 465)
+                        center=(
+                            self.game.screen.get_width() // 2 + 100,
+                            self.save_load_manager.buttons_y,
+                        )
                     ),
                 ),
                 call(
                     self.font.render.return_value,
                     self.font.render.return_value.get_rect(
-                        center=(self.game.screen.get_width() // 2 - 100, 465)
+                        center=(
+                            self.game.screen.get_width() // 2 - 100,
+                            self.save_load_manager.buttons_y,
+                        )
                     ),
                 ),
             ]
@@ -689,39 +806,15 @@ class TestSaveLoadSystem(unittest.TestCase):
             )
             self.save_load_manager.display_screen_title.assert_called_once()
             self.game.screen_manager.draw_cursor.assert_called_once()
-            mock_pygame.display.flip.assert_called_once()
-
-    def test_get_save_files(self):
-        """Test the get_save_files method."""
-        # Create test files with different extensions
-        test_files = [
-            "savegame1.save",
-            "savegame2.save",
-            "savegame3.save",
-            "random_file.txt",
-        ]
-        for filename in test_files:
-            open(
-                os.path.join(self.save_load_manager.save_folder, filename),
-                "w",
-                encoding="utf-8",
-            ).close()
-
-        result = self.save_load_manager._get_save_files()
-
-        # Define the expected result
-        expected_result = ["savegame1.save", "savegame2.save", "savegame3.save"]
-
-        # Assertion
-        self.assertListEqual(result, expected_result)
+            self.game.display_manager.present.assert_called_once()
 
     def test_get_save_status_text_no_savefiles(self):
         """Test the get_save_status_text with no savefiles."""
-        save_files = []
+        save_index = {}
 
         # Call the method
         result = self.save_load_manager._get_save_status_text(
-            slot_number=1, save_files=save_files
+            slot_number=1, save_index=save_index
         )
 
         expected_result = "Empty"
@@ -732,18 +825,17 @@ class TestSaveLoadSystem(unittest.TestCase):
     def test_get_save_status_text_existing_savefile(self):
         """Test the get_save_status_text with a savefile."""
         # Prepare data for testing
-        test_save_file = "save1.save"
-        open(
-            os.path.join(self.save_load_manager.save_folder, test_save_file),
-            "w",
-            encoding="utf-8",
-        ).close()
-
-        save_files = [test_save_file]
+        save_index = {
+            "save1": {
+                "timestamp": datetime.datetime.now().timestamp(),
+                "level": 1,
+                "mode": "normal",
+            }
+        }
 
         # Call the method
         result = self.save_load_manager._get_save_status_text(
-            slot_number=1, save_files=save_files
+            slot_number=1, save_index=save_index
         )
 
         # Get the current date and time in the required format
@@ -754,43 +846,67 @@ class TestSaveLoadSystem(unittest.TestCase):
         # Assertion
         self.assertEqual(result, expected_result)
 
+    def test_get_save_details_text(self):
+        """Test the details text of a save slot."""
+        metadata = {
+            "timestamp": 0,
+            "level": 7,
+            "mode": "boss_rush",
+            "score": 12500,
+            "ship": "Thunderbird",
+        }
+
+        result = self.save_load_manager._get_save_details_text(metadata)
+
+        self.assertEqual(
+            result, "Level 7  |  BOSS RUSH  |  Score: 12,500  |  Thunderbird"
+        )
+        self.assertIsNone(self.save_load_manager._get_save_details_text(None))
+        self.assertIsNone(
+            self.save_load_manager._get_save_details_text(
+                {"timestamp": 0, "level": None, "mode": None}
+            )
+        )
+
+    def test_refresh_slots(self):
+        """Test that the slots are rebuilt from the save index."""
+        timestamp = datetime.datetime.now().timestamp()
+        self.save_load_manager.save_writer = MagicMock()
+        self.save_load_manager.save_writer.get_index.return_value = {
+            "save2": {"timestamp": timestamp, "level": 3, "mode": "normal"}
+        }
+
+        self.save_load_manager.refresh_slots()
+
+        slots = self.save_load_manager.slots
+        self.assertEqual(len(slots), SAVE_SLOTS_NUM)
+        self.assertTrue(slots[0].is_empty)
+        self.assertFalse(slots[1].is_empty)
+        self.assertIsNone(slots[0].details)
+        self.assertIsNotNone(slots[1].details)
+        self.assertTrue(all(isinstance(slot.rect, pygame.Rect) for slot in slots))
+
+        current_time = datetime.datetime.now().strftime("%d %b %Y  %I:%M %p")
+        rendered_texts = [args[0][0] for args in self.font.render.call_args_list]
+        self.assertIn("Save File 1: Empty", rendered_texts)
+        self.assertIn(f"Save File 2: Saved On: {current_time}", rendered_texts)
+
     @patch("src.managers.save_load_manager.pygame.draw.rect")
     def test_draw_save_slots(self, mock_draw_rect):
         """Test the draw_save_slots method."""
-        # Prepare data for testing
-        test_save_files = ["save1.save", "save2.save", "save3.save"]
-        for filename in test_save_files:
-            open(
-                os.path.join(self.save_load_manager.save_folder, filename),
-                "w",
-                encoding="utf-8",
-            ).close()
-
-        text_color = (255, 255, 255)
-        center_x = 400
-        slot_selected = 0
-        slot_rects = []
+        self.save_load_manager.save_writer = MagicMock()
+        self.save_load_manager.save_writer.get_index.return_value = {}
+        self.save_load_manager.refresh_slots()
+        self.save_load_manager.screen = MagicMock()
+        self.font.render.reset_mock()
 
-        # Call the method
-        self.save_load_manager._draw_save_slots(
-            font=self.font,
-            text_color=text_color,
-            center_x=center_x,
-            save_files=test_save_files,
-            slot_selected=slot_selected,
-            slot_rects=slot_rects,
-        )
-        current_time = datetime.datetime.now().strftime("%d %b %Y  %I:%M %p")
-        expected_text_0 = f"Save File 1: Saved On: {current_time}"
-        actual_text_0 = self.font.render.call_args_list[2][0][0]
+        self.save_load_manager._draw_save_slots(slot_selected=1)
 
-        expected_text_1 = f"Save File 2: Saved On: {current_time}"
-        actual_text_1 = self.font.render.call_args_list[3][0][0]
-        # Assertions:
+        # The slot text is rendered once, not on every frame.
+        self.font.render.assert_not_called()
+        self.assertEqual(self.save_load_manager.screen.blit.call_count, SAVE_SLOTS_NUM)
         mock_draw_rect.assert_called_once()
-        self.assertEqual(actual_text_0, expected_text_0)
-        self.assertEqual(actual_text_1, expected_text_1)
-        self.assertEqual(len(slot_rects), 3)
+        self.assertEqual(len(self.save_load_manager.slots), SAVE_SLOTS_NUM)
 
     def test_handle_save_slot_action(self):
         """Test the handle_save_slot_action method."""
@@ -823,16 +939,13 @@ class TestSaveLoadSystem(unittest.TestCase):
         # Prepare testing data
         slot_selected = 0
 
-        self.save_load_manager._get_save_files = MagicMock(
-            return_value=["save1.save", "save2.save"]
-        )
+        self.save_load_manager.slots = self._make_slots("save1", "save2")
         self.save_load_manager._show_confirmation_popup = MagicMock()
         self.save_load_manager._save_game = MagicMock()
 
         self.save_load_manager._handle_save_action(self.font, slot_selected)
 
         # Assertions
-        self.save_load_manager._get_save_files.assert_called_once()
         self.save_load_manager._show_confirmation_popup.assert_called_once_with(
             delete_save_files=False
         )
@@ -845,16 +958,13 @@ class TestSaveLoadSystem(unittest.TestCase):
         # Prepare testing data
         slot_selected = 0
 
-        self.save_load_manager._get_save_files = MagicMock(
-            return_value=["save1.save", "save2.save"]
-        )
+        self.save_load_manager.slots = self._make_slots("save1", "save2")
         self.save_load_manager._show_confirmation_popup = MagicMock(return_value=False)
         self.save_load_manager._save_game = MagicMock()
 
         self.save_load_manager._handle_save_action(self.font, slot_selected)
 
         # Assertions
-        self.save_load_manager._get_save_files.assert_called_once()
         self.save_load_manager._show_confirmation_popup.assert_called_once_with(
             delete_save_files=False
         )
@@ -869,16 +979,13 @@ class TestSaveLoadSystem(unittest.TestCase):
         # Prepare testing data
         slot_selected = 2
 
-        self.save_load_manager._get_save_files = MagicMock(
-            return_value=["save1.save", "save2.save"]
-        )
+        self.save_load_manager.slots = self._make_slots("save1", "save2")
         self.save_load_manager._show_confirmation_popup = MagicMock()
         self.save_load_manager._save_game = MagicMock()
 
         self.save_load_manager._handle_save_action(self.font, slot_selected)
 
         # Assertions
-        self.save_load_manager._get_save_files.assert_called_once()
         self.save_load_manager._show_confirmation_popup.assert_not_called()
         self.save_load_manager._save_game.assert_called_once()
 
@@ -891,14 +998,11 @@ class TestSaveLoadSystem(unittest.TestCase):
         # Prepare data for testing
         slot_selected = 0
 
-        self.save_load_manager._get_save_files = MagicMock(
-            return_value=["save1.save", "save2.save"]
-        )
+        self.save_load_manager.slots = self._make_slots("save1", "save2")
         self.save_load_manager.load_data = MagicMock()
 
         self.save_load_manager._handle_load_action(self.font, slot_selected)
 
-        self.save_load_manager._get_save_files.assert_called_once()
         mock_play_sound.assert_called_once_with(
             self.game.sound_manager.game_sounds, "load_game"
         )
@@ -906,8 +1010,14 @@ class TestSaveLoadSystem(unittest.TestCase):
             f"save{slot_selected + 1}"
         )
         self.assertTrue(self.game.game_loaded)
+        self.game.telemetry.record_event.assert_called_once_with("load", slot="save1")
         mock_display_message.assert_called_once_with(
-            self.game.screen, "Game Loaded!", self.font, "lightblue", 1000
+            self.game.screen,
+            "Game Loaded!",
+            self.font,
+            "lightblue",
+            1000,
+            self.game.display_manager,
         )
 
     @patch("src.managers.save_load_manager.play_sound")
@@ -919,19 +1029,21 @@ class TestSaveLoadSystem(unittest.TestCase):
         # Prepare data for testing
         slot_selected = 2
 
-        self.save_load_manager._get_save_files = MagicMock(
-            return_value=["save1.save", "save2.save"]
-        )
+        self.save_load_manager.slots = self._make_slots("save1", "save2")
         self.save_load_manager.load_data = MagicMock()
 
         self.save_load_manager._handle_load_action(self.font, slot_selected)
 
-        self.save_load_manager._get_save_files.assert_called_once()
         mock_play_sound.assert_called_once_with(
             self.game.sound_manager.game_sounds, "empty_save"
         )
         mock_display_message.assert_called_once_with(
-            self.game.screen, "Empty save slot", self.font, "red", 500
+            self.game.screen,
+            "Empty save slot",
+            self.font,
+            "red",
+            500,
+            self.game.display_manager,
         )
 
         self.save_load_manager.load_data.assert_not_called()
@@ -952,38 +1064,24 @@ class TestSaveLoadSystem(unittest.TestCase):
         self.save_load_manager.save_data.assert_called_once_with(
             f"save{slot_selected + 1}", save_date=save_date
         )
-        mock_display_message.assert_called_once_with(
-            self.game.screen, "Game Saved!", self.font, "lightblue", 1000
-        )
+        # The result is shown when the background save completes.
+        mock_display_message.assert_not_called()
 
     def test_delete_all_save_files(self):
         """Test the delete_all_save_files method."""
-        # Set up test data
-        self.save_load_manager._get_save_files = MagicMock(
-            return_value=["save1.save", "save2.save", "save3.save"]
-        )
-
-        # Create some sample save files
-        sample_save_files = ["save1.save", "save2.save", "save3.save"]
-        for save_file in sample_save_files:
-            with open(
-                os.path.join(self.save_load_manager.save_folder, save_file),
-                "w",
-                encoding="utf-8",
-            ) as file:
-                file.write("Sample data")
+        self.save_load_manager.save_writer = MagicMock()
+        self.save_load_manager.save_writer.get_index.return_value = {}
 
-        # Call the method
         self.save_load_manager._delete_all_save_files()
 
-        # Check if the save files have been deleted
-        self.assertFalse(os.listdir(self.save_load_manager.save_folder))
+        self.save_load_manager.save_writer.clear.assert_called_once()
+        self.save_load_manager.save_writer.wait.assert_called_once()
+        self.assertEqual(len(self.save_load_manager.slots), SAVE_SLOTS_NUM)
 
-    @patch("src.managers.save_load_manager.tk.Tk")
-    @patch("src.managers.save_load_manager.messagebox.askyesno")
-    def test_show_confirmation_popup_delete_save_files(self, mock_askyesno, mock_tk):
+    def test_show_confirmation_popup_delete_save_files(self):
         """Test the show_confirmation_popup with delete_save_files."""
-        mock_askyesno.return_value = True
+        self.save_load_manager.confirm_dialog = MagicMock()
+        self.save_load_manager.confirm_dialog.ask.return_value = True
 
         # Call the _show_confirmation_popup method with delete_save_files=True
         response = self.save_load_manager._show_confirmation_popup(
@@ -992,14 +1090,14 @@ class TestSaveLoadSystem(unittest.TestCase):
 
         # Assertions
         self.assertTrue(response)
-        mock_tk.assert_called_once()
-        mock_askyesno.assert_called_once_with("Confirmation", "Delete all save files?")
+        self.save_load_manager.confirm_dialog.ask.assert_called_once_with(
+            "Delete all save files?"
+        )
 
-    @patch("src.managers.save_load_manager.tk.Tk")
-    @patch("src.managers.save_load_manager.messagebox.askyesno")
-    def test_show_confirmation_popup_overwrite_save_file(self, mock_askyesno, mock_tk):
+    def test_show_confirmation_popup_overwrite_save_file(self):
         """Test the show_confirmation_popup with overwrite save_file."""
-        mock_askyesno.return_value = False
+        self.save_load_manager.confirm_dialog = MagicMock()
+        self.save_load_manager.confirm_dialog.ask.return_value = False
 
         # Call the _show_confirmation_popup method with delete_save_files=False
         response = self.save_load_manager._show_confirmation_popup(
@@ -1008,9 +1106,8 @@ class TestSaveLoadSystem(unittest.TestCase):
 
         # Assertions
         self.assertFalse(response)
-        mock_tk.assert_called_once()
-        mock_askyesno.assert_called_once_with(
-            "Confirmation", "Overwrite this save file?"
+        self.save_load_manager.confirm_dialog.ask.assert_called_once_with(
+            "Overwrite this save file?"
         )
 
     def test_update_rect_positions(self):
@@ -1019,8 +1116,9 @@ class TestSaveLoadSystem(unittest.TestCase):
 
         # Assertions
         self.assertEqual(self.save_load_manager.center_x, 640)
-        self.assertEqual(self.save_load_manager.cancel_rect.center, (740, 465))
-        self.assertEqual(self.save_load_manager.delete_rect.center, (540, 465))
+        buttons_y = self.save_load_manager.buttons_y
+        self.assertEqual(self.save_load_manager.cancel_rect.center, (740, buttons_y))
+        self.assertEqual(self.save_load_manager.delete_rect.center, (540, buttons_y))
 
     def test_set_screen_title_position(self):
         """Test the set_screen_title_position method."""
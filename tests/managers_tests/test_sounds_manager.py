@@ -4,11 +4,21 @@ in the game.
 """
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, patch, call
 
 import pygame
 
-from src.managers.sounds_manager import SoundManager
+from src.game_logic.game_events import (
+    AlienKilled,
+    ShieldHit,
+    ShipHit,
+    MissileExploded,
+    PowerCollected,
+    WeaponFired,
+    LaserStatus,
+    ScoreChanged,
+)
+from src.managers.sounds_manager import SoundManager, get_event_sound
 
 
 class TestSoundManager(unittest.TestCase):
@@ -130,10 +140,17 @@ class TestSoundManager(unittest.TestCase):
         self.sound_manager.level_music[range(1, 8)] = "path_to_sound_file"
         self.sound_manager.stats.level = 1
 
-        with patch("src.managers.sounds_manager.play_music") as mock_play_music:
-            self.sound_manager.prepare_level_music()
+        self.sound_manager.music_manager = MagicMock()
+        self.sound_manager.music_manager.track_for_level.side_effect = [
+            "path_to_sound_file",
+            None,
+        ]
+        self.sound_manager.prepare_level_music()
 
-        mock_play_music.assert_called_with(self.sound_manager.level_music, range(1, 8))
+        self.sound_manager.music_manager.play.assert_called_once_with(
+            "path_to_sound_file"
+        )
+        self.sound_manager.music_manager.preload.assert_called_once_with(None)
         self.assertEqual(self.sound_manager.current_sound, "path_to_sound_file")
 
     def test_prepare_level_music_no_change(self):
@@ -147,10 +164,10 @@ class TestSoundManager(unittest.TestCase):
         self.sound_manager.level_music[range(1, 8)] = "path_to_sound_file"
         self.sound_manager.stats.level = 1
 
-        with patch("src.managers.sounds_manager.play_music") as mock_play_music:
-            self.sound_manager.prepare_level_music()
+        self.sound_manager.prepare_level_music()
 
-        mock_play_music.assert_not_called()
+        self.assertIsNone(self.sound_manager.music_manager.pending_track)
+        self.assertEqual(self.sound_manager.current_sound, "path_to_sound_file")
 
     def test_prepare_level_music_change(self):
         """Test case for the prepare level music when the
@@ -163,12 +180,67 @@ class TestSoundManager(unittest.TestCase):
         self.sound_manager.level_music[range(1, 8)] = "path_to_sound_file"
         self.sound_manager.stats.level = 5
 
-        with patch("src.managers.sounds_manager.play_music") as mock_play_music:
-            self.sound_manager.prepare_level_music()
+        self.sound_manager.music_manager = MagicMock()
+        self.sound_manager.music_manager.track_for_level.side_effect = [
+            "path_to_sound_file",
+            None,
+        ]
+        self.sound_manager.prepare_level_music()
 
-        mock_play_music.assert_called_with(self.sound_manager.level_music, range(1, 8))
+        self.sound_manager.music_manager.play.assert_called_once_with(
+            "path_to_sound_file"
+        )
+        self.sound_manager.music_manager.preload.assert_called_once_with(None)
         self.assertEqual(self.sound_manager.current_sound, "path_to_sound_file")
 
+    def test_prepare_level_music_preloads_next_track(self):
+        """Test that the track of the next level is preloaded."""
+        self.sound_manager._set_level_music = MagicMock(
+            return_value={range(1, 2): "first", range(2, 4): "second"}
+        )
+        self.sound_manager.current_sound = "first"
+        self.sound_manager.stats.level = 1
+        self.sound_manager.music_manager = MagicMock()
+        self.sound_manager.music_manager.track_for_level.side_effect = [
+            "first",
+            "second",
+        ]
+
+        self.sound_manager.prepare_level_music()
+
+        self.sound_manager.music_manager.play.assert_not_called()
+        self.sound_manager.music_manager.preload.assert_called_once_with("second")
+
+    def test_prepare_level_music_disabled(self):
+        """Test that no music is played or preloaded when music is off."""
+        self.sound_manager._set_level_music = MagicMock()
+        self.sound_manager.music_manager = MagicMock()
+        self.sound_manager.music_enabled = False
+
+        self.sound_manager.prepare_level_music()
+
+        self.sound_manager._set_level_music.assert_not_called()
+        self.sound_manager.music_manager.play.assert_not_called()
+        self.sound_manager.music_manager.preload.assert_not_called()
+
+    def test_play_menu_music(self):
+        """Test that the menu tracks are played through the music manager."""
+        self.sound_manager.music_manager = MagicMock()
+        self.sound_manager.menu_music = {"menu": "menu_track"}
+
+        self.sound_manager.play_menu_music("menu")
+
+        self.sound_manager.music_manager.play_now.assert_called_once_with("menu_track")
+        self.assertEqual(self.sound_manager.current_sound, "menu_track")
+
+    def test_update_music(self):
+        """Test that update_music updates the music manager."""
+        self.sound_manager.music_manager = MagicMock()
+
+        self.sound_manager.update_music()
+
+        self.sound_manager.music_manager.update.assert_called_once()
+
     def test__prepare_gameplay_sounds_volume(self):
         """Test the preparation of the gameplay sound volume."""
         self.sound_manager.game_sounds = {
@@ -211,6 +283,44 @@ class TestSoundManager(unittest.TestCase):
         pygame.mixer.music.set_volume.assert_called_with(volume)
         self.assertEqual(pygame.mixer.music.set_volume.call_count, 4)
 
+    def test_get_event_sound(self):
+        """Test the sounds played for the gameplay events."""
+        self.assertEqual(get_event_sound(AlienKilled("phoenix")), "alien_exploding")
+        self.assertEqual(
+            get_event_sound(AlienKilled("phoenix", boss=True)), "boss_exploding"
+        )
+        self.assertEqual(get_event_sound(ShieldHit("bullet")), "alien_exploding")
+        self.assertEqual(get_event_sound(ShieldHit("asteroid")), "asteroid_exploding")
+        self.assertEqual(get_event_sound(ShipHit("thunderbird")), "explode")
+        self.assertEqual(get_event_sound(MissileExploded()), "missile")
+        self.assertEqual(
+            get_event_sound(PowerCollected("thunderbird", "freeze")), "freeze"
+        )
+        self.assertEqual(get_event_sound(WeaponFired("missile")), "missile_launch")
+        self.assertEqual(get_event_sound(LaserStatus(ready=False)), "laser_not_ready")
+        self.assertIsNone(get_event_sound(ScoreChanged()))
+
+    @patch("src.managers.sounds_manager.play_sound")
+    def test_play_event_sounds(self, mock_play_sound):
+        """Test that each sound is played once per frame."""
+        self.sound_manager.play_event_sounds(
+            [
+                AlienKilled("thunderbird"),
+                AlienKilled("phoenix"),
+                ShieldHit("alien"),
+                ScoreChanged(),
+                WeaponFired("bullet"),
+            ]
+        )
+
+        self.assertEqual(
+            mock_play_sound.call_args_list,
+            [
+                call(self.sound_manager.game_sounds, "alien_exploding"),
+                call(self.sound_manager.game_sounds, "bullet"),
+            ],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,142 @@
+"""
+This module tests the TelemetryManager class that measures the frames
+of the game and records them with the game events.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.managers.telemetry_manager import TelemetryManager, get_percentile
+from src.utils.game_dataclasses import GameModes
+from src.utils.game_utils import render_counts, voice_allocator
+
+
+class TelemetryManagerTest(unittest.TestCase):
+    """Test cases for the TelemetryManager class."""
+
+    def setUp(self):
+        """Set up a game with a few entities and a fake clock."""
+        self.game = MagicMock()
+        self.game.stats.level = 1
+        self.game.stats.game_active = True
+        self.game.settings.game_modes = GameModes()
+        self.game.display_manager.window = pygame.Surface((1280, 700))
+        self.game.display_manager.full_screen = False
+        self.game.aliens = [MagicMock()] * 20
+        self.game.alien_bullet = [MagicMock()] * 4
+        self.game.thunderbird_bullets = [MagicMock()] * 3
+        self.game.phoenix_bullets = [MagicMock()] * 2
+        self.game.thunderbird_missiles = []
+        self.game.phoenix_missiles = [MagicMock()]
+        self.game.asteroids = [MagicMock()]
+        self.game.powers = []
+
+        self.ticks = 0
+        ticks_patch = patch(
+            "src.managers.telemetry_manager.pygame.time.get_ticks",
+            side_effect=lambda: self.ticks,
+        )
+        ticks_patch.start()
+        self.addCleanup(ticks_patch.stop)
+
+        self.writer = MagicMock()
+        self.telemetry = TelemetryManager(self.game, enabled=True, writer=self.writer)
+
+    def get_records(self):
+        """Return the records written so far."""
+        return [call.args[0] for call in self.writer.write.call_args_list]
+
+    def run_frames(self, frame_times, frame_length=16):
+        """Run frames that took the given times, frame_length ms apart."""
+        for frame_time in frame_times:
+            self.ticks += frame_length
+            self.telemetry.update(frame_time)
+
+    def test_interval_record(self):
+        """Test the record written once per interval."""
+        self.telemetry.sound_plays = voice_allocator.plays - 7
+        render_counts["text"] += 3
+
+        self.run_frames([10] * 46 + [20, 20, 20, 80], frame_length=20)
+
+        (record,) = self.get_records()
+        self.assertEqual(record["fps"], 50.0)
+        self.assertEqual(
+            record["frame_ms"], {"p50": 10, "p95": 20, "p99": 80, "max": 80}
+        )
+        self.assertEqual(record["stalls"], 1)
+        self.assertEqual(record["aliens"], 20)
+        self.assertEqual(record["alien_bullets"], 4)
+        self.assertEqual(record["bullets"], 5)
+        self.assertEqual(record["missiles"], 1)
+        self.assertEqual(record["asteroids"], 1)
+        self.assertEqual(record["powers"], 0)
+        self.assertEqual((record["level"], record["mode"]), (1, "normal"))
+        self.assertEqual(record["sound_plays"], 7)
+        self.assertEqual(record["text_renders"], 3)
+
+    def test_counts_start_over(self):
+        """Test that every interval only counts its own frames."""
+        self.run_frames([10] * 70)
+        render_counts["text"] += 2
+        self.run_frames([10] * 70)
+
+        first, second = self.get_records()
+        self.assertEqual(first["text_renders"], 0)
+        self.assertEqual(second["text_renders"], 2)
+        self.assertLess(second["fps"], first["fps"] * 2)
+
+    def test_skip_frame(self):
+        """Test that a paused frame is left out of the frame times."""
+        self.telemetry.skip_frame()
+        self.run_frames([5000, 10])
+
+        self.assertEqual(self.telemetry.frame_times, [10])
+
+    def test_level_and_resize_events(self):
+        """Test that the level changes and the resizes are recorded."""
+        self.game.stats.level = 2
+        self.game.display_manager.window = pygame.Surface((1920, 1080))
+        self.game.display_manager.full_screen = True
+        self.run_frames([10, 10])
+
+        events = self.get_records()
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[0]["event"], "level")
+        self.assertEqual((events[0]["level"], events[0]["mode"]), (2, "normal"))
+        self.assertEqual(events[1]["event"], "resize")
+        self.assertEqual(events[1]["size"], [1920, 1080])
+        self.assertTrue(events[1]["fullscreen"])
+
+    def test_record_event(self):
+        """Test that the events are recorded with their time."""
+        self.telemetry.record_event("save", slot="save1", success=True)
+
+        (record,) = self.get_records()
+        self.assertEqual(record["event"], "save")
+        self.assertEqual(record["slot"], "save1")
+        self.assertIn("time", record)
+
+    def test_disabled(self):
+        """Test that nothing is measured when telemetry is off."""
+        telemetry = TelemetryManager(self.game, enabled=False)
+
+        telemetry.update(10)
+        telemetry.record_event("save")
+
+        self.assertIsNone(telemetry.writer)
+        self.assertEqual(telemetry.frame_times, [])
+
+    def test_get_percentile(self):
+        """Test the percentiles of sorted values."""
+        values = list(range(1, 101))
+
+        self.assertEqual(get_percentile(values, 50), 51)
+        self.assertEqual(get_percentile(values, 99), 100)
+        self.assertEqual(get_percentile([7], 95), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
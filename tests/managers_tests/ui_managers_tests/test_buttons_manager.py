@@ -48,150 +48,47 @@ class GameButtonsManagerTest(unittest.TestCase):
         self.assertEqual(len(self.manager.game_mode_buttons), 8)
 
         self.manager._create_game_buttons()
-        expected_calls = [
-            call(
-                self.manager,
-                self.manager.button_imgs["play_button"],
-                (0, 0),
-                center=True,
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["load_game"],
-                (self.manager.play.rect.centerx - 74, self.manager.play.rect.bottom - 4),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["select_ship"],
-                (
-                    self.manager.load_game.rect.centerx - 74,
-                    self.manager.load_game.rect.bottom - 4,
-                ),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["difficulty"],
-                (
-                    self.manager.select_ship.rect.centerx - 74,
-                    self.manager.select_ship.rect.bottom - 4,
-                ),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["easy"],
-                (
-                    self.manager.difficulty.rect.right - 10,
-                    self.manager.difficulty.rect.y,
-                ),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["medium"],
-                (self.manager.easy.rect.right - 5, self.manager.easy.rect.y),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["hard"],
-                (self.manager.medium.rect.right - 5, self.manager.medium.rect.y),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["game_modes"],
-                (
-                    self.manager.difficulty.rect.centerx - 74,
-                    self.manager.difficulty.rect.bottom - 4,
-                ),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["normal"],
-                (
-                    self.manager.game_modes.rect.right - 8,
-                    self.manager.game_modes.rect.y,
-                ),
-                GAME_MODES_DESCRIPTIONS[0],
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["endless"],
-                (self.manager.normal.rect.right - 5, self.manager.normal.rect.y),
-                GAME_MODES_DESCRIPTIONS[1],
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["slow_burn"],
-                (self.manager.endless.rect.right - 5, self.manager.endless.rect.y),
-                GAME_MODES_DESCRIPTIONS[2],
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["meteor_madness"],
-                (self.manager.normal.rect.left, self.manager.slow_burn.rect.bottom),
-                GAME_MODES_DESCRIPTIONS[3],
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["boss_rush"],
-                (
-                    self.manager.meteor_madness.rect.right - 5,
-                    self.manager.meteor_madness.rect.y,
-                ),
-                GAME_MODES_DESCRIPTIONS[4],
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["last_bullet"],
-                (self.manager.boss_rush.rect.right - 5, self.manager.boss_rush.rect.y),
-                GAME_MODES_DESCRIPTIONS[5],
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["cosmic_conflict"],
-                (self.manager.slow_burn.rect.right - 5, self.manager.slow_burn.rect.y),
-                GAME_MODES_DESCRIPTIONS[6],
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["one_life_reign"],
-                (
-                    self.manager.last_bullet.rect.right - 5,
-                    self.manager.last_bullet.rect.y,
-                ),
-                GAME_MODES_DESCRIPTIONS[7],
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["high_scores"],
-                (
-                    self.manager.game_modes.rect.centerx - 74,
-                    self.manager.game_modes.rect.bottom - 4,
-                ),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["delete_scores"],
-                (
-                    self.manager.high_scores.rect.left - 85,
-                    self.manager.high_scores.rect.y,
-                ),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["menu_button"],
-                (
-                    self.manager.high_scores.rect.centerx - 74,
-                    self.manager.high_scores.rect.bottom - 4,
-                ),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["quit_button"],
-                (
-                    self.manager.menu.rect.centerx - 74,
-                    self.manager.menu.rect.bottom - 4,
-                ),
-            ),
+
+        plain_buttons = [
+            "play_button",
+            "load_game",
+            "select_ship",
+            "difficulty",
+            "easy",
+            "medium",
+            "hard",
+            "game_modes",
+        ]
+        game_mode_buttons = [
+            "normal",
+            "endless",
+            "slow_burn",
+            "meteor_madness",
+            "boss_rush",
+            "last_bullet",
+            "cosmic_conflict",
+            "one_life_reign",
         ]
+        other_buttons = ["high_scores", "delete_scores", "menu_button", "quit_button"]
+        expected_calls = (
+            [
+                call(self.manager, self.manager.button_imgs[name], (0, 0))
+                for name in plain_buttons
+            ]
+            + [
+                call(
+                    self.manager,
+                    self.manager.button_imgs[name],
+                    (0, 0),
+                    GAME_MODES_DESCRIPTIONS[i],
+                )
+                for i, name in enumerate(game_mode_buttons)
+            ]
+            + [
+                call(self.manager, self.manager.button_imgs[name], (0, 0))
+                for name in other_buttons
+            ]
+        )
 
         self.assertEqual(mock_button.call_args_list, expected_calls)
 
@@ -201,30 +98,33 @@ class GameButtonsManagerTest(unittest.TestCase):
         self.manager._create_menu_buttons()
 
         expected_calls = [
-            call(
-                self.manager,
-                self.manager.button_imgs["single_player"],
-                (0, 0),
-                center=False,
-                menu_button=True,
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["multiplayer"],
-                (
-                    self.manager.single.rect.centerx - 100,
-                    self.manager.single.rect.bottom - 4,
-                ),
-            ),
-            call(
-                self.manager,
-                self.manager.button_imgs["menu_quit_button"],
-                (self.manager.multi.rect.centerx - 100, self.manager.multi.rect.bottom - 4),
-            ),
+            call(self.manager, self.manager.button_imgs[name], (0, 0))
+            for name in ["single_player", "multiplayer", "menu_quit_button"]
         ]
 
         self.assertEqual(mock_button.call_args_list, expected_calls)
 
+    def test_update_layout(self):
+        """Test the placement of the buttons by the button layout."""
+        play, load_game = self.manager.play.rect, self.manager.load_game.rect
+        self.assertEqual(play.center, (400, 150))
+        self.assertEqual(load_game.topleft, (play.centerx - 74, play.bottom - 4))
+        self.assertEqual(
+            self.manager.meteor_madness.rect.topleft,
+            (self.manager.normal.rect.left, self.manager.slow_burn.rect.bottom),
+        )
+        self.assertEqual(self.manager.single.rect.center, (400, 220))
+
+        # Nothing moves when the layout is applied again.
+        self.assertEqual(self.manager.update_layout(), [])
+
+        # Moving the easy button only places the buttons next to it.
+        self.manager.easy.rect.x += 10
+        self.assertEqual(self.manager.update_layout(["easy"]), ["medium", "hard"])
+        self.assertEqual(
+            self.manager.medium.rect.left, self.manager.easy.rect.right - 5
+        )
+
     @patch("pygame.mouse.get_pos")
     def test_display_description(self, _):
         """Test the display_description method."""
@@ -513,21 +413,19 @@ class GameButtonsManagerTest(unittest.TestCase):
     def test_handle_difficulty_button(self):
         """Test the handle_difficulty_button method."""
         # Set up initial state
-        speedup_scale = 1.5
-        max_alien_speed = 10
+        self.game.settings.difficulty = "EASY"
         self.game.settings.speedup_scale = 1.0
         self.game.settings.max_alien_speed = 5
         self.game.ui_options.show_difficulty = True
 
-        handle_function = self.manager.handle_difficulty_button(
-            speedup_scale, max_alien_speed
-        )
+        handle_function = self.manager.handle_difficulty_button("HARD")
 
         handle_function()
 
         # Assert updated state
-        self.assertEqual(self.game.settings.speedup_scale, speedup_scale)
-        self.assertEqual(self.game.settings.max_alien_speed, max_alien_speed)
+        self.assertEqual(self.game.settings.difficulty, "HARD")
+        self.assertEqual(self.game.settings.speedup_scale, DIFFICULTIES["HARD"])
+        self.assertEqual(self.game.settings.max_alien_speed, DIFFICULTIES["MAX_HARD"])
         self.assertFalse(self.game.ui_options.show_difficulty)
 
     def test_handle_difficulty_toggle(self):
@@ -621,21 +519,15 @@ class GameButtonsManagerTest(unittest.TestCase):
         )
         self.assertEqual(
             actions_dict[self.manager.easy](),
-            self.manager.handle_difficulty_button(
-                DIFFICULTIES["EASY"], DIFFICULTIES["MAX_EASY"]
-            )(),
+            self.manager.handle_difficulty_button("EASY")(),
         )
         self.assertEqual(
             actions_dict[self.manager.medium](),
-            self.manager.handle_difficulty_button(
-                DIFFICULTIES["MEDIUM"], DIFFICULTIES["MAX_MEDIUM"]
-            )(),
+            self.manager.handle_difficulty_button("MEDIUM")(),
         )
         self.assertEqual(
             actions_dict[self.manager.hard](),
-            self.manager.handle_difficulty_button(
-                DIFFICULTIES["HARD"], DIFFICULTIES["MAX_HARD"]
-            )(),
+            self.manager.handle_difficulty_button("HARD")(),
         )
         self.assertEqual(
             actions_dict[self.manager.difficulty], self.manager.handle_difficulty_toggle
@@ -0,0 +1,162 @@
+"""
+This module tests the DisplayManager class which scales the canvas
+of the game to the window.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.managers.ui_managers.display_manager import DisplayManager, RESIZE_EVENTS
+
+
+class DisplayManagerTest(unittest.TestCase):
+    """Test cases for the DisplayManager class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        pygame.init()
+        self.settings = MagicMock()
+        self.settings.screen_width = 1260
+        self.settings.screen_height = 700
+        self.display = DisplayManager(self.settings)
+
+    def test_init(self):
+        """Test the initialization of the class."""
+        self.assertEqual(self.display.logical_size, (1260, 700))
+        self.assertEqual(self.display.canvas.get_size(), (1260, 700))
+        self.assertEqual(self.display.window.get_size(), (1260, 700))
+        self.assertEqual(self.display.window_flag, pygame.RESIZABLE)
+        self.assertEqual(self.display.viewport, pygame.Rect(0, 0, 1260, 700))
+        self.assertIsNone(self.display.target)
+        self.assertFalse(self.display.full_screen)
+        self.assertEqual(
+            self.display.desktop_size, pygame.display.get_desktop_sizes()[0]
+        )
+
+    def test_toggle_fullscreen(self):
+        """Test switching to fullscreen and back to the previous window."""
+        self.display.set_mode((1400, 800), pygame.RESIZABLE)
+        self.display.desktop_size = (2520, 1400)
+
+        with patch("pygame.display.Info") as mock_info:
+            self.display.toggle_fullscreen()
+
+            self.assertTrue(self.display.full_screen)
+            self.assertEqual(self.display.window_flag, pygame.FULLSCREEN)
+            self.assertEqual(self.display.viewport.size, (2520, 1400))
+
+            with patch(
+                "pygame.display.set_mode", wraps=pygame.display.set_mode
+            ) as mock_set_mode:
+                self.display.toggle_fullscreen()
+
+        self.assertFalse(self.display.full_screen)
+        self.assertEqual(self.display.window_flag, pygame.RESIZABLE)
+        mock_set_mode.assert_called_once_with((1400, 800), pygame.RESIZABLE)
+        mock_info.assert_not_called()
+
+    def test_resize_events(self):
+        """Test the window events that resize the canvas."""
+        self.assertIn(pygame.VIDEORESIZE, RESIZE_EVENTS)
+        self.assertIn(pygame.WINDOWSIZECHANGED, RESIZE_EVENTS)
+
+    def test_set_mode_keeps_aspect_ratio(self):
+        """Test that the canvas is scaled to the center of a larger window."""
+        self.display.set_mode((2520, 1600), pygame.RESIZABLE)
+
+        self.assertEqual(self.display.viewport, pygame.Rect(0, 100, 2520, 1400))
+        self.assertEqual(self.display.target.get_size(), (2520, 1400))
+
+    def test_integer_scaling(self):
+        """Test that the integer scaling only uses whole multiples."""
+        self.display.scaling = "integer"
+        self.display.set_mode((3000, 1600), pygame.RESIZABLE)
+
+        self.assertEqual(self.display.viewport.size, (2520, 1400))
+
+        # Windows smaller than the canvas are still filled.
+        self.display.set_mode((630, 400), pygame.RESIZABLE)
+
+        self.assertEqual(self.display.viewport.size, (630, 350))
+
+    def test_present_same_size(self):
+        """Test that the canvas is copied without scaling when it fits."""
+        self.display.canvas.fill("red")
+
+        with patch("pygame.display.flip") as mock_flip, patch(
+            "pygame.transform.scale"
+        ) as mock_scale:
+            self.display.present()
+
+        mock_scale.assert_not_called()
+        mock_flip.assert_called_once()
+        self.assertEqual(self.display.window.get_at((10, 10)), pygame.Color("red"))
+
+    def test_present_scaled(self):
+        """Test that the scaled canvas fills the viewport with black bars around."""
+        self.display.set_mode((2520, 1600), pygame.RESIZABLE)
+        self.display.canvas.fill("red")
+
+        with patch("pygame.display.flip"):
+            self.display.present()
+
+        window = self.display.window
+        self.assertEqual(window.get_at((0, 50)), pygame.Color("black"))
+        self.assertEqual(window.get_at((0, 100)), pygame.Color("red"))
+        self.assertEqual(window.get_at((2519, 1499)), pygame.Color("red"))
+        self.assertEqual(window.get_at((2519, 1550)), pygame.Color("black"))
+
+    def test_present_smooth(self):
+        """Test the smooth scaling of the canvas."""
+        self.display.scaling = "smooth"
+        self.display.set_mode((1890, 1050), pygame.RESIZABLE)
+
+        with patch("pygame.display.flip"), patch(
+            "pygame.transform.smoothscale"
+        ) as mock_smoothscale:
+            self.display.present()
+
+        mock_smoothscale.assert_called_once_with(
+            self.display.canvas, (1890, 1050), self.display.target
+        )
+
+    def test_resize(self):
+        """Test that the viewport follows the resized window."""
+        with patch(
+            "pygame.display.get_surface", return_value=pygame.Surface((1890, 1050))
+        ):
+            self.display.resize()
+
+        self.assertEqual(self.display.viewport, pygame.Rect(0, 0, 1890, 1050))
+
+    def test_request_resize(self):
+        """Test that the resize events of a frame are handled once."""
+        with patch.object(
+            self.display, "resize", wraps=self.display.resize
+        ) as mock_resize:
+            for _ in range(20):
+                self.display.request_resize()
+            self.assertTrue(self.display.resize_pending)
+
+            with patch("pygame.display.flip"):
+                self.display.present()
+                self.display.present()
+
+        mock_resize.assert_called_once()
+        self.assertFalse(self.display.resize_pending)
+
+    def test_to_canvas(self):
+        """Test the mapping of window positions to the canvas."""
+        self.display.set_mode((2520, 1600), pygame.RESIZABLE)
+
+        self.assertEqual(self.display.to_canvas((0, 100)), (0, 0))
+        self.assertEqual(self.display.to_canvas((1260, 800)), (630, 350))
+
+        with patch("pygame.mouse.get_pos", return_value=(2518, 1498)):
+            self.assertEqual(self.display.get_mouse_pos(), (1259, 699))
+
+
+if __name__ == "__main__":
+    unittest.main()
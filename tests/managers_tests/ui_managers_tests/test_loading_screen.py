@@ -18,13 +18,15 @@ class LoadingScreenTest(unittest.TestCase):
         """Set up test environment."""
         self.screen = MagicMock()
         self.screen.get_size.return_value = (800, 600)
+        self.display = MagicMock()
 
         with patch("pygame.font.Font"):
-            self.loading_screen = LoadingScreen(self.screen)
+            self.loading_screen = LoadingScreen(self.screen, self.display)
 
     def test_init(self):
         """Test the initialization of the class."""
         self.assertEqual(self.loading_screen.screen, self.screen)
+        self.assertEqual(self.loading_screen.display, self.display)
         self.assertEqual(self.loading_screen.load_bar_width, 400)
         self.assertEqual(self.loading_screen.load_bar_height, 25)
         self.assertEqual(self.loading_screen.load_percent, 0)
@@ -50,13 +52,13 @@ class LoadingScreenTest(unittest.TestCase):
 
     def test_draw(self):
         """Test the draw method."""
-        with patch("pygame.draw.rect"), patch("pygame.display.update"):
+        with patch("pygame.draw.rect"):
             self.loading_screen.draw()
 
             # Assert method calls
             self.screen.fill.assert_called_once_with((2, 24, 49, 255))
             self.assertEqual(pygame.draw.rect.call_count, 2)
-            pygame.display.update.assert_called_once()
+            self.display.present.assert_called_once()
             self.screen.blit.assert_called_once_with(
                 self.loading_screen.text,
                 (
@@ -47,120 +47,9 @@ class TestScreenManager(unittest.TestCase):
         self.assertEqual(self.screen_manager.buttons, self.buttons_manager)
         self.assertEqual(self.screen_manager.screen, self.screen)
         self.assertIsNotNone(self.screen_manager.player_controls)
-        self.assertEqual(self.screen_manager.screen_flag, pygame.RESIZABLE)
-        self.assertFalse(self.screen_manager.full_screen)
         self.assertEqual(self.screen_manager.singleplayer, self.singleplayer)
         self.assertIsNotNone(self.screen_manager.cursor_surface)
 
-    def test_update_buttons(self):
-        """Test the update_buttons method."""
-        self.screen_manager.update_buttons()
-
-        # Assert the expected position updates of the buttons
-        self.screen_manager.buttons.play.update_pos.assert_called_once_with(
-            self.screen.get_rect().center, y=-150
-        )
-        self.screen_manager.buttons.load_game.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.play.rect.centerx - 74,
-            self.screen_manager.buttons.play.rect.bottom - 4,
-        )
-        self.screen_manager.buttons.select_ship.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.load_game.rect.centerx - 74,
-            self.screen_manager.buttons.load_game.rect.bottom - 4,
-        )
-        self.screen_manager.buttons.difficulty.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.select_ship.rect.centerx - 74,
-            self.screen_manager.buttons.select_ship.rect.bottom - 4,
-        )
-        self.screen_manager.buttons.game_modes.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.difficulty.rect.centerx - 74,
-            self.screen_manager.buttons.difficulty.rect.bottom - 4,
-        )
-        self.screen_manager.buttons.high_scores.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.game_modes.rect.centerx - 74,
-            self.screen_manager.buttons.game_modes.rect.bottom - 4,
-        )
-        self.screen_manager.buttons.delete_scores.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.high_scores.rect.left - 85,
-            self.screen_manager.buttons.high_scores.rect.y,
-        )
-        self.screen_manager.buttons.menu.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.high_scores.rect.centerx - 74,
-            self.screen_manager.buttons.high_scores.rect.bottom - 4,
-        )
-        self.screen_manager.buttons.quit.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.menu.rect.centerx - 74,
-            self.screen_manager.buttons.menu.rect.bottom - 4,
-        )
-        self.screen_manager.buttons.easy.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.difficulty.rect.right - 10,
-            self.screen_manager.buttons.difficulty.rect.y,
-        )
-        self.screen_manager.buttons.medium.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.easy.rect.right - 5,
-            self.screen_manager.buttons.difficulty.rect.y,
-        )
-        self.screen_manager.buttons.hard.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.medium.rect.right - 5,
-            self.screen_manager.buttons.difficulty.rect.y,
-        )
-        self.screen_manager.buttons.normal.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.game_modes.rect.right - 8,
-            self.screen_manager.buttons.game_modes.rect.y,
-        )
-        self.screen_manager.buttons.endless.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.normal.rect.right - 5,
-            self.screen_manager.buttons.normal.rect.y,
-        )
-        self.screen_manager.buttons.slow_burn.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.endless.rect.right - 5,
-            self.screen_manager.buttons.endless.rect.y,
-        )
-        self.screen_manager.buttons.cosmic_conflict.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.slow_burn.rect.right - 5,
-            self.screen_manager.buttons.slow_burn.rect.y,
-        )
-        self.screen_manager.buttons.meteor_madness.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.normal.rect.left,
-            self.screen_manager.buttons.slow_burn.rect.bottom,
-        )
-        self.screen_manager.buttons.boss_rush.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.meteor_madness.rect.right - 5,
-            self.screen_manager.buttons.meteor_madness.rect.y,
-        )
-        self.screen_manager.buttons.last_bullet.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.boss_rush.rect.right - 5,
-            self.screen_manager.buttons.boss_rush.rect.y,
-        )
-        self.screen_manager.buttons.one_life_reign.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.last_bullet.rect.right - 5,
-            self.screen_manager.buttons.last_bullet.rect.y,
-        )
-
-        # Update Menu Buttons
-        self.screen_manager.buttons.single.update_pos.assert_called_once_with(
-            self.screen.get_rect().center, y=-80
-        )
-        self.screen_manager.buttons.multi.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.single.rect.centerx - 100,
-            self.screen_manager.buttons.single.rect.bottom - 4,
-        )
-        self.screen_manager.buttons.menu_quit.update_pos.assert_called_once_with(
-            self.screen_manager.buttons.multi.rect.centerx - 100,
-            self.screen_manager.buttons.multi.rect.bottom - 4,
-        )
-        self.screen_manager.settings.game_title_rect.centerx = (
-            self.screen.get_rect().centerx
-        )
-
-        # Update scoreboard
-        self.screen_manager.score_board.prep_level.assert_called_once()
-        self.screen_manager.score_board.render_scores.assert_called_once()
-        self.screen_manager.score_board.render_missiles_num.assert_called_once()
-        self.screen_manager.score_board.render_high_score.assert_called_once()
-        self.screen_manager.score_board.create_health.assert_called_once()
-        self.screen_manager.score_board.render_bullets_num.assert_called_once()
-
     @patch("pygame.mouse")
     @patch("pygame.Surface")
     def test__initialize_cursor(self, mock_surface, mock_mouse):
@@ -175,20 +64,19 @@ class TestScreenManager(unittest.TestCase):
 
         self.screen_manager.cursor_surface.blit.assert_called_once_with(self.settings.cursor_img, (0, 0))
 
-    @patch("pygame.mouse")
     @patch("pygame.Surface")
-    def test_draw_cursor(self, mock_surface, mock_mouse):
+    def test_draw_cursor(self, mock_surface):
         """Test the draw_cursor method."""
         mock_surface.return_value = pygame.Surface((50, 100))
         mock_cursor_rect = MagicMock()
         self.screen_manager.cursor_surface = MagicMock()
         self.settings.cursor_img = mock_surface.return_value
 
-        mock_mouse.get_pos.return_value = (5, 10)
+        self.game.display_manager.get_mouse_pos.return_value = (5, 10)
 
         self.screen_manager.draw_cursor()
 
-        mock_mouse.get_pos.assert_called_once()
+        self.game.display_manager.get_mouse_pos.assert_called_once()
         self.screen.blit.assert_called_once_with(self.screen_manager.cursor_surface, (5, 10))
 
     def test_create_controls(self):
@@ -319,26 +207,43 @@ class TestScreenManager(unittest.TestCase):
     def test_display_high_scores_on_screen(self):
         """Test the display_high_scores method."""
         self.settings.game_modes.game_mode = "normal"
-        mock_display_high_scores = MagicMock()
+        high_score_manager = self.screen_manager.game.high_score_manager
+        high_score_manager.store.version = 0
+        mock_render_high_scores = MagicMock(return_value=[])
         with patch(
-            "src.managers.ui_managers.screen_manager.display_high_scores",
-            mock_display_high_scores,
+            "src.managers.ui_managers.screen_manager.render_high_scores",
+            mock_render_high_scores,
         ):
             self.screen_manager.display_high_scores_on_screen()
 
-            mock_display_high_scores.assert_called_once_with(
-                self.screen_manager, self.screen, "high_scores", "NORMAL"
+            mock_render_high_scores.assert_called_once_with(
+                self.screen.get_size(),
+                high_score_manager.get_scores.return_value,
+                "NORMAL",
             )
+            high_score_manager.get_scores.assert_called_once_with("high_scores")
 
-            mock_display_high_scores.reset_mock()
-            self.settings.game_modes.game_mode = "endless_onslaught"
+            # The table is cached until the scores change.
+            mock_render_high_scores.reset_mock()
+            self.screen_manager.display_high_scores_on_screen()
+            mock_render_high_scores.assert_not_called()
 
+            self.settings.game_modes.game_mode = "endless_onslaught"
             self.screen_manager.display_high_scores_on_screen()
 
-            mock_display_high_scores.assert_called_once_with(
-                self.screen_manager, self.screen, "endless_scores", "ENDLESS ONSLAUGHT"
+            mock_render_high_scores.assert_called_once_with(
+                self.screen.get_size(),
+                high_score_manager.get_scores.return_value,
+                "ENDLESS ONSLAUGHT",
             )
 
+            mock_render_high_scores.reset_mock()
+            high_score_manager.store.version = 1
+            self.screen_manager.display_high_scores_on_screen()
+            mock_render_high_scores.assert_called_once()
+
+        self.screen.blits.assert_called_with([], doreturn=False)
+
     def test_display_pause(self):
         """Test the display_pause method."""
         self.screen_manager.display_pause()
@@ -353,83 +258,6 @@ class TestScreenManager(unittest.TestCase):
             self.settings.pause.get_rect().centery, self.screen.get_rect().centery
         )
 
-    def test_update_window_mode_fullscreen(self):
-        """Test the update_window_mode in fullscreen."""
-        with patch("pygame.display"):
-            mock_info = MagicMock()
-            mock_info.current_w = 1920
-            mock_info.current_h = 1080
-            pygame.display.Info.return_value = mock_info
-            self.screen_manager.full_screen = True
-            self.screen_manager.game.ui_options.resizable = True
-
-            self.screen_manager.update_window_mode()
-
-            pygame.display.set_mode.assert_called_once_with(
-                (1920, 1080), pygame.FULLSCREEN
-            )
-            self.assertFalse(self.screen_manager.game.ui_options.resizable)
-
-    def test_update_window_mode_resizable(self):
-        """Test the update window mode in resizable."""
-        with patch("pygame.display"):
-            mock_info = MagicMock()
-            mock_info.current_w = 1920
-            mock_info.current_h = 1080
-            pygame.display.Info.return_value = mock_info
-            self.screen_manager.full_screen = False
-            self.screen_manager.game.ui_options.resizable = True
-
-            self.screen_manager.update_window_mode()
-
-            pygame.display.set_mode.assert_called_once_with(
-                (1920, 1080), pygame.RESIZABLE
-            )
-            self.assertFalse(self.screen_manager.game.ui_options.resizable)
-
-    def test_toggle_window_mode(self):
-        """Test the toggle window mode method."""
-        self.screen_manager.full_screen = True
-        self.screen_manager.game.ui_options.resizable = True
-
-        self.screen_manager.toggle_window_mode()
-
-        self.assertFalse(self.screen_manager.full_screen)
-        self.assertFalse(self.screen_manager.game.ui_options.resizable)
-
-        self.screen_manager.toggle_window_mode()
-
-        self.assertTrue(self.screen_manager.full_screen)
-        self.assertTrue(self.screen_manager.game.ui_options.resizable)
-
-    @patch("src.managers.ui_managers.screen_manager.resize_image")
-    def test_resize_screen(self, mock_resize):
-        """Test the resize_screen method."""
-        pygame.display.set_mode = MagicMock()
-        mock_ship = MagicMock()
-        self.game.ships = [mock_ship]
-        self.game.game_over_manager.set_game_end_position = MagicMock()
-
-        new_size = (1600, 900)
-        self.screen_manager.resize_screen(new_size)
-
-        # Assertions
-        self.assertEqual(
-            self.settings.screen_width, self.screen_manager.screen.get_rect().width
-        )
-        self.assertEqual(
-            self.settings.screen_height, self.screen_manager.screen.get_rect().height
-        )
-
-        self.assertEqual(mock_resize.call_count, 5)
-
-        self.game.game_over_manager.set_game_end_position.assert_called_once()
-        self.game.save_load_manager.update_rect_positions.assert_called_once()
-        self.game.save_load_manager.set_screen_title_position.assert_called_once()
-
-        mock_ship.screen_rect = self.screen.get_rect.return_value
-        mock_ship.set_cosmic_conflict_pos.assert_called_once()
-
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+"""
+This module tests the ConfirmDialog class that asks the player
+to confirm an action.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.ui.dialog import ConfirmDialog, DIALOG_EVENTS
+
+
+class ConfirmDialogTest(unittest.TestCase):
+    """Test cases for the ConfirmDialog class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        pygame.init()
+        self.game = MagicMock()
+        self.game.screen = pygame.Surface((1260, 700))
+        self.game.display_manager.to_canvas.side_effect = lambda position: position
+        self.dialog = ConfirmDialog(self.game)
+
+    def ask(self, *events):
+        """Ask a question, answered by the given events."""
+        with patch("pygame.event.get", side_effect=[[event] for event in events]):
+            return self.dialog.ask("Delete all save files?")
+
+    def test_panel_is_cached(self):
+        """Test that the panel of a question is rendered once."""
+        panel, panel_rect, buttons = self.dialog.get_panel("Delete all save files?")
+
+        self.assertIs(self.dialog.get_panel("Delete all save files?")[0], panel)
+        self.assertEqual(panel_rect.center, (630, 350))
+        self.assertTrue(panel_rect.contains(buttons[True]))
+        self.assertTrue(panel_rect.contains(buttons[False]))
+        self.assertLess(buttons[True].right, buttons[False].left)
+
+    def test_ask_keys(self):
+        """Test answering the question with the keyboard."""
+        key_y = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_y)
+        key_escape = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+
+        self.assertTrue(self.ask(key_y))
+        self.assertFalse(self.ask(key_escape))
+
+    def test_ask_click(self):
+        """Test answering the question with the mouse, after a frame is drawn."""
+        buttons = self.dialog.get_panel("Delete all save files?")[2]
+        outside = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0))
+        click_no = pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, button=1, pos=buttons[False].center
+        )
+
+        self.assertFalse(self.ask(outside, click_no))
+        self.game.display_manager.present.assert_called_once()
+        self.game.screen_manager.draw_cursor.assert_called_once()
+
+    def test_ask_resize(self):
+        """Test that the window can be resized while the dialog is open."""
+        resize = pygame.event.Event(pygame.VIDEORESIZE, size=(1600, 900))
+        key_return = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)
+
+        self.assertTrue(self.ask(resize, key_return))
+        self.game.display_manager.request_resize.assert_called_once()
+
+    def test_other_events_stay_queued(self):
+        """Test that the dialog only takes the events it handles."""
+        self.assertNotIn(pygame.MOUSEMOTION, DIALOG_EVENTS)
+        self.assertIn(pygame.KEYDOWN, DIALOG_EVENTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+This module tests the Layout class that places the rects
+of the user interface.
+"""
+
+import unittest
+
+import pygame
+
+from src.ui.layout import Layout
+
+
+class LayoutTest(unittest.TestCase):
+    """Test cases for the Layout class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.rules = {
+            "title": ("center", ("screen", "centerx", 0), ("screen", "centery", -100)),
+            "first": ("topleft", ("title", "left", 0), ("title", "bottom", 10)),
+            "second": ("topleft", ("first", "right", 5), ("first", "y", 0)),
+            "footer": ("midbottom", ("screen", "centerx", 0), ("screen", "bottom", 0)),
+        }
+        self.layout = Layout(self.rules)
+        self.rects = {
+            "screen": pygame.Rect(0, 0, 800, 600),
+            "title": pygame.Rect(0, 0, 200, 50),
+            "first": pygame.Rect(0, 0, 100, 40),
+            "second": pygame.Rect(0, 0, 100, 40),
+            "footer": pygame.Rect(0, 0, 300, 20),
+        }
+
+    def test_apply(self):
+        """Test that every rect is placed from its anchors."""
+        moved = self.layout.apply(self.rects)
+
+        self.assertEqual(moved, ["title", "first", "second", "footer"])
+        self.assertEqual(self.rects["title"].center, (400, 200))
+        self.assertEqual(self.rects["first"].topleft, (300, 235))
+        self.assertEqual(self.rects["second"].topleft, (405, 235))
+        self.assertEqual(self.rects["footer"].midbottom, (400, 600))
+
+    def test_apply_unchanged(self):
+        """Test that nothing moves when the layout is applied twice."""
+        self.layout.apply(self.rects)
+
+        self.assertEqual(self.layout.apply(self.rects), [])
+
+    def test_apply_changed(self):
+        """Test that only the rects depending on the changed ones are placed."""
+        self.layout.apply(self.rects)
+        self.rects["first"].x = 0
+        self.rects["footer"].x = 0
+
+        moved = self.layout.apply(self.rects, ["first"])
+
+        self.assertEqual(moved, ["second"])
+        self.assertEqual(self.rects["second"].topleft, (105, 235))
+        # The footer doesn't depend on the first rect.
+        self.assertEqual(self.rects["footer"].x, 0)
+
+    def test_apply_stops_at_unmoved_rects(self):
+        """Test that a rect that doesn't move doesn't update its dependents."""
+        self.layout.apply(self.rects)
+        self.rects["second"].x = 0
+
+        # The first rect is placed again at the same position.
+        moved = self.layout.apply(self.rects, ["title"])
+
+        self.assertEqual(moved, [])
+        self.assertEqual(self.rects["second"].x, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
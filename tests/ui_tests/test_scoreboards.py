@@ -8,6 +8,14 @@ from unittest.mock import MagicMock, patch, call
 
 import pygame
 
+from src.game_logic.game_events import (
+    AlienKilled,
+    ScoreChanged,
+    ShipHit,
+    AmmoChanged,
+    WeaponFired,
+    LaserStatus,
+)
 from src.ui.scoreboards import ScoreBoard
 from src.entities.player_entities.player_health import Heart
 
@@ -48,6 +56,42 @@ class ScoreBoardTest(unittest.TestCase):
         self.assertEqual(self.scoreboard.level_color, "blue")
         self.assertIsInstance(self.scoreboard.font, pygame.font.Font)
         self.assertIsInstance(self.scoreboard.bullets_num_font, pygame.font.Font)
+        self.assertIsNone(self.scoreboard.laser_message_time)
+
+    def test_handle_events(self):
+        """Test that each part of the HUD is rendered once per frame."""
+        self.scoreboard.render_scores = MagicMock()
+        self.scoreboard.update_high_score = MagicMock()
+        self.scoreboard.create_health = MagicMock()
+        self.scoreboard.render_missiles_num = MagicMock()
+        self.scoreboard.render_bullets_num = MagicMock()
+
+        self.scoreboard.handle_events(
+            [
+                AlienKilled("thunderbird"),
+                AlienKilled("phoenix"),
+                ScoreChanged(),
+                ShipHit("phoenix"),
+                AmmoChanged("missiles"),
+                WeaponFired("missile"),
+            ]
+        )
+
+        self.scoreboard.render_scores.assert_called_once()
+        self.scoreboard.update_high_score.assert_called_once()
+        self.scoreboard.create_health.assert_called_once()
+        self.scoreboard.render_missiles_num.assert_called_once()
+        self.scoreboard.render_bullets_num.assert_not_called()
+        self.assertIsNone(self.scoreboard.laser_message_time)
+
+    @patch("src.ui.scoreboards.pygame.time.get_ticks", return_value=2500)
+    def test_handle_events_laser_not_ready(self, _mock_get_ticks):
+        """Test that a laser fired too early starts the laser message."""
+        self.scoreboard.handle_events([LaserStatus(ready=True)])
+        self.assertIsNone(self.scoreboard.laser_message_time)
+
+        self.scoreboard.handle_events([LaserStatus(ready=False)])
+        self.assertEqual(self.scoreboard.laser_message_time, 2500)
 
     def test_render_scores(self):
         """Test the render_scores method."""
@@ -206,6 +250,7 @@ class ScoreBoardTest(unittest.TestCase):
         self.scoreboard.draw_high_score = MagicMock()
         self.scoreboard.draw_player_health = MagicMock()
         self.scoreboard.draw_bullets_info = MagicMock()
+        self.scoreboard.draw_laser_messages = MagicMock()
 
         self.scoreboard.show_score()
 
@@ -215,6 +260,7 @@ class ScoreBoardTest(unittest.TestCase):
         self.scoreboard.draw_high_score.assert_called_once()
         self.scoreboard.draw_player_health.assert_called_once()
         self.scoreboard.draw_bullets_info.assert_called_once()
+        self.scoreboard.draw_laser_messages.assert_called_once()
 
     @patch("src.ui.scoreboards.draw_image")
     def test_draw_player_scores(self, mock_draw_img):
@@ -409,5 +455,87 @@ class ScoreBoardTest(unittest.TestCase):
         self.scoreboard.thunderbird_health.draw.assert_not_called()
 
 
+    def _laser_message_ship(self, laser_ready, laser_fired):
+        """Set up one ship and the laser message for the laser tests."""
+        ship = MagicMock()
+        ship.laser_ready = laser_ready
+        ship.laser_fired = laser_fired
+        self.game.ships = [ship]
+        self.scoreboard.laser_message_time = 1000
+        return ship
+
+    @patch("src.ui.scoreboards.pygame.time.get_ticks", return_value=2000)
+    @patch("src.ui.scoreboards.display_custom_message")
+    def test_draw_laser_messages_ready_cosmic_conflict(
+        self, mock_display_message, _mock_get_ticks
+    ):
+        """Test the laser ready message in the cosmic conflict game mode."""
+        ship = self._laser_message_ship(laser_ready=True, laser_fired=False)
+        self.game.settings.game_modes.cosmic_conflict = True
+
+        self.scoreboard.draw_laser_messages()
+
+        mock_display_message.assert_called_once_with(
+            self.game.screen, "Ready!", ship, cosmic=True
+        )
+
+    @patch("src.ui.scoreboards.pygame.time.get_ticks", return_value=2000)
+    @patch("src.ui.scoreboards.display_custom_message")
+    def test_draw_laser_messages_not_ready(self, mock_display_message, _mock_get_ticks):
+        """Test the message of a laser fired before it was ready."""
+        ship = self._laser_message_ship(laser_ready=False, laser_fired=True)
+        self.game.settings.game_modes.cosmic_conflict = False
+        self.game.settings.game_modes.last_bullet = False
+
+        self.scoreboard.draw_laser_messages()
+
+        mock_display_message.assert_called_once_with(
+            self.game.screen, "Not Ready!", ship
+        )
+        self.assertEqual(self.scoreboard.laser_message_time, 1000)
+
+    @patch("src.ui.scoreboards.pygame.time.get_ticks", return_value=2000)
+    @patch("src.ui.scoreboards.display_custom_message")
+    def test_draw_laser_messages_not_ready_last_bullet(
+        self, mock_display_message, _mock_get_ticks
+    ):
+        """Test the laser message in the last bullet game mode."""
+        ship = self._laser_message_ship(laser_ready=False, laser_fired=True)
+        self.game.settings.game_modes.cosmic_conflict = False
+        self.game.settings.game_modes.last_bullet = True
+
+        self.scoreboard.draw_laser_messages()
+
+        mock_display_message.assert_called_once_with(
+            self.game.screen, "Not available!", ship
+        )
+
+    @patch("src.ui.scoreboards.pygame.time.get_ticks", return_value=2000)
+    @patch("src.ui.scoreboards.display_custom_message")
+    def test_draw_laser_messages_not_ready_cosmic(
+        self, mock_display_message, _mock_get_ticks
+    ):
+        """Test the laser message in the cosmic conflict game mode."""
+        ship = self._laser_message_ship(laser_ready=False, laser_fired=True)
+        self.game.settings.game_modes.cosmic_conflict = True
+        self.game.settings.game_modes.last_bullet = False
+
+        self.scoreboard.draw_laser_messages()
+
+        mock_display_message.assert_called_once_with(
+            self.game.screen, "Not Ready!", ship, cosmic=True
+        )
+
+    @patch("src.ui.scoreboards.pygame.time.get_ticks", return_value=2600)
+    @patch("src.ui.scoreboards.display_custom_message")
+    def test_draw_laser_messages_expired(self, mock_display_message, _mock_get_ticks):
+        """Test that the not ready message is hidden after 1.5 seconds."""
+        self._laser_message_ship(laser_ready=False, laser_fired=True)
+
+        self.scoreboard.draw_laser_messages()
+
+        mock_display_message.assert_not_called()
+        self.assertIsNone(self.scoreboard.laser_message_time)
+
 if __name__ == "__main__":
     unittest.main()
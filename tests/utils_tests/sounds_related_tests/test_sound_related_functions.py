@@ -14,7 +14,6 @@ from src.utils.game_utils import (
     play_music,
     load_sound_files,
     load_music_files,
-    get_available_channels,
     set_sounds_volume,
     play_sound,
 )
@@ -99,67 +98,22 @@ class SoundUtilsTest(unittest.TestCase):
         # Assert that pygame.mixer.music.set_volume was called
         self.assertEqual(mock_music.call_count, len(music))
 
-    def test_get_available_channels(self):
-        """Test getting available sound channels."""
-        with patch("pygame.mixer") as mock_mixer:
-            mock_channel = mock_mixer.Channel
-            available_channels = [mock_channel(0), mock_channel(1)]
-
-            with patch("src.utils.game_utils.get_available_channels") as mock_channels:
-                mock_channels.return_value = available_channels
-                result = get_available_channels()
-
-            self.assertIsInstance(available_channels, list)
-
-            for channel in result:
-                self.assertIsInstance(channel, pygame.mixer.Channel)
-
     def test_play_sound(self):
-        """Test playing a sound."""
+        """Test playing a sound through the voice allocator."""
         sounds_list = {
             "bullet": pygame.mixer.Sound(os.path.join(SOUND_PATH, "bullet.wav")),
-            "alien_exploding": pygame.mixer.Sound(
-                os.path.join(SOUND_PATH, "alien_exploding.wav")
-            ),
             "sound1": pygame.mixer.Sound(os.path.join(SOUND_PATH, "sound1.wav")),
-            "sound2": pygame.mixer.Sound(os.path.join(SOUND_PATH, "sound2.wav")),
         }
 
-        with patch("pygame.mixer.Channel") as mock_channel, patch(
-            "src.utils.game_utils.get_available_channels"
-        ) as mock_get_available_channels:
-            mock_get_available_channels.return_value = [
-                pygame.mixer.Channel(2),
-                pygame.mixer.Channel(3),
-            ]
-
-            # Call the function two times to test for both sounds
+        with patch("src.utils.game_utils.voice_allocator") as mock_allocator:
             play_sound(sounds_list, "bullet")
-            play_sound(sounds_list, "alien_exploding")
             play_sound(sounds_list, "sound1")
 
         expected_calls = [
-            call(2),
-            call(3),
-            call(7),
-            call(6),
+            call(sounds_list["bullet"], "bullet"),
+            call(sounds_list["sound1"], "sound1"),
         ]
-
-        self.assertEqual(mock_channel.call_args_list, expected_calls)
-
-        mock_get_available_channels.assert_called_once()
-        self.assertEqual(mock_channel.call_count, 4)
-
-        # Assert that the play method was called with the correct sound
-        expected_play_calls = [
-            call(sounds_list["bullet"]),
-            call(sounds_list["alien_exploding"]),
-            call(sounds_list["sound1"]),
-        ]
-
-        self.assertEqual(
-            mock_channel.return_value.play.call_args_list, expected_play_calls
-        )
+        self.assertEqual(mock_allocator.play.call_args_list, expected_calls)
 
 
 if __name__ == "__main__":
@@ -12,7 +12,6 @@ from src.utils.animation_constants import (
     shield_frames,
     immune_frames,
     explosion_frames,
-    asteroid_frames,
     empower_frames,
     missile_frames,
     missile_ex_frames,
@@ -106,19 +105,6 @@ class AnimationConstantsTests(unittest.TestCase):
             "Failed: Number of frames in explosion_frames is not equal to 89",
         )
 
-    def test_asteroid_frames(self):
-        """
-        Test the asteroid_frames constant.
-        """
-        self.assertIsInstance(
-            asteroid_frames, list, "Failed: asteroid_frames is not an instance of list"
-        )
-        self.assertEqual(
-            len(asteroid_frames),
-            120,
-            "Failed: Number of frames in asteroid_frames is not equal to 120",
-        )
-
     def test_empower_frames(self):
         """
         Test the empower_frames constant.
@@ -10,13 +10,11 @@ from unittest.mock import patch, MagicMock
 import pygame
 
 from src.utils.game_utils import (
-    load_high_scores,
-    display_high_scores,
+    render_high_scores,
     get_player_name,
     render_label,
     draw_buttons,
 )
-from src.utils.constants import DEFAULT_HIGH_SCORES
 
 
 class HighScoreFunctionsTests(unittest.TestCase):
@@ -31,55 +29,15 @@ class HighScoreFunctionsTests(unittest.TestCase):
     def tearDown(self):
         pygame.quit()
 
-    @patch("builtins.open")
-    @patch("json.load")
-    def test_load_high_scores_existing_file(self, mock_json_load, mock_open):
-        """Test loading high scores from an existing file."""
-        mock_file = MagicMock()
-        mock_open.return_value.__enter__.return_value = mock_file
-        expected_scores = {"score_key": [10, 20, 30]}
-
-        mock_json_load.return_value = expected_scores
-
-        scores = load_high_scores(self.game)
-
-        mock_open.assert_called_once_with(
-            "single_high_score.json", "r", encoding="utf-8"
-        )
-        mock_json_load.assert_called_once_with(mock_file)
-
-        self.assertEqual(scores, expected_scores)
-
-    @patch("builtins.open")
-    @patch("json.load")
-    def test_load_high_scores_non_existing_file(self, mock_json_load, mock_open):
-        """Test loading high scores from a non-existing file."""
-        mock_open.side_effect = FileNotFoundError
-        expected_scores = DEFAULT_HIGH_SCORES
-
-        self.game.singleplayer = False
-
-        scores = load_high_scores(self.game)
-
-        mock_open.assert_called_once_with("high_score.json", "r", encoding="utf-8")
-        mock_json_load.assert_not_called()
-
-        self.assertEqual(scores, expected_scores)
-
-    @patch("src.utils.game_utils.load_high_scores")
     @patch("src.utils.game_utils.render_text")
     @patch("pygame.font.SysFont")
-    def test_display_high_scores(
-        self, mock_sysfont, mock_render_text, mock_load_high_scores
-    ):
-        """Test the display_high_scores function."""
+    def test_render_high_scores(self, mock_sysfont, mock_render_text):
+        """Test the render_high_scores function."""
         # Set up mock objects and test data
         screen = MagicMock()
         screen.get_size.return_value = (800, 600)
-        score_key = "score_key"
         game_mode_name = "NORMAL"
         scores = [{"name": "Player1", "score": 10}, {"name": "Player2", "score": 20}]
-        mock_load_high_scores.return_value = {score_key: scores}
 
         # mock_render_text side effects
         title_text_surfaces = [MagicMock()]
@@ -94,7 +52,7 @@ class HighScoreFunctionsTests(unittest.TestCase):
             (score_text_surfaces, score_text_rects),
         ]
 
-        display_high_scores(self.game, screen, score_key, game_mode_name)
+        blits = render_high_scores(screen.get_size(), scores, game_mode_name)
 
         # Assertions
         self.assertEqual(mock_sysfont.call_count, 2)
@@ -120,13 +78,16 @@ class HighScoreFunctionsTests(unittest.TestCase):
             (screen.get_size()[0] // 2 - 270, screen.get_size()[1] // 2 - 50),
             int(screen.get_size()[1] * 0.05),
         )
-        screen.blit.assert_any_call(title_text_surfaces[0], title_text_rects[0])
-        screen.blit.assert_any_call(rank_text_surfaces[0], rank_text_rects[0])
-        screen.blit.assert_any_call(rank_text_surfaces[1], rank_text_rects[1])
-        screen.blit.assert_any_call(score_text_surfaces[0], score_text_rects[0])
-        screen.blit.assert_any_call(score_text_surfaces[1], score_text_rects[1])
-
-        mock_load_high_scores.assert_called_with(self.game)
+        self.assertEqual(
+            blits,
+            [
+                (title_text_surfaces[0], title_text_rects[0]),
+                (rank_text_surfaces[0], rank_text_rects[0]),
+                (rank_text_surfaces[1], rank_text_rects[1]),
+                (score_text_surfaces[0], score_text_rects[0]),
+                (score_text_surfaces[1], score_text_rects[1]),
+            ],
+        )
 
     @patch("pygame.font.SysFont")
     def test_get_player_name(self, mock_sysfont):
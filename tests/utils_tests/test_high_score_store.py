@@ -0,0 +1,159 @@
+"""
+This module tests the HighScoreStore class that keeps the high score
+tables in memory and writes them to disk in the background.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.utils.high_score_store import HighScoreStore
+
+
+class HighScoreStoreTests(unittest.TestCase):
+    """Test cases for the HighScoreStore class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "high_score.json")
+        self.store = HighScoreStore(max_entries=3)
+
+    def tearDown(self):
+        """Wait for the pending writes and clean up the temporary folder."""
+        self.store.flush()
+        self.temp_dir.cleanup()
+
+    def _write_file(self, data):
+        """Write a high score file."""
+        with open(self.filename, "w", encoding="utf-8") as score_file:
+            json.dump(data, score_file)
+
+    def _read_file(self):
+        """Read the high score file."""
+        with open(self.filename, "r", encoding="utf-8") as score_file:
+            return json.load(score_file)
+
+    def test_get_scores_sorted(self):
+        """Test that the loaded tables are sorted and invalid entries dropped."""
+        self._write_file(
+            {
+                "high_scores": [
+                    {"name": "A", "score": 10},
+                    0,
+                    {"name": "B", "score": 30},
+                ]
+            }
+        )
+
+        scores = self.store.get_scores(self.filename, "high_scores")
+
+        self.assertEqual(
+            scores, [{"name": "B", "score": 30}, {"name": "A", "score": 10}]
+        )
+
+    def test_get_scores_limited(self):
+        """Test that a file with too many entries is cut when it is loaded."""
+        self._write_file(
+            {
+                "high_scores": [
+                    {"name": str(score), "score": score} for score in range(6)
+                ]
+            }
+        )
+
+        scores = self.store.get_scores(self.filename, "high_scores")
+
+        self.assertEqual([entry["score"] for entry in scores], [5, 4, 3])
+
+    def test_file_is_loaded_once(self):
+        """Test that the file is only read the first time it is used."""
+        self._write_file({"high_scores": [{"name": "A", "score": 10}]})
+
+        self.store.get_scores(self.filename, "high_scores")
+        with patch("builtins.open") as mock_open:
+            self.store.get_scores(self.filename, "high_scores")
+            self.store.has_name(self.filename, "high_scores", "A")
+
+        mock_open.assert_not_called()
+
+    def test_missing_file(self):
+        """Test that a missing file gives empty tables."""
+        self.assertEqual(self.store.get_scores(self.filename, "high_scores"), [])
+
+    def test_add_score(self):
+        """Test that scores are inserted in order and the table is truncated."""
+        for name, score in [("A", 10), ("B", 40), ("C", 20), ("D", 30)]:
+            self.store.add_score(self.filename, "high_scores", name, score)
+
+        self.assertEqual(
+            [
+                entry["name"]
+                for entry in self.store.get_scores(self.filename, "high_scores")
+            ],
+            ["B", "D", "C"],
+        )
+        self.assertEqual(self.store.version, 4)
+
+    def test_add_score_replaces_equal_score(self):
+        """Test that an entry with the same score is replaced."""
+        self.store.add_score(self.filename, "high_scores", "A", 10)
+        self.store.add_score(self.filename, "high_scores", "B", 10)
+
+        self.assertEqual(
+            self.store.get_scores(self.filename, "high_scores"),
+            [{"name": "B", "score": 10}],
+        )
+
+    def test_has_name(self):
+        """Test the has_name method."""
+        self.store.add_score(self.filename, "high_scores", "A", 10)
+
+        self.assertTrue(self.store.has_name(self.filename, "high_scores", "A"))
+        self.assertFalse(self.store.has_name(self.filename, "high_scores", "B"))
+        self.assertFalse(self.store.has_name(self.filename, "endless_scores", "A"))
+
+    def test_changes_are_written(self):
+        """Test that changes are written to the file in the background."""
+        self.store.add_score(self.filename, "high_scores", "A", 10)
+        self.store.add_score(self.filename, "endless_scores", "B", 20)
+        self.store.flush()
+
+        self.assertEqual(
+            self._read_file(),
+            {
+                "high_scores": [{"name": "A", "score": 10}],
+                "endless_scores": [{"name": "B", "score": 20}],
+            },
+        )
+
+    def test_delete_scores(self):
+        """Test that a deleted table is removed from the file."""
+        self._write_file(
+            {
+                "high_scores": [{"name": "A", "score": 10}],
+                "endless_scores": [{"name": "B", "score": 20}],
+            }
+        )
+
+        self.store.delete_scores(self.filename, "high_scores")
+        self.store.flush()
+
+        self.assertEqual(self.store.get_scores(self.filename, "high_scores"), [])
+        self.assertEqual(
+            self._read_file(), {"endless_scores": [{"name": "B", "score": 20}]}
+        )
+        self.assertEqual(self.store.version, 1)
+
+    def test_delete_missing_scores(self):
+        """Test that deleting a missing table does not write the file."""
+        self.store.delete_scores(self.filename, "high_scores")
+
+        self.assertIsNone(self.store.thread)
+        self.assertEqual(self.store.version, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+This module tests the functions that load the key bindings of the players
+and build the key table.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.utils.constants import DEFAULT_KEY_BINDINGS
+from src.utils.key_bindings import build_key_table, get_key_code, load_key_bindings
+
+
+class KeyBindingsTests(unittest.TestCase):
+    """Test cases for the key bindings functions."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "key_bindings.json")
+
+    def tearDown(self):
+        """Clean up the temporary folder."""
+        self.temp_dir.cleanup()
+
+    def write_config(self, config):
+        """Write a key bindings file."""
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            json.dump(config, file)
+
+    def test_get_key_code(self):
+        """Test the key codes of the key names."""
+        self.assertEqual(get_key_code("d"), pygame.K_d)
+        self.assertEqual(get_key_code("RSHIFT"), pygame.K_RSHIFT)
+        self.assertIsNone(get_key_code("NOT_A_KEY"))
+        self.assertIsNone(get_key_code("init"))
+        self.assertIsNone(get_key_code(5))
+
+    def test_load_default_bindings(self):
+        """Test that the defaults are used without a key bindings file."""
+        bindings = load_key_bindings(self.file_path)
+
+        self.assertEqual(bindings, DEFAULT_KEY_BINDINGS)
+        self.assertIsNot(bindings["thunderbird"], DEFAULT_KEY_BINDINGS["thunderbird"])
+
+    def test_load_user_bindings(self):
+        """Test that the valid bindings of the file replace the defaults."""
+        self.write_config(
+            {
+                "thunderbird": {"fire": "j", "laser": "NOT_A_KEY", "jump": "k"},
+                "phoenix": {"missile": "KP0"},
+                "unknown": {"fire": "f"},
+            }
+        )
+
+        bindings = load_key_bindings(self.file_path)
+
+        self.assertEqual(bindings["thunderbird"]["fire"], "j")
+        self.assertEqual(bindings["thunderbird"]["laser"], "c")
+        self.assertNotIn("jump", bindings["thunderbird"])
+        self.assertEqual(bindings["phoenix"]["missile"], "KP0")
+        self.assertNotIn("unknown", bindings)
+
+    def test_load_invalid_file(self):
+        """Test that a broken key bindings file is ignored."""
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            file.write("{not json")
+
+        self.assertEqual(load_key_bindings(self.file_path), DEFAULT_KEY_BINDINGS)
+
+        self.write_config(["d"])
+        self.assertEqual(load_key_bindings(self.file_path), DEFAULT_KEY_BINDINGS)
+
+    def test_build_key_table(self):
+        """Test that every key maps to its player and input bit."""
+        table = build_key_table(DEFAULT_KEY_BINDINGS)
+
+        self.assertEqual(len(table), 14)
+        self.assertEqual(table[pygame.K_SPACE], ("thunderbird", 16))
+        self.assertEqual(table[pygame.K_RCTRL], ("phoenix", 32))
+        self.assertEqual(table[pygame.K_LEFT], ("phoenix", 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
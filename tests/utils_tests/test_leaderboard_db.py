@@ -0,0 +1,133 @@
+"""
+This module tests the Leaderboard class that keeps the high scores
+and the match history in a SQLite database.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from src.utils.leaderboard_db import Leaderboard
+
+
+class LeaderboardTests(unittest.TestCase):
+    """Test cases for the Leaderboard class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "high_score.json")
+        self.db_path = os.path.join(self.temp_dir.name, "leaderboard.db")
+        self.leaderboard = Leaderboard(self.db_path, max_entries=3)
+
+    def tearDown(self):
+        """Close the database and clean up the temporary folder."""
+        self.leaderboard.close()
+        self.temp_dir.cleanup()
+
+    def _write_file(self, data):
+        """Write a high score file."""
+        with open(self.filename, "w", encoding="utf-8") as score_file:
+            json.dump(data, score_file)
+
+    def test_rank_index(self):
+        """Test that top score queries use the rank index."""
+        plan = self.leaderboard.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT name, score FROM matches "
+            "WHERE board = ? AND mode = ? ORDER BY score DESC LIMIT 10",
+            ("high_score.json", "high_scores"),
+        ).fetchall()
+
+        details = " ".join(row["detail"] for row in plan)
+        self.assertIn("matches_rank", details)
+        self.assertNotIn("TEMP B-TREE", details)
+
+    def test_migrate_json(self):
+        """Test that a JSON file is imported once, on first use."""
+        self._write_file(
+            {
+                "high_scores": [{"name": "A", "score": 10}, 0],
+                "endless_scores": [{"name": "B", "score": 20}],
+            }
+        )
+
+        self.assertEqual(
+            self.leaderboard.get_scores(self.filename, "high_scores"),
+            [{"name": "A", "score": 10}],
+        )
+
+        # A new connection must not import the file again.
+        self.leaderboard.close()
+        self.leaderboard = Leaderboard(self.db_path)
+        self.assertEqual(
+            self.leaderboard.get_scores(self.filename, "endless_scores"),
+            [{"name": "B", "score": 20}],
+        )
+
+    def test_add_score(self):
+        """Test that the top scores are sorted and limited."""
+        for name, score in [("A", 10), ("B", 40), ("C", 20), ("D", 30)]:
+            self.leaderboard.add_score(self.filename, "high_scores", name, score)
+
+        self.assertEqual(
+            [
+                entry["name"]
+                for entry in self.leaderboard.get_scores(self.filename, "high_scores")
+            ],
+            ["B", "D", "C"],
+        )
+        self.assertEqual(self.leaderboard.version, 4)
+        self.assertTrue(self.leaderboard.has_name(self.filename, "high_scores", "C"))
+        self.assertFalse(self.leaderboard.has_name(self.filename, "high_scores", "A"))
+
+    def test_history_and_stats(self):
+        """Test that every match is kept in the history, apart from
+        the high scores.
+        """
+        match = {"ship": "Thunderbird_1", "difficulty": "HARD", "level": 5}
+        self.leaderboard.record_match(
+            self.filename, "boss_rush_scores", 100, dict(match, duration=30.0)
+        )
+        self.leaderboard.record_match(
+            self.filename, "boss_rush_scores", 300, dict(match, duration=90.0)
+        )
+
+        history = self.leaderboard.get_history(self.filename, "boss_rush_scores")
+        self.assertEqual([entry["score"] for entry in history], [300, 100])
+        self.assertEqual(
+            self.leaderboard.get_scores(self.filename, "boss_rush_scores"), []
+        )
+        self.assertEqual(history[0]["ship"], "Thunderbird_1")
+        self.assertEqual(history[0]["difficulty"], "HARD")
+        self.assertEqual(history[0]["level"], 5)
+
+        self.assertEqual(
+            self.leaderboard.get_stats(self.filename, "boss_rush_scores"),
+            {
+                "matches": 2,
+                "best_score": 300,
+                "average_score": 200.0,
+                "average_duration": 60.0,
+            },
+        )
+
+    def test_delete_scores(self):
+        """Test that deleting a mode leaves the other modes."""
+        self.leaderboard.add_score(self.filename, "high_scores", "A", 10)
+        self.leaderboard.add_score(self.filename, "endless_scores", "B", 20)
+        self.leaderboard.record_match(self.filename, "high_scores", 10, {})
+
+        self.leaderboard.delete_scores(self.filename, "high_scores")
+        self.leaderboard.delete_scores(self.filename, "high_scores")
+
+        self.assertEqual(self.leaderboard.get_scores(self.filename, "high_scores"), [])
+        self.assertEqual(self.leaderboard.get_history(self.filename, "high_scores"), [])
+        self.assertEqual(
+            len(self.leaderboard.get_scores(self.filename, "endless_scores")), 1
+        )
+        self.assertEqual(self.leaderboard.version, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+"""
+This module tests the match farm that plays bot matches on a pool of
+worker processes and sums up their results.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.game_logic.bot_match import MatchConfig, MatchResult
+from src.utils import match_farm
+from src.utils.constants import FARM_FRAME_BUDGET
+from src.utils.match_farm import (
+    format_errors,
+    format_report,
+    get_level_costs,
+    make_configs,
+    run_farm,
+    summarize,
+)
+
+
+def make_result(config, outcome="survived", level=2, frame_cost=0.001):
+    """Return the result of a match of 100 frames, split over two levels."""
+    return MatchResult(
+        config=config,
+        outcome=outcome,
+        level=level,
+        score=100,
+        frames=100,
+        frame_time=100 * frame_cost,
+        worst_frame=2 * frame_cost,
+        over_budget=0,
+        peak_entities={"aliens": level * 10, "alien_bullet": 5},
+        level_costs={1: [50, 50 * frame_cost], level: [50, 50 * frame_cost]},
+    )
+
+
+class MatchFarmTest(unittest.TestCase):
+    """Test cases for the match farm functions."""
+
+    def test_make_configs(self):
+        """Test that the configs cover every combination, with their own seeds."""
+        configs = make_configs(300, seed=1, max_frames=500)
+
+        self.assertEqual(len(configs), 300)
+        self.assertEqual(len({config.seed for config in configs}), 300)
+        self.assertEqual(len({config.difficulty for config in configs[:50]}), 3)
+        self.assertTrue(all(config.max_frames == 500 for config in configs))
+        self.assertFalse(
+            any(
+                config.singleplayer and config.game_mode == "cosmic_conflict"
+                for config in configs
+            )
+        )
+        self.assertEqual(
+            [config.seed for config in make_configs(10, seed=1)],
+            [config.seed for config in configs[:10]],
+        )
+
+    def test_summarize(self):
+        """Test that the results are grouped and summed up."""
+        config = MatchConfig(seed=1, loadout=("slow_thunder", "fast_phoenix"))
+        single = MatchConfig(seed=2, singleplayer=True)
+        results = [
+            make_result(config, level=3),
+            make_result(config, "defeat", level=1, frame_cost=0.003),
+            make_result(single),
+        ]
+
+        rows = summarize(results)
+
+        self.assertEqual(len(rows), 2)
+        row = rows[0]
+        self.assertEqual(row["loadout"], "regular_thunder")
+        self.assertEqual(row["players"], 1)
+        row = rows[1]
+        self.assertEqual(row["loadout"], "slow_thunder/fast_phoenix")
+        self.assertEqual(row["matches"], 2)
+        self.assertEqual(row["win_rate"], 0.5)
+        self.assertEqual(row["mean_level"], 2)
+        self.assertEqual(row["max_level"], 3)
+        self.assertAlmostEqual(row["mean_frame_ms"], 2)
+        self.assertAlmostEqual(row["worst_frame_ms"], 6)
+        self.assertEqual(row["peak_entities"], {"aliens": 30, "alien_bullet": 5})
+        self.assertIsNone(row["first_slow_level"])
+
+    def test_level_costs(self):
+        """Test that the frame cost of every level is averaged over the
+        matches and that the slow levels are found.
+        """
+        config = MatchConfig(seed=1)
+        results = [
+            make_result(config, level=2),
+            make_result(config, level=3, frame_cost=FARM_FRAME_BUDGET * 2),
+        ]
+
+        level_costs = get_level_costs(results)
+        rows = summarize(results)
+        report = format_report(rows, level_costs)
+
+        self.assertEqual([level for level, _, _ in level_costs], [1, 2, 3])
+        self.assertEqual(level_costs[0][1], 100)
+        self.assertAlmostEqual(level_costs[1][2], 0.001)
+        self.assertEqual(rows[0]["first_slow_level"], 1)
+        self.assertIn("over budget", report.splitlines()[-1])
+        self.assertNotIn("over budget", report.splitlines()[-2])
+
+    @patch("src.utils.match_farm.multiprocessing.Pool")
+    def test_run_farm(self, mock_pool):
+        """Test that the matches are played on the pool of workers."""
+        pool = mock_pool.return_value.__enter__.return_value
+        pool.imap_unordered.side_effect = lambda play, configs, _: map(play, configs)
+        configs = make_configs(3)
+
+        with patch.object(match_farm, "_worker_game") as game, patch(
+            "src.utils.match_farm.run_match",
+            side_effect=lambda _, config: make_result(config),
+        ):
+            results = run_farm(configs, processes=2)
+
+        mock_pool.assert_called_once_with(2, initializer=match_farm._init_worker)
+        self.assertEqual([result.config for result in results], configs)
+        self.assertEqual(game.game_state.restore.call_count, 3)
+
+    @patch("src.utils.match_farm.multiprocessing.Pool")
+    def test_run_farm_error(self, mock_pool):
+        """Test that a match that raises is reported and the others are played."""
+        pool = mock_pool.return_value.__enter__.return_value
+        pool.imap_unordered.side_effect = lambda play, configs, _: map(play, configs)
+        configs = [MatchConfig(seed=1), MatchConfig(seed=2)]
+
+        with patch.object(match_farm, "_worker_game"), patch(
+            "src.utils.match_farm.run_match",
+            side_effect=[RuntimeError("no music"), make_result(configs[1])],
+        ):
+            results = run_farm(configs)
+
+        self.assertEqual([result.outcome for result in results], ["error", "survived"])
+        self.assertFalse(results[0].won)
+        self.assertEqual(results[0].error, "RuntimeError: no music")
+
+        rows = summarize(results)
+        report = format_report(rows, get_level_costs(results))
+
+        self.assertEqual(rows[0]["matches"], 1)
+        self.assertEqual(rows[0]["errors"], 1)
+        self.assertEqual(rows[0]["win_rate"], 1)
+        self.assertTrue(report.splitlines()[1].endswith("1"))
+        self.assertEqual(
+            format_errors(results), ["seed 1 EASY normal: RuntimeError: no music"]
+        )
+
+    def test_summarize_only_errors(self):
+        """Test that a group whose matches all raised is still summed up."""
+        config = MatchConfig(seed=1)
+        error = make_result(config, "error", level=0)
+        error.frames = 0
+
+        rows = summarize([error])
+
+        self.assertEqual(rows[0]["matches"], 0)
+        self.assertEqual(rows[0]["errors"], 1)
+        self.assertEqual(rows[0]["mean_frame_ms"], 0)
+
+    @patch("src.utils.match_farm.AlienOnslaught")
+    def test_init_worker(self, mock_game):
+        """Test that every worker keeps the state of its new game."""
+        with patch.object(match_farm, "_worker_game"), patch.object(
+            match_farm, "_worker_baseline"
+        ):
+            match_farm._init_worker()
+
+            self.assertIs(match_farm._worker_game, mock_game.return_value)
+            self.assertIs(
+                match_farm._worker_baseline,
+                mock_game.return_value.game_state.snapshot.return_value,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
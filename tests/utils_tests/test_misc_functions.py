@@ -11,19 +11,27 @@ from unittest.mock import patch, MagicMock, call
 import pygame
 
 from src.utils.game_utils import (
+    get_mask,
+    get_colliding_sprite,
     get_colliding_sprites,
+    get_group_collisions,
+    remove_sprites_below,
+    remove_sprites_outside,
     get_boss_rush_title,
     display_description,
     render_bullet_num,
     display_message,
     display_custom_message,
     render_text,
+    render_font_text,
+    render_counts,
     calculate_control_positions,
     display_controls,
     set_attribute,
     create_save_dir,
     render_simple_text,
     display_simple_message,
+    update_display,
 )
 
 from src.utils.constants import P1_CONTROLS, P2_CONTROLS, GAME_CONTROLS
@@ -99,6 +107,74 @@ class MiscFunctionsTests(unittest.TestCase):
         self.assertEqual(result, ["sprite1", "sprite2"])
         mock_spritecollide.assert_called_once_with(ship, bullets_or_missiles, False)
 
+    def _make_sprites(self, *positions):
+        """Return a sprite group with one small sprite at each position."""
+        group = pygame.sprite.Group()
+        sprites = []
+        for position in positions:
+            sprite = pygame.sprite.Sprite()
+            sprite.rect = pygame.Rect(position, (10, 10))
+            sprites.append(sprite)
+        group.add(sprites)
+        return group, sprites
+
+    def test_remove_sprites_below(self):
+        """Test the remove_sprites_below function."""
+        group, sprites = self._make_sprites((0, 100), (0, 601), (0, 600))
+
+        remove_sprites_below(group, 600)
+
+        self.assertEqual(set(group.sprites()), {sprites[0], sprites[2]})
+
+    def test_remove_sprites_outside(self):
+        """Test the remove_sprites_outside function."""
+        group, sprites = self._make_sprites((100, 100), (100, -20), (-5, 50))
+
+        remove_sprites_outside(group, pygame.Rect(0, 0, 800, 600))
+
+        self.assertEqual(set(group.sprites()), {sprites[0], sprites[2]})
+
+    def _make_round_sprites(self, *positions):
+        """Return a sprite group with one round sprite at each position."""
+        group, sprites = self._make_sprites(*positions)
+        for sprite in sprites:
+            sprite.image = pygame.Surface((10, 10), pygame.SRCALPHA)
+            pygame.draw.circle(sprite.image, (255, 255, 255), (5, 5), 5)
+        return group, sprites
+
+    def test_get_mask(self):
+        """Test that the mask of an image is created only once."""
+        image = pygame.Surface((10, 10), pygame.SRCALPHA)
+
+        self.assertIs(get_mask(image), get_mask(image))
+        self.assertEqual(get_mask(image).count(), 0)
+
+    def test_precise_collisions(self):
+        """Test that the masks are checked only for the precise sprite types."""
+        # The rects overlap in a corner, the circles do not.
+        ship = self._make_round_sprites((0, 0))[1][0]
+        group, sprites = self._make_round_sprites((8, 8), (3, 0))
+
+        with patch.dict("src.utils.game_utils.MASK_COLLISIONS", {"Sprite": False}):
+            self.assertIs(get_colliding_sprite(ship, group), sprites[0])
+            self.assertEqual(len(get_colliding_sprites(ship, group)), 2)
+
+        with patch.dict("src.utils.game_utils.MASK_COLLISIONS", {"Sprite": True}):
+            self.assertIs(get_colliding_sprite(ship, group), sprites[1])
+            self.assertEqual(get_colliding_sprites(ship, group), [sprites[1]])
+
+    def test_get_group_collisions(self):
+        """Test that only the precise hits are returned and killed."""
+        bullets, bullet_sprites = self._make_round_sprites((0, 0), (100, 100))
+        aliens, alien_sprites = self._make_round_sprites((8, 8), (103, 100))
+
+        with patch.dict("src.utils.game_utils.MASK_COLLISIONS", {"Sprite": True}):
+            collisions = get_group_collisions(bullets, aliens, kill_a=True)
+
+        self.assertEqual(collisions, {bullet_sprites[1]: [alien_sprites[1]]})
+        self.assertEqual(bullets.sprites(), [bullet_sprites[0]])
+        self.assertEqual(len(aliens), 2)
+
     @patch("src.utils.game_utils.BOSS_RUSH")
     def test_get_boss_rush_title(self, mock_boss_rush):
         """Test the get_boss_rush_title function."""
@@ -216,6 +292,18 @@ class MiscFunctionsTests(unittest.TestCase):
             pygame.display.flip.assert_called_once()
             time_wait_mock.assert_called_once_with(int(duration * 1000))
 
+    def test_update_display(self):
+        """Test the update_display function."""
+        display = MagicMock()
+
+        with patch("pygame.display.flip") as mock_flip:
+            update_display(display)
+            display.present.assert_called_once()
+            mock_flip.assert_not_called()
+
+            update_display()
+            mock_flip.assert_called_once()
+
     @patch("pygame.font.SysFont")
     def test_display_custom_message(self, mock_sysfont):
         """Test the display_custom_message function."""
@@ -401,6 +489,17 @@ class MiscFunctionsTests(unittest.TestCase):
                 ]
                 render_text_mock.assert_has_calls(expected_calls)
 
+    def test_render_font_text(self):
+        """Test that the texts rendered with render_font_text are counted."""
+        font = MagicMock()
+        renders = render_counts["text"]
+
+        surface = render_font_text(font, "Level 3", True, "white", None)
+
+        font.render.assert_called_once_with("Level 3", True, "white", None)
+        self.assertIs(surface, font.render.return_value)
+        self.assertEqual(render_counts["text"], renders + 1)
+
     def test_render_simple_text(self):
         """Test the render_simple_text function."""
         # Set test data
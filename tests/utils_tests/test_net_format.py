@@ -0,0 +1,125 @@
+"""
+This module tests the functions that encode and decode the packets
+of the Cosmic Conflict netcode.
+"""
+
+import unittest
+
+from src.utils.game_dataclasses import ShipStates
+from src.utils.net_format import (
+    BULLET,
+    ENTITY_HEADER,
+    ENTITY_RECORDS,
+    INPUT_PACKET,
+    LASER,
+    MISSILE,
+    SHIP,
+    SNAPSHOT_PACKET,
+    decode_input,
+    decode_ship_flags,
+    decode_snapshot,
+    encode_input,
+    encode_ship_flags,
+    encode_snapshot,
+    get_packet_type,
+)
+
+
+class NetFormatTests(unittest.TestCase):
+    """Test cases for the netcode packets."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.entities = {
+            0: (SHIP, (10, 350, 1, 3, 2, 500)),
+            1: (SHIP, (1200, 350, 1, 3, 3, 0)),
+            2: (BULLET, (0, 100, 340)),
+            3: (MISSILE, (1, 900, 360)),
+            4: (LASER, (0, 300, -20)),
+        }
+
+    def test_input_round_trip(self):
+        """Test encoding and decoding an input packet."""
+        packet = encode_input(41, 120, [1, 17, 49])
+
+        self.assertEqual(get_packet_type(packet), INPUT_PACKET)
+        self.assertEqual(decode_input(packet), (41, 120, [1, 17, 49]))
+
+    def test_decode_input_invalid(self):
+        """Test that a truncated input packet is rejected."""
+        with self.assertRaises(ValueError):
+            decode_input(encode_input(0, 1, [1, 2])[:-1])
+
+    def test_ship_flags(self):
+        """Test packing the states of a ship."""
+        state = ShipStates(alive=True, shielded=True, immune=True)
+
+        flags = decode_ship_flags(encode_ship_flags(state))
+
+        self.assertTrue(flags["alive"])
+        self.assertTrue(flags["shielded"])
+        self.assertTrue(flags["immune"])
+        self.assertFalse(flags["exploding"])
+        self.assertFalse(flags["warping"])
+
+    def test_full_snapshot(self):
+        """Test that a snapshot without baseline holds every entity."""
+        packet, state = encode_snapshot(1, 0, {}, self.entities)
+
+        self.assertEqual(get_packet_type(packet), SNAPSHOT_PACKET)
+        self.assertEqual(state, self.entities)
+        self.assertEqual(decode_snapshot(packet), (1, 0, [], self.entities))
+
+    def test_delta_snapshot(self):
+        """Test that only the changes from the baseline are sent."""
+        entities = dict(self.entities)
+        entities[0] = (SHIP, (15, 350, 1, 3, 2, 500))
+        del entities[2]
+        entities[5] = (BULLET, (1, 1100, 340))
+
+        packet, state = encode_snapshot(2, 1, self.entities, entities)
+        tick, baseline_tick, removed, updates = decode_snapshot(packet)
+
+        self.assertEqual((tick, baseline_tick), (2, 1))
+        self.assertEqual(removed, [2])
+        self.assertEqual(updates, {0: entities[0], 5: entities[5]})
+        self.assertEqual(state, entities)
+        self.assertLess(len(packet), len(encode_snapshot(2, 0, {}, entities)[0]))
+
+    def test_snapshot_size_limit(self):
+        """Test that a snapshot never exceeds the size limit and that the
+        ships are sent before the projectiles.
+        """
+        entities = dict(self.entities)
+        for net_id in range(10, 200):
+            entities[net_id] = (BULLET, (0, net_id, net_id))
+        bullet_size = ENTITY_HEADER.size + ENTITY_RECORDS[BULLET].size
+
+        packet, state = encode_snapshot(1, 0, {}, entities, max_size=300)
+        updates = decode_snapshot(packet)[3]
+
+        self.assertLessEqual(len(packet), 300)
+        self.assertGreater(len(packet), 300 - bullet_size)
+        self.assertIn(0, updates)
+        self.assertIn(1, updates)
+        self.assertEqual(updates[4], entities[4])
+        self.assertEqual(state, updates)
+
+        # The entities left out are sent with the next snapshots.
+        packet, state = encode_snapshot(2, 1, state, entities, max_size=300)
+
+        self.assertNotIn(0, decode_snapshot(packet)[3])
+        self.assertGreater(len(state), len(updates))
+
+    def test_decode_snapshot_invalid(self):
+        """Test that snapshots with a wrong size or type are rejected."""
+        packet = encode_snapshot(1, 0, {}, self.entities)[0]
+
+        with self.assertRaises(ValueError):
+            decode_snapshot(packet + b"\x00")
+        with self.assertRaises(ValueError):
+            decode_snapshot(b"\x01" + packet[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+This module tests the UDP endpoint of the netcode and the LinkSimulator
+class that adds latency and packet loss to it.
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from src.utils.net_link import LinkSimulator, UdpEndpoint
+
+
+def receive_packets(endpoint, count, timeout=1.0):
+    """Return the packets received by an endpoint, waiting until
+    the given number of packets arrived or the timeout expired.
+    """
+    packets = []
+    deadline = time.monotonic() + timeout
+    while len(packets) < count and time.monotonic() < deadline:
+        packets.extend(endpoint.receive())
+        time.sleep(0.001)
+    return packets
+
+
+class UdpEndpointTests(unittest.TestCase):
+    """Test cases for the UdpEndpoint class."""
+
+    def setUp(self):
+        """Set up two endpoints on localhost."""
+        self.first = UdpEndpoint()
+        self.second = UdpEndpoint()
+
+    def tearDown(self):
+        self.first.close()
+        self.second.close()
+
+    def test_send_and_receive(self):
+        """Test sending packets between two endpoints."""
+        self.first.send(b"hello", self.second.address)
+        self.first.send(b"world", self.second.address)
+
+        packets = receive_packets(self.second, 2)
+
+        self.assertEqual([packet for packet, _ in packets], [b"hello", b"world"])
+        self.assertEqual(packets[0][1], self.first.address)
+
+    def test_receive_nothing(self):
+        """Test that receiving never waits for packets."""
+        self.assertEqual(self.first.receive(), [])
+
+
+class LinkSimulatorTests(unittest.TestCase):
+    """Test cases for the LinkSimulator class."""
+
+    def setUp(self):
+        """Set up a simulator with a fake clock."""
+        self.now = 0.0
+        self.endpoint = MagicMock()
+
+    def make_link(self, **kwargs):
+        """Return a simulator around the mocked endpoint."""
+        return LinkSimulator(self.endpoint, clock=lambda: self.now, seed=1, **kwargs)
+
+    def test_latency(self):
+        """Test that packets are sent once their latency passed."""
+        link = self.make_link(latency=0.1)
+
+        link.send(b"packet", ("127.0.0.1", 5000))
+        self.now = 0.09
+        link.receive()
+        self.endpoint.send.assert_not_called()
+
+        self.now = 0.1
+        link.receive()
+        self.endpoint.send.assert_called_once_with(b"packet", ("127.0.0.1", 5000))
+
+    def test_loss(self):
+        """Test that a share of the packets is dropped."""
+        link = self.make_link(loss=0.25)
+
+        for _ in range(1000):
+            link.send(b"packet", ("127.0.0.1", 5000))
+
+        self.assertEqual(self.endpoint.send.call_count + link.dropped, 1000)
+        self.assertAlmostEqual(link.dropped / 1000, 0.25, delta=0.05)
+
+    def test_jitter_reorders_packets(self):
+        """Test that the jitter can deliver packets out of order."""
+        link = self.make_link(latency=0.05, jitter=0.05)
+
+        for number in range(50):
+            link.send(bytes([number]), ("127.0.0.1", 5000))
+        self.now = 1.0
+        link.flush()
+
+        sent = [call.args[0][0] for call in self.endpoint.send.call_args_list]
+        self.assertEqual(sorted(sent), list(range(50)))
+        self.assertNotEqual(sent, list(range(50)))
+
+    def test_over_localhost(self):
+        """Test a simulated link between two real endpoints."""
+        receiver = UdpEndpoint()
+        link = LinkSimulator(UdpEndpoint(), latency=0.01, seed=1)
+
+        link.send(b"packet", receiver.address)
+        self.assertEqual(receiver.receive(), [])
+        time.sleep(0.02)
+        link.flush()
+
+        self.assertEqual(receive_packets(receiver, 1)[0][0], b"packet")
+        link.close()
+        receiver.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+This module tests the functions that encode and decode the binary
+save file format.
+"""
+
+import unittest
+
+from src.utils.constants import SAVE_MAGIC
+from src.utils.save_format import (
+    ALIEN_RECORD,
+    HEADER,
+    encode_save,
+    decode_save,
+    is_save_format,
+)
+
+
+class SaveFormatTests(unittest.TestCase):
+    """Test cases for the save file format."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.game_data = {
+            "level": 12,
+            "thunder_ship_name": "Thunderbird",
+            "thunderbird_alive": True,
+            "speedup_scale": 0.3,
+            "save_date": "2024-01-01 10:00:00",
+        }
+        self.alien_states = [
+            {
+                "type": "alien",
+                "is_baby": True,
+                "location": 120.5,
+                "y": 40,
+                "hit_count": 1,
+                "last_bullet_time": 5000,
+                "immune_state": True,
+                "frozen_state": False,
+                "frozen_time": 0.0,
+                "immune_time": 1.5,
+                "direction": -1,
+            },
+            {
+                "type": "boss",
+                "is_baby": False,
+                "location": 300.0,
+                "y": -20,
+                "hit_count": 42,
+                "last_bullet_time": 0,
+                "immune_state": False,
+                "frozen_state": True,
+                "frozen_time": 2.25,
+                "immune_time": 0.0,
+                "direction": 1,
+            },
+        ]
+
+    def test_round_trip(self):
+        """Test that decoding an encoded save returns the same state."""
+        blob = encode_save(self.game_data, self.alien_states)
+
+        loaded_data = decode_save(blob)
+
+        sprite_data = loaded_data.pop("sprite_data")
+        self.assertEqual(loaded_data, self.game_data)
+        self.assertEqual(sprite_data["alien_sprites"], self.alien_states)
+
+    def test_record_size(self):
+        """Test that every alien is stored as a fixed size record."""
+        empty = encode_save(self.game_data, [])
+        blob = encode_save(self.game_data, self.alien_states)
+
+        self.assertEqual(len(blob) - len(empty), 2 * ALIEN_RECORD.size)
+
+    def test_is_save_format(self):
+        """Test the detection of the binary save format."""
+        self.assertTrue(is_save_format(encode_save(self.game_data, [])))
+        self.assertFalse(is_save_format(b"\x80\x04legacy pickle"))
+
+    def test_decode_unsupported_version(self):
+        """Test that files with an unknown version are rejected."""
+        blob = HEADER.pack(SAVE_MAGIC, 99, 0, 0)
+
+        with self.assertRaises(ValueError):
+            decode_save(blob)
+
+
+if __name__ == "__main__":
+    unittest.main()
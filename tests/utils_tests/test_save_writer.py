@@ -0,0 +1,130 @@
+"""
+This module tests the SaveWriter class that writes the save files
+on a background thread.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.utils.save_format import decode_save
+from src.utils.save_writer import SaveWriter, SAVE_COMPLETED_EVENT, write_atomic
+
+
+class SaveWriterTests(unittest.TestCase):
+    """Test cases for the SaveWriter class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_folder = self.temp_dir.name
+        self.post_patch = patch("src.utils.save_writer.pygame.event.post")
+        self.mock_post = self.post_patch.start()
+        self.writer = SaveWriter(self.save_folder, "save")
+        self.metadata = {"timestamp": 1000.0, "level": 3, "mode": "normal"}
+
+    def tearDown(self):
+        """Clean up the temporary folder and the patches."""
+        self.post_patch.stop()
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        """Return the path of a file in the save folder."""
+        return os.path.join(self.save_folder, name)
+
+    def test_write_atomic(self):
+        """Test that the data replaces the file and no temp file is left."""
+        file_path = self._path("save1.save")
+        write_atomic(file_path, b"old")
+        write_atomic(file_path, b"new")
+
+        with open(file_path, "rb") as file:
+            self.assertEqual(file.read(), b"new")
+        self.assertEqual(os.listdir(self.save_folder), ["save1.save"])
+
+    def test_index_existing_saves(self):
+        """Test that save files missing from the index are added once."""
+        write_atomic(self._path("save2.save"), b"legacy")
+        write_atomic(
+            self._path("save_index.json"),
+            json.dumps({"save3": self.metadata}).encode("utf-8"),
+        )
+
+        writer = SaveWriter(self.save_folder, "save")
+
+        index = writer.get_index()
+        self.assertEqual(list(index), ["save2"])
+        self.assertIsNone(index["save2"]["level"])
+
+    def test_write_save(self):
+        """Test that a save is written, indexed and reported."""
+        self.writer._write_save("save1", {"level": 3}, [], self.metadata)
+
+        with open(self._path("save1.save"), "rb") as file:
+            self.assertEqual(decode_save(file.read())["level"], 3)
+        with open(self._path("save_index.json"), "r", encoding="utf-8") as file:
+            self.assertEqual(json.load(file), {"save1": self.metadata})
+
+        event = self.mock_post.call_args[0][0]
+        self.assertEqual(event.type, SAVE_COMPLETED_EVENT)
+        self.assertEqual(event.slot, "save1")
+        self.assertTrue(event.success)
+
+    def test_write_save_failure(self):
+        """Test that a failed save is reported and not indexed."""
+        with patch("src.utils.save_writer.write_atomic", side_effect=OSError("full")):
+            self.writer._write_save("save1", {"level": 3}, [], self.metadata)
+
+        event = self.mock_post.call_args[0][0]
+        self.assertFalse(event.success)
+        self.assertEqual(event.error, "full")
+        self.assertEqual(self.writer.get_index(), {})
+
+    def test_save_runs_in_background(self):
+        """Test that queued saves are written by the worker thread."""
+        self.writer.save("save1", {"level": 3}, [], self.metadata)
+        self.writer.wait()
+
+        self.assertTrue(os.path.exists(self._path("save1.save")))
+        self.assertTrue(self.writer.thread.daemon)
+        self.mock_post.assert_called_once()
+
+    def test_worker_survives_failures(self):
+        """Test that the saves queued after a failing one are still written."""
+        with patch(
+            "src.utils.save_writer.encode_save", side_effect=[KeyError("level"), b""]
+        ):
+            self.writer.save("save1", {}, [], self.metadata)
+            self.writer.save("save2", {}, [], self.metadata)
+            self.writer.wait()
+
+        events = [call[0][0] for call in self.mock_post.call_args_list]
+        self.assertEqual(
+            [(event.slot, event.success) for event in events],
+            [("save1", False), ("save2", True)],
+        )
+
+        # Even an error while posting the completion doesn't stop the worker.
+        self.mock_post.side_effect = [RuntimeError("no event queue"), None]
+        self.writer.save("save3", {"level": 3}, [], self.metadata)
+        self.writer.save("save4", {"level": 3}, [], self.metadata)
+        self.writer.wait()
+
+        self.assertTrue(self.writer.thread.is_alive())
+        self.assertTrue(os.path.exists(self._path("save4.save")))
+
+    def test_clear(self):
+        """Test that clearing removes the save files and the index entries."""
+        self.writer._write_save("save1", {"level": 3}, [], self.metadata)
+
+        self.writer.clear()
+        self.writer.wait()
+
+        self.assertFalse(os.path.exists(self._path("save1.save")))
+        self.assertEqual(self.writer.get_index(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+This module tests the TelemetryWriter class that writes the telemetry
+records to a rotating JSON lines file on a background thread.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from src.utils.telemetry_writer import TelemetryWriter
+
+
+class TelemetryWriterTests(unittest.TestCase):
+    """Test cases for the TelemetryWriter class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "telemetry.jsonl")
+
+    def tearDown(self):
+        """Clean up the temporary folder."""
+        self.temp_dir.cleanup()
+
+    def read_lines(self, file_path):
+        """Return the records of a telemetry file."""
+        with open(file_path, encoding="utf-8") as file:
+            return [json.loads(line) for line in file]
+
+    def test_write(self):
+        """Test that every record is written as a JSON line."""
+        writer = TelemetryWriter(self.file_path)
+
+        writer.write({"fps": 60.0, "level": 1})
+        writer.write({"event": "level", "level": 2})
+        writer.wait()
+        writer._close_file()
+
+        self.assertEqual(
+            self.read_lines(self.file_path),
+            [{"fps": 60.0, "level": 1}, {"event": "level", "level": 2}],
+        )
+
+    def test_no_thread_before_first_record(self):
+        """Test that the worker thread only starts with the first record."""
+        writer = TelemetryWriter(self.file_path)
+
+        self.assertIsNone(writer.thread)
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_rotation(self):
+        """Test that the full file is moved to a backup and the oldest
+        backup is deleted.
+        """
+        writer = TelemetryWriter(self.file_path, max_bytes=30, backups=2)
+
+        for number in range(8):
+            writer.write({"record": number})
+        writer.wait()
+        writer._close_file()
+
+        lines = [
+            self.read_lines(path)
+            for path in (self.file_path, f"{self.file_path}.1", f"{self.file_path}.2")
+        ]
+        self.assertEqual(lines[0], [{"record": 6}, {"record": 7}])
+        self.assertEqual(lines[1], [{"record": 4}, {"record": 5}])
+        self.assertEqual(lines[2], [{"record": 2}, {"record": 3}])
+        self.assertFalse(os.path.exists(f"{self.file_path}.3"))
+        self.assertLessEqual(os.path.getsize(f"{self.file_path}.1"), 30)
+
+    def test_unwritable_record(self):
+        """Test that a record that can't be written is dropped."""
+        writer = TelemetryWriter(self.file_path)
+
+        writer.write({"surface": object()})
+        writer.write({"fps": 30.0})
+        writer.wait()
+        writer._close_file()
+
+        self.assertEqual(self.read_lines(self.file_path), [{"fps": 30.0}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+This module tests the VoiceAllocator class that assigns sound effects
+to reserved mixer channels.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.utils.voice_allocator import VoiceAllocator
+
+POOLS = {
+    "ui": {"channels": 1, "priority": 3, "min_interval": 0},
+    "explosions": {"channels": 2, "priority": 2, "min_interval": 60},
+    "weapons": {"channels": 1, "priority": 1, "min_interval": 0},
+}
+CATEGORIES = {"click": "ui", "alien_exploding": "explosions", "bullet": "weapons"}
+
+
+class VoiceAllocatorTests(unittest.TestCase):
+    """Test cases for the VoiceAllocator class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.mixer_patch = patch("src.utils.voice_allocator.pygame.mixer")
+        self.ticks_patch = patch(
+            "src.utils.voice_allocator.pygame.time.get_ticks", return_value=1000
+        )
+        self.mock_mixer = self.mixer_patch.start()
+        self.mock_ticks = self.ticks_patch.start()
+        self.mock_mixer.get_num_channels.return_value = 8
+        self.mock_mixer.Channel.side_effect = lambda i: MagicMock(
+            name=f"channel{i}", **{"get_busy.return_value": False}
+        )
+        self.allocator = VoiceAllocator(POOLS, CATEGORIES, default_category="ui")
+        self.sound = MagicMock()
+
+    def tearDown(self):
+        """Clean up the patches."""
+        self.mixer_patch.stop()
+        self.ticks_patch.stop()
+
+    def test_init_channels(self):
+        """Test that the channels are reserved and split between pools."""
+        self.allocator._init_channels()
+
+        self.mock_mixer.set_reserved.assert_called_once_with(4)
+        self.assertEqual(
+            self.allocator.pools, {"ui": [0], "explosions": [1, 2], "weapons": [3]}
+        )
+        self.assertEqual(len(self.allocator.channels), 4)
+
+    def test_play_uses_category_pool(self):
+        """Test that a sound is played on a channel from its pool."""
+        channel = self.allocator.play(self.sound, "bullet")
+
+        self.assertIs(channel, self.allocator.channels[3])
+        channel.play.assert_called_once_with(self.sound)
+        self.assertEqual(self.allocator.voices[3], (1, 1000))
+
+    def test_play_unknown_sound_uses_default_pool(self):
+        """Test that unmapped sounds use the default category."""
+        channel = self.allocator.play(self.sound, "unknown")
+
+        self.assertIs(channel, self.allocator.channels[0])
+
+    def test_play_rate_limited(self):
+        """Test that the same sound is not replayed inside its min interval."""
+        self.allocator.play(self.sound, "alien_exploding")
+        self.mock_ticks.return_value = 1030
+
+        self.assertIsNone(self.allocator.play(self.sound, "alien_exploding"))
+
+        self.mock_ticks.return_value = 1060
+        self.assertIsNotNone(self.allocator.play(self.sound, "alien_exploding"))
+        # Only the sounds that were played are counted.
+        self.assertEqual(self.allocator.plays, 2)
+
+    def test_play_steals_oldest_voice(self):
+        """Test that the oldest voice in the pool is stolen when all are busy."""
+        self.allocator._init_channels()
+        for channel in self.allocator.channels:
+            channel.get_busy.return_value = True
+        self.allocator.voices = {1: (2, 500), 2: (2, 200), 3: (1, 900)}
+
+        channel = self.allocator.play(self.sound, "alien_exploding")
+
+        # The weapons voice has the lowest priority, so it is stolen first.
+        self.assertIs(channel, self.allocator.channels[3])
+
+    def test_play_does_not_steal_higher_priority(self):
+        """Test that low priority sounds never take higher priority channels."""
+        self.allocator._init_channels()
+        self.allocator.channels[3].get_busy.return_value = True
+        self.allocator.voices = {3: (1, 900)}
+
+        channel = self.allocator.play(self.sound, "bullet")
+
+        self.assertIs(channel, self.allocator.channels[3])
+        self.allocator.channels[0].play.assert_not_called()
+
+    def test_stop_all(self):
+        """Test that stop_all stops the channels and clears the history."""
+        self.allocator.play(self.sound, "click")
+
+        self.allocator.stop_all()
+
+        for channel in self.allocator.channels:
+            channel.stop.assert_called_once()
+        self.assertEqual(self.allocator.voices, {})
+        self.assertEqual(self.allocator.last_played, {})
+
+
+if __name__ == "__main__":
+    unittest.main()